@@ -6,8 +6,9 @@ InsideGMT faction-strategy articles -- used for strategy priors only, never for
 rules decisions) as a plan-building policy that occupies a "human" seat via
 ``decision_func`` while the NP bots play the other Factions.
 
-Every candidate plan is dry-run through ``moves.validate_player_action`` before
-being committed; on failure the policy degrades (next command, drop the SA,
+Every candidate plan is dry-run (``moves.validate_many`` /
+``moves.validate_player_action``, sharing one board snapshot) before being
+committed; on failure the policy degrades (next command, drop the SA,
 finally Pass), so a profile can never wedge a game.
 """
 from __future__ import annotations
@@ -18,6 +19,7 @@ import fs_bot.rules_consts as rc
 from fs_bot.board.pieces import count_pieces
 from fs_bot.engine import moves
 from fs_bot.map.map_data import get_adjacent, get_playable_regions
+from fs_bot.state.observation import region_view
 
 WB, LEG, AUX, ALLY, CIT, FORT, LDR = (rc.WARBAND, rc.LEGION, rc.AUXILIA,
                                       rc.ALLY, rc.CITADEL, rc.FORT, rc.LEADER)
@@ -28,18 +30,19 @@ WB, LEG, AUX, ALLY, CIT, FORT, LDR = (rc.WARBAND, rc.LEGION, rc.AUXILIA,
 # --------------------------------------------------------------------------- #
 def force(state, region, faction):
     """Crude force level: Legions heavy, leader bonus, foot pieces 1."""
-    f = (count_pieces(state, region, faction, WB)
-         + count_pieces(state, region, faction, AUX)
-         + 3 * count_pieces(state, region, faction, LEG))
-    if count_pieces(state, region, faction, LDR):
+    view = region_view(state, region)
+    f = (view.count(faction, WB) + view.count(faction, AUX)
+         + 3 * view.count(faction, LEG))
+    if view.leader(faction) is not None:
         f += 2
     return f
 
 
 def defense(state, region, faction):
+    view = region_view(state, region)
     return (force(state, region, faction)
-            + 2 * count_pieces(state, region, faction, CIT)
-            + 2 * count_pieces(state, region, faction, FORT))
+            + 2 * view.count(faction, CIT)
+            + 2 * view.count(faction, FORT))
 
 
 def _subdued(state, region):
@@ -47,8 +50,8 @@ def _subdued(state, region):
 
 
 def _mobile(state, region, faction):
-    return sum(count_pieces(state, region, faction, t)
-               for t in (WB, AUX, LEG))
+    view = region_view(state, region)
+    return sum(view.count(faction, t) for t in (WB, AUX, LEG))
 
 
 # --------------------------------------------------------------------------- #
@@ -272,29 +275,41 @@ def plan_turn(state, faction, profile, options, position):
     can_sa = ACTION_COMMAND_SA in options
 
     legal = set(moves.legal_commands(faction))
-    for cmd in profile["commands"]:
-        if cmd not in legal:
-            continue
-        pa = _BUILDERS[cmd](state, faction, profile, single)
-        if pa is None:
-            continue
-        # Try with the profile's SA first, then without.
-        sa = profile.get("sa")
-        attempts = []
-        if sa and can_sa and not single:
-            attempts.append(({**pa, "sa": sa,
-                              "sa_regions": _sa_regions_for(state, faction,
-                                                            sa, profile)},
-                             ACTION_COMMAND_SA))
-        attempts.append(({**pa, "sa": "No SA", "sa_regions": []}, cmd_action))
+
+    def attempts():
+        # Built as they are tried: no plan past the first valid one.
+        for cmd in profile["commands"]:
+            if cmd not in legal:
+                continue
+            pa = _BUILDERS[cmd](state, faction, profile, single)
+            if pa is None:
+                continue
+            # Try with the profile's SA first, then without.
+            sa = profile.get("sa")
+            if sa and can_sa and not single:
+                yield ({**pa, "sa": sa,
+                        "sa_regions": _sa_regions_for(state, faction, sa,
+                                                      profile)},
+                       ACTION_COMMAND_SA)
+            yield {**pa, "sa": "No SA", "sa_regions": []}, cmd_action
+    return _first_valid(state, faction, attempts()) or {"action": ACTION_PASS}
+
+
+def _first_valid(state, faction, attempts):
+    """Decision for the first ``(player_action, action)`` attempt that
+    dry-runs cleanly, or None. ``attempts`` is drawn lazily; all attempts
+    share one board snapshot."""
+    tried = []
+
+    def cands():
         for cand, act in attempts:
-            try:
-                ok, info = moves.validate_player_action(state, faction, cand)
-            except Exception:
-                ok = False
-            if ok:
-                return {"action": act, "player_action": cand}
-    return {"action": ACTION_PASS}
+            tried.append((cand, act))
+            yield cand
+    results = moves.validate_many(state, faction, cands(), first_ok=True)
+    if results and results[-1][0]:
+        cand, act = tried[len(results) - 1]
+        return {"action": act, "player_action": cand}
+    return None
 
 
 class RandomPlanPolicy:
@@ -315,6 +330,7 @@ class RandomPlanPolicy:
         single = cmd_action == ACTION_LIMITED_COMMAND
         cmds = list(moves.legal_commands(faction))
         self.rng.shuffle(cmds)
+        snap = moves.snapshot(state)
         for cmd in cmds:
             p = {"rally_allies": self.rng.random() < 0.5,
                  "battle_edge": -99, "disperse": self.rng.random() < 0.5,
@@ -326,7 +342,8 @@ class RandomPlanPolicy:
                 continue
             pa = {**pa, "sa": "No SA", "sa_regions": []}
             try:
-                ok, _ = moves.validate_player_action(state, faction, pa)
+                ok, _ = moves.validate_player_action(state, faction, pa,
+                                                     snap=snap)
             except Exception:
                 ok = False
             if ok:
@@ -566,7 +583,6 @@ def plan_turn_aedui_deep(state, faction, options, position):
     if suborn and suborn[3] < 20:
         suborn = None
 
-    candidates = []
     rally_budget = max(0, res - (suborn[2] if suborn else 0))
     rally_plan, _ = build_rally_deep(state, rally_budget,
                                      max_regions=1 if single else 3)
@@ -574,60 +590,47 @@ def plan_turn_aedui_deep(state, faction, options, position):
                                         or rally_plan["allies"]))
     p = {"rally_allies": True, "battle_edge": 99, "march_foe": None,
          "march_subdue_w": 1}
-    raid = build_raid(state, rc.AEDUI, p, single)
-    m = build_march_seed(state)
-
-    # Carrier order. With a scoring Suborn in hand: Rally (if it also
-    # scores) > March > Raid. Without one: March Hidden Warbands toward the
-    # next Suborn target (Raid would Reveal them, killing future Suborns),
-    # with Trade as the income SA; Raid only as a last resort when broke.
     rally_cand = ({"command": "Rally", "regions": [],
                    "details": {"rally_plan": rally_plan}}
                   if rally_plan else None)
-    if suborn:
-        if rally_scores:
-            candidates.append(rally_cand)
-        if m:
-            candidates.append(m)
-        if raid:
-            candidates.append(raid)
-        if rally_cand and not rally_scores:
-            candidates.append(rally_cand)
-    else:
+
+    def carriers():
+        # Carrier order. With a scoring Suborn in hand: Rally (if it also
+        # scores) > March > Raid. Without one: March Hidden Warbands toward
+        # the next Suborn target (Raid would Reveal them, killing future
+        # Suborns), with Trade as the income SA; Raid only as a last resort
+        # when broke. Each carrier is built when it is reached.
         if rally_scores:
-            candidates.append(rally_cand)
+            yield rally_cand
+        m = build_march_seed(state)
         if m:
-            candidates.append(m)
-        if res <= 2 and raid:
-            candidates.append(raid)
+            yield m
+        raid = build_raid(state, rc.AEDUI, p, single)
+        early_raid = bool(suborn) or res <= 2
+        if raid and early_raid:
+            yield raid
         if rally_cand and not rally_scores:
-            candidates.append(rally_cand)
-        if raid and raid not in candidates:
-            candidates.append(raid)
-
-    for cand in candidates:
-        attempts = []
-        if can_sa and suborn and cand["command"] in ("Rally", "March", "Raid"):
-            attempts.append(({**cand, "sa": "Suborn",
-                              "sa_regions": [suborn[0]],
-                              "details": {**cand["details"],
-                                          "suborn_plan": [
-                                              {"region": suborn[0],
-                                               "actions": suborn[1]}]}},
-                             ACTION_COMMAND_SA))
-        if can_sa:
-            attempts.append(({**cand, "sa": "Trade", "sa_regions": []},
-                             ACTION_COMMAND_SA))
-        attempts.append(({**cand, "sa": "No SA", "sa_regions": []},
-                         cmd_action))
-        for pa, act in attempts:
-            try:
-                ok, _info = moves.validate_player_action(state, rc.AEDUI, pa)
-            except Exception:
-                ok = False
-            if ok:
-                return {"action": act, "player_action": pa}
-    return {"action": ACTION_PASS}
+            yield rally_cand
+        if raid and not early_raid:
+            yield raid
+
+    def attempts():
+        for cand in carriers():
+            if can_sa and suborn and cand["command"] in ("Rally", "March",
+                                                         "Raid"):
+                yield ({**cand, "sa": "Suborn",
+                        "sa_regions": [suborn[0]],
+                        "details": {**cand["details"],
+                                    "suborn_plan": [
+                                        {"region": suborn[0],
+                                         "actions": suborn[1]}]}},
+                       ACTION_COMMAND_SA)
+            if can_sa:
+                yield ({**cand, "sa": "Trade", "sa_regions": []},
+                       ACTION_COMMAND_SA)
+            yield {**cand, "sa": "No SA", "sa_regions": []}, cmd_action
+    return (_first_valid(state, rc.AEDUI, attempts())
+            or {"action": ACTION_PASS})
 
 
 PROFILES["AE-DEEP"] = {
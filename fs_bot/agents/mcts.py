@@ -0,0 +1,271 @@
+"""Monte Carlo search agent: UCB1 over candidate plans, NP-bot rollouts.
+
+The agent occupies one seat via ``decision_func``; every other seat (and, in
+rollouts, its own later turns) is played by the NP bots
+(``bot_dispatch.dispatch_bot_turn``). At each decision it:
+
+1. Lists candidates -- Pass, the Event (either text, NP-derived params) and
+   the first ``max_candidates`` plans of ``moves.iter_legal_plans`` -- and
+   drops any that do not execute on a dry-run.
+2. Takes one ``moves.snapshot`` of the board; every rollout forks it (an
+   unpickle -- the cheapest clone the state allows; a deep copy when the
+   state cannot be pickled) and simply discards the fork afterwards, so
+   there is no rollback bookkeeping.
+3. Picks the candidate to sample by UCB1, applies it to the fork, finishes
+   the current card with ``resolve_card_turn`` (the seats that already
+   acted are replayed, not re-run), then plays ``depth`` more cards with
+   the bots.
+4. Scores the leaf with ``victory.calculate_victory_margin``: own margin
+   minus the best rival's (a finished game scores the winner outright).
+
+Hidden information is determinized per rollout: the fork gets its own rng
+(seeded from the agent's rng; a counter-based game rng is forked) and the
+unseen deck below the visible next card is reshuffled, Winter cards keeping
+their slots. The search is open-loop at the root only (a flat UCT) -- the
+bot seats are fixed policies, so deeper own-decision nodes would mostly
+re-sample the same bot lines.
+
+Budget by ``rollouts`` or wall-clock ``seconds``; ``last_search`` and
+``stats`` report rollouts/sec, a direct throughput figure for engine work.
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import math
+import pickle
+import random
+import time
+
+from fs_bot.rules_consts import FACTIONS, EVENT_SHADED, EVENT_UNSHADED
+from fs_bot.bots.bot_dispatch import bot_decision
+from fs_bot.engine import events, moves
+from fs_bot.engine.game_engine import (
+    ACTION_PASS, ACTION_EVENT, ACTION_COMMAND, ACTION_COMMAND_SA,
+    get_eligible_factions, resolve_card_turn, advance_to_next_card,
+    is_winter_card, play_card,
+)
+from fs_bot.engine.victory import (
+    calculate_victory_margin, VictoryError,
+)
+
+# A finished game is worth more than any margin a card or two can swing.
+_WIN_SCORE = 100.0
+
+
+def evaluate(state, faction, winner=None):
+    """Leaf value for ``faction``: own victory margin minus the best rival's
+    (Factions that do not track victory in this scenario are skipped)."""
+    if winner is not None:
+        return _WIN_SCORE if winner == faction else -_WIN_SCORE
+    margins = {}
+    for f in FACTIONS:
+        try:
+            margins[f] = calculate_victory_margin(state, f)
+        except VictoryError:
+            continue
+    own = margins.pop(faction, 0)
+    return own - max(margins.values(), default=0)
+
+
+def determinize(state, rng):
+    """Reseed ``state``'s rng from ``rng`` and reshuffle the unseen deck:
+    every card below the visible next card, Winter cards held in place.
+    A game rng that can ``fork`` (the counter-based backend) is forked, so
+    the rollout keeps the game's backend."""
+    stream = rng.getrandbits(64)
+    fork = getattr(state.get("rng"), "fork", None)
+    state["rng"] = fork(stream) if fork is not None else random.Random(stream)
+    deck = state.get("deck") or []
+    slots = [i for i in range(1, len(deck)) if not is_winter_card(deck[i])]
+    cards = [deck[i] for i in slots]
+    rng.shuffle(cards)
+    for i, c in zip(slots, cards):
+        deck[i] = c
+
+
+def first_action_from_options(options):
+    """The 1st Eligible's effective action, read back from the 2nd
+    Eligible's options (§2.3.4 gives each a distinct option set)."""
+    opts = set(options)
+    if ACTION_COMMAND in opts:
+        return ACTION_EVENT
+    if ACTION_EVENT in opts:
+        return ACTION_COMMAND_SA
+    return ACTION_COMMAND
+
+
+def _finish_card(state, faction, decision, position, history, policy,
+                 first_action=None):
+    """Resolve the rest of the current card on a fork after ``faction``'s
+    ``decision``: ``resolve_card_turn`` with the seats that already acted
+    replayed from ``history`` (``{faction: decision}``).
+
+    A seat planner sees no history. Every Faction ahead of a 1st Eligible
+    passed; ahead of a 2nd Eligible one acted -- taken to be the earliest,
+    with ``first_action`` -- and the rest passed."""
+    eligible = get_eligible_factions(state)
+    ahead = eligible[:eligible.index(faction)] if faction in eligible else []
+    acted = {f: history[f] for f in ahead if f in history}
+    if (position != "2nd_eligible"
+            or any(d["action"] != ACTION_PASS for d in acted.values())):
+        first_action = None
+    for f in ahead:
+        if f not in acted:
+            if first_action is not None:
+                acted[f], first_action = {"action": first_action}, None
+            else:
+                acted[f] = {"action": ACTION_PASS}
+
+    def decide(st, f, options, pos):
+        return decision if f == faction else policy(st, f, options, pos)
+
+    resolve_card_turn(state, decide, execute=True, acted=acted)
+
+
+class MCTSAgent:
+    """Search agent for one seat. Use ``decision_func`` as the game's
+    decision callback (it plays the other seats with the bots and records
+    each card's earlier decisions for the rollouts), or ``plan_turn`` as a
+    seat planner alongside another driver's bots."""
+
+    def __init__(self, faction, *, rollouts=None, seconds=None, depth=4,
+                 max_candidates=24, exploration=2.0, seed=0, policy=None):
+        if rollouts is None and seconds is None:
+            rollouts = 64
+        self.faction = faction
+        self.rollouts = rollouts
+        self.seconds = seconds
+        self.depth = depth
+        self.max_candidates = max_candidates
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.policy = policy or bot_decision
+        self.last_search = None
+        self.stats = {"decisions": 0, "rollouts": 0, "seconds": 0.0,
+                      "failed_rollouts": 0}
+        self._history = (None, {})
+
+    # -- decision_func -------------------------------------------------- #
+    def decision_func(self, state, faction, options, position):
+        card = state.get("current_card")
+        if self._history[0] != card:
+            self._history = (card, {})
+        if faction == self.faction:
+            decision = self.plan_turn(state, faction, options, position)
+        else:
+            decision = self.policy(state, faction, options, position)
+        # The engine rewrites "action" in place for an SA that did nothing;
+        # holding the dict keeps the effective action for _finish_card.
+        self._history[1][faction] = decision
+        return decision
+
+    # -- candidates ----------------------------------------------------- #
+    def candidates(self, state, faction, options, position):
+        cands = [{"action": ACTION_PASS}] if ACTION_PASS in options else []
+        if ACTION_EVENT in options:
+            for side in (EVENT_UNSHADED, EVENT_SHADED):
+                cands.append({"action": ACTION_EVENT, "bot_action": {
+                    "command": "Event", "details": {
+                        "card_id": state.get("current_card"),
+                        "text_preference": side}}})
+        first_action = (first_action_from_options(options)
+                        if position == "2nd_eligible" else None)
+        plans = list(moves.iter_legal_plans(
+            state, faction, position, first_action=first_action,
+            limit=self.max_candidates))
+        cands += [d for d in plans if d["action"] in options]
+        # Drop plans that would not execute (Pass needs no dry-run).
+        with contextlib.redirect_stdout(io.StringIO()):
+            checked = iter(moves.validate_many(
+                state, faction,
+                [c for c in cands if c["action"] != ACTION_PASS],
+                decisions=True))
+        return [c for c in cands
+                if c["action"] == ACTION_PASS or next(checked)[0]]
+
+    # -- search --------------------------------------------------------- #
+    def plan_turn(self, state, faction, options, position):
+        # Dry runs and rollouts are not moves of the game being played, so
+        # they stay off the event stream.
+        with events.muted():
+            return self._search(state, faction, options, position)
+
+    def _search(self, state, faction, options, position):
+        t0 = time.perf_counter()
+        cands = self.candidates(state, faction, options, position)
+        if not cands:
+            return {"action": ACTION_PASS}
+        if len(cands) == 1:
+            return cands[0]
+        snap = moves.snapshot(state)
+        card, history = self._history
+        history = dict(history) if card == state.get("current_card") else {}
+        first_action = (first_action_from_options(options)
+                        if position == "2nd_eligible" else None)
+        n = [0] * len(cands)
+        total = [0.0] * len(cands)
+        done = 0
+        deadline = None if self.seconds is None else t0 + self.seconds
+        with contextlib.redirect_stdout(io.StringIO()):
+            while True:
+                if self.rollouts is not None and done >= self.rollouts:
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                i = self._select(n, total, done)
+                total[i] += self.rollout(state, snap, faction, cands[i],
+                                         position, history, first_action)
+                n[i] += 1
+                done += 1
+        elapsed = time.perf_counter() - t0
+        best = max(range(len(cands)),
+                   key=lambda k: (n[k], total[k] / n[k] if n[k] else 0))
+        self.last_search = {
+            "candidates": len(cands), "rollouts": done,
+            "seconds": round(elapsed, 4),
+            "rollouts_per_sec": round(done / elapsed, 2) if elapsed else None,
+            "visits": n, "best": best,
+            "value": total[best] / n[best] if n[best] else None,
+        }
+        self.stats["decisions"] += 1
+        self.stats["rollouts"] += done
+        self.stats["seconds"] += elapsed
+        return pickle.loads(pickle.dumps(cands[best]))
+
+    def _select(self, n, total, done):
+        for i, visits in enumerate(n):
+            if visits == 0:
+                return i
+        log_t = math.log(done)
+        return max(range(len(n)), key=lambda i: (
+            total[i] / n[i] + self.exploration * math.sqrt(log_t / n[i])))
+
+    def rollout(self, state, snap, faction, decision, position, history,
+                first_action=None):
+        """One determinized rollout of ``decision`` from ``state`` (forked
+        from ``snap``, its ``moves.snapshot``, when there is one); returns
+        its leaf value. The fork is thrown away afterwards -- nothing to
+        roll back."""
+        sim = moves._fork(state, snap)
+        determinize(sim, self.rng)
+        decision = pickle.loads(pickle.dumps(decision))
+        try:
+            _finish_card(sim, faction, decision, position, history,
+                         self.policy, first_action)
+            if advance_to_next_card(sim) is None:
+                return evaluate(sim, faction)
+            for _ in range(self.depth):
+                res = play_card(sim, self.policy, execute=True)
+                if res.get("game_over"):
+                    return evaluate(sim, faction, res.get("winner"))
+        except Exception:
+            # A rollout the engine cannot finish tells us nothing either way;
+            # count it so a broken rollout path shows up in the stats.
+            self.stats["failed_rollouts"] += 1
+            return 0.0
+        return evaluate(sim, faction)
+
+    def rollouts_per_sec(self):
+        s = self.stats["seconds"]
+        return self.stats["rollouts"] / s if s else None
@@ -15,7 +15,6 @@ Reference:
 import math
 
 from fs_bot.rules_consts import (
-    EVENT_UNSHADED,
     # Factions
     ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS,
     FACTIONS,
@@ -40,6 +39,7 @@ from fs_bot.board.pieces import (
     count_pieces, count_pieces_by_state, get_leader_in_region,
     remove_piece, flip_piece, clear_allied_tribe,
 )
+from fs_bot.cards.capabilities import capability_view
 
 
 # ============================================================================
@@ -57,12 +57,7 @@ def _a33_motivation_active(state):
     designer Q&A, BGG thread 2079436 (and errata-thread Abatis
     clarification: marker/card text = "Event effects").
     """
-    from fs_bot.rules_consts import EVENT_SHADED
-    from fs_bot.cards.capabilities import is_capability_active
-    if state.get("event_modifiers", {}).get(
-            "card_A31_cancel_german_benefits"):
-        return False
-    return is_capability_active(state, "A33", EVENT_SHADED)
+    return capability_view(state).motivation
 
 def calculate_losses(state, region, attacking_faction, defending_faction,
                      *, is_retreat=False, is_counterattack=False,
@@ -132,10 +127,8 @@ def calculate_losses(state, region, attacking_faction, defending_faction,
     )
     # A31 shaded CAPABILITY "Stalwart": named enemy Leaders do not double
     # Losses to Germans.
-    from fs_bot.cards.capabilities import is_capability_active
-    from fs_bot.rules_consts import EVENT_SHADED as _ESH
-    _a31_stalwart = (defending_faction == GERMANS
-                     and is_capability_active(state, "A31", _ESH))
+    cv = capability_view(state)
+    _a31_stalwart = defending_faction == GERMANS and cv.phalanx_stalwart
     if _a31_stalwart:
         caesar_attacking = False
 
@@ -161,7 +154,7 @@ def calculate_losses(state, region, attacking_faction, defending_faction,
     if caesar_attacking:
         # §3.2.4: "two per Legion instead of just one per Legion"
         # Card 15 shaded: Caesar doubles the Loss of 1 Legion only.
-        if is_capability_active(state, 15, _ESH) and enemy_legions > 0:
+        if cv.legio_x_shaded and enemy_legions > 0:
             component_a = enemy_legions + 1
         else:
             component_a = enemy_legions * 2
@@ -180,9 +173,7 @@ def calculate_losses(state, region, attacking_faction, defending_faction,
     aux_factor = 1.0 if double_auxilia else 0.5
     # Card 59 unshaded (Germanic Horse): Roman Auxilia inflict 1 Loss each
     # in the flagged Region this Battle Command (attack and counterattack).
-    if (enemy_faction == ROMANS
-            and state.get("event_modifiers", {}).get(
-                "card59_unshaded_region") == region):
+    if enemy_faction == ROMANS and cv.germanic_horse_region == region:
         aux_factor = 1.0
     component_b = leader_value + enemy_auxilia * aux_factor
 
@@ -203,8 +194,7 @@ def calculate_losses(state, region, attacking_faction, defending_faction,
     # Doubles total losses unless enemy (faction taking losses) is Defending
     # with Fort or Citadel. But an Attacker always takes double in
     # counterattack even with Fort/Citadel.
-    if ariovistus_in_battle and not state.get("event_modifiers", {}).get(
-            "card_A31_no_ario_double"):
+    if ariovistus_in_battle and not cv.no_ario_double:
         defender_pieces = space.get("pieces", {}).get(defending_faction, {})
         _m2 = state.get("markers", {}).get(region, {})
         from fs_bot.rules_consts import MARKER_ABATIS as _MAB
@@ -233,12 +223,9 @@ def calculate_losses(state, region, attacking_faction, defending_faction,
         _m = state.get("markers", {}).get(region, {})
         _abatis = _m.get(MARKER_ABATIS) == defending_faction
         if _abatis:
-            if (defending_faction == GERMANS and state.get(
-                    "event_modifiers", {}).get(
-                        "card_A31_cancel_german_benefits")):
+            if defending_faction == GERMANS and cv.german_benefits_cancelled:
                 _abatis = False
-            elif (enemy_faction == GERMANS
-                    and is_capability_active(state, "A31", _ESH)):
+            elif enemy_faction == GERMANS and cv.phalanx_stalwart:
                 _abatis = False
         if _abatis:
             # recompute component B without the negated Auxilia
@@ -264,18 +251,15 @@ def calculate_losses(state, region, attacking_faction, defending_faction,
 
         # Card 27 unshaded: Arverni attack inflicts 1 fewer Defender
         # Loss before any halving.
-        if (enemy_faction == ARVERNI
-                and is_capability_active(state, 27, EVENT_UNSHADED)):
+        if enemy_faction == ARVERNI and cv.gallic_archers:
             total = max(0.0, total - 1)
 
         # Card 59 shaded: the owner doubles the enemy's Losses in the
         # flagged Region unless the Defender has Fort/Citadel.
-        if (state.get("event_modifiers", {}).get(
-                "card59_shaded_region") == region
-                and not (has_fort or has_citadel)):
-            from fs_bot.cards.capabilities import get_capability_owner
-            if get_capability_owner(state, 59) == enemy_faction:
-                total *= 2
+        if (cv.germanic_horse_tips_region == region
+                and not (has_fort or has_citadel)
+                and cv.germanic_horse_owner == enemy_faction):
+            total *= 2
 
         if (is_retreat or has_fort or has_citadel or motivated_defender
                 or _abatis):
@@ -284,12 +268,10 @@ def calculate_losses(state, region, attacking_faction, defending_faction,
         # Card 59 shaded (Tips): the owner ALSO doubles when defending —
         # their Counterattack in the flagged Region — unless they defend
         # with a Citadel.
-        if (state.get("event_modifiers", {}).get(
-                "card59_shaded_region") == region):
-            from fs_bot.cards.capabilities import get_capability_owner
-            if (get_capability_owner(state, 59) == enemy_faction
-                    and enemy_pieces.get(CITADEL, 0) == 0):
-                total *= 2
+        if (cv.germanic_horse_tips_region == region
+                and cv.germanic_horse_owner == enemy_faction
+                and enemy_pieces.get(CITADEL, 0) == 0):
+            total *= 2
 
         # Motivation: the German Counterattack (Germans firing back, i.e.
         # attacking_faction == GERMANS here) inflicts +1 Loss. Applied after
@@ -304,7 +286,7 @@ def calculate_losses(state, region, attacking_faction, defending_faction,
 
     # Card 15 unshaded: Battles with Roman Leader AND Legion — final
     # Losses Romans inflict +2; final Losses against Romans -1.
-    if is_capability_active(state, 15, EVENT_UNSHADED):
+    if cv.legio_x:
         if (get_leader_in_region(state, region, ROMANS) is not None
                 and count_pieces(state, region, ROMANS, LEGION) > 0):
             if enemy_faction == ROMANS:
@@ -330,9 +312,8 @@ def card30_arverni_legion_warbands(state, region, faction):
     (0, 1, or 2): 0 unless the capability is active, the Faction is Arverni, and
     the Arverni Leader is in the Battle Region.
     """
-    from fs_bot.rules_consts import ARVERNI, WARBAND, EVENT_SHADED
-    from fs_bot.cards.capabilities import is_capability_active
-    if faction != ARVERNI or not is_capability_active(state, 30, EVENT_SHADED):
+    from fs_bot.rules_consts import ARVERNI, WARBAND
+    if faction != ARVERNI or not capability_view(state).vercingetorix_elite:
         return 0
     if get_leader_in_region(state, region, ARVERNI) is None:
         return 0
@@ -500,9 +481,7 @@ def resolve_losses(state, region, faction, num_losses, *,
                 # Card 10 unshaded: "Battle rolls remove Forts on 1-2
                 # not 1-3" — Roman Forts are more defensible.
                 if piece_type == FORT:
-                    from fs_bot.cards.capabilities import (
-                        is_capability_active as _ica10)
-                    if _ica10(state, 10, EVENT_UNSHADED):
+                    if capability_view(state).ballistae:
                         threshold = 2
 
             if roll <= threshold:
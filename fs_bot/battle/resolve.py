@@ -39,14 +39,17 @@ from fs_bot.rules_consts import (
 from fs_bot.board.pieces import (
     count_pieces, count_pieces_by_state, get_leader_in_region,
     move_piece, flip_piece, remove_piece, clear_allied_tribe,
+    batched,
 )
-from fs_bot.board.control import refresh_all_control
+from fs_bot.cards.capabilities import capability_view
+from fs_bot.engine import events
 from fs_bot.map.map_data import get_adjacent, is_adjacent
 from fs_bot.battle.losses import (calculate_losses, resolve_losses,
                                   _remove_battle_piece,
                                   card30_arverni_legion_warbands)
 
 
+@batched
 def resolve_battle(state, region, attacking_faction, defending_faction,
                    *, is_ambush=False, besiege_target=None,
                    retreat_declaration=None, retreat_region=None,
@@ -133,11 +136,11 @@ def resolve_battle(state, region, attacking_faction, defending_faction,
         # either voluntarily or when they are forced to by combat"
         can_retreat = False
     elif (defending_faction == GERMANS
-          and state.get("event_modifiers", {}).get("card_A33_no_german_retreat")):
+          and capability_view(state).no_german_retreat):
         # A33 Wailing Women: Germans never Retreat.
         can_retreat = False
     elif (defending_faction == BELGAE
-          and state.get("event_modifiers", {}).get("card_A70_no_belgae_retreat")):
+          and capability_view(state).no_belgae_retreat):
         # A70: Belgae never Retreat.
         can_retreat = False
     elif (defending_faction == ARVERNI
@@ -320,11 +323,8 @@ def resolve_battle(state, region, attacking_faction, defending_faction,
     # — §4.2.3: "even after the Citadel is removed"
     # Card 10 unshaded: "Besiege cancels Citadel's halving of Losses."
     _c10_citadel = had_citadel_at_start
-    if besiege_target is not None:
-        from fs_bot.cards.capabilities import is_capability_active as _ica
-        from fs_bot.rules_consts import EVENT_UNSHADED as _EUN
-        if _ica(state, 10, _EUN):
-            _c10_citadel = False
+    if besiege_target is not None and capability_view(state).ballistae:
+        _c10_citadel = False
     attack_losses = _calculate_attack_losses(
         state, region, attacking_faction, defending_faction,
         is_retreat=defender_retreats,
@@ -416,8 +416,7 @@ def resolve_battle(state, region, attacking_faction, defending_faction,
         # A33 Wailing Women: unless Ariovistus is on the map, remove the
         # Germans' outnumbered Warbands after they Counterattack.
         if (defending_faction == GERMANS
-                and state.get("event_modifiers", {}).get(
-                    "card_A33_remove_outnumbered")):
+                and capability_view(state).remove_outnumbered):
             from fs_bot.board.pieces import find_leader as _find_leader
             ario_on_map = _find_leader(state, GERMANS) is not None
             g_wb = count_pieces(state, region, GERMANS, WARBAND)
@@ -451,9 +450,13 @@ def resolve_battle(state, region, attacking_faction, defending_faction,
         )
         result["retreat"] = retreat_result
 
-    # Refresh control after battle — pieces moved/removed
-    refresh_all_control(state)
-
+    if events.enabled:
+        counter = result["counterattack"] or {}
+        events.emit(events.BATTLE, state, attacking_faction, region=region,
+                    defender=defending_faction, ambush=is_ambush,
+                    losses=(result["attack"] or {}).get("losses_taken", 0),
+                    counter_losses=counter.get("losses_taken", 0),
+                    retreated=result["defender_retreated"])
     return result
 
 
@@ -506,9 +509,8 @@ def _calculate_attack_losses(state, region, attacking_faction,
 
     scenario = state["scenario"]
 
-    from fs_bot.cards.capabilities import is_capability_active
-    from fs_bot.rules_consts import (EVENT_SHADED as _ESH, GERMANS as _GE,
-                                     ROMANS as _RO59)
+    from fs_bot.rules_consts import GERMANS as _GE, ROMANS as _RO59
+    cv = capability_view(state)
 
     # Leader modifiers
     caesar_attacking = (enemy_leader == CAESAR)
@@ -516,8 +518,7 @@ def _calculate_attack_losses(state, region, attacking_faction,
     # A31 shaded CAPABILITY "Stalwart": "named enemy Leaders do not double
     # Losses to Germans" — Caesar's x2 Legions and Ambiorix's x1 Warbands
     # revert to normal rates against a German defender.
-    if (defending_faction == _GE
-            and is_capability_active(state, "A31", _ESH)):
+    if defending_faction == _GE and cv.phalanx_stalwart:
         caesar_attacking = False
         ambiorix_attacking = False
     ariovistus_in_battle = (
@@ -534,11 +535,9 @@ def _calculate_attack_losses(state, region, attacking_faction,
     # attackers.
     _abatis_active = _abatis_defends(state, region, defending_faction)
     if _abatis_active:
-        if (defending_faction == _GE and state.get(
-                "event_modifiers", {}).get("card_A31_cancel_german_benefits")):
+        if defending_faction == _GE and cv.german_benefits_cancelled:
             _abatis_active = False
-        elif (attacking_faction == _GE
-                and is_capability_active(state, "A31", _ESH)):
+        elif attacking_faction == _GE and cv.phalanx_stalwart:
             _abatis_active = False
     if _abatis_active:
         enemy_auxilia = 0  # negates all Losses caused by Auxilia
@@ -547,7 +546,7 @@ def _calculate_attack_losses(state, region, attacking_faction,
     if caesar_attacking:
         # Card 15 shaded: "Caesar attacking in Battle doubles Loss
         # inflicted by 1 Legion only (not by all Legions)."
-        if is_capability_active(state, 15, _ESH) and enemy_legions > 0:
+        if cv.legio_x_shaded and enemy_legions > 0:
             component_a = enemy_legions + 1
         else:
             component_a = enemy_legions * 2
@@ -562,9 +561,7 @@ def _calculate_attack_losses(state, region, attacking_faction,
     aux_factor = 1.0 if double_auxilia else 0.5
     # Card 59 unshaded: Roman Auxilia inflict 1 Loss each in the flagged
     # Region this Battle Command.
-    if (attacking_faction == _RO59
-            and state.get("event_modifiers", {}).get(
-                "card59_unshaded_region") == region):
+    if attacking_faction == _RO59 and cv.germanic_horse_region == region:
         aux_factor = 1.0
     component_b = leader_value + enemy_auxilia * aux_factor
 
@@ -579,39 +576,31 @@ def _calculate_attack_losses(state, region, attacking_faction,
 
     # Ariovistus doubling — A3.2.4 (an Abatis "acts as a Fort" for the
     # defender, so it also blocks the doubling — card A64)
-    if ariovistus_in_battle and not state.get("event_modifiers", {}).get(
-            "card_A31_no_ario_double"):
+    if ariovistus_in_battle and not cv.no_ario_double:
         if not (had_fort_at_start or had_citadel_at_start or _abatis_active):
             total *= 2
 
     # A33 shaded CAPABILITY "Motivation": "Defending Germans suffer 1/2
     # Losses whether or not Retreating" — halving applies once, never
     # quartered. Source: A Card Reference, card A33.
-    _motivated = (defending_faction == _GE
-                  and is_capability_active(state, "A33", _ESH)
-                  # A31 unshaded cancels Event effects benefitting
-                  # Germans in Battle (capabilities included — BGG
-                  # thread 2079436).
-                  and not state.get("event_modifiers", {}).get(
-                      "card_A31_cancel_german_benefits"))
+    # A31 unshaded cancels Event effects benefitting Germans in Battle
+    # (capabilities included — BGG thread 2079436); cv.motivation folds
+    # that in.
+    _motivated = defending_faction == _GE and cv.motivation
 
     # Card 27 unshaded: "Arverni Battle each Region inflicts 1 fewer
     # Defender Loss (before any halving)" — Arverni attack step only.
     from fs_bot.rules_consts import (ARVERNI as _ARV, ROMANS as _RO,
-                                     EVENT_UNSHADED as _EUN2,
                                      LEGION as _LG2)
-    if (attacking_faction == _ARV
-            and is_capability_active(state, 27, _EUN2)):
+    if attacking_faction == _ARV and cv.gallic_archers:
         total = max(0.0, total - 1)
 
     # Card 59 shaded: the owner doubles enemy Losses in the flagged
     # Region unless the Defender has Fort/Citadel (at-start state).
-    if (state.get("event_modifiers", {}).get(
-            "card59_shaded_region") == region
-            and not (had_fort_at_start or had_citadel_at_start)):
-        from fs_bot.cards.capabilities import get_capability_owner
-        if get_capability_owner(state, 59) == attacking_faction:
-            total *= 2
+    if (cv.germanic_horse_tips_region == region
+            and not (had_fort_at_start or had_citadel_at_start)
+            and cv.germanic_horse_owner == attacking_faction):
+        total *= 2
 
     # Halving — use original state
     if (is_retreat or had_citadel_at_start or had_fort_at_start
@@ -623,7 +612,7 @@ def _calculate_attack_losses(state, region, attacking_faction,
     # Card 15 unshaded: "In Battles that have Roman Leader and Legion,
     # final Losses against Romans -1 and final Losses that Romans
     # inflict +2" (Tip: fully calculate first, then subtract or add).
-    if is_capability_active(state, 15, _EUN2):
+    if cv.legio_x:
         _ro_leader = get_leader_in_region(state, region, _RO) is not None
         _ro_legion = count_pieces(state, region, _RO, _LG2) > 0
         if _ro_leader and _ro_legion:
@@ -0,0 +1,84 @@
+"""Golden mid-game states — the inputs every benchmark runs on.
+
+A benchmark of ``count_pieces`` on a freshly set-up board measures the
+setup position, not the crowded boards the bots spend their time on. The
+corpus is a fixed set of bot-only games stopped after a fixed number of
+cards and written with ``serialize.save_game``:
+
+    corpus/<scenario-slug>-s<seed>-c<cards>.json
+
+The engine is deterministic for a given (scenario, seed) under a pinned
+hash seed, so a point always captures the same state; recapture after a
+change to the state layout with ``python -m fs_bot.bench.run --capture``.
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import re
+from pathlib import Path
+
+import fs_bot.rules_consts as rc
+from fs_bot.engine.game_engine import start_game, play_card
+from fs_bot.state.serialize import save_game, load_game
+from fs_bot.tools import farm
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+
+# (scenario, seed, cards played). The Gallic War point at 50 cards is past
+# the Interlude.
+POINTS = (
+    (rc.SCENARIO_PAX_GALLICA, 1, 12),
+    (rc.SCENARIO_RECONQUEST, 1, 15),
+    (rc.SCENARIO_GREAT_REVOLT, 1, 20),
+    (rc.SCENARIO_ARIOVISTUS, 1, 20),
+    (rc.SCENARIO_GALLIC_WAR, 1, 20),
+    (rc.SCENARIO_GALLIC_WAR, 1, 50),
+)
+
+
+def point_name(scenario, seed, cards):
+    """The file stem of a corpus point."""
+    slug = re.sub(r"[^a-z0-9]+", "-", scenario.lower()).strip("-")
+    return f"{slug}-s{seed}-c{cards}"
+
+
+def capture_state(scenario, seed, cards):
+    """Play the bot-only game (scenario, seed) for ``cards`` cards and
+    return its state, ready for the next card."""
+    state = farm.new_game(scenario, seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start_game(state)
+        for _ in range(cards):
+            if play_card(state, farm.bot_decision,
+                         execute=True)["game_over"]:
+                raise ValueError(f"{scenario} seed {seed} ended before "
+                                 f"card {cards}")
+    return state
+
+
+def capture(points=POINTS, directory=CORPUS_DIR):
+    """Write every point in ``points`` under ``directory``; returns the
+    paths written."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for scenario, seed, cards in points:
+        path = directory / f"{point_name(scenario, seed, cards)}.json"
+        save_game(capture_state(scenario, seed, cards), path,
+                  meta={"scenario": scenario, "seed": seed, "cards": cards})
+        paths.append(path)
+    return paths
+
+
+def load_corpus(directory=CORPUS_DIR):
+    """``[(name, state), ...]`` for every saved state, by name."""
+    out = []
+    for path in sorted(Path(directory).glob("*.json")):
+        state, _meta, _log = load_game(path)
+        out.append((path.stem, state))
+    if not out:
+        raise FileNotFoundError(
+            f"No corpus states in {directory}; "
+            f"run python -m fs_bot.bench.run --capture")
+    return out
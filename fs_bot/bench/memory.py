@@ -0,0 +1,218 @@
+"""Memory profiling — peak and retained memory per game, phase and subsystem.
+
+Opt-in, on the stdlib ``tracemalloc``. A profile listens on the event
+stream (fs_bot.engine.events) and measures at every card start (CARD) and
+after every Winter phase (WINTER_PHASE):
+
+    with memory.profiling() as prof:
+        farm.play_game(scenario, seed)
+    report = prof.report()
+    print(memory.format_report(report))
+
+A report holds, relative to the game's start:
+
+  peak, retained       the highest traced memory during the game, and what
+                       was still allocated once it returned (bytes)
+  phases               per span label — "event card", "winter card" (the
+                       Winter card outside its phases), "winter:<phase>" —
+                       the spans seen, net bytes and the highest peak
+  subsystems           the retained bytes by the innermost fs_bot frame
+                       that allocated them: bots, execute, card_effects,
+                       battle, winter (with the Interlude), engine (the
+                       rest of fs_bot), other (no fs_bot frame within
+                       TRACE_FRAMES, e.g. deep in a deepcopy)
+  process              the traced memory left after each game profiled in
+                       this process, and ``leak``: it grew across each of
+                       the last LEAK_GAMES games by more than LEAK_BYTES
+
+Tracing makes a game several times slower. Subsystem attribution traces
+TRACE_FRAMES frames per allocation, slower again, and takes a snapshot at
+the game's start and end; ``profiling(snapshots=False)`` keeps only the
+totals. Tracing starts on first use, with the frame depth that use needs,
+and keeps running for the life of the process so growth across games
+stays visible. ``farm.run(..., memory=True)``
+(``--memory`` on the farm tools) profiles every game of a batch.
+"""
+from __future__ import annotations
+
+import contextlib
+import gc
+import os
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+from fs_bot.engine import events
+
+SUBSYSTEMS = ("bots", "execute", "card_effects", "battle", "winter",
+              "engine", "other")
+
+TRACE_FRAMES = 4
+LEAK_GAMES = 3
+LEAK_BYTES = 64 * 1024
+
+_PKG = str(Path(__file__).resolve().parent.parent) + os.sep
+_RULES = (
+    ("bots" + os.sep, "bots"),
+    (os.path.join("engine", "execute.py"), "execute"),
+    (os.path.join("cards", "card_effects.py"), "card_effects"),
+    ("battle" + os.sep, "battle"),
+    (os.path.join("engine", "winter.py"), "winter"),
+    (os.path.join("engine", "interlude.py"), "winter"),
+)
+_OWN = (tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, tracemalloc.__file__))
+
+_KINDS = frozenset({events.CARD, events.WINTER_PHASE, events.GAME_OVER})
+
+# Traced memory after each profiled game in this process.
+_history = []
+
+
+def subsystem(traceback):
+    """The subsystem of the innermost fs_bot frame in ``traceback``."""
+    for frame in reversed(traceback):
+        if frame.filename.startswith(_PKG):
+            rel = frame.filename[len(_PKG):]
+            for prefix, name in _RULES:
+                if rel.startswith(prefix):
+                    return name
+            return "engine"
+    return "other"
+
+
+def leak(history, games=LEAK_GAMES, threshold=LEAK_BYTES):
+    """True when ``history`` (memory after each game) grew across each of
+    the last ``games`` games, by more than ``threshold`` in all."""
+    if len(history) <= games:
+        return False
+    tail = history[-games - 1:]
+    steps = [b - a for a, b in zip(tail, tail[1:])]
+    return all(s > 0 for s in steps) and sum(steps) > threshold
+
+
+class MemoryProfile:
+    """Event sink measuring traced memory between boundaries."""
+
+    def __init__(self, snapshots=True):
+        self.snapshots = snapshots
+        self.phases = {}
+        self._open = "setup"
+        self._start = self._last = None
+        self._peak = 0
+        self._subs = None
+        self._report = None
+
+    def _by_subsystem(self):
+        if not self.snapshots:
+            return None
+        snap = tracemalloc.take_snapshot().filter_traces(_OWN)
+        out = Counter()
+        for stat in snap.statistics("traceback"):
+            out[subsystem(stat.traceback)] += stat.size
+        return out
+
+    def begin(self):
+        self._subs = self._by_subsystem()
+        gc.collect()                    # the snapshot's own garbage
+        tracemalloc.reset_peak()
+        self._start = self._last = tracemalloc.get_traced_memory()[0]
+
+    def _close(self, label):
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        phase = self.phases.setdefault(
+            label, {"spans": 0, "net": 0, "peak": 0})
+        phase["spans"] += 1
+        phase["net"] += current - self._last
+        phase["peak"] = max(phase["peak"], peak - self._start)
+        self._peak = max(self._peak, peak - self._start)
+        self._last = current
+
+    def __call__(self, event):
+        if event.kind == events.CARD:
+            self._close(self._open)
+            self._open = f"{event.data.get('type')} card"
+        elif event.kind == events.WINTER_PHASE:
+            self._close(f"winter:{event.data.get('phase')}")
+        elif event.kind == events.GAME_OVER:
+            self._close(self._open)
+            self._open = "after game"
+
+    def end(self):
+        self._close(self._open)
+        gc.collect()
+        current = tracemalloc.get_traced_memory()[0]
+        _history.append(current)
+        subs = self._by_subsystem()
+        self._report = {
+            "peak": self._peak,
+            "retained": current - self._start,
+            "phases": self.phases,
+            "subsystems": (None if subs is None else
+                           {k: subs.get(k, 0) - self._subs.get(k, 0)
+                            for k in SUBSYSTEMS}),
+            "process": {"pid": os.getpid(), "games": len(_history),
+                        "growth": current - _history[0],
+                        "leak": leak(_history)},
+        }
+
+    def report(self):
+        """The report of the profiled block (a plain, picklable dict)."""
+        return self._report
+
+
+@contextlib.contextmanager
+def profiling(snapshots=True):
+    """Profile the block; yields the MemoryProfile."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACE_FRAMES if snapshots else 1)
+    prof = MemoryProfile(snapshots)
+    prof.begin()
+    with events.subscribe(prof, kinds=_KINDS):
+        yield prof
+    prof.end()
+
+
+def _kib(n):
+    return f"{n / 1024:,.0f} KiB"
+
+
+def format_report(report, label=""):
+    """One report as indented text."""
+    proc = report["process"]
+    lines = [f"{label}peak {_kib(report['peak'])}, retained "
+             f"{_kib(report['retained'])}; process {proc['pid']} after "
+             f"{proc['games']} game(s): {_kib(proc['growth'])} grown"
+             + ("  <-- LEAK?" if proc["leak"] else "")]
+    for name, p in sorted(report["phases"].items(),
+                          key=lambda kv: -kv[1]["peak"]):
+        lines.append(f"  {name:22s} x{p['spans']:<3d} peak "
+                     f"{_kib(p['peak']):>12s}  net {_kib(p['net']):>10s}")
+    if report["subsystems"] is not None:
+        lines.append("  retained by subsystem: " + ", ".join(
+            f"{k} {_kib(v)}" for k, v in report["subsystems"].items() if v))
+    return "\n".join(lines)
+
+
+def summarize(reports):
+    """Totals over many games' reports: the worst peak, mean retained, and
+    the processes flagged as leaking."""
+    reports = [r for r in reports if r]
+    if not reports:
+        return "memory: no games profiled"
+    last = {}
+    for r in reports:
+        last[r["process"]["pid"]] = r["process"]
+    leaking = sorted(pid for pid, p in last.items() if p["leak"])
+    text = (f"memory: {len(reports)} game(s), worst peak "
+            f"{_kib(max(r['peak'] for r in reports))}, mean retained "
+            f"{_kib(sum(r['retained'] for r in reports) / len(reports))}; "
+            f"growth per process: " + ", ".join(
+                f"{pid} {_kib(p['growth'])}" for pid, p in sorted(
+                    last.items())))
+    if leaking:
+        text += (f"\nmemory: LEAK? traced memory grew across each of the "
+                 f"last {LEAK_GAMES} games in process(es) "
+                 f"{', '.join(map(str, leaking))}")
+    return text
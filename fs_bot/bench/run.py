@@ -0,0 +1,139 @@
+"""Speed guardrail: the benchmark suite vs a stored baseline.
+
+Times every benchmark in fs_bot.bench.suite on the golden corpus
+(fs_bot.bench.corpus) and fails when one is slower than ``baseline.json``
+by more than ``--band`` (a fraction: 0.5 = 50% slower). Timings are
+machine-specific; rebaseline on the machine that runs the check, and after
+an *intended* slowdown, with ``--update``.
+
+    python -m fs_bot.bench.run                   # check (exit 1 on regression)
+    python -m fs_bot.bench.run --update          # rebaseline
+    python -m fs_bot.bench.run --groups micro    # micro,bots,execute,games
+    python -m fs_bot.bench.run --capture         # rewrite the corpus states
+    python -m fs_bot.bench.run --memory          # also profile one game per
+                                                 # scenario (bench.memory)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+from pathlib import Path
+
+# Pin the hash seed (re-exec once) so captured corpus states and the bots'
+# decisions on them are the same on every run, as balance_smoke does.
+_HASHSEED = "0"
+if os.environ.get("PYTHONHASHSEED") != _HASHSEED and __name__ == "__main__":
+    os.environ["PYTHONHASHSEED"] = _HASHSEED
+    os.execv(sys.executable, [sys.executable, "-m",
+                              "fs_bot.bench.run"] + sys.argv[1:])
+
+import fs_bot.rules_consts as rc
+from fs_bot.bench import corpus as _corpus
+from fs_bot.bench import memory, suite
+from fs_bot.tools import farm
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+
+def compare(baseline, current, band):
+    """``(name, base, now, ratio, regressed)`` for every benchmark in both;
+    ratio is now / base."""
+    rows = []
+    for name, now in current.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = now / base
+        rows.append((name, base, now, ratio, ratio > 1 + band))
+    return rows
+
+
+def _fmt(seconds):
+    if seconds >= 1e-1:
+        return f"{seconds:8.3f} s "
+    if seconds >= 1e-4:
+        return f"{seconds * 1e3:8.3f} ms"
+    return f"{seconds * 1e6:8.2f} µs"
+
+
+def _profile_games(seed=1):
+    print("\n=== memory (one game per scenario) ===")
+    for scenario in rc.ALL_SCENARIOS:
+        with memory.profiling() as prof:
+            farm.play_game(scenario, seed)
+        print(memory.format_report(prof.report(), f"{scenario}: "))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--groups", default=",".join(suite.GROUPS))
+    ap.add_argument("--band", type=float, default=0.5)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--min-time", type=float, default=0.2)
+    ap.add_argument("--update", action="store_true")
+    ap.add_argument("--capture", action="store_true",
+                    help="Rewrite the corpus states and exit.")
+    ap.add_argument("--baseline", default=str(BASELINE_PATH))
+    ap.add_argument("--memory", action="store_true",
+                    help="After timing, profile the memory of one game per "
+                         "scenario (untimed).")
+    args = ap.parse_args(argv)
+
+    if args.capture:
+        for path in _corpus.capture():
+            print(f"captured {path.name}")
+        return 0
+
+    groups = [g for g in args.groups.split(",") if g]
+    unknown = set(groups) - set(suite.GROUPS)
+    if unknown:
+        ap.error(f"unknown group(s) {sorted(unknown)}; "
+                 f"expected {','.join(suite.GROUPS)}")
+    bpath = Path(args.baseline)
+    stored = (json.loads(bpath.read_text()) if bpath.exists()
+              else {"results": {}})
+
+    current = {}
+    for bench in suite.benches(_corpus.load_corpus(), groups):
+        current[bench.name] = suite.measure(bench, args.repeat,
+                                            args.min_time)
+        line = f"{bench.name:40s} {_fmt(current[bench.name])}"
+        if bench.group == suite.GAMES:
+            line += f"  ({1 / current[bench.name]:.1f} games/s)"
+        print(line, flush=True)
+    if args.memory:
+        _profile_games()
+
+    if args.update:
+        stored["results"].update(current)
+        stored["python"] = platform.python_version()
+        stored["machine"] = platform.machine()
+        bpath.write_text(json.dumps(stored, indent=1, sort_keys=True) + "\n")
+        print(f"\nBaseline updated: {bpath} "
+              f"({len(stored['results'])} benchmarks)")
+        return 0
+
+    rows = compare(stored["results"], current, args.band)
+    if not rows:
+        print("\nNo overlapping baseline benchmarks. Run with --update first.")
+        return 2
+    print("\n=== baseline -> current ===")
+    for name, base, now, ratio, regressed in rows:
+        flag = f"  <-- SLOWER > +{args.band:.0%}" if regressed else ""
+        print(f"  {name:40s} {_fmt(base)} -> {_fmt(now)} "
+              f"({ratio - 1:+.0%}){flag}")
+    slow = [r[0] for r in rows if r[4]]
+    if slow:
+        print(f"\nFAIL: {len(slow)} benchmark(s) slower than the band: "
+              f"{', '.join(slow)}")
+        print("If intended: python -m fs_bot.bench.run --update")
+        return 1
+    print(f"\nOK: {len(rows)} benchmark(s) within band.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
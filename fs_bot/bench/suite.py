@@ -0,0 +1,177 @@
+"""The benchmarks: hot primitives, bot turns, executed Commands, whole games.
+
+Each :class:`Bench` times one sweep — every call of its primitive over the
+whole corpus — and reports seconds per call:
+
+  micro    count_pieces, calculate_control, has_supply_line,
+           calculate_victory_margin, predict_battle, prevalidate_rally_plan
+  bots     dispatch_bot_turn per Faction, on every corpus state where that
+           Faction is a bot
+  execute  execute_decision per Command, replaying the bots' own decisions
+  games    one whole bot-only game per scenario (seeds 1-3)
+
+Every sweep runs on fresh copies of the corpus states from ``setup``,
+outside the timed region — so the bots and executor never change the
+corpus, and no sweep reads the caches a previous one left on a state.
+"""
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+import fs_bot.rules_consts as rc
+from fs_bot.board.control import calculate_control
+from fs_bot.board.pieces import count_pieces
+from fs_bot.board.tribes import tribe_index
+from fs_bot.bots.bot_common import predict_battle, prevalidate_rally_plan
+from fs_bot.commands.rally import has_supply_line
+from fs_bot.engine.execute import execute_decision
+from fs_bot.engine.game_engine import (
+    ACTION_COMMAND, ACTION_COMMAND_SA, ACTION_EVENT, ACTION_LIMITED_COMMAND,
+    ACTION_PASS, get_sop_factions,
+)
+from fs_bot.engine.victory import calculate_victory_margin
+from fs_bot.tools import farm
+
+MICRO, BOTS, EXECUTE, GAMES = "micro", "bots", "execute", "games"
+GROUPS = (MICRO, BOTS, EXECUTE, GAMES)
+
+GAME_SEEDS = (1, 2, 3)
+_OPTIONS = (ACTION_COMMAND_SA, ACTION_COMMAND, ACTION_LIMITED_COMMAND,
+            ACTION_EVENT, ACTION_PASS)
+
+
+class Bench(NamedTuple):
+    """One benchmark. ``run(setup())`` is one sweep of ``calls`` calls."""
+    name: str
+    group: str
+    run: Callable[[Any], Any]
+    calls: int
+    setup: Optional[Callable[[], Any]] = None
+    repeat: Optional[int] = None        # None: the runner's default
+
+
+def measure(bench, repeat=3, min_time=0.2):
+    """Seconds per call: the best of ``repeat`` rounds, each round running
+    sweeps until ``min_time`` has been spent in them."""
+    best = float("inf")
+    for _ in range(bench.repeat or repeat):
+        n, spent = 0, 0.0
+        while n == 0 or spent < min_time:
+            arg = bench.setup() if bench.setup is not None else None
+            t0 = time.perf_counter()
+            bench.run(arg)
+            spent += time.perf_counter() - t0
+            n += 1
+        best = min(best, spent / n)
+    return best / bench.calls
+
+
+def _sweep(fn):
+    def run(args):
+        for a in args:
+            fn(*a)
+    return run
+
+
+def _draft_rally_plan(state):
+    """Every Subdued Tribe as an Ally and a Warband everywhere — the widest
+    plan a bot would hand the filter."""
+    return {"allies": [{"region": rc.TRIBE_TO_REGION.get(t), "tribe": t}
+                       for t in tribe_index(state).everywhere(rc.SUBDUED)
+                       if rc.TRIBE_TO_REGION.get(t)],
+            "warbands": list(state["spaces"])}
+
+
+def micro_benches(corpus):
+    states = [s for _, s in corpus]
+    spaces = [(s, r) for s in states for r in s["spaces"]]
+    sop = [(s, f) for s in states for f in get_sop_factions(s)]
+    args = {
+        "count_pieces": (count_pieces, [(s, r, f) for s, r in spaces
+                                        for f in rc.FACTIONS]),
+        "calculate_control": (calculate_control, spaces),
+        "has_supply_line": (has_supply_line, spaces),
+        "calculate_victory_margin": (calculate_victory_margin, sop),
+        "predict_battle": (predict_battle, [
+            (s, r, att, d) for s, r in spaces
+            for att in get_sop_factions(s) for d in rc.FACTIONS
+            if d != att and count_pieces(s, r, att)
+            and count_pieces(s, r, d)]),
+        "prevalidate_rally_plan": (prevalidate_rally_plan, [
+            (s, f, _draft_rally_plan(s)) for s, f in sop
+            if f != rc.ROMANS]),
+    }
+    # One deepcopy per sweep copies each state once (the memo shares it
+    # across that state's argument tuples).
+    return [Bench(name, MICRO, _sweep(fn), len(a),
+                  setup=lambda a=a: copy.deepcopy(a))
+            for name, (fn, a) in args.items() if a]
+
+
+def _bot_states(corpus, faction):
+    return [s for _, s in corpus if faction in get_sop_factions(s)
+            and faction in s.get("non_player_factions", ())]
+
+
+def _decide(state, faction):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return farm.bot_decision(state, faction, _OPTIONS, "1st_eligible")
+
+
+def bot_benches(corpus):
+    out = []
+    for faction in rc.FACTIONS:
+        states = _bot_states(corpus, faction)
+        if not states:
+            continue
+
+        def run(copies, faction=faction):
+            for st in copies:
+                _decide(st, faction)
+        out.append(Bench(f"dispatch_bot_turn[{faction}]", BOTS, run,
+                         len(states), setup=lambda s=states: [
+                             copy.deepcopy(st) for st in s]))
+    return out
+
+
+def execute_benches(corpus):
+    by_command = {}
+    for faction in rc.FACTIONS:
+        for state in _bot_states(corpus, faction):
+            sim = copy.deepcopy(state)
+            decision = _decide(sim, faction)
+            command = (decision.get("bot_action") or {}).get("command")
+            if command:
+                by_command.setdefault(command, []).append(
+                    (sim, faction, decision))
+    out = []
+    for command in sorted(by_command):
+        cases = by_command[command]
+
+        def run(prepared):
+            with contextlib.redirect_stdout(io.StringIO()):
+                for st, faction, decision in prepared:
+                    execute_decision(st, faction, decision)
+        out.append(Bench(f"execute_decision[{command}]", EXECUTE, run,
+                         len(cases), setup=lambda c=cases: copy.deepcopy(c)))
+    return out
+
+
+def game_benches(scenarios=rc.ALL_SCENARIOS, seeds=GAME_SEEDS):
+    def bench(scenario):
+        def run(_):
+            for seed in seeds:
+                farm.play_game(scenario, seed)
+        return Bench(f"game[{scenario}]", GAMES, run, len(seeds), repeat=1)
+    return [bench(s) for s in scenarios]
+
+
+def benches(corpus, groups=GROUPS):
+    """Every benchmark in ``groups``."""
+    build = {MICRO: micro_benches, BOTS: bot_benches,
+             EXECUTE: execute_benches, GAMES: lambda _: game_benches()}
+    return [b for g in GROUPS if g in groups for b in build[g](corpus)]
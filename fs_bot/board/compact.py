@@ -0,0 +1,297 @@
+"""
+Compact piece storage — every Region's pieces in one int16 buffer.
+
+By default a Region keeps its pieces in nested dicts
+(``space["pieces"][faction][HIDDEN][WARBAND]``), a few hundred small dicts
+per state. A state packed with :func:`compact_pieces` keeps them in one
+``array('h')`` laid out like the ``pieces`` block of a board row
+(fs_bot.state.encode): Region x Faction x slot, slot 0 the Leader
+(1 + index in LEADER_NAMES), then Legion, Fort, Ally, Citadel, Settlement
+and Auxilia/Warband x Hidden/Revealed/Scouted.
+
+    state = setup_scenario(scenario, seed=7, piece_backend=PIECES_COMPACT)
+
+Each ``space["pieces"]`` is then a :class:`RegionPieces` view over the
+shared buffer that reads and writes like the dicts it replaces, so the
+board/pieces API, and code that indexes the dicts, work unchanged;
+``count_pieces`` and ``count_pieces_by_state`` read the buffer directly.
+A deepcopy or pickle of the state copies the buffer once and the Region
+views share the copy.
+
+The views differ from the dicts in three ways. A zero count is absent,
+not stored as 0. A Faction with no pieces in the Region is not a key,
+though it can still be indexed. The Leader slot holds only names in
+LEADER_NAMES. Saves store the dict form plus ``state["piece_backend"]``,
+and load_game packs the pieces again.
+
+Reference: §1.4
+"""
+
+import copy
+from array import array
+from collections.abc import MutableMapping
+
+from fs_bot.rules_consts import (
+    FACTIONS, ALL_REGIONS, LEADER, HIDDEN, REVEALED, SCOUTED,
+    FLIPPABLE_PIECES,
+)
+from fs_bot.state.encode import (
+    LEADER_NAMES, COUNT_SLOTS, FLIP_SLOTS, PIECE_SLOTS,
+)
+
+PIECES_DICT = "dict"
+PIECES_COMPACT = "compact"
+PIECE_BACKENDS = (PIECES_DICT, PIECES_COMPACT)
+
+_NF = len(FACTIONS)
+_BLOCK = _NF * PIECE_SLOTS                  # one Region
+SIZE = len(ALL_REGIONS) * _BLOCK
+
+_REGION_IX = {r: i for i, r in enumerate(ALL_REGIONS)}
+_FACTION_IX = {f: i for i, f in enumerate(FACTIONS)}
+_LEADER_CODE = {name: i for i, name in enumerate(LEADER_NAMES, 1)}
+_COUNT_SLOT = {pt: k for k, pt in enumerate(COUNT_SLOTS, 1)}
+_FLIP_SLOT = {key: k for k, key in enumerate(FLIP_SLOTS,
+                                             1 + len(COUNT_SLOTS))}
+_STATES = (HIDDEN, REVEALED, SCOUTED)
+# piece type -> its slots; a Leader slot counts as one piece when set.
+_TYPE_SLOTS = dict({pt: (k,) for pt, k in _COUNT_SLOT.items()}, **{
+    pt: tuple(_FLIP_SLOT[(pt, ps)] for ps in _STATES)
+    for pt in FLIPPABLE_PIECES})
+_PIECE_SLOTS = tuple(range(1, PIECE_SLOTS))
+
+
+def _leader_code(name):
+    if name is None:
+        return 0
+    code = _LEADER_CODE.get(name)
+    if code is None:
+        raise ValueError(f"Unknown Leader {name!r} (compact pieces hold "
+                         f"{LEADER_NAMES})")
+    return code
+
+
+class _StatePieces(MutableMapping):
+    """``fp[HIDDEN]``: Auxilia/Warband counts in one piece state."""
+
+    __slots__ = ("_buf", "_off", "_state")
+
+    def __init__(self, buf, off, piece_state):
+        self._buf, self._off, self._state = buf, off, piece_state
+
+    def _slot(self, piece_type):
+        k = _FLIP_SLOT.get((piece_type, self._state))
+        if k is None:
+            raise KeyError(piece_type)
+        return self._off + k
+
+    def __getitem__(self, piece_type):
+        return self._buf[self._slot(piece_type)]
+
+    def __setitem__(self, piece_type, n):
+        self._buf[self._slot(piece_type)] = n
+
+    def __delitem__(self, piece_type):
+        self._buf[self._slot(piece_type)] = 0
+
+    def __iter__(self):
+        buf, off, ps = self._buf, self._off, self._state
+        return iter([pt for pt in FLIPPABLE_PIECES
+                     if buf[off + _FLIP_SLOT[(pt, ps)]]])
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, piece_type):
+        k = _FLIP_SLOT.get((piece_type, self._state))
+        return k is not None and self._buf[self._off + k] != 0
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class FactionPieces(MutableMapping):
+    """``space["pieces"][faction]`` over the buffer."""
+
+    __slots__ = ("_buf", "_off")
+
+    def __init__(self, buf, off):
+        self._buf, self._off = buf, off
+
+    def __getitem__(self, key):
+        if key == LEADER:
+            code = self._buf[self._off]
+            return LEADER_NAMES[code - 1] if code else None
+        k = _COUNT_SLOT.get(key)
+        if k is not None:
+            return self._buf[self._off + k]
+        if key in _STATES:
+            return _StatePieces(self._buf, self._off, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == LEADER:
+            self._buf[self._off] = _leader_code(value)
+        elif key in _COUNT_SLOT:
+            self._buf[self._off + _COUNT_SLOT[key]] = value
+        elif key in _STATES:
+            counts = dict(value)
+            bucket = _StatePieces(self._buf, self._off, key)
+            for pt in FLIPPABLE_PIECES:
+                bucket[pt] = 0
+            bucket.update(counts)
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key):
+        self[key] = None if key == LEADER else (
+            {} if key in _STATES else 0)
+
+    def __iter__(self):
+        buf, off = self._buf, self._off
+        keys = [LEADER] if buf[off] else []
+        keys.extend(pt for pt, k in _COUNT_SLOT.items() if buf[off + k])
+        keys.extend(_STATES)
+        return iter(keys)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key == LEADER:
+            return self._buf[self._off] != 0
+        k = _COUNT_SLOT.get(key)
+        if k is not None:
+            return self._buf[self._off + k] != 0
+        return key in _STATES
+
+    def __repr__(self):
+        return repr(_faction_dict(self))
+
+
+def _faction_dict(fp):
+    out = {ps: dict(fp[ps]) for ps in _STATES}
+    for key in fp:
+        if key not in _STATES:
+            out[key] = fp[key]
+    return out
+
+
+class RegionPieces(MutableMapping):
+    """``space["pieces"]`` of a packed state: Faction -> FactionPieces."""
+
+    __slots__ = ("_buf", "_region")
+
+    def __init__(self, buf, region):
+        self._buf, self._region = buf, region
+
+    def _off(self, faction):
+        f = _FACTION_IX.get(faction)
+        if f is None:
+            raise KeyError(faction)
+        return _REGION_IX[self._region] * _BLOCK + f * PIECE_SLOTS
+
+    def __getitem__(self, faction):
+        return FactionPieces(self._buf, self._off(faction))
+
+    def __setitem__(self, faction, pieces):
+        off = self._off(faction)
+        if isinstance(pieces, FactionPieces):
+            pieces = _faction_dict(pieces)
+        self._buf[off:off + PIECE_SLOTS] = array("h", bytes(2 * PIECE_SLOTS))
+        FactionPieces(self._buf, off).update(pieces)
+
+    def __delitem__(self, faction):
+        self[faction] = {}
+
+    def __iter__(self):
+        buf = self._buf
+        base = _REGION_IX[self._region] * _BLOCK
+        return iter([f for i, f in enumerate(FACTIONS)
+                     if any(buf[base + i * PIECE_SLOTS:
+                                base + (i + 1) * PIECE_SLOTS])])
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, faction):
+        return faction in _FACTION_IX and faction in list(self)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def __deepcopy__(self, memo):
+        return RegionPieces(copy.deepcopy(self._buf, memo), self._region)
+
+    def __reduce__(self):
+        return RegionPieces, (self._buf, self._region)
+
+    def to_dict(self):
+        """The nested-dict form of these pieces."""
+        return {f: _faction_dict(self[f]) for f in self}
+
+    def count(self, faction=None, piece_type=None):
+        """``count_pieces`` read straight from the buffer."""
+        buf = self._buf
+        base = _REGION_IX[self._region] * _BLOCK
+        if faction is None:
+            offs = range(base, base + _BLOCK, PIECE_SLOTS)
+        else:
+            offs = (base + _FACTION_IX[faction] * PIECE_SLOTS,)
+        total = 0
+        if piece_type is None or piece_type == LEADER:
+            total += sum(1 for off in offs if buf[off])
+            if piece_type == LEADER:
+                return total
+        slots = (_PIECE_SLOTS if piece_type is None
+                 else _TYPE_SLOTS[piece_type])
+        for off in offs:
+            for k in slots:
+                total += buf[off + k]
+        return total
+
+    def count_state(self, faction, piece_type, piece_state):
+        """``count_pieces_by_state`` read straight from the buffer."""
+        return self._buf[_REGION_IX[self._region] * _BLOCK
+                         + _FACTION_IX[faction] * PIECE_SLOTS
+                         + _FLIP_SLOT[(piece_type, piece_state)]]
+
+
+def piece_backend(state):
+    """PIECES_DICT or PIECES_COMPACT."""
+    return state.get("piece_backend", PIECES_DICT)
+
+
+def compact_pieces(state):
+    """Pack ``state``'s pieces into one buffer, in place; returns state."""
+    if piece_backend(state) == PIECES_COMPACT:
+        return state
+    buf = array("h", bytes(2 * SIZE))
+    for region, space in state.get("spaces", {}).items():
+        view = RegionPieces(buf, region)
+        for faction, pieces in (space.get("pieces") or {}).items():
+            view[faction] = pieces
+        space["pieces"] = view
+    state["piece_backend"] = PIECES_COMPACT
+    return state
+
+
+def dict_pieces(state):
+    """Unpack a packed state back to nested dicts, in place; returns
+    state."""
+    if piece_backend(state) != PIECES_COMPACT:
+        return state
+    for space in state.get("spaces", {}).values():
+        space["pieces"] = space["pieces"].to_dict()
+    del state["piece_backend"]
+    return state
+
+
+def set_piece_backend(state, backend):
+    """Store ``state``'s pieces with ``backend``, in place."""
+    if backend == PIECES_COMPACT:
+        return compact_pieces(state)
+    if backend == PIECES_DICT:
+        return dict_pieces(state)
+    raise ValueError(f"Unknown piece backend: {backend!r} "
+                     f"(expected one of {PIECE_BACKENDS})")
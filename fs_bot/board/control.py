@@ -23,6 +23,7 @@ from fs_bot.rules_consts import (
     FACTION_CONTROL,
     ARIOVISTUS_SCENARIOS,
 )
+from fs_bot.board import pieces as _pieces
 
 
 def _count_faction_forces(space, faction, scenario):
@@ -114,6 +115,9 @@ def calculate_control(state, region):
 def refresh_all_control(state):
     """Recalculate control for all regions and update markers.
 
+    For pieces changed through board.pieces, wrap the changes in
+    ``batch_mutations`` instead: it refreshes only the regions touched.
+
     Args:
         state: Game state dict. Modified in place.
     """
@@ -133,6 +137,8 @@ def is_controlled_by(state, region, faction):
     Returns:
         True if the faction controls the region.
     """
+    if _pieces._BATCHES:
+        _pieces.flush_control(state)
     space = state["spaces"].get(region, {})
     return space.get("control") == FACTION_CONTROL.get(faction)
 
@@ -150,6 +156,8 @@ def get_controlled_regions(state, faction):
     ctrl = FACTION_CONTROL.get(faction)
     if ctrl is None:
         return []
+    if _pieces._BATCHES:
+        _pieces.flush_control(state)
     return [
         region for region, space in state["spaces"].items()
         if space.get("control") == ctrl
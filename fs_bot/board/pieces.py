@@ -8,6 +8,9 @@ Never manipulate piece counts in space dictionaries directly.
 Reference: §1.4, §1.4.1, §1.4.2, §1.4.3, A1.4
 """
 
+import contextlib
+import functools
+
 from fs_bot.rules_consts import (
     # Factions
     ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS,
@@ -35,6 +38,11 @@ from fs_bot.rules_consts import (
     # Tribe stacking
     TRIBE_FACTION_RESTRICTION,
 )
+from fs_bot.engine import events as _events
+from fs_bot.state import invariants as _invariants
+from fs_bot.state.caches import KEY as CACHES, state_caches
+from fs_bot.board.tribes import tribe_changed
+from fs_bot.board.compact import RegionPieces, PIECES_COMPACT
 
 
 class PieceError(Exception):
@@ -76,6 +84,10 @@ def _get_faction_cap(state, faction, piece_type):
 def _count_on_map(state, faction, piece_type):
     """Count how many of a piece type a faction has on the map."""
     total = 0
+    if state.get("piece_backend") == PIECES_COMPACT:
+        for space in state["spaces"].values():
+            total += space["pieces"].count(faction, piece_type)
+        return total
     for region, space in state["spaces"].items():
         pieces = space.get("pieces", {}).get(faction, {})
         if piece_type == LEADER:
@@ -190,6 +202,9 @@ def count_pieces(state, region, faction=None, piece_type=None):
         Integer count.
     """
     space = state["spaces"].get(region, {})
+    pieces = space.get("pieces")
+    if type(pieces) is RegionPieces:
+        return pieces.count(faction, piece_type)
     total = 0
 
     factions_to_check = [faction] if faction else list(space.get("pieces", {}).keys())
@@ -239,6 +254,9 @@ def count_pieces_by_state(state, region, faction, piece_type, piece_state):
     if piece_type not in FLIPPABLE_PIECES:
         raise PieceError(f"{piece_type} is not flippable")
     space = state["spaces"].get(region, {})
+    pieces = space.get("pieces")
+    if type(pieces) is RegionPieces:
+        return pieces.count_state(faction, piece_type, piece_state)
     return space.get("pieces", {}).get(faction, {}).get(
         piece_state, {}
     ).get(piece_type, 0)
@@ -688,6 +706,10 @@ def flip_piece(state, region, faction, piece_type, count=1, *,
     f_pieces[actual_to][piece_type] = (
         f_pieces[actual_to].get(piece_type, 0) + count
     )
+    bump_board_version(state, region)
+    if _events.enabled:
+        _events.emit(_events.PIECE_FLIP, state, faction, region=region,
+                     piece_type=piece_type, count=count, to=actual_to)
 
 
 def get_leader_in_region(state, region, faction):
@@ -761,6 +783,7 @@ def clear_allied_tribe(state, region, faction, removed_piece_type):
         # Subdued again (status holds Dispersed markers only).
         if tribes[tribe].get("status") == "Allied":
             tribes[tribe]["status"] = None
+        tribe_changed(state, tribe)
         return tribe
 
     if removed_piece_type == CITADEL:
@@ -790,7 +813,58 @@ def clear_allied_tribe(state, region, faction, removed_piece_type):
 # Control is a region-local function of the pieces in that region (§1.6), so
 # each mutating helper now refreshes exactly the region(s) it touched.
 
+def board_version(state):
+    """A counter that every piece operation here advances. Caches of
+    values derived from the map key on it; code that must edit piece
+    counts directly calls :func:`bump_board_version` afterwards, naming
+    the region(s) it edited."""
+    return state.get("board_version", 0)
+
+
+# Change tracking, cached on the state as (spaces dict, {region: version of
+# its last change}, [version before which changes are unknown]). Started by
+# the first changed_regions call.
+
+def bump_board_version(state, *regions):
+    """Advance the board version after ``regions`` changed (none given:
+    the change could be anywhere)."""
+    version = state.get("board_version", 0) + 1
+    state["board_version"] = version
+    if _BATCHES:
+        pending = _pending(state)
+        if pending is not None:
+            pending.update(regions or state.get("spaces", ()))
+    caches = state.get(CACHES)
+    hit = caches and caches.get("changes")
+    if hit:
+        if regions:
+            changed = hit[1]
+            for region in regions:
+                changed[region] = version
+        else:
+            hit[2][0] = version
+
+
+def changed_regions(state, since):
+    """The regions whose pieces or Control changed after board version
+    ``since``, or None when that is not known — the changes predate
+    tracking, one was not attributed to a region, or the spaces were
+    replaced (rollback, restore). Callers rebuild everything on None."""
+    version = board_version(state)
+    spaces = state.get("spaces")
+    caches = state_caches(state)
+    hit = caches.get("changes")
+    if hit is None or hit[0] is not spaces:
+        caches["changes"] = (spaces, {}, [version])
+        return frozenset() if since == version else None
+    if since < hit[2][0] or since > version:
+        return None
+    return frozenset(r for r, v in hit[1].items() if v > since)
+
+
 def _refresh_region_control(state, *regions):
+    if _BATCHES and _pending(state) is not None:
+        return      # bump_board_version queues the regions
     from fs_bot.board.control import calculate_control
     spaces = state.get("spaces", {})
     for region in regions:
@@ -798,13 +872,99 @@ def _refresh_region_control(state, *regions):
             spaces[region]["control"] = calculate_control(state, region)
 
 
+# ============================================================================
+# Batched mutations — one Control refresh per touched region
+# ============================================================================
+# A Command, SA or game-run phase moves many pieces, often through the same
+# regions. Inside batch_mutations the per-operation refresh above is
+# deferred: each changed region is queued (direct writers queue theirs by
+# naming it to bump_board_version; a bump naming none queues every region)
+# and Control is recomputed once per region when the batch ends. The
+# Control readers in board.control, and checked mode, flush first, so
+# nothing reads a stale flag mid-batch.
+
+# id(state) -> (state, set of regions whose Control is pending). Holding the
+# state keeps its id from being reused while batched.
+_BATCHES = {}
+
+
+def _pending(state):
+    hit = _BATCHES.get(id(state))
+    if hit is not None and hit[0] is state:
+        return hit[1]
+    return None
+
+
+@contextlib.contextmanager
+def batch_mutations(state):
+    """Defer Control refreshes on ``state`` to the end of the block, then
+    recompute Control once for each region changed inside it. Nests: only
+    the outermost block refreshes."""
+    if _pending(state) is not None:
+        yield
+        return
+    _BATCHES[id(state)] = (state, set())
+    try:
+        yield
+    finally:
+        try:
+            flush_control(state)
+        finally:
+            del _BATCHES[id(state)]
+
+
+def batched(func):
+    """Decorator: run ``func(state, ...)`` inside ``batch_mutations(state)``
+    — for Commands, SAs and phases that change many pieces."""
+    @functools.wraps(func)
+    def wrapper(state, *args, **kwargs):
+        with batch_mutations(state):
+            return func(state, *args, **kwargs)
+    return wrapper
+
+
+def flush_control(state):
+    """Recompute Control now for the regions a batch on ``state`` has
+    queued (no-op outside a batch)."""
+    pending = _pending(state)
+    if not pending:
+        return
+    from fs_bot.board.control import calculate_control
+    spaces = state.get("spaces", {})
+    regions = [r for r in spaces if r in pending]
+    pending.clear()
+    changed = []
+    for region in regions:
+        space = spaces[region]
+        ctrl = calculate_control(state, region)
+        if space.get("control") != ctrl:
+            space["control"] = ctrl
+            changed.append(region)
+    if changed:
+        # Views built mid-batch showed the old flags.
+        bump_board_version(state, *changed)
+        pending.difference_update(changed)
+
+
 _place_piece_inner = place_piece
 
 
 def place_piece(state, region, faction, piece_type, count=1, **kwargs):
+    if _invariants.enabled:
+        flush_control(state)
+        _invariants.before_piece_op(state, "place_piece", (region,), region,
+                                    faction, piece_type, count)
     result = _place_piece_inner(state, region, faction, piece_type, count,
                                 **kwargs)
     _refresh_region_control(state, region)
+    bump_board_version(state, region)
+    if _invariants.enabled:
+        _invariants.after_piece_op(state, "place_piece", (region,), faction,
+                                   piece_type, region, faction, piece_type,
+                                   count)
+    if _events.enabled:
+        _events.emit(_events.PIECE_PLACE, state, faction, region=region,
+                     piece_type=piece_type, count=count)
     return result
 
 
@@ -814,9 +974,21 @@ _remove_piece_inner = remove_piece
 
 
 def remove_piece(state, region, faction, piece_type, count=1, **kwargs):
+    if _invariants.enabled:
+        flush_control(state)
+        _invariants.before_piece_op(state, "remove_piece", (region,), region,
+                                    faction, piece_type, count)
     result = _remove_piece_inner(state, region, faction, piece_type, count,
                                  **kwargs)
     _refresh_region_control(state, region)
+    bump_board_version(state, region)
+    if _invariants.enabled:
+        _invariants.after_piece_op(state, "remove_piece", (region,), faction,
+                                   piece_type, region, faction, piece_type,
+                                   count)
+    if _events.enabled:
+        _events.emit(_events.PIECE_REMOVE, state, faction, region=region,
+                     piece_type=piece_type, count=count)
     return result
 
 
@@ -827,9 +999,22 @@ _move_piece_inner = move_piece
 
 def move_piece(state, from_region, to_region, faction, piece_type, count=1,
                **kwargs):
+    regions = (from_region, to_region)
+    if _invariants.enabled:
+        flush_control(state)
+        _invariants.before_piece_op(state, "move_piece", regions, from_region,
+                                    to_region, faction, piece_type, count)
     result = _move_piece_inner(state, from_region, to_region, faction,
                                piece_type, count, **kwargs)
     _refresh_region_control(state, from_region, to_region)
+    bump_board_version(state, from_region, to_region)
+    if _invariants.enabled:
+        _invariants.after_piece_op(state, "move_piece", regions, faction,
+                                   piece_type, from_region, to_region,
+                                   faction, piece_type, count)
+    if _events.enabled:
+        _events.emit(_events.PIECE_MOVE, state, faction, region=from_region,
+                     to=to_region, piece_type=piece_type, count=count)
     return result
 
 
@@ -0,0 +1,198 @@
+"""
+Tribe status index — which Tribes are Subdued, Dispersed or Allied, by Region.
+
+``state["tribes"]`` is keyed by Tribe, so "how many Tribes are Subdued" or
+"the Dispersed Tribes in Belgic-Controlled Regions" walks every entry.
+:func:`tribe_index` answers from a per-Region index instead:
+
+    idx = tribe_index(state)
+    idx.count(SUBDUED)              # Subdued Tribes on the map (§1.7)
+    idx.count(AEDUI)                # Tribes Allied to the Aedui
+    idx.tribes(region, DISPERSED)   # in tribes-dict order
+    idx.labels(tribe)               # frozenset({BELGAE}), ...
+    idx.stamp(region)               # advances when a Tribe there changes
+    idx.stamp()                     # ... anywhere on the map
+
+A Tribe's labels are the Faction it is Allied to, its status marker
+(DISPERSED, DISPERSED_GATHERING, MARKER_RAZED), or SUBDUED when it has
+neither. Dynamic Tribes (Card 71 Colony) are indexed under the Region their
+entry carries.
+
+The index is kept in the state's cache slot (:mod:`fs_bot.state.caches`)
+and built on first use. The tribe mutators (``_ally_tribe``/
+``_unally_tribe``, setup's ``_set_tribe_*``, Seize Dispersal, Spring) call
+:func:`tribe_changed` after a write, which updates it in place. A direct
+write to ``state["tribes"]`` without the call is still seen:
+:func:`tribe_index` compares every Tribe's ``allied_faction``, ``status``
+and ``region`` with what the index last saw (one pass over the dict, no
+rebuild) and re-indexes the ones that differ. A state whose tribes dict was
+replaced (rollback, restore, copy) gets a fresh index.
+
+Reference: §1.4.2, §1.7, §3.2.3, §6.6
+"""
+
+from collections import Counter
+
+from fs_bot.rules_consts import (
+    FACTIONS, SUBDUED, DISPERSED, DISPERSED_GATHERING, TRIBE_TO_REGION,
+)
+from fs_bot.state.caches import KEY as CACHES, state_caches
+
+
+_CLAIMED = frozenset(FACTIONS + (DISPERSED, DISPERSED_GATHERING))
+_NO_LABELS = frozenset()
+
+
+def _seen(tribes):
+    """``{tribe: (allied_faction, status, region)}`` — what the index is
+    built from."""
+    return {t: (info.get("allied_faction"), info.get("status"),
+                info.get("region"))
+            for t, info in tribes.items()}
+
+
+def _labels(info):
+    allied = info.get("allied_faction")
+    status = info.get("status")
+    if allied is None:
+        return frozenset((SUBDUED if status is None else status,))
+    if status is None:
+        return frozenset((allied,))
+    return frozenset((allied, status))
+
+
+class TribeIndex:
+    """Tribes by Region and label, with a count per label."""
+
+    __slots__ = ("_regions", "_counts", "_where", "_order", "_stamps",
+                 "_updates", "_seen")
+
+    def __init__(self, tribes):
+        self._regions = {}      # region -> {label: set of tribes}
+        self._counts = Counter()
+        self._where = {}        # tribe -> (region, labels)
+        self._order = {}        # tribe -> tribes-dict position
+        self._stamps = Counter()    # region -> updates to its Tribes
+        self._updates = 0
+        self._seen = {}         # tribe -> its entry as last indexed
+        for tribe, info in tribes.items():
+            self.update(tribe, info)
+
+    def update(self, tribe, info):
+        """Re-index ``tribe`` from its tribes-dict entry ``info`` (None:
+        the Tribe is gone)."""
+        self._updates += 1
+        self._seen.pop(tribe, None)
+        old = self._where.pop(tribe, None)
+        if old is not None:
+            self._stamps[old[0]] += 1
+            buckets = self._regions[old[0]]
+            for label in old[1]:
+                buckets[label].discard(tribe)
+                self._counts[label] -= 1
+        if info is None:
+            return
+        self._order.setdefault(tribe, len(self._order))
+        self._seen[tribe] = (info.get("allied_faction"), info.get("status"),
+                             info.get("region"))
+        region = info.get("region") or TRIBE_TO_REGION.get(tribe)
+        labels = _labels(info)
+        self._stamps[region] += 1
+        buckets = self._regions.setdefault(region, {})
+        for label in labels:
+            buckets.setdefault(label, set()).add(tribe)
+            self._counts[label] += 1
+        self._where[tribe] = (region, labels)
+
+    def count(self, label):
+        """Tribes carrying ``label`` across the map."""
+        return self._counts[label]
+
+    def tribes(self, region, label):
+        """Tribes in ``region`` carrying ``label``, in tribes-dict order."""
+        found = self._regions.get(region, {}).get(label)
+        if not found:
+            return ()
+        return tuple(sorted(found, key=self._order.__getitem__))
+
+    def everywhere(self, label):
+        """Tribes carrying ``label`` anywhere, in tribes-dict order."""
+        found = [t for buckets in self._regions.values()
+                 for t in buckets.get(label, ())]
+        return tuple(sorted(found, key=self._order.__getitem__))
+
+    def labels(self, tribe):
+        """The labels of ``tribe`` (empty for a Tribe not in the state)."""
+        where = self._where.get(tribe)
+        return where[1] if where is not None else _NO_LABELS
+
+    def region(self, tribe):
+        """The Region ``tribe`` is indexed under (None if not indexed)."""
+        where = self._where.get(tribe)
+        return where[0] if where is not None else None
+
+    def stamp(self, region=None):
+        """A count that advances whenever a Tribe of ``region`` (of any
+        Region when None) is re-indexed; with the index's identity, a key
+        for caches."""
+        if region is None:
+            return self._updates
+        return self._stamps[region]
+
+    def is_open(self, tribe):
+        """No Ally and no Dispersed marker — the Tribes Rally may Ally and
+        Seize may Disperse (§3.2.1, §3.2.3)."""
+        return self.labels(tribe).isdisjoint(_CLAIMED)
+
+    def sync(self, tribes):
+        """Re-index the Tribes whose entry in ``tribes`` changed since the
+        index last saw it; returns them."""
+        now = _seen(tribes)
+        if now == self._seen:
+            return []
+        changed = [t for t, entry in now.items()
+                   if self._seen.get(t) != entry]
+        changed.extend(t for t in self._seen if t not in now)
+        for tribe in changed:
+            self.update(tribe, tribes.get(tribe))
+        return changed
+
+    def stale(self, tribes):
+        """Tribes whose entry in ``tribes`` disagrees with the index."""
+        out = [t for t, info in tribes.items()
+               if self._where.get(t) != (info.get("region")
+                                         or TRIBE_TO_REGION.get(t),
+                                         _labels(info))]
+        out.extend(t for t in self._where if t not in tribes)
+        return out
+
+
+def tribe_index(state):
+    """The TribeIndex of ``state``; treat it as read-only."""
+    tribes = state.get("tribes")
+    if tribes is None:
+        return TribeIndex({})
+    # Cached on the state as (tribes dict, TribeIndex).
+    caches = state_caches(state)
+    hit = caches.get("tribe_index")
+    if hit is not None and hit[0] is tribes:
+        hit[1].sync(tribes)
+        return hit[1]
+    index = TribeIndex(tribes)
+    caches["tribe_index"] = (tribes, index)
+    return index
+
+
+def tribe_changed(state, tribe):
+    """Record that ``tribe``'s entry (``allied_faction``, ``status``, or
+    the entry itself) changed; the tribe mutators call this after a
+    write, so the next lookup finds nothing to resync."""
+    caches = state.get(CACHES)
+    hit = caches and caches.get("tribe_index")
+    if not hit:
+        return
+    tribes = state.get("tribes")
+    if hit[0] is tribes:
+        hit[1].update(tribe, tribes.get(tribe))
+    else:
+        del caches["tribe_index"]
@@ -48,6 +48,7 @@ from fs_bot.board.control import (
 from fs_bot.engine.victory import (
     calculate_victory_score, calculate_victory_margin, check_victory,
 )
+from fs_bot.engine import events
 from fs_bot.map.map_data import (
     get_adjacent, get_playable_regions, get_tribes_in_region,
     get_tribe_data,
@@ -80,7 +81,9 @@ from fs_bot.bots.bot_common import (
     # Rally prevalidation (executor-legal plans)
     prevalidate_rally_plan,
 )
-from fs_bot.commands.rally import _find_subdued_tribe_for_ally
+from fs_bot.commands.rally import (
+    _find_subdued_tribe_for_ally, rally_opportunities,
+)
 from fs_bot.commands.common import _is_devastated
 from fs_bot.bots.bot_dispatch import BotDispatchError
 from fs_bot.cards.bot_instructions import (
@@ -485,7 +488,7 @@ def _estimate_rally_placements(state, scenario):
     Returns:
         Dict with "citadels", "allies", "warbands", "total" counts.
     """
-    playable = get_playable_regions(scenario, state.get("capabilities"))
+    rows = rally_opportunities(state, AEDUI).values()
     citadels = 0
     allies = 0
     warbands = 0
@@ -495,55 +498,35 @@ def _estimate_rally_placements(state, scenario):
     avail_warbands = get_available(state, AEDUI, WARBAND)
 
     # Step 1: Citadels — replace Allies in Cities with Citadels
-    for region in playable:
+    for row in rows:
         if avail_citadels <= 0:
             break
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
+        for tribe in row.city_allied:
             if avail_citadels <= 0:
                 break
-            tribe_info = state["tribes"].get(tribe, {})
-            if (tribe_info.get("allied_faction") == AEDUI
-                    and is_city_tribe(tribe)):
-                citadels += 1
-                avail_citadels -= 1
-                # This frees up an Ally
-                avail_allies += 1
+            citadels += 1
+            avail_citadels -= 1
+            # This frees up an Ally
+            avail_allies += 1
 
     # Step 2: Allies — place wherever possible
-    for region in playable:
+    for row in rows:
         if avail_allies <= 0:
             break
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
+        # Must have Aedui presence for Rally — §3.3.1
+        if not (row.pieces > 0 or row.controlled):
+            continue
+        for tribe in row.open_tribes:
             if avail_allies <= 0:
                 break
-            tribe_info = state["tribes"].get(tribe, {})
-            if tribe_info.get("allied_faction") is not None:
-                continue
-            # Must have Aedui presence for Rally — §3.3.1
-            if (count_pieces(state, region, AEDUI) > 0
-                    or is_controlled_by(state, region, AEDUI)):
-                allies += 1
-                avail_allies -= 1
+            allies += 1
+            avail_allies -= 1
 
     # Step 3: Warbands — place most possible
-    for region in playable:
+    for row in rows:
         if avail_warbands <= 0:
             break
-        has_base = False
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
-            tribe_info = state["tribes"].get(tribe, {})
-            if tribe_info.get("allied_faction") == AEDUI:
-                has_base = True
-                break
-        if count_pieces(state, region, AEDUI, CITADEL) > 0:
-            has_base = True
-        if is_controlled_by(state, region, AEDUI):
-            has_base = True
-
-        if has_base:
+        if row.allied_tribes or row.citadels > 0 or row.controlled:
             warbands += 1
             avail_warbands -= 1
 
@@ -1337,7 +1320,9 @@ def _estimate_trade_resources(state, scenario):
     # non-deterministic): strip it so trade() uses agreement defaults.
     sim.pop("decision_agent", None)
     try:
-        return trade(sim, roman_agreed=romans_agree).get("resources_gained", 0)
+        with events.muted():
+            return trade(sim, roman_agreed=romans_agree).get(
+                "resources_gained", 0)
     except Exception:
         return 0
 
@@ -77,7 +77,9 @@ from fs_bot.bots.bot_common import (
     # Rally prevalidation (executor-legal plans)
     prevalidate_rally_plan,
 )
-from fs_bot.commands.rally import _find_subdued_tribe_for_ally
+from fs_bot.commands.rally import (
+    _find_subdued_tribe_for_ally, rally_opportunities,
+)
 from fs_bot.commands.common import _is_devastated
 from fs_bot.bots.bot_dispatch import BotDispatchError
 from fs_bot.cards.bot_instructions import (
@@ -308,7 +310,7 @@ def _estimate_rally_placements(state, scenario):
     Returns:
         Dict with "citadels", "allies", "warbands", "total" counts.
     """
-    playable = get_playable_regions(scenario, state.get("capabilities"))
+    rows = rally_opportunities(state, ARVERNI).values()
     citadels = 0
     allies = 0
     warbands = 0
@@ -318,56 +320,37 @@ def _estimate_rally_placements(state, scenario):
     avail_warbands = get_available(state, ARVERNI, WARBAND)
 
     # Step 1: Citadels — replace Allies in Cities with Citadels
-    for region in playable:
+    for row in rows:
         if avail_citadels <= 0:
             break
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
+        for tribe in row.city_allied:
             if avail_citadels <= 0:
                 break
-            tribe_info = state["tribes"].get(tribe, {})
-            if (tribe_info.get("allied_faction") == ARVERNI
-                    and is_city_tribe(tribe)):
-                citadels += 1
-                avail_citadels -= 1
-                # This frees up an Ally
-                avail_allies += 1
+            citadels += 1
+            avail_citadels -= 1
+            # This frees up an Ally
+            avail_allies += 1
 
     # Step 2: Allies — place wherever possible
-    # Allies require Arverni Control or Home Region with pieces
-    for region in playable:
+    # Can place if tribe is subdued/empty and region has Arverni pieces
+    for row in rows:
         if avail_allies <= 0:
             break
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
+        if row.pieces <= 0:
+            continue
+        for tribe in row.open_tribes:
             if avail_allies <= 0:
                 break
-            tribe_info = state["tribes"].get(tribe, {})
-            # Can place if tribe is subdued/empty and region has Arverni
-            # control or is a Rally region
-            if tribe_info.get("allied_faction") is None:
-                if count_pieces(state, region, ARVERNI) > 0:
-                    allies += 1
-                    avail_allies -= 1
+            allies += 1
+            avail_allies -= 1
 
     # Step 3: Warbands — place most possible
-    for region in playable:
+    # Can place Warbands in regions where Arverni have Control or
+    # an Ally/Citadel — standard Rally rules §3.3.1
+    for row in rows:
         if avail_warbands <= 0:
             break
-        # Can place Warbands in regions where Arverni have Control or
-        # an Ally/Citadel — standard Rally rules §3.3.1
-        has_ally_or_citadel = False
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
-            tribe_info = state["tribes"].get(tribe, {})
-            if tribe_info.get("allied_faction") == ARVERNI:
-                has_ally_or_citadel = True
-                break
-        if count_pieces(state, region, ARVERNI, CITADEL) > 0:
-            has_ally_or_citadel = True
-
-        if has_ally_or_citadel or is_controlled_by(state, region, ARVERNI):
-            # Place Warbands here
+        if row.allied_tribes or row.citadels > 0 or row.controlled:
             warbands += 1
             avail_warbands -= 1
 
@@ -84,7 +84,9 @@ from fs_bot.bots.bot_common import (
     # Rally prevalidation (executor-legal plans)
     prevalidate_rally_plan,
 )
-from fs_bot.commands.rally import _find_subdued_tribe_for_ally
+from fs_bot.commands.rally import (
+    _find_subdued_tribe_for_ally, rally_opportunities,
+)
 from fs_bot.commands.common import _is_devastated
 from fs_bot.bots.bot_dispatch import BotDispatchError
 from fs_bot.cards.bot_instructions import (
@@ -363,7 +365,7 @@ def _estimate_rally_would_qualify(state, scenario):
     if resources <= 0:
         return False
 
-    playable = get_playable_regions(scenario, state.get("capabilities"))
+    rows = rally_opportunities(state, BELGAE).values()
 
     avail_citadels = get_available(state, BELGAE, CITADEL)
     avail_allies = get_available(state, BELGAE, ALLY)
@@ -375,56 +377,36 @@ def _estimate_rally_would_qualify(state, scenario):
     would_add_control = False
 
     # Step 1: Citadel — replace Ally in City
-    for region in playable:
+    for row in rows:
         if avail_citadels <= 0:
             break
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
+        for tribe in row.city_allied:
             if avail_citadels <= 0:
                 break
-            tribe_info = state["tribes"].get(tribe, {})
-            if (tribe_info.get("allied_faction") == BELGAE
-                    and is_city_tribe(tribe)):
-                would_place_citadel = True
-                avail_citadels -= 1
-                avail_allies += 1  # Freed Ally
+            would_place_citadel = True
+            avail_citadels -= 1
+            avail_allies += 1  # Freed Ally
 
     # Step 2: Allies — place wherever able
-    for region in playable:
+    for row in rows:
         if avail_allies <= 0:
             break
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
+        # Rally requires Control or Ally/Citadel — §3.3.1
+        if not (row.pieces > 0 or row.controlled):
+            continue
+        for tribe in row.open_tribes:
             if avail_allies <= 0:
                 break
-            tribe_info = state["tribes"].get(tribe, {})
-            if tribe_info.get("allied_faction") is not None:
-                continue
-            # Rally requires Control or Ally/Citadel — §3.3.1
-            if (count_pieces(state, region, BELGAE) > 0
-                    or is_controlled_by(state, region, BELGAE)):
-                would_place_ally = True
-                avail_allies -= 1
+            would_place_ally = True
+            avail_allies -= 1
 
     # Step 3: Warbands — count how many we'd place
-    for region in playable:
+    for row in rows:
         if avail_warbands <= 0:
             break
-        has_base = False
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
-            tribe_info = state["tribes"].get(tribe, {})
-            if tribe_info.get("allied_faction") == BELGAE:
-                has_base = True
-                break
-        if count_pieces(state, region, BELGAE, CITADEL) > 0:
-            has_base = True
-        if is_controlled_by(state, region, BELGAE):
-            has_base = True
-
-        if has_base:
+        if row.allied_tribes or row.citadels > 0 or row.controlled:
             # Check if placing here would add Belgic Control
-            if not is_controlled_by(state, region, BELGAE):
+            if not row.controlled:
                 would_add_control = True
             warband_count += 1
             avail_warbands -= 1
@@ -432,14 +414,10 @@ def _estimate_rally_would_qualify(state, scenario):
     # Also check if placing Warbands anywhere would flip Control
     # (even if we already counted them above)
     if not would_add_control and warband_count > 0:
-        # Re-check: placing Warbands might add control somewhere
-        for region in playable:
-            if not is_controlled_by(state, region, BELGAE):
-                belgae_total = count_pieces(state, region, BELGAE)
-                if belgae_total > 0:
-                    # Would the Rally Warband tip control?
-                    would_add_control = True
-                    break
+        # Re-check: placing Warbands might add control somewhere —
+        # would the Rally Warband tip control?
+        would_add_control = any(not row.controlled and row.pieces > 0
+                                for row in rows)
 
     if would_place_citadel:
         return True
@@ -41,6 +41,8 @@ from fs_bot.board.control import is_controlled_by, get_controlled_regions
 from fs_bot.engine.victory import (
     calculate_victory_score, calculate_victory_margin, check_victory,
 )
+from fs_bot.engine.victory_whatif import VictoryTally
+from fs_bot.engine import events
 from fs_bot.map.map_data import (
     get_adjacent, get_playable_regions, get_tribes_in_region,
     is_city_tribe, get_tribe_data, ALL_TRIBE_DATA,
@@ -279,7 +281,8 @@ def is_frost_active(state):
     return state.get("frost", False)
 
 
-def would_advance_player_victory(state, faction, player_faction):
+def would_advance_player_victory(state, faction, player_faction,
+                                 candidate=None, tally=None):
     """Check if an action by NP faction could advance a player faction's victory.
 
     Per §8.4.4: "Non-players take no action that could directly advance
@@ -293,17 +296,34 @@ def would_advance_player_victory(state, faction, player_faction):
         state: Game state dict.
         faction: The NP faction considering an action.
         player_faction: The player faction that might be advanced.
+        candidate: Optional what-if delta(s) describing the action
+            (fs_bot.engine.victory_whatif). When given, the action itself
+            is scored rather than the current standing.
+        tally: Optional VictoryTally of ``state``, shared by every check
+            of one decision.
 
     Returns:
         True if the player faction is at or above its victory threshold.
+        With ``candidate``: True if the action would leave the player
+        faction above its threshold with a larger margin than now.
     """
-    scenario = state["scenario"]
     non_players = state.get("non_player_factions", set())
 
     # Only restricts advancement of PLAYER factions — §8.4.4 NOTE
     if player_faction in non_players:
         return False
 
+    if candidate is not None or tally is not None:
+        tally = tally or VictoryTally(state)
+        base = tally.outcomes()
+        # A Faction without victory in this scenario is never advanced.
+        if player_faction not in base:
+            return False
+        if candidate is None:
+            return base[player_faction].wins
+        after = tally.outcomes(candidate)[player_faction]
+        return after.wins and after.margin > base[player_faction].margin
+
     # Check if the player faction tracks victory in this scenario
     try:
         return check_victory(state, player_faction)
@@ -311,7 +331,8 @@ def would_advance_player_victory(state, faction, player_faction):
         return False
 
 
-def check_frost_restriction(state, player_faction):
+def check_frost_restriction(state, player_faction, candidate=None,
+                            tally=None):
     """Should a NP skip an action due to Frost?
 
     Combines the Frost-active check with the player-at-victory check.
@@ -321,13 +342,39 @@ def check_frost_restriction(state, player_faction):
     Args:
         state: Game state dict.
         player_faction: The player faction that might benefit.
+        candidate: Optional what-if delta(s) for the action, passed to
+            would_advance_player_victory.
+        tally: Optional VictoryTally shared by the decision's checks.
 
     Returns:
         True if the action should be skipped due to Frost.
     """
     if not is_frost_active(state):
         return False
-    return would_advance_player_victory(state, None, player_faction)
+    return would_advance_player_victory(state, None, player_faction,
+                                        candidate, tally)
+
+
+def frost_restricted(state, candidates, tally=None):
+    """§8.4.4 for a batch of candidate actions, scored on one tally.
+
+    Each candidate is a what-if delta or a sequence of them
+    (fs_bot.engine.victory_whatif). Returns a list of bools aligned with
+    ``candidates``: True where, with Frost in effect, the action would
+    leave some player Faction above its victory threshold with a larger
+    margin than now.
+    """
+    if not is_frost_active(state):
+        return [False] * len(candidates)
+    non_players = state.get("non_player_factions", set())
+    tally = tally or VictoryTally(state)
+    base = tally.outcomes()
+    players = [f for f in base if f not in non_players]
+    if not players:
+        return [False] * len(candidates)
+    return [any(after[f].wins and after[f].margin > base[f].margin
+                for f in players)
+            for after in tally.what_if(candidates)]
 
 
 # ============================================================================
@@ -1022,7 +1069,8 @@ def predict_battle(state, region, attacking_faction, defending_faction):
             had_fort_at_start=had_fort)
         # Defender absorbs them, all rolls forced to removals (fewest survivors).
         if inflicted > 0:
-            resolve_losses(sim, region, defending_faction, inflicted)
+            with events.muted():
+                resolve_losses(sim, region, defending_faction, inflicted)
         # Counterattack Loss COUNT from the surviving Defender.
         taken = calculate_losses(
             sim, region, attacking_faction=defending_faction,
@@ -1073,7 +1121,8 @@ def roman_battle_is_favorable(state, region, defending_faction):
 def prevalidate_rally_plan(state, faction, rally_plan, *, resources=None):
     """Filter a draft rally_plan to the entries rally_in_region will accept.
 
-    Simulates, without mutating state: region legality
+    Simulates, without mutating state and reading the per-Region facts
+    from rally_opportunities: region legality
     (validate_rally_region), the place_ally Control-or-Vercingetorix gate,
     Subdued-tribe eligibility (_find_subdued_tribe_for_ally), Available-pool
     tracking (a Citadel replacement frees its Ally back to Available, as
@@ -1099,12 +1148,8 @@ def prevalidate_rally_plan(state, faction, rally_plan, *, resources=None):
         A new rally_plan dict, same shape, filtered to executor-legal
         entries.
     """
-    from fs_bot.commands.rally import (
-        validate_rally_region, rally_cost, _find_subdued_tribe_for_ally,
-        _gallic_warband_cap, _german_warband_cap, _get_home_regions,
-    )
+    from fs_bot.commands.rally import rally_row
 
-    scenario = state["scenario"]
     budget = (state.get("resources", {}).get(faction, 0)
               if resources is None else resources)
 
@@ -1118,11 +1163,10 @@ def prevalidate_rally_plan(state, faction, rally_plan, *, resources=None):
     citadel_delta = {}     # region -> Citadels placed this plan
     tribes_allied = set()  # tribes allied earlier in this plan
 
-    home = _get_home_regions(faction, scenario)
     out = dict(rally_plan)
 
-    def _cost(region):
-        return rally_cost(state, region, faction)
+    def _row(region):
+        return rally_row(state, region, faction)
 
     # --- Citadels (executed first; freed Allies return to Available) ---
     kept = []
@@ -1131,7 +1175,8 @@ def prevalidate_rally_plan(state, faction, rally_plan, *, resources=None):
         region, tribe = entry.get("region"), entry.get("tribe")
         if region is None or tribe is None:
             continue
-        if not validate_rally_region(state, region, faction)[0]:
+        row = _row(region)
+        if not row.legal:
             continue
         if not is_city_tribe(tribe):
             continue
@@ -1142,12 +1187,12 @@ def prevalidate_rally_plan(state, faction, rally_plan, *, resources=None):
         # via a Citadel has none, and rally_in_region would refuse
         # ("Only 0 ... Ally ..., need 1").
         used = ally_discs_used.get(region, 0)
-        if count_pieces(state, region, faction, ALLY) - used < 1:
+        if row.allies - used < 1:
             continue
-        if avail[CITADEL] < 1 or _cost(region) > budget:
+        if avail[CITADEL] < 1 or row.cost > budget:
             continue
         ally_discs_used[region] = used + 1
-        budget -= _cost(region)
+        budget -= row.cost
         avail[CITADEL] -= 1
         avail[ALLY] += 1  # freed Ally — rally_in_region to_available=True
         ally_delta[region] = ally_delta.get(region, 0) - 1
@@ -1156,30 +1201,25 @@ def prevalidate_rally_plan(state, faction, rally_plan, *, resources=None):
     out["citadels"] = kept
 
     # --- Allies ---
-    vercingetorix_gate = (faction == ARVERNI and scenario in BASE_SCENARIOS)
     kept = []
     for entry in rally_plan.get("allies") or []:
         region, tribe = entry.get("region"), entry.get("tribe")
         if region is None or tribe is None:
             continue
-        if not validate_rally_region(state, region, faction)[0]:
+        row = _row(region)
+        if not row.legal:
             continue
         # place_ally gate — §3.3.1: faction Control (or Vercingetorix
         # for Arverni in the base game).
-        gate = is_controlled_by(state, region, faction)
-        if not gate and vercingetorix_gate:
-            from fs_bot.rules_consts import VERCINGETORIX
-            gate = (get_leader_in_region(state, region, ARVERNI)
-                    == VERCINGETORIX)
-        if not gate:
+        if not row.ally_gate:
             continue
         if tribe in tribes_allied:
             continue
-        if tribe not in _find_subdued_tribe_for_ally(state, region, faction):
+        if tribe not in row.ally_tribes:
             continue
-        if avail[ALLY] < 1 or _cost(region) > budget:
+        if avail[ALLY] < 1 or row.cost > budget:
             continue
-        budget -= _cost(region)
+        budget -= row.cost
         avail[ALLY] -= 1
         tribes_allied.add(tribe)
         ally_delta[region] = ally_delta.get(region, 0) + 1
@@ -1192,49 +1232,21 @@ def prevalidate_rally_plan(state, faction, rally_plan, *, resources=None):
         region = entry if isinstance(entry, str) else entry.get("region")
         if region is None:
             continue
-        if not validate_rally_region(state, region, faction)[0]:
+        row = _row(region)
+        if not row.legal:
             continue
-        d_ally = ally_delta.get(region, 0)
-        d_citadel = citadel_delta.get(region, 0)
-        if faction == GERMANS:
-            cap = _german_warband_cap(state, region) + d_ally
-            has_ally = (count_pieces(state, region, GERMANS, ALLY)
-                        + d_ally > 0)
-            has_settlement = (
-                scenario in ARIOVISTUS_SCENARIOS
-                and count_pieces(state, region, GERMANS, SETTLEMENT) > 0)
-            is_home = region in home or has_settlement
-            if not (has_ally or has_settlement):
-                if is_home:
-                    cap = max(cap, 1)  # §3.4.1 home minimum
-                elif cap <= 0:
-                    continue  # executor raises: needs Ally/Settlement
-        else:
-            has_ally = (count_pieces(state, region, faction, ALLY)
-                        + d_ally > 0)
-            has_citadel = (count_pieces(state, region, faction, CITADEL)
-                           + d_citadel > 0)
-            has_leader = (
-                faction == ARVERNI
-                and get_leader_in_region(state, region, ARVERNI) is not None)
-            if not (has_ally or has_citadel or has_leader):
-                if region in home:
-                    cap = 1  # §3.3.1 Home Region: "at least one Warband"
-                else:
-                    continue  # executor raises: needs Ally/Citadel(/Leader)
-            else:
-                cap = (_gallic_warband_cap(state, region, faction)
-                       + d_ally + d_citadel)
-            if region in home:
-                cap = max(cap, 1)
-        if _cost(region) > budget:
+        # Caps and the Home-Region minimum; 0 where the executor raises
+        # for want of an Ally/Citadel(/Leader/Settlement).
+        cap = row.warband_cap(ally_delta.get(region, 0),
+                              citadel_delta.get(region, 0))
+        if row.cost > budget:
             continue
         to_place = min(cap, avail[WARBAND])
         if to_place <= 0:
             # rally_in_region would charge yet place nothing; the flowchart
             # Rallies only "wherever able to place a piece" — drop it.
             continue
-        budget -= _cost(region)
+        budget -= row.cost
         avail[WARBAND] -= to_place
         kept.append(entry)
     out["warbands"] = kept
@@ -1,6 +1,10 @@
 """
 Bot dispatch — Route NP faction turns to the correct bot module.
 
+:func:`bot_decision` wraps the dispatch as an engine ``decision_func``,
+translating the bot's action dict into the engine's action constants
+(§2.3.4, §2.3.5, §8.1.2).
+
 Enforces scenario isolation per CLAUDE.md:
 - German bot never called in base game (Germans are game-run via §6.2).
 - Arverni bot never called in Ariovistus (Arverni are game-run via A6.2).
@@ -10,6 +14,10 @@ from fs_bot.rules_consts import (
     ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS,
     BASE_SCENARIOS, ARIOVISTUS_SCENARIOS,
 )
+from fs_bot.engine.game_engine import (
+    ACTION_COMMAND, ACTION_COMMAND_SA, ACTION_LIMITED_COMMAND,
+    ACTION_EVENT, ACTION_PASS,
+)
 
 
 class BotDispatchError(Exception):
@@ -100,3 +108,99 @@ def dispatch_bot_turn(state, faction):
         return execute_german_turn(state)
 
     raise BotDispatchError(f"Unknown faction: {faction}")
+
+
+# Bot action.command string constants (all bots use these literal labels)
+_BOT_PASS = "Pass"
+_BOT_EVENT = "Event"
+_BOT_NONE = "None"
+# Any of these means "the bot wants a Command of some kind"
+_BOT_COMMAND_NAMES = {"Battle", "March", "Rally", "Raid", "Recruit", "Seize"}
+# SA "no SA" sentinel — all bots use the literal "No SA"
+_BOT_SA_NONE = "No SA"
+
+
+def _translate_bot_action(bot_action, options):
+    """Translate a bot action dict to an engine action constant.
+
+    Rules:
+    - command == "Pass"  -> ACTION_PASS
+    - command == "Event" -> ACTION_EVENT
+    - command == "None"  -> ACTION_PASS (defensive — treat as a Pass)
+    - command in {Battle, March, Rally, Raid, Recruit, Seize}:
+        - If sa != "No SA"            -> ACTION_COMMAND_SA
+        - Else                        -> ACTION_COMMAND
+      Then, if the engine's legal options does NOT include the chosen
+      constant but DOES include LIMITED_COMMAND, downgrade to
+      LIMITED_COMMAND (§2.3.5). This handles the case where the engine
+      has already trimmed the menu for a 2nd Eligible whose options
+      are {LIMITED_COMMAND, ...}. Per §8.1.2 the NP would normally be
+      upgraded back to full Command+SA, but the engine's option list is
+      authoritative for what's legal in this position.
+
+    Args:
+        bot_action: Dict from a bot module.
+        options: List of legal engine action strings.
+
+    Returns:
+        The chosen engine action constant.
+
+    Raises:
+        ValueError: If translation produces a non-legal action and
+            cannot be downgraded.
+    """
+    cmd = bot_action.get("command", _BOT_NONE)
+
+    if cmd == _BOT_PASS or cmd == _BOT_NONE:
+        if ACTION_PASS in options:
+            return ACTION_PASS
+        # Defensive: if engine doesn't allow Pass somehow, fall through
+        raise ValueError(f"Bot chose Pass but it is not legal: {options}")
+
+    if cmd == _BOT_EVENT:
+        if ACTION_EVENT in options:
+            return ACTION_EVENT
+        # Engine forbids Event in this position — fall back to a Command
+        if ACTION_COMMAND in options:
+            return ACTION_COMMAND
+        if ACTION_LIMITED_COMMAND in options:
+            return ACTION_LIMITED_COMMAND
+        return ACTION_PASS
+
+    # Command of some kind
+    if cmd in _BOT_COMMAND_NAMES:
+        sa = bot_action.get("sa", _BOT_SA_NONE)
+        if sa and sa != _BOT_SA_NONE:
+            preferred = ACTION_COMMAND_SA
+        else:
+            preferred = ACTION_COMMAND
+        if preferred in options:
+            return preferred
+        # 2nd Eligible after 1st played Command-only:
+        # only LIMITED_COMMAND and PASS are legal — downgrade.
+        if ACTION_LIMITED_COMMAND in options:
+            return ACTION_LIMITED_COMMAND
+        # Fallback to whatever Command-like option is left
+        if ACTION_COMMAND in options:
+            return ACTION_COMMAND
+        if ACTION_COMMAND_SA in options:
+            return ACTION_COMMAND_SA
+        if ACTION_PASS in options:
+            return ACTION_PASS
+        raise ValueError(
+            f"Cannot translate bot command {cmd!r} into any of {options}"
+        )
+
+    # Unknown command literal — defensive fallback
+    if ACTION_PASS in options:
+        return ACTION_PASS
+    raise ValueError(f"Unknown bot command label: {cmd!r}")
+
+
+def bot_decision(state, faction, options, position):
+    """The NP bots as an engine ``decision_func``."""
+    state["current_card_id"] = state.get("current_card")
+    state["is_second_eligible"] = (position == "2nd_eligible")
+    state["can_play_event"] = (ACTION_EVENT in options)
+    ba = dispatch_bot_turn(state, faction)
+    return {"action": _translate_bot_action(ba, options), "bot_action": ba}
@@ -78,7 +78,7 @@ from fs_bot.bots.bot_common import (
     get_leader_placement_region,
     prevalidate_rally_plan,
 )
-from fs_bot.commands.rally import _find_subdued_tribe_for_ally
+from fs_bot.commands.rally import rally_opportunities
 from fs_bot.bots.bot_dispatch import BotDispatchError
 from fs_bot.cards.bot_instructions import (
     get_bot_instruction, NO_EVENT, SPECIFIC_INSTRUCTION, PLAY_EVENT,
@@ -628,7 +628,7 @@ def _estimate_rally_settle_would_qualify(state, scenario):
     - add to Germanic Control.
     """
     resources = state.get("resources", {}).get(GERMANS, 0)
-    playable = get_playable_regions(scenario, state.get("capabilities"))
+    rows = rally_opportunities(state, GERMANS).values()
 
     avail_settlements = get_available(state, GERMANS, SETTLEMENT)
     avail_allies = get_available(state, GERMANS, ALLY)
@@ -640,19 +640,14 @@ def _estimate_rally_settle_would_qualify(state, scenario):
 
     # Ally: at any tribe where Germans have base AND tribe unallied
     if avail_allies > 0:
-        for region in playable:
-            if (count_pieces(state, region, GERMANS) == 0
-                    and not is_controlled_by(state, region, GERMANS)
-                    and region not in GERMANIA_REGIONS):
+        for row in rows:
+            if (row.pieces == 0 and not row.controlled
+                    and row.region not in GERMANIA_REGIONS):
                 continue
-            for tribe in get_tribes_in_region(region, scenario):
-                tribe_info = state["tribes"].get(tribe, {})
-                if tribe_info.get("allied_faction") is not None:
-                    continue
-                # Ally placement cost = same as Warband per A3.4.1
-                cost = _german_rally_cost(state, region)
-                if resources >= cost:
-                    return True
+            # Ally placement cost = same as Warband per A3.4.1
+            if (row.open_tribes
+                    and resources >= _german_rally_cost(state, row.region)):
+                return True
 
     # Warbands: count how many we could afford+place
     if avail_warbands > 0:
@@ -663,10 +658,8 @@ def _estimate_rally_settle_would_qualify(state, scenario):
 
         # Or: any Warband placement that would add Germanic Control?
         if wb_placeable > 0:
-            for region in playable:
-                if is_controlled_by(state, region, GERMANS):
-                    continue
-                if _rally_would_tip_control(state, region):
+            for row in rows:
+                if not row.controlled and _rally_would_tip_control(row):
                     return True
 
     return False
@@ -720,46 +713,30 @@ def _german_rally_cost(state, region):
     return GERMAN_RALLY_COST_OUTSIDE_GERMANIA_NO_SETTLEMENT
 
 
+def _rally_base(row):
+    """Rally needs a base: Control, Ally, Settlement, or Germania (Home) —
+    §3.3.1, A3.4.1."""
+    return (row.controlled or bool(row.allied_tribes) or row.settlements > 0
+            or row.region in GERMANIA_REGIONS)
+
+
 def _count_placeable_warbands(state, scenario, resources, avail_warbands):
     """Estimate how many Warbands could be Rallied with current Resources.
 
     Per A8.7.4 starting-with-Settlements-and-Germania to reduce costs.
     """
-    playable = get_playable_regions(scenario, state.get("capabilities"))
     remaining_res = resources
     remaining_wb = avail_warbands
     placed = 0
 
-    def _region_sort_key(r):
-        if r in GERMANIA_REGIONS:
-            return 0
-        if _has_settlement(state, r):
-            return 1
-        return 2
-
-    candidates = []
-    for region in playable:
-        # Rally needs a base: Control, Ally, Settlement, or Home — §3.3.1, A3.4.1
-        has_base = False
-        if is_controlled_by(state, region, GERMANS):
-            has_base = True
-        if not has_base:
-            for tribe in get_tribes_in_region(region, scenario):
-                if state["tribes"].get(tribe, {}).get(
-                        "allied_faction") == GERMANS:
-                    has_base = True
-                    break
-        if not has_base and _has_settlement(state, region):
-            has_base = True
-        if region in GERMANIA_REGIONS:
-            has_base = True
-        if has_base:
-            candidates.append(region)
+    # Cheapest first: Germania (0), Settlements (1), elsewhere (2) — A3.4.1
+    candidates = sorted(
+        (row for row in rally_opportunities(state, GERMANS).values()
+         if _rally_base(row)),
+        key=lambda row: _german_rally_cost(state, row.region))
 
-    candidates.sort(key=_region_sort_key)
-
-    for region in candidates:
-        cost = _german_rally_cost(state, region)
+    for row in candidates:
+        cost = _german_rally_cost(state, row.region)
         while remaining_wb > 0 and remaining_res >= cost:
             placed += 1
             remaining_wb -= 1
@@ -771,15 +748,10 @@ def _count_placeable_warbands(state, scenario, resources, avail_warbands):
     return placed
 
 
-def _rally_would_tip_control(state, region):
+def _rally_would_tip_control(row):
     """Conservative check: would adding 1+ German Warband(s) flip Control?
     """
-    german_forces = count_pieces(state, region, GERMANS)
-    non_german_forces = sum(
-        count_pieces(state, region, f)
-        for f in (ROMANS, ARVERNI, AEDUI, BELGAE)
-    )
-    return german_forces + 1 > non_german_forces
+    return row.pieces + 1 > row.rival_pieces
 
 
 # ============================================================================
@@ -1206,7 +1178,6 @@ def node_g_rally(state):
         Action dict for Rally with Settle (SA).
     """
     scenario = state["scenario"]
-    playable = get_playable_regions(scenario, state.get("capabilities"))
     resources = state.get("resources", {}).get(GERMANS, 0)
 
     rally_plan = {
@@ -1242,59 +1213,43 @@ def node_g_rally(state):
 
     # Phase B: Place all Allies possible — A8.7.4
     # place_ally requires German Control — §3.3.1/A3.4.1; tribe eligibility
-    # per the executor's _find_subdued_tribe_for_ally. Final legality and
-    # the Resource budget are enforced by prevalidate_rally_plan below.
+    # per the executor's _find_subdued_tribe_for_ally (RallyRow.ally_tribes).
+    # Final legality and the Resource budget are enforced by
+    # prevalidate_rally_plan below.
+    rows = rally_opportunities(state, GERMANS).values()
     avail_allies = get_available(state, GERMANS, ALLY)
-    for region in playable:
+    for row in rows:
         if avail_allies <= 0:
             break
-        if not is_controlled_by(state, region, GERMANS):
+        if not row.controlled:
             continue
-        for tribe in _find_subdued_tribe_for_ally(state, region, GERMANS):
+        for tribe in row.ally_tribes:
             if avail_allies <= 0:
                 break
-            cost = _german_rally_cost(state, region)
+            cost = _german_rally_cost(state, row.region)
             if resources < cost:
                 continue
             rally_plan["allies"].append({
-                "region": region, "tribe": tribe, "cost": cost,
+                "region": row.region, "tribe": tribe, "cost": cost,
             })
             resources -= cost
             avail_allies -= 1
 
-    # Phase C: Place all Warbands possible, cheapest first — A8.7.4
-    def _wb_sort_key(r):
-        if r in GERMANIA_REGIONS:
-            return 0
-        if _has_settlement(state, r):
-            return 1
-        return 2
-
+    # Phase C: Place all Warbands possible, cheapest first (Germania,
+    # then Settlements) — A8.7.4
     avail_warbands = get_available(state, GERMANS, WARBAND)
-    candidates = []
-    for region in playable:
-        has_base = (
-            is_controlled_by(state, region, GERMANS)
-            or _has_settlement(state, region)
-            or region in GERMANIA_REGIONS
-        )
-        if not has_base:
-            for tribe in get_tribes_in_region(region, scenario):
-                if state["tribes"].get(tribe, {}).get(
-                        "allied_faction") == GERMANS:
-                    has_base = True
-                    break
-        if has_base:
-            candidates.append(region)
-    candidates.sort(key=_wb_sort_key)
+    candidates = sorted((row for row in rows if _rally_base(row)),
+                        key=lambda row: _german_rally_cost(state,
+                                                           row.region))
 
-    for region in candidates:
+    for row in candidates:
         if avail_warbands <= 0:
             break
-        cost = _german_rally_cost(state, region)
+        cost = _german_rally_cost(state, row.region)
         placements_here = 0
         while avail_warbands > 0 and resources >= cost:
-            rally_plan["warbands"].append({"region": region, "cost": cost})
+            rally_plan["warbands"].append({"region": row.region,
+                                           "cost": cost})
             resources -= cost
             avail_warbands -= 1
             placements_here += 1
@@ -55,6 +55,8 @@ from fs_bot.board.control import (
 from fs_bot.engine.victory import (
     calculate_victory_score, calculate_victory_margin, check_victory,
 )
+from fs_bot.engine import events
+from fs_bot.engine.victory_whatif import VictoryTally, PieceDelta
 from fs_bot.map.map_data import (
     get_adjacent, get_playable_regions, get_tribes_in_region,
     get_region_group, ALL_REGION_DATA, is_adjacent,
@@ -69,7 +71,7 @@ from fs_bot.bots.bot_common import (
     get_faction_targeting_order, get_enemy_piece_target_order,
     get_own_loss_order,
     # Frost
-    is_frost_active, check_frost_restriction,
+    is_frost_active, check_frost_restriction, frost_restricted,
     # Harassment
     get_harassing_factions, np_will_harass,
     # Retreat
@@ -706,12 +708,16 @@ def node_r_march(state):
     # benefit another winning player (e.g., by shifting control). The safe
     # approach is to exclude destinations targeting player factions at
     # victory, since the flowchart says "If none (or Frost): R_RECRUIT."
-    if is_frost_active(state):
+    # One victory tally serves every §8.4.4 check of this decision.
+    frost = is_frost_active(state)
+    tally = VictoryTally(state) if frost else None
+    if frost:
         filtered = []
         for region, target_faction in destinations:
             # Only restrict if target is a player faction at/beyond victory
             if target_faction not in non_players:
-                if check_frost_restriction(state, target_faction):
+                if check_frost_restriction(state, target_faction,
+                                           tally=tally):
                     continue  # Skip — would advance winning player's enemy
             filtered.append((region, target_faction))
         destinations = filtered
@@ -741,6 +747,17 @@ def node_r_march(state):
         if g is not None:
             groups[o] = g
 
+    # Per §8.4.4: the group leaving an origin must not hand that Region's
+    # Control to a player Faction at/beyond victory (e.g. Belgic Control
+    # Value). Score every origin's departure on the shared tally.
+    if frost:
+        departures = [_departure_deltas(o, groups.get(o)) for o in origins]
+        blocked = frost_restricted(state, departures, tally)
+        origins = [o for o, b in zip(origins, blocked) if not b]
+        if not origins:
+            return node_r_recruit(state)
+        groups = {o: g for o, g in groups.items() if o in origins}
+
     details = {
         "origins": origins,
         "destinations": selected_dests,
@@ -757,6 +774,18 @@ def node_r_march(state):
     )
 
 
+def _departure_deltas(origin, group):
+    """What-if PieceDeltas for a March ``group`` (see _march_group_8_8_1)
+    leaving ``origin``."""
+    if not group:
+        return ()
+    deltas = [PieceDelta(origin, ROMANS, pt, -group[pt])
+              for pt in (LEGION, AUXILIA) if group.get(pt)]
+    if group.get(LEADER):
+        deltas.append(PieceDelta(origin, ROMANS, LEADER, -1))
+    return tuple(deltas)
+
+
 def _march_group_8_8_1(state, origin):
     """Per-origin Roman threat-March group — §8.8.1 (errata 15Nov2018).
 
@@ -1366,6 +1395,7 @@ def _scout_emit_move(sim, moves, src, dst, count):
         remaining -= n
 
 
+@events.muted()
 def _scout_auxilia_moves(state):
     """Concrete §8.8.1 SCOUT Auxilia moves (errata 15Nov2018), in the
     instruction's order: (1) end with 4+ Auxilia in Caesar's Region;
@@ -11,6 +11,10 @@ Owner-scoped capabilities ("Take this card" / "Place near a Faction" —
 cards 8, 10 shaded, 59 shaded, 63 shaded) additionally record the owning
 Faction in state["capability_owners"]: {card_id: faction}.
 
+Hot paths (Battle Losses and resolution) read the compiled
+:func:`capability_view` instead of probing those dicts per check; the view
+is rebuilt when the setters here run (or the dicts visibly change).
+
 Source: §5.3, §5.1.2, Card Reference, A Card Reference
 """
 
@@ -19,6 +23,7 @@ from fs_bot.rules_consts import (
     CAPABILITY_CARDS, CAPABILITY_CARDS_ARIOVISTUS,
     ARIOVISTUS_SCENARIOS,
 )
+from fs_bot.state.caches import KEY as CACHES, state_caches
 
 
 # Companion event_modifiers set by capability handlers, keyed by
@@ -39,6 +44,7 @@ def _clear_companion_modifiers(state, card_id, side):
         return
     for key in _CAPABILITY_MODIFIERS.get((card_id, side), ()):
         mods.pop(key, None)
+    _invalidate_view(state)
 
 
 def _ensure_capabilities(state):
@@ -71,12 +77,14 @@ def activate_capability(state, card_id, shaded_or_unshaded):
     if prev is not None and prev != shaded_or_unshaded:
         _clear_companion_modifiers(state, card_id, prev)
     state["capabilities"][card_id] = shaded_or_unshaded
+    _invalidate_view(state)
 
 
 def set_capability_owner(state, card_id, faction):
     """Record the Faction that holds an owner-scoped capability card
     ("Take this card ..." / "Place this card near a ... Faction")."""
     state.setdefault("capability_owners", {})[card_id] = faction
+    _invalidate_view(state)
 
 
 def get_capability_owner(state, card_id):
@@ -103,9 +111,24 @@ def deactivate_capability(state, card_id):
     side = state["capabilities"].pop(card_id, None)
     if side is not None:
         _clear_companion_modifiers(state, card_id, side)
+    _invalidate_view(state)
     return side
 
 
+def set_event_modifier(state, key, value=True):
+    """Set ``state["event_modifiers"][key]``. Modifiers compiled into the
+    capability view must be set (and cleared) through these setters."""
+    state.setdefault("event_modifiers", {})[key] = value
+    _invalidate_view(state)
+
+
+def clear_event_modifier(state, key):
+    """Remove an event modifier; returns its value (None if unset)."""
+    value = (state.get("event_modifiers") or {}).pop(key, None)
+    _invalidate_view(state)
+    return value
+
+
 def is_capability_active(state, card_id, shaded_or_unshaded=None):
     """Check if a capability is active in game state.
 
@@ -119,12 +142,10 @@ def is_capability_active(state, card_id, shaded_or_unshaded=None):
     Returns:
         bool
     """
-    _ensure_capabilities(state)
-    if card_id not in state["capabilities"]:
+    side = (state.get("capabilities") or {}).get(card_id)
+    if side is None:
         return False
-    if shaded_or_unshaded is None:
-        return True
-    return state["capabilities"][card_id] == shaded_or_unshaded
+    return shaded_or_unshaded is None or side == shaded_or_unshaded
 
 
 def get_active_capabilities(state):
@@ -151,3 +172,81 @@ def is_valid_capability(card_id, scenario=None):
         return (card_id in CAPABILITY_CARDS or
                 card_id in CAPABILITY_CARDS_ARIOVISTUS)
     return card_id in CAPABILITY_CARDS
+
+
+# ============================================================================
+# COMPILED VIEW — named flags for the rule effects read on hot paths
+# ============================================================================
+
+
+class CapabilityView:
+    """Read-only flags compiled from one state's capabilities, capability
+    owners and event modifiers. Obtain via :func:`capability_view`."""
+
+    __slots__ = (
+        "ballistae",             # 10 unshaded — Ballistae
+        "legio_x",               # 15 unshaded — Legio X
+        "legio_x_shaded",        # 15 shaded
+        "gallic_archers",        # 27 unshaded — Massed Gallic Archers
+        "vercingetorix_elite",   # 30 shaded — Vercingetorix's Elite
+        "germanic_horse_region",       # 59 unshaded flagged Region
+        "germanic_horse_tips_region",  # 59 shaded flagged Region
+        "germanic_horse_owner",        # 59 owner
+        "phalanx_stalwart",      # A31 shaded — German Phalanx
+        "german_benefits_cancelled",   # A31 unshaded modifier
+        "no_ario_double",              # A31 unshaded modifier
+        "motivation",            # A33 shaded, unless A31 unshaded cancels
+        "no_german_retreat",     # A33 modifier
+        "remove_outnumbered",    # A33 modifier
+        "no_belgae_retreat",     # A70 modifier
+    )
+
+    def __init__(self, caps, mods, owners):
+        self.ballistae = caps.get(10) == EVENT_UNSHADED
+        self.legio_x = caps.get(15) == EVENT_UNSHADED
+        self.legio_x_shaded = caps.get(15) == EVENT_SHADED
+        self.gallic_archers = caps.get(27) == EVENT_UNSHADED
+        self.vercingetorix_elite = caps.get(30) == EVENT_SHADED
+        self.germanic_horse_region = mods.get("card59_unshaded_region")
+        self.germanic_horse_tips_region = mods.get("card59_shaded_region")
+        self.germanic_horse_owner = owners.get(59)
+        self.phalanx_stalwart = caps.get("A31") == EVENT_SHADED
+        self.german_benefits_cancelled = bool(
+            mods.get("card_A31_cancel_german_benefits"))
+        self.no_ario_double = bool(mods.get("card_A31_no_ario_double"))
+        self.motivation = (caps.get("A33") == EVENT_SHADED
+                           and not self.german_benefits_cancelled)
+        self.no_german_retreat = bool(mods.get("card_A33_no_german_retreat"))
+        self.remove_outnumbered = bool(
+            mods.get("card_A33_remove_outnumbered"))
+        self.no_belgae_retreat = bool(mods.get("card_A70_no_belgae_retreat"))
+
+
+# Cached on the state as (capabilities, event_modifiers, capability_owners,
+# sizes, view); a different dict object or a changed size (a write that
+# bypassed the setters) forces a rebuild.
+
+def _invalidate_view(state):
+    caches = state.get(CACHES)
+    if caches:
+        caches.pop("capability_view", None)
+
+
+def capability_view(state):
+    """The compiled :class:`CapabilityView` for ``state`` (cached until a
+    capability or modifier setter runs)."""
+    caps = state.get("capabilities")
+    if caps is None:
+        caps = state["capabilities"] = {}
+    mods = state.get("event_modifiers")
+    owners = state.get("capability_owners")
+    sizes = (len(caps), len(mods) if mods else 0,
+             len(owners) if owners else 0)
+    caches = state_caches(state)
+    entry = caches.get("capability_view")
+    if (entry is not None and entry[0] is caps and entry[1] is mods
+            and entry[2] is owners and entry[3] == sizes):
+        return entry[4]
+    view = CapabilityView(caps, mods or {}, owners or {})
+    caches["capability_view"] = (caps, mods, owners, sizes, view)
+    return view
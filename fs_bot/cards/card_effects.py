@@ -31,18 +31,21 @@ from fs_bot.rules_consts import (
     MARKER_ABATIS, EVENT_SHADED, EVENT_UNSHADED, NO_CONTROL,
     ELIGIBLE, INELIGIBLE, ALLIED,
 )
+from fs_bot.state import invariants
 from fs_bot.board.pieces import (
     place_piece, remove_piece, move_piece, flip_piece,
     count_pieces, count_pieces_by_state, get_available,
     get_leader_in_region, find_leader, PieceError,
     _count_on_legions_track, clear_allied_tribe,
+    batched, flush_control,
 )
 from fs_bot.board.control import (
-    calculate_control, refresh_all_control,
+    calculate_control,
     is_controlled_by, get_controlled_regions,
 )
+from fs_bot.board.tribes import tribe_changed
 from fs_bot.cards.capabilities import (
-    activate_capability, deactivate_capability,
+    activate_capability, deactivate_capability, set_event_modifier,
 )
 
 
@@ -115,6 +118,8 @@ def _cap_resources(state, faction, amount):
     current = state["resources"].get(faction, 0)
     new_val = max(0, min(MAX_RESOURCES, current + amount))
     state["resources"][faction] = new_val
+    if invariants.enabled:
+        invariants.resources(state, "_cap_resources", faction)
     return new_val - current
 
 
@@ -162,6 +167,7 @@ def _tribe_piece_type(state, tribe):
     return None
 
 
+@batched
 def _ally_tribe(state, tribe, faction):
     """Ally a Subdued tribe to ``faction``: place the ALLY disc in the
     tribe's Region AND set allied_faction, together.
@@ -184,10 +190,13 @@ def _ally_tribe(state, tribe, faction):
     place_piece(state, region, faction, ALLY)
     info["allied_faction"] = faction
     info["status"] = None
-    refresh_all_control(state)
+    tribe_changed(state, tribe)
+    if invariants.enabled:
+        invariants.tribe_backing(state, "_ally_tribe", tribe)
     return True
 
 
+@batched
 def _unally_tribe(state, tribe, to_available=True):
     """Un-ally a tribe: remove its matching on-map piece (ALLY disc, or
     the CITADEL for a City tribe holding one) AND clear allied_faction,
@@ -210,7 +219,9 @@ def _unally_tribe(state, tribe, to_available=True):
         info["status"] = None
     if info.get("status") == ALLIED:
         info["status"] = None
-    refresh_all_control(state)
+    tribe_changed(state, tribe)
+    if invariants.enabled:
+        invariants.tribe_backing(state, "_unally_tribe", tribe)
     return faction
 
 
@@ -1168,6 +1179,7 @@ def execute_card_23(state, shaded=False):
                     remove_piece(state, region, fac, CITADEL)
                     clear_allied_tribe(state, region, fac, CITADEL)
             tribe_info["status"] = MARKER_RAZED
+            tribe_changed(state, tribe)
     else:
         # Shaded: If a Legion where executing faction's Citadel,
         # remove the Legion to Fallen, Romans Ineligible
@@ -1339,7 +1351,8 @@ def execute_card_26(state, shaded=False):
             place_piece(state, region, place_faction, place_type)
             # Either piece allies the Tribe — record allegiance with it.
             tribe_info["allied_faction"] = place_faction
-            refresh_all_control(state)
+            tribe_changed(state, tribe)
+            flush_control(state)
     else:
         # Shaded: Arverni remove/place Allies in Arverni Region + free Rally
         params = state.get("event_params", {})
@@ -1422,6 +1435,7 @@ def execute_card_28(state, shaded=False):
                 remove_piece(state, region, fac, ALLY)
                 place_piece(state, region, fac, CITADEL)
 
+@batched
 def execute_card_29(state, shaded=False):
     """Card 29: Suebi Mobilize — Remove Dispersed / Germans Phase.
 
@@ -1445,6 +1459,7 @@ def execute_card_29(state, shaded=False):
             if tribe_info.get("status") in (MARKER_DISPERSED,
                                             MARKER_DISPERSED_GATHERING):
                 tribe_info["status"] = None
+                tribe_changed(state, tribe)
         # Place Germanic Ally at each Suebi that has none
         _ally_tribe(state, tribe, GERMANS)
     # Immediate Germans Phase without Rally: March, Raid, Battle
@@ -1456,7 +1471,6 @@ def execute_card_29(state, shaded=False):
         if count_pieces_by_state(state, region, GERMANS, WARBAND, HIDDEN) > 0:
             germans_phase_raid_region(state, region)
     germans_phase_battle(state)
-    refresh_all_control(state)
 
 def execute_card_30(state, shaded=False):
     """Card 30: Vercingetorix's Elite — CAPABILITY (both sides).
@@ -1531,7 +1545,7 @@ def execute_card_31(state, shaded=False):
         if third_region and third_faction:
             remove_piece(state, third_region, third_faction, ALLY)
             clear_allied_tribe(state, third_region, third_faction, ALLY)
-        refresh_all_control(state)
+        flush_control(state)
 
 def execute_card_32(state, shaded=False):
     """Card 32: Forced Marches — Relocate pieces freely.
@@ -1668,7 +1682,8 @@ def execute_card_34(state, shaded=False):
                         if get_available(state, ARVERNI, CITADEL) > 0:
                             place_piece(state, region, ARVERNI, CITADEL)
                             tribe_info["allied_faction"] = ARVERNI
-                            refresh_all_control(state)
+                            tribe_changed(state, tribe)
+                            flush_control(state)
                     else:
                         _ally_tribe(state, tribe, ARVERNI)
 
@@ -2087,6 +2102,7 @@ def execute_card_48(state, shaded=False):
     if faction:
         state["eligibility"][faction] = ELIGIBLE
 
+@batched
 def execute_card_49(state, shaded=False):
     """Card 49: Drought — Halve Resources, Devastate, remove pieces.
 
@@ -2185,7 +2201,6 @@ def execute_card_49(state, shaded=False):
                 elif get_leader_in_region(
                         state, region, faction) is not None:
                     remove_piece(state, region, faction, LEADER)
-    refresh_all_control(state)
 
 def execute_card_50(state, shaded=False):
     """Card 50: Shifting Loyalties — Remove a Capability.
@@ -2284,6 +2299,7 @@ def execute_card_52(state, shaded=False):
         state["event_modifiers"]["card_52_free_command_sa"] = True
         state["event_modifiers"]["card_52_special_abilities"] = 2
 
+@batched
 def execute_card_53(state, shaded=False):
     """Card 53: Consuetudine — Germanic Warbands Hidden + Germans Phase.
 
@@ -2295,7 +2311,6 @@ def execute_card_53(state, shaded=False):
     from fs_bot.commands.rally import germans_phase_rally
     from fs_bot.commands.raid import germans_phase_raid_region
     from fs_bot.engine.germans_battle import germans_phase_battle
-    from fs_bot.board.control import refresh_all_control
     # Flip all Germanic Warbands to Hidden.
     for region in state["spaces"]:
         revealed = count_pieces_by_state(state, region, GERMANS, WARBAND, REVEALED)
@@ -2331,7 +2346,6 @@ def execute_card_53(state, shaded=False):
                 and not _reserve_for_ambush(region)):
             germans_phase_raid_region(state, region)
     germans_phase_battle(state)
-    refresh_all_control(state)
 
 def execute_card_54(state, shaded=False):
     """Card 54: Joined Ranks — Free March + multi-faction Battle.
@@ -2446,6 +2460,7 @@ def execute_card_57(state, shaded=False):
                 if t_info and t_info.get("status") in (
                         MARKER_DISPERSED, MARKER_DISPERSED_GATHERING):
                     t_info["status"] = None
+                    tribe_changed(state, tribe)
         # Place 1 Gallic Ally and up to 4 Warbands
         ally_faction = params.get("ally_faction")
         ally_tribe = params.get("ally_tribe")
@@ -2570,6 +2585,7 @@ def execute_card_60(state, shaded=False):
             if tribe_info and tribe_info.get("status") in (
                     MARKER_DISPERSED, MARKER_DISPERSED_GATHERING):
                 tribe_info["status"] = None
+                tribe_changed(state, tribe)
             markers = state.get("markers", {})
             if tribe in markers:
                 markers[tribe].pop(MARKER_DISPERSED, None)
@@ -2630,6 +2646,7 @@ def execute_card_61(state, shaded=False):
             if tribe_info.get("status") in (
                     MARKER_DISPERSED, MARKER_DISPERSED_GATHERING):
                 tribe_info["status"] = None
+                tribe_changed(state, tribe)
             markers = state.get("markers", {})
             if tribe in markers:
                 markers[tribe].pop(MARKER_DISPERSED, None)
@@ -2940,6 +2957,7 @@ def execute_card_68(state, shaded=False):
         if t_info and t_info.get("status") in (
                 MARKER_DISPERSED, MARKER_DISPERSED_GATHERING, MARKER_RAZED):
             t_info["status"] = None
+            tribe_changed(state, tribe)
         markers = state.get("markers", {})
         if tribe in markers:
             markers[tribe].pop(MARKER_DISPERSED, None)
@@ -2952,13 +2970,15 @@ def execute_card_68(state, shaded=False):
             place_piece(state, region, faction, CITADEL)
             if t_info is not None:
                 t_info["allied_faction"] = faction
-            refresh_all_control(state)
+                tribe_changed(state, tribe)
+            flush_control(state)
         if faction:
             avail = get_available(state, faction, WARBAND)
             to_place = min(4, avail)
             if to_place > 0:
                 place_piece(state, region, faction, WARBAND, count=to_place)
 
+@batched
 def execute_card_69(state, shaded=False):
     """Card 69: Segni & Condrusi — Place Germanic Warbands + Germans Phase.
 
@@ -2985,7 +3005,6 @@ def execute_card_69(state, shaded=False):
         if count_pieces_by_state(state, region, GERMANS, WARBAND, HIDDEN) > 0:
             germans_phase_raid_region(state, region)
     germans_phase_battle(state)
-    refresh_all_control(state)
 
 def execute_card_70(state, shaded=False):
     """Card 70: Camulogenus — Roman March+Battle / Place Warbands+Command.
@@ -3074,7 +3093,8 @@ def execute_card_71(state, shaded=False):
             # helpers read this).
             "region": region,
         }
-        refresh_all_control(state)
+        tribe_changed(state, colony_name)
+        flush_control(state)
 
 def execute_card_72(state, shaded=False):
     """Card 72: Impetuosity — March into Region + enemy Battle / Hidden March.
@@ -3705,8 +3725,8 @@ def execute_card_A31(state, shaded=False):
         # resolution and never persists as a standing German benefit, so it
         # has no separate referent here. The cancel flag is therefore set for
         # completeness; its concrete effect is the no-double below.
-        state["event_modifiers"]["card_A31_cancel_german_benefits"] = True
-        state["event_modifiers"]["card_A31_no_ario_double"] = True
+        set_event_modifier(state, "card_A31_cancel_german_benefits")
+        set_event_modifier(state, "card_A31_no_ario_double")
         # BGG thread 2079436 (Q&A): the unshaded side IS a Capability —
         # register it so Shifting Loyalties can remove it (the companion
         # modifiers above are cleared by deactivate/replace).
@@ -3757,9 +3777,8 @@ def execute_card_A33(state, shaded=False):
     Source: A Card Reference, card A33
     """
     if not shaded:
-        state.setdefault("event_modifiers", {})
-        state["event_modifiers"]["card_A33_no_german_retreat"] = True
-        state["event_modifiers"]["card_A33_remove_outnumbered"] = True
+        set_event_modifier(state, "card_A33_no_german_retreat")
+        set_event_modifier(state, "card_A33_remove_outnumbered")
     else:
         activate_capability(state, "A33", EVENT_SHADED)
 
@@ -4648,8 +4667,7 @@ def execute_card_A70(state, shaded=False):
     Source: A Card Reference, card A70
     """
     if not shaded:
-        state.setdefault("event_modifiers", {})
-        state["event_modifiers"]["card_A70_no_belgae_retreat"] = True
+        set_event_modifier(state, "card_A70_no_belgae_retreat")
     else:
         activate_capability(state, "A70", EVENT_SHADED)
 
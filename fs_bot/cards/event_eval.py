@@ -62,10 +62,11 @@ from fs_bot.rules_consts import (
     ROMAN_CONTROL, NO_CONTROL,
 )
 from fs_bot.board.pieces import (
-    get_available, count_pieces, find_leader,
+    get_available, count_pieces, find_leader, board_version,
     _count_on_legions_track,
 )
 from fs_bot.board.control import is_controlled_by, get_controlled_regions
+from fs_bot.state.caches import state_caches
 from fs_bot.cards.card_data import is_capability_card
 from fs_bot.cards.bot_instructions import (
     get_bot_instruction, NO_EVENT, CONDITIONAL,
@@ -904,68 +905,189 @@ def get_event_flags(card_id, shaded=False, scenario=None):
 # For Capability cards, they are always considered effective per §8.1.1
 # ("Adding or removing a Capability is an effect") — the separate
 # "Capability in final year" check handles the last-year rejection.
+#
+# Each card side's flags are compiled at import into a requirement: a
+# bitmask over the board facts below, any one of which makes the Event
+# effective (_ALWAYS for sides that are effective unconditionally). The
+# map facts take a board sweep, so they are cached per board version
+# (pieces.board_version); the pool facts are a handful of dict reads and
+# are taken fresh.
+
+_ALWAYS = 1 << 0
+# Map facts
+_ON_MAP_GERMANS = 1 << 1          # any Germanic piece
+_ON_MAP_ARVERNI = 1 << 2          # any Arverni piece
+_ON_MAP_LEGION = 1 << 3
+_ON_MAP_AUXILIA = 1 << 4
+_ON_MAP_WARBAND = 1 << 5          # any Faction's Warbands
+_ON_MAP_ALLY = 1 << 6             # any Faction's Allies
+_ON_MAP_CITADEL = 1 << 7          # any Gallic Citadel
+_ON_MAP_FORT = 1 << 8
+_ON_MAP_SETTLEMENT = 1 << 9
+# Pool facts
+_AV_GERMAN_WARBAND = 1 << 10
+_AV_GERMAN_ALLY = 1 << 11
+_AV_ARVERNI_WARBAND = 1 << 12
+_AV_LEGION = 1 << 13              # on the track or Fallen
+_AV_AUXILIA = 1 << 14
+_AV_WARBAND = 1 << 15
+_AV_ALLY = 1 << 16
+_AV_CITADEL = 1 << 17
+_AV_FORT = 1 << 18
+_AV_SETTLEMENT = 1 << 19
+_ANY_CAPABILITY = 1 << 20
+
+_MAP_FACTS = ((1 << 10) - 1) & ~_ALWAYS
+_POOL_FACTS = ((1 << 21) - 1) & ~(_MAP_FACTS | _ALWAYS)
+
+_WARBAND_FACTIONS = (ARVERNI, AEDUI, BELGAE, GERMANS)
+
+# (faction, piece type, fact) probed per Region by the map sweep.
+_MAP_PROBES = (
+    ((ROMANS, LEGION, _ON_MAP_LEGION),
+     (ROMANS, AUXILIA, _ON_MAP_AUXILIA),
+     (ROMANS, FORT, _ON_MAP_FORT),
+     (GERMANS, SETTLEMENT, _ON_MAP_SETTLEMENT))
+    + tuple((f, WARBAND, _ON_MAP_WARBAND) for f in _WARBAND_FACTIONS)
+    + tuple((f, ALLY, _ON_MAP_ALLY) for f in FACTIONS)
+    + tuple((f, CITADEL, _ON_MAP_CITADEL) for f in GALLIC_FACTIONS)
+)
 
-def _has_legions_on_map(state):
-    """Check if any Legions exist on the map."""
-    for region in ALL_REGIONS:
-        if count_pieces(state, region, ROMANS, LEGION) > 0:
-            return True
-    return False
+_FREE_ACTION_FLAGS = frozenset({
+    FREE_COMMAND, FREE_BATTLE, FREE_MARCH, FREE_RALLY,
+    FREE_RAID, FREE_SCOUT, FREE_SEIZE, FREE_SA,
+})
+_UNCONDITIONAL_FLAGS = frozenset({
+    AFFECTS_ELIGIBILITY, ADDS_RESOURCES, REMOVES_RESOURCES, PLACES_MARKERS,
+})
+# Placement needs pieces to place; removal needs pieces on the map.
+_PIECE_FLAG_FACTS = {
+    PLACES_LEGIONS: _AV_LEGION,
+    PLACES_AUXILIA: _AV_AUXILIA,
+    PLACES_WARBANDS: _AV_WARBAND,
+    PLACES_ALLIES: _AV_ALLY,
+    PLACES_CITADELS: _AV_CITADEL,
+    PLACES_FORTS: _AV_FORT,
+    PLACES_SETTLEMENTS: _AV_SETTLEMENT,
+    REMOVES_LEGIONS: _ON_MAP_LEGION,
+    REMOVES_AUXILIA: _ON_MAP_AUXILIA,
+    REMOVES_WARBANDS: _ON_MAP_WARBAND,
+    REMOVES_ALLIES: _ON_MAP_ALLY,
+    REMOVES_CITADELS: _ON_MAP_CITADEL,
+    REMOVES_FORTS: _ON_MAP_FORT,
+    REMOVES_SETTLEMENTS: _ON_MAP_SETTLEMENT,
+}
 
 
-def _has_fallen_legions(state):
-    """Check if any Fallen Legions exist."""
-    return state.get("fallen_legions", 0) > 0
+def _requirement(card_id, flags):
+    """Compile one card side's flags into its board-fact requirement."""
+    # Free Commands/Battles/Marches can almost always do something, and
+    # the Senate can always shift.
+    if flags & _FREE_ACTION_FLAGS or SHIFTS_SENATE in flags:
+        return _ALWAYS
+    # A Germans Phase with no Germans on map might still Rally from
+    # Available; likewise the Arverni Phase (Ariovistus).
+    if TRIGGERS_GERMANS_PHASE in flags:
+        return _ON_MAP_GERMANS | _AV_GERMAN_WARBAND | _AV_GERMAN_ALLY
+    if TRIGGERS_ARVERNI_PHASE in flags:
+        return _ON_MAP_ARVERNI | _AV_ARVERNI_WARBAND
+    if flags & _UNCONDITIONAL_FLAGS:
+        return _ALWAYS
+    if REMOVES_MARKERS in flags:
+        # Card 50 (Shifting Loyalties): removes a Capability
+        return _ANY_CAPABILITY if card_id == 50 else _ALWAYS
+    if flags & {MOVES_PIECES, PLACES_LEADER, REMOVES_LEADER}:
+        return _ALWAYS
+    need = 0
+    for flag, fact in _PIECE_FLAG_FACTS.items():
+        if flag in flags:
+            need |= fact
+    # Empty flag set — shouldn't happen, assume effective
+    return need if flags else _ALWAYS
 
 
-def _total_legions_on_track(state):
-    """Count total Legions on the Legions track."""
-    return _count_on_legions_track(state)
+def _compile(table):
+    return {card_id: (_requirement(card_id, unshaded),
+                      _requirement(card_id, shaded))
+            for card_id, (unshaded, shaded) in table.items()}
 
 
-def _faction_has_pieces_on_map(state, faction, piece_type=None):
-    """Check if a faction has any pieces on the map."""
-    for region in ALL_REGIONS:
-        if piece_type:
-            if count_pieces(state, region, faction, piece_type) > 0:
-                return True
-        else:
-            if count_pieces(state, region, faction) > 0:
-                return True
-    return False
+_BASE_NEEDS = _compile(_BASE_FLAGS)
+_ARIOVISTUS_NEEDS = _compile(_ARIOVISTUS_FLAGS)
+_SECOND_EDITION_NEEDS = _compile(_SECOND_EDITION_FLAGS)
 
 
-def _any_gallic_faction_has_citadel(state):
-    """Check if any Gallic faction has a Citadel on the map."""
-    for faction in GALLIC_FACTIONS:
-        if _faction_has_pieces_on_map(state, faction, CITADEL):
-            return True
-    return False
+def _event_requirement(card_id, shaded, scenario):
+    """The compiled requirement for a card side (KeyError if unknown);
+    table selection mirrors get_event_flags."""
+    idx = 1 if shaded else 0
+    if isinstance(card_id, str) and card_id.startswith("A"):
+        return _ARIOVISTUS_NEEDS[card_id][idx]
+    if (scenario is not None and scenario in ARIOVISTUS_SCENARIOS
+            and card_id in _SECOND_EDITION_NEEDS):
+        return _SECOND_EDITION_NEEDS[card_id][idx]
+    return _BASE_NEEDS[card_id][idx]
 
 
-def _count_on_map(state, faction, piece_type):
-    """Count total pieces of a type on the map for a faction."""
-    total = 0
+def _sweep_map(state):
+    """One pass over the map collecting the map facts."""
+    facts = 0
     for region in ALL_REGIONS:
-        total += count_pieces(state, region, faction, piece_type)
-    return total
-
-
-def _any_allies_on_map(state, factions=None):
-    """Check if any Allied Tribes exist on the map for given factions."""
-    if factions is None:
-        factions = FACTIONS
-    for faction in factions:
-        if _faction_has_pieces_on_map(state, faction, ALLY):
-            return True
-    return False
-
-
-def _any_active_capabilities(state):
-    """Check if any Capabilities are currently active. state["capabilities"]
-    maps each active Capability's card_id to the side in play (a string), so a
-    non-empty dict means at least one Capability is active."""
-    return bool(state.get("capabilities", {}))
+        if not facts & _ON_MAP_GERMANS and count_pieces(state, region,
+                                                        GERMANS):
+            facts |= _ON_MAP_GERMANS
+        if not facts & _ON_MAP_ARVERNI and count_pieces(state, region,
+                                                        ARVERNI):
+            facts |= _ON_MAP_ARVERNI
+        for faction, piece_type, fact in _MAP_PROBES:
+            if not facts & fact and count_pieces(state, region, faction,
+                                                 piece_type):
+                facts |= fact
+        if facts == _MAP_FACTS:
+            break
+    return facts
+
+
+def _map_facts(state):
+    # Cached on the state as (board version, map facts).
+    version = board_version(state)
+    caches = state_caches(state)
+    entry = caches.get("map_facts")
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    facts = _sweep_map(state)
+    caches["map_facts"] = (version, facts)
+    return facts
+
+
+def _pool_facts(state):
+    facts = 0
+    if get_available(state, GERMANS, WARBAND) > 0:
+        facts |= _AV_GERMAN_WARBAND
+    if get_available(state, GERMANS, ALLY) > 0:
+        facts |= _AV_GERMAN_ALLY
+    if get_available(state, ARVERNI, WARBAND) > 0:
+        facts |= _AV_ARVERNI_WARBAND
+    if (_count_on_legions_track(state) > 0
+            or state.get("fallen_legions", 0) > 0):
+        facts |= _AV_LEGION
+    if get_available(state, ROMANS, AUXILIA) > 0:
+        facts |= _AV_AUXILIA
+    if any(get_available(state, f, WARBAND) > 0 for f in _WARBAND_FACTIONS):
+        facts |= _AV_WARBAND
+    if any(get_available(state, f, ALLY) > 0 for f in FACTIONS):
+        facts |= _AV_ALLY
+    if any(get_available(state, f, CITADEL) > 0 for f in GALLIC_FACTIONS):
+        facts |= _AV_CITADEL
+    if get_available(state, ROMANS, FORT) > 0:
+        facts |= _AV_FORT
+    if get_available(state, GERMANS, SETTLEMENT) > 0:
+        facts |= _AV_SETTLEMENT
+    # state["capabilities"] maps each active Capability's card_id to the
+    # side in play, so a non-empty dict means at least one is active.
+    if state.get("capabilities"):
+        facts |= _ANY_CAPABILITY
+    return facts
 
 
 def is_event_effective(state, card_id, shaded=False):
@@ -990,150 +1112,19 @@ def is_event_effective(state, card_id, shaded=False):
     if is_capability_card(card_id, scenario):
         return True
 
-    # Check card-specific effectiveness via the flag table plus state checks
     try:
-        flags = get_event_flags(card_id, shaded, scenario)
+        need = _event_requirement(card_id, shaded, scenario)
     except KeyError:
         # Unknown card — assume effective to be safe
         return True
-
-    # If the card has free commands/battles/marches, it's almost always
-    # effective (something can be done). The only exception would be if
-    # no pieces exist at all, which is extremely rare.
-    free_action_flags = {
-        FREE_COMMAND, FREE_BATTLE, FREE_MARCH, FREE_RALLY,
-        FREE_RAID, FREE_SCOUT, FREE_SEIZE, FREE_SA,
-    }
-    if flags & free_action_flags:
+    if need & _ALWAYS:
         return True
-
-    # If the card shifts the Senate, it's always effective
-    if SHIFTS_SENATE in flags:
-        return True
-
-    # If the card triggers Germans Phase or Arverni Phase, check if
-    # relevant faction has pieces
-    if TRIGGERS_GERMANS_PHASE in flags:
-        if _faction_has_pieces_on_map(state, GERMANS):
-            return True
-        # Germans Phase with no Germans on map might still do something
-        # (Rally places from Available)
-        if get_available(state, GERMANS, WARBAND) > 0:
-            return True
-        if get_available(state, GERMANS, ALLY) > 0:
-            return True
-        return False
-
-    if TRIGGERS_ARVERNI_PHASE in flags:
-        # Arverni Phase (Ariovistus) — check if Arverni have pieces
-        if _faction_has_pieces_on_map(state, ARVERNI):
-            return True
-        if get_available(state, ARVERNI, WARBAND) > 0:
-            return True
-        return False
-
-    # If the card affects eligibility, it's always effective
-    if AFFECTS_ELIGIBILITY in flags:
-        return True
-
-    # If the card adds/removes resources, usually effective unless at cap/0
-    if ADDS_RESOURCES in flags or REMOVES_RESOURCES in flags:
-        return True
-
-    # If the card places markers, generally effective
-    if PLACES_MARKERS in flags:
-        return True
-
-    # If the card removes markers, check if any relevant markers exist
-    if REMOVES_MARKERS in flags:
-        # Card 50 (Shifting Loyalties): removes a Capability
-        if card_id == 50:
-            return _any_active_capabilities(state)
-        return True
-
-    # If the card moves pieces, check if pieces exist to move
-    if MOVES_PIECES in flags:
-        return True
-
-    # Check piece placement flags against Available pools
-    if PLACES_LEGIONS in flags:
-        # Legions come from track, not Available
-        if _total_legions_on_track(state) > 0:
-            return True
-        if _has_fallen_legions(state):
-            return True
-
-    if PLACES_AUXILIA in flags:
-        if get_available(state, ROMANS, AUXILIA) > 0:
-            return True
-
-    if PLACES_WARBANDS in flags:
-        for faction in (ARVERNI, AEDUI, BELGAE, GERMANS):
-            if get_available(state, faction, WARBAND) > 0:
-                return True
-
-    if PLACES_ALLIES in flags:
-        for faction in FACTIONS:
-            if get_available(state, faction, ALLY) > 0:
-                return True
-
-    if PLACES_CITADELS in flags:
-        for faction in GALLIC_FACTIONS:
-            if get_available(state, faction, CITADEL) > 0:
-                return True
-
-    if PLACES_FORTS in flags:
-        if get_available(state, ROMANS, FORT) > 0:
-            return True
-
-    if PLACES_SETTLEMENTS in flags:
-        if get_available(state, GERMANS, SETTLEMENT) > 0:
-            return True
-
-    if PLACES_LEADER in flags:
-        return True
-
-    # Check piece removal flags against what's on the map
-    if REMOVES_LEGIONS in flags:
-        if _has_legions_on_map(state):
-            return True
-
-    if REMOVES_AUXILIA in flags:
-        if _faction_has_pieces_on_map(state, ROMANS, AUXILIA):
-            return True
-
-    if REMOVES_WARBANDS in flags:
-        for faction in (ARVERNI, AEDUI, BELGAE, GERMANS):
-            if _faction_has_pieces_on_map(state, faction, WARBAND):
-                return True
-
-    if REMOVES_ALLIES in flags:
-        if _any_allies_on_map(state):
-            return True
-
-    if REMOVES_CITADELS in flags:
-        if _any_gallic_faction_has_citadel(state):
-            return True
-
-    if REMOVES_FORTS in flags:
-        if _faction_has_pieces_on_map(state, ROMANS, FORT):
-            return True
-
-    if REMOVES_SETTLEMENTS in flags:
-        if _faction_has_pieces_on_map(state, GERMANS, SETTLEMENT):
-            return True
-
-    if REMOVES_LEADER in flags:
-        return True
-
-    # If we got here and no flags matched as effective, the event
-    # is ineffective (nothing would happen)
-    # But only return False if we actually had flags to check
-    if flags:
-        return False
-
-    # Empty flag set — shouldn't happen, assume effective
-    return True
+    facts = 0
+    if need & _POOL_FACTS:
+        facts = _pool_facts(state)
+    if not need & facts and need & _MAP_FACTS:
+        facts |= _map_facts(state)
+    return bool(need & facts)
 
 
 # ---------------------------------------------------------------------------
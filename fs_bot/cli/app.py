@@ -429,14 +429,14 @@ def main(argv=None, stdin=None, stdout=None):
         + format_state_summary(state) + "\n"
         + format_region_table(state) + "\n"))
 
-    # Initial display
+    # Initial display. The same Observation is the baseline for the
+    # changes-diff: without it, the FIRST human prompt had no reference
+    # and bot actions earlier on card 1 were invisible.
+    last_human_snap[0] = snapshot_state(state)
     stdout.write(format_victory_state(state) + "\n")
     stdout.write(format_state_summary(state) + "\n")
-    stdout.write(format_region_table(state) + "\n")
+    stdout.write(format_region_table(state, last_human_snap[0]) + "\n")
     stdout.flush()
-    # Baseline for the changes-diff: without this, the FIRST human prompt
-    # had no reference and bot actions earlier on card 1 were invisible.
-    last_human_snap[0] = snapshot_state(state)
 
     # Run the game card by card with full rules execution, displaying and
     # autosaving after every card.
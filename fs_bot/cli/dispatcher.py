@@ -17,102 +17,12 @@ Reference:
 
 import sys
 
-from fs_bot.bots.bot_dispatch import dispatch_bot_turn
-from fs_bot.engine.game_engine import (
-    ACTION_COMMAND, ACTION_COMMAND_SA, ACTION_LIMITED_COMMAND,
-    ACTION_EVENT, ACTION_PASS,
-)
+from fs_bot.bots.bot_dispatch import dispatch_bot_turn, _translate_bot_action
+from fs_bot.engine.game_engine import ACTION_EVENT
 from fs_bot.cli.menus import prompt_action
 from fs_bot.cli.display import format_action
 
 
-# Bot action.command string constants (all bots use these literal labels)
-_BOT_PASS = "Pass"
-_BOT_EVENT = "Event"
-_BOT_NONE = "None"
-# Any of these means "the bot wants a Command of some kind"
-_BOT_COMMAND_NAMES = {"Battle", "March", "Rally", "Raid", "Recruit", "Seize"}
-# SA "no SA" sentinel — all bots use the literal "No SA"
-_BOT_SA_NONE = "No SA"
-
-
-def _translate_bot_action(bot_action, options):
-    """Translate a bot action dict to an engine action constant.
-
-    Rules:
-    - command == "Pass"  -> ACTION_PASS
-    - command == "Event" -> ACTION_EVENT
-    - command == "None"  -> ACTION_PASS (defensive — treat as a Pass)
-    - command in {Battle, March, Rally, Raid, Recruit, Seize}:
-        - If sa != "No SA"            -> ACTION_COMMAND_SA
-        - Else                        -> ACTION_COMMAND
-      Then, if the engine's legal options does NOT include the chosen
-      constant but DOES include LIMITED_COMMAND, downgrade to
-      LIMITED_COMMAND (§2.3.5). This handles the case where the engine
-      has already trimmed the menu for a 2nd Eligible whose options
-      are {LIMITED_COMMAND, ...}. Per §8.1.2 the NP would normally be
-      upgraded back to full Command+SA, but the engine's option list is
-      authoritative for what's legal in this position.
-
-    Args:
-        bot_action: Dict from a bot module.
-        options: List of legal engine action strings.
-
-    Returns:
-        The chosen engine action constant.
-
-    Raises:
-        ValueError: If translation produces a non-legal action and
-            cannot be downgraded.
-    """
-    cmd = bot_action.get("command", _BOT_NONE)
-
-    if cmd == _BOT_PASS or cmd == _BOT_NONE:
-        if ACTION_PASS in options:
-            return ACTION_PASS
-        # Defensive: if engine doesn't allow Pass somehow, fall through
-        raise ValueError(f"Bot chose Pass but it is not legal: {options}")
-
-    if cmd == _BOT_EVENT:
-        if ACTION_EVENT in options:
-            return ACTION_EVENT
-        # Engine forbids Event in this position — fall back to a Command
-        if ACTION_COMMAND in options:
-            return ACTION_COMMAND
-        if ACTION_LIMITED_COMMAND in options:
-            return ACTION_LIMITED_COMMAND
-        return ACTION_PASS
-
-    # Command of some kind
-    if cmd in _BOT_COMMAND_NAMES:
-        sa = bot_action.get("sa", _BOT_SA_NONE)
-        if sa and sa != _BOT_SA_NONE:
-            preferred = ACTION_COMMAND_SA
-        else:
-            preferred = ACTION_COMMAND
-        if preferred in options:
-            return preferred
-        # 2nd Eligible after 1st played Command-only:
-        # only LIMITED_COMMAND and PASS are legal — downgrade.
-        if ACTION_LIMITED_COMMAND in options:
-            return ACTION_LIMITED_COMMAND
-        # Fallback to whatever Command-like option is left
-        if ACTION_COMMAND in options:
-            return ACTION_COMMAND
-        if ACTION_COMMAND_SA in options:
-            return ACTION_COMMAND_SA
-        if ACTION_PASS in options:
-            return ACTION_PASS
-        raise ValueError(
-            f"Cannot translate bot command {cmd!r} into any of {options}"
-        )
-
-    # Unknown command literal — defensive fallback
-    if ACTION_PASS in options:
-        return ACTION_PASS
-    raise ValueError(f"Unknown bot command label: {cmd!r}")
-
-
 def make_decision_func(faction_modes, stdin=None, stdout=None, *, pause=True):
     """Build the engine decision callback.
 
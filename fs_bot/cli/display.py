@@ -4,6 +4,11 @@ Renders plain-text snapshots of the game state for the player. ASCII only,
 no curses, no emojis. All labels come from rules_consts. The display layer
 is read-only — it never mutates state.
 
+Tables are rendered incrementally: each Region's row is cached against the
+RegionView it was drawn from (region table) or the Tribe index stamp of
+its Region (tribes table), so after bots play a run of cards only the
+Regions that changed are formatted again.
+
 Reference:
   §1.0   Pieces, regions, tribes
   §1.6   Control
@@ -50,7 +55,9 @@ from fs_bot.rules_consts import (
 from fs_bot.cards.card_data import (
     get_card, get_np_symbols, get_faction_order, card_has_carnyx_trigger,
 )
-from fs_bot.board.pieces import count_pieces, get_available
+from fs_bot.board.pieces import count_on_map, get_available
+from fs_bot.board.tribes import tribe_index
+from fs_bot.state.observation import observe, EMPTY_REGION
 from fs_bot.map.map_data import (
     get_playable_regions, get_tribes_in_region,
 )
@@ -131,14 +138,8 @@ def _eligibility_label(state, faction):
 
 def _faction_total_allies_citadels(state, faction):
     """Return (allies, citadels) on the map for a faction."""
-    allies = sum(
-        1 for t in state["tribes"].values()
-        if t.get("allied_faction") == faction
-    )
-    citadels = 0
-    for region in state["spaces"]:
-        citadels += count_pieces(state, region, faction, CITADEL)
-    return allies, citadels
+    return (tribe_index(state).count(faction),
+            count_on_map(state, faction, CITADEL))
 
 
 def _format_senate(state):
@@ -260,51 +261,71 @@ def format_state_summary(state):
 # REGION TABLE
 # ============================================================================
 
-def _region_pieces_summary(state, region, faction, scenario):
-    """One-cell summary of a faction's pieces in a region."""
+def _region_pieces_summary(view, faction, scenario):
+    """One-cell summary of a faction's pieces in a region (a RegionView)."""
     parts = []
     # Allied Tribe discs FIRST — they are victory points and battle
     # targets; omitting them made enemy Allies invisible in play.
-    from fs_bot.rules_consts import ALLY as _ALLY_D
-    allies = count_pieces(state, region, faction, _ALLY_D)
+    allies = view.count(faction, ALLY)
     if allies:
         parts.append(f"Al:{allies}")
     # Leader — show only "L" + suffix (full names like Caesar/Ambiorix/Boduognatus
     # are too wide for the table). The leader's identity is on the card
     # and in the faction-detail views.
-    leader = state["spaces"].get(region, {}).get("pieces", {}).get(
-        faction, {}
-    ).get(LEADER)
+    leader = view.leader(faction)
     if leader is not None:
         # Use first 3 chars of leader name for ID hint
         leader_tag = str(leader)[:3]
         parts.append(f"L({leader_tag})")
     # Legions (Romans)
     if faction == ROMANS:
-        legs = count_pieces(state, region, faction, LEGION)
+        legs = view.count(faction, LEGION)
         if legs:
             parts.append(f"Lg:{legs}")
-        aux = count_pieces(state, region, faction, AUXILIA)
+        aux = view.count(faction, AUXILIA)
         if aux:
             parts.append(f"A:{aux}")
-        forts = count_pieces(state, region, faction, FORT)
+        forts = view.count(faction, FORT)
         if forts:
             parts.append(f"F:{forts}")
     else:
-        wb = count_pieces(state, region, faction, WARBAND)
+        wb = view.count(faction, WARBAND)
         if wb:
             parts.append(f"W:{wb}")
-    cit = count_pieces(state, region, faction, CITADEL)
+    cit = view.count(faction, CITADEL)
     if cit:
         parts.append(f"C:{cit}")
     if faction == GERMANS and scenario in ARIOVISTUS_SCENARIOS:
-        st = count_pieces(state, region, faction, SETTLEMENT)
+        st = view.count(faction, SETTLEMENT)
         if st:
             parts.append(f"S:{st}")
     return ",".join(parts) if parts else "-"
 
 
-def format_region_table(state):
+# (region, scenario) -> (RegionView, row). RegionViews are immutable and
+# carried over between observations until their region changes, so an
+# identical view means an identical row.
+_REGION_ROWS = {}
+
+
+def _region_row(region, view, scenario, w_rom, w_other):
+    key = (region, scenario)
+    hit = _REGION_ROWS.get(key)
+    if hit is not None and hit[0] is view:
+        return hit[1]
+    ctrl = _CONTROL_SHORT.get(
+        view.control if view.control is not None else NO_CONTROL, "-")
+    row = f"{region:<14}{ctrl:<6}"
+    for faction, width in ((ROMANS, w_rom), (ARVERNI, w_other),
+                           (AEDUI, w_other), (BELGAE, w_other),
+                           (GERMANS, w_other)):
+        cell = _region_pieces_summary(view, faction, scenario)
+        row += f"{cell:<{width}}"
+    _REGION_ROWS[key] = (view, row)
+    return row
+
+
+def format_region_table(state, obs=None):
     """Render a table of playable regions with piece counts per faction.
 
     Columns: Region | Control | Rom | Arv | Aed | Bel | Ger
@@ -313,11 +334,18 @@ def format_region_table(state):
     F=Fort, C=Citadel, S=Settlement (Ariovistus). Each cell lists only
     non-zero piece types separated by commas, or '-' if empty.
 
+    Args:
+        state: Game state dict.
+        obs: Optional Observation of ``state`` already taken for this
+            decision point.
+
     Returns:
         Multi-line string.
     """
     scenario = state["scenario"]
     playable = get_playable_regions(scenario)
+    if obs is None:
+        obs = observe(state)
     lines = []
     lines.append(SEP_HEAVY)
     lines.append("REGIONS  (Al=Ally L=Leader Lg=Legion A=Aux W=Warband "
@@ -340,16 +368,8 @@ def format_region_table(state):
     for region in ALL_REGIONS:
         if region not in playable:
             continue
-        ctrl = _CONTROL_SHORT.get(
-            state["spaces"][region].get("control", NO_CONTROL), "-"
-        )
-        row = f"{region:<14}{ctrl:<6}"
-        row += f"{_region_pieces_summary(state, region, ROMANS, scenario):<{w_rom}}"
-        row += f"{_region_pieces_summary(state, region, ARVERNI, scenario):<{w_other}}"
-        row += f"{_region_pieces_summary(state, region, AEDUI, scenario):<{w_other}}"
-        row += f"{_region_pieces_summary(state, region, BELGAE, scenario):<{w_other}}"
-        row += f"{_region_pieces_summary(state, region, GERMANS, scenario):<{w_other}}"
-        lines.append(row)
+        lines.append(_region_row(region, obs.region(region), scenario,
+                                 w_rom, w_other))
     lines.append(SEP_HEAVY)
     return "\n".join(lines)
 
@@ -371,6 +391,25 @@ def _tribe_status_label(tribe_info):
     return "Subdued"
 
 
+# (region, scenario) -> (TribeIndex, stamp, rows). The index's stamp for a
+# region advances whenever one of its Tribes changes.
+_TRIBE_ROWS = {}
+
+
+def _tribe_rows(state, region, scenario, index):
+    key = (region, scenario)
+    stamp = index.stamp(region)
+    hit = _TRIBE_ROWS.get(key)
+    if hit is not None and hit[0] is index and hit[1] == stamp:
+        return hit[2]
+    rows = []
+    for tribe in get_tribes_in_region(region, scenario):
+        info = state["tribes"].get(tribe, {})
+        rows.append(f"{region:<14}{tribe:<22}{_tribe_status_label(info):<24}")
+    _TRIBE_ROWS[key] = (index, stamp, rows)
+    return rows
+
+
 def format_tribes_table(state):
     """Render the tribe allegiances table, grouped by region.
 
@@ -381,6 +420,7 @@ def format_tribes_table(state):
     """
     scenario = state["scenario"]
     playable = get_playable_regions(scenario)
+    index = tribe_index(state)
     lines = []
     lines.append(SEP_HEAVY)
     lines.append("TRIBES")
@@ -390,12 +430,7 @@ def format_tribes_table(state):
     for region in ALL_REGIONS:
         if region not in playable:
             continue
-        tribes = get_tribes_in_region(region, scenario)
-        for tribe in tribes:
-            info = state["tribes"].get(tribe, {})
-            lines.append(
-                f"{region:<14}{tribe:<22}{_tribe_status_label(info):<24}"
-            )
+        lines.extend(_tribe_rows(state, region, scenario, index))
     lines.append(SEP_HEAVY)
     return "\n".join(lines)
 
@@ -545,33 +580,9 @@ def format_victory_state(state):
 # ============================================================================
 
 def snapshot_state(state):
-    """Light snapshot of the visible board for human-facing diffs."""
-    from fs_bot.rules_consts import (FACTIONS, WARBAND, AUXILIA, LEGION,
-                                     ALLY, CITADEL, FORT, SETTLEMENT)
-    from fs_bot.board.pieces import count_pieces, get_leader_in_region
-    pieces = {}
-    leaders = {}
-    for region in state.get("spaces", {}):
-        for f in FACTIONS:
-            for pt in (WARBAND, AUXILIA, LEGION, ALLY, CITADEL, FORT,
-                       SETTLEMENT):
-                n = count_pieces(state, region, f, pt)
-                if n:
-                    pieces[(region, f, pt)] = n
-            ldr = get_leader_in_region(state, region, f)
-            if ldr:
-                leaders[(region, f)] = ldr
-    tribes = {t: (ti.get("allied_faction"), ti.get("status"))
-              for t, ti in state.get("tribes", {}).items()}
-    return {
-        "resources": dict(state.get("resources", {})),
-        "pieces": pieces,
-        "leaders": leaders,
-        "tribes": tribes,
-        "senate": dict(state.get("senate") or {}),
-        "fallen": state.get("fallen_legions", 0),
-        "capabilities": dict(state.get("capabilities", {})),
-    }
+    """Snapshot of the visible board for human-facing diffs — an
+    :class:`~fs_bot.state.observation.Observation`."""
+    return observe(state)
 
 
 def _tribe_label(alleg):
@@ -584,49 +595,67 @@ def _tribe_label(alleg):
 
 
 def format_state_delta(before, after):
-    """Human-readable lines describing what changed between snapshots."""
+    """Human-readable lines describing what changed between two
+    Observations. Regions whose view is shared (an unchanged board) are
+    skipped without comparing."""
     lines = []
     # Resources
-    for f, v in after["resources"].items():
-        b = before["resources"].get(f, 0)
+    b_res = dict(before.resources)
+    for f, v in after.resources:
+        b = b_res.get(f, 0)
         if v != b:
             lines.append(f"  {f} Resources: {b} -> {v}")
-    # Pieces per region
-    keys = set(before["pieces"]) | set(after["pieces"])
+    # Pieces and leaders, per region
+    b_regions = dict(before.regions)
+    a_regions = dict(after.regions)
     per_region = {}
-    for k in sorted(keys):
-        region, f, pt = k
-        d = after["pieces"].get(k, 0) - before["pieces"].get(k, 0)
-        if d:
-            per_region.setdefault(region, []).append(
-                f"{f} {'+' if d > 0 else ''}{d} {pt}")
+    moved = []
+    for region in sorted(set(b_regions) | set(a_regions)):
+        b_view = b_regions.get(region, EMPTY_REGION)
+        a_view = a_regions.get(region, EMPTY_REGION)
+        if b_view is a_view:
+            continue
+        if b_view.pieces != a_view.pieces:
+            b_n = {(f, pt): n for f, pt, n in b_view.pieces}
+            a_n = {(f, pt): n for f, pt, n in a_view.pieces}
+            for k in sorted(set(b_n) | set(a_n)):
+                d = a_n.get(k, 0) - b_n.get(k, 0)
+                if d:
+                    f, pt = k
+                    per_region.setdefault(region, []).append(
+                        f"{f} {'+' if d > 0 else ''}{d} {pt}")
+        if b_view.leaders != a_view.leaders:
+            b_l, a_l = dict(b_view.leaders), dict(a_view.leaders)
+            for f in sorted(set(b_l) | set(a_l)):
+                if b_l.get(f) != a_l.get(f):
+                    if f not in a_l:
+                        moved.append(f"  {region}: {b_l[f]} left")
+                    else:
+                        moved.append(f"  {region}: {a_l[f]} arrived")
     for region in sorted(per_region):
         lines.append(f"  {region}: " + ", ".join(per_region[region]))
     # Leaders moved
-    b_l, a_l = before["leaders"], after["leaders"]
-    for k in sorted(set(b_l) | set(a_l)):
-        if b_l.get(k) != a_l.get(k):
-            region, f = k
-            if k not in a_l:
-                lines.append(f"  {region}: {b_l[k]} left")
-            else:
-                lines.append(f"  {region}: {a_l[k]} arrived")
+    lines.extend(moved)
     # Tribes
-    for t in sorted(set(before["tribes"]) | set(after["tribes"])):
-        b = before["tribes"].get(t, (None, None))
-        a = after["tribes"].get(t, (None, None))
+    b_tribes = {t: (allied, status) for t, allied, status in before.tribes}
+    a_tribes = {t: (allied, status) for t, allied, status in after.tribes}
+    for t in sorted(set(b_tribes) | set(a_tribes)):
+        b = b_tribes.get(t, (None, None))
+        a = a_tribes.get(t, (None, None))
         if b != a:
             lines.append(f"  {t}: {_tribe_label(b)} -> {_tribe_label(a)}")
     # Senate / fallen / capabilities
-    if before["senate"] != after["senate"]:
-        lines.append(f"  Senate: {before['senate'].get('position')} -> "
-                     f"{after['senate'].get('position')}")
-    if before["fallen"] != after["fallen"]:
-        lines.append(f"  Fallen Legions: {before['fallen']} -> "
-                     f"{after['fallen']}")
-    for cid in set(after["capabilities"]) - set(before["capabilities"]):
+    b_senate, a_senate = dict(before.senate), dict(after.senate)
+    if b_senate != a_senate:
+        lines.append(f"  Senate: {b_senate.get('position')} -> "
+                     f"{a_senate.get('position')}")
+    if before.fallen != after.fallen:
+        lines.append(f"  Fallen Legions: {before.fallen} -> "
+                     f"{after.fallen}")
+    b_caps, a_caps = dict(before.capabilities), dict(after.capabilities)
+    for cid in set(a_caps) - set(b_caps):
         lines.append(f"  New Capability in effect: card {cid} "
-                     f"({after['capabilities'][cid]})")
-    for cid in set(before["capabilities"]) - set(after["capabilities"]):
+                     f"({a_caps[cid]})")
+    for cid in set(b_caps) - set(a_caps):
         lines.append(f"  Capability removed: card {cid}")
     return lines
@@ -24,7 +24,7 @@ from fs_bot.rules_consts import (
     GERMAN_SPECIAL_ABILITIES_BASE, GERMAN_SPECIAL_ABILITIES_ARIOVISTUS,
     ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS,
     FACTIONS, LEGION, AUXILIA, WARBAND,
-    EVENT_SHADED, EVENT_UNSHADED, ARIOVISTUS_SCENARIOS,
+    EVENT_SHADED, EVENT_UNSHADED, ARIOVISTUS_SCENARIOS, SUBDUED,
 )
 from fs_bot.engine.game_engine import (
     ACTION_COMMAND, ACTION_COMMAND_SA, ACTION_LIMITED_COMMAND,
@@ -33,6 +33,7 @@ from fs_bot.engine.game_engine import (
 from fs_bot.map.map_data import (get_playable_regions, get_adjacent,
                                  is_adjacent)
 from fs_bot.board.pieces import count_pieces, get_leader_in_region
+from fs_bot.board.tribes import tribe_index
 from fs_bot.cli.menus import prompt_choice, prompt_yes_no
 
 _SA_NONE = "No SA"
@@ -92,12 +93,9 @@ def _battle_regions(state, faction):
 
 def _subdued_tribes(state, region):
     from fs_bot.map.map_data import get_tribes_in_region
-    out = []
-    for t in get_tribes_in_region(region, state["scenario"]):
-        ti = state.get("tribes", {}).get(t, {})
-        if ti.get("allied_faction") is None and ti.get("status") is None:
-            out.append(t)
-    return out
+    subdued = tribe_index(state).tribes(region, SUBDUED)
+    return [t for t in get_tribes_in_region(region, state["scenario"])
+            if t in subdued]
 
 
 def _pick_regions(stdin, stdout, prompt, candidates, *, at_least_one=True,
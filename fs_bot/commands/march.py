@@ -48,10 +48,10 @@ from fs_bot.board.pieces import (
     move_piece, count_pieces, count_pieces_by_state,
     flip_piece, remove_piece, get_leader_in_region,
     PieceError,
+    batched,
 )
-from fs_bot.board.control import refresh_all_control
 from fs_bot.map.map_data import (
-    get_adjacent_with_type, get_adjacency_type,
+    get_adjacent, get_adjacent_with_type, get_adjacency_type,
     ALL_REGION_DATA,
 )
 from fs_bot.commands.common import CommandError, _is_devastated
@@ -281,6 +281,43 @@ def _max_steps_for_group(state, origin, faction, group):
     return 1
 
 
+# ============================================================================
+# ROUTES
+# ============================================================================
+
+def _bfs_tree(origin, playable):
+    """Sorted-neighbour BFS from ``origin`` over ``playable``: {dest: path}
+    with each path the tuple of Regions moved into (origin excluded)."""
+    paths = {origin: ()}
+    frontier = [origin]
+    while frontier:
+        nxt = []
+        for cur in frontier:
+            base = paths[cur]
+            for nb in sorted(get_adjacent(cur)):
+                if nb in paths or nb not in playable:
+                    continue
+                paths[nb] = base + (nb,)
+                nxt.append(nb)
+        frontier = nxt
+    return paths
+
+
+_ROUTE_TREES = {}
+
+
+def march_route(origin, dest, playable):
+    """Shortest route origin -> dest over ``playable`` (the Regions moved
+    into), or None. Ties go to the alphabetically first neighbour at each
+    step; the BFS tree per (playable, origin) is computed once."""
+    key = (frozenset(playable), origin)
+    tree = _ROUTE_TREES.get(key)
+    if tree is None:
+        tree = _ROUTE_TREES[key] = _bfs_tree(origin, key[0])
+    found = tree.get(dest)
+    return None if found is None else list(found)
+
+
 # ============================================================================
 # FLIPPING (HIDE) AT ORIGIN
 # ============================================================================
@@ -374,6 +411,7 @@ def _flip_origin_pieces(state, origin, faction):
 # HARASSMENT — §3.2.2, §3.3.2, §3.2.3, A3.2.2, A3.4.5
 # ============================================================================
 
+@batched
 def resolve_harassment(state, region, marching_faction, departing_pieces,
                        *, harassing_factions=None):
     """Resolve Harassment against departing pieces in a region.
@@ -459,9 +497,6 @@ def resolve_harassment(state, region, marching_faction, departing_pieces,
                 result["total_pieces_removed"] += removal[1]
 
         result["losses_by_faction"].append(faction_result)
-
-    # Harassment removes pieces; keep Control flags current.
-    refresh_all_control(state)
     return result
 
 def _auto_detect_harassers(state, region, marching_faction):
@@ -574,6 +609,7 @@ def _resolve_one_harassment_loss(state, region, marching_faction,
 # MARCH EXECUTION — SINGLE GROUP
 # ============================================================================
 
+@batched
 def march_group(state, faction, origin, destinations, group, *,
                 free=False):
     """Execute a March for a single group from origin through destinations.
@@ -679,10 +715,6 @@ def march_group(state, faction, origin, destinations, group, *,
             result["pieces_moved"][piece_type] = count
     if group.get(LEADER) is not None:
         result["pieces_moved"][LEADER] = 1
-
-    # Keep Control flags trustworthy for any caller (the bot March path
-    # calls march_group directly, without execute_march's tail refresh).
-    refresh_all_control(state)
     return result
 
 def _iter_group_pieces(group):
@@ -865,6 +897,7 @@ def march_from_origin(state, faction, origin, groups_and_destinations, *,
 # FULL MARCH COMMAND
 # ============================================================================
 
+@batched
 def execute_march(state, faction, origins_data, *, free=False, limited=False):
     """Execute a full March command across one or more origin regions.
 
@@ -926,9 +959,6 @@ def execute_march(state, faction, origins_data, *, free=False, limited=False):
         origin_result["cost"] = cost
         result["origins"].append(origin_result)
 
-    # Refresh control after all movement
-    refresh_all_control(state)
-
     return result
 
 
@@ -936,6 +966,7 @@ def execute_march(state, faction, origins_data, *, free=False, limited=False):
 # GERMANS PHASE MARCH (§6.2.2) — Base Game Only
 # ============================================================================
 
+@batched
 def germans_phase_march(state):
     """Execute the Germans Phase March procedure — §6.2.2.
 
@@ -1144,7 +1175,4 @@ def germans_phase_march(state):
         if flipped:
             result["flipped_regions"].append(region)
 
-    # Refresh control
-    refresh_all_control(state)
-
     return result
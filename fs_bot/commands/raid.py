@@ -35,8 +35,8 @@ from fs_bot.rules_consts import (
 
 from fs_bot.board.pieces import (
     flip_piece, count_pieces, count_pieces_by_state, PieceError,
+    batched,
 )
-from fs_bot.board.control import refresh_all_control
 from fs_bot.map.map_data import ALL_REGION_DATA
 from fs_bot.commands.common import CommandError, _is_devastated
 
@@ -193,6 +193,7 @@ def get_valid_steal_targets(state, region, faction):
 # RAID EXECUTION
 # ============================================================================
 
+@batched
 def raid_in_region(state, region, faction, raid_actions, *, free=False):
     """Execute Raid in a single region.
 
@@ -322,10 +323,6 @@ def raid_in_region(state, region, faction, raid_actions, *, free=False):
                     result["resources_stolen"].get(target, 0) + 1
                 )
 
-    # Control doesn't change from Raid (no pieces placed/removed,
-    # only flipped), but refresh for safety
-    refresh_all_control(state)
-
     return result
 
 
@@ -368,6 +365,7 @@ def get_germans_phase_raid_targets(state, region):
     return targets
 
 
+@batched
 def germans_phase_raid_region(state, region):
     """Execute deterministic Germanic Raid in a region during Germans Phase.
 
@@ -449,6 +447,4 @@ def germans_phase_raid_region(state, region):
             result["resources_stolen"][target] = (
                 result["resources_stolen"].get(target, 0) + 1
             )
-
-    refresh_all_control(state)
     return result
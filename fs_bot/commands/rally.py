@@ -10,6 +10,8 @@ Reference: §3.2.1 (Recruit), §3.3.1 (Rally), §3.4.1 (Germanic Rally),
            A3.2.1, A3.3.1, A3.4.1
 """
 
+from typing import NamedTuple
+
 from fs_bot.rules_consts import (
     # Factions
     ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS,
@@ -56,15 +58,18 @@ from fs_bot.rules_consts import (
 
 from fs_bot.board.pieces import (
     place_piece, remove_piece, count_pieces, get_available,
-    get_leader_in_region, PieceError,
+    get_leader_in_region, PieceError, board_version,
+    batched, flush_control,
 )
 from fs_bot.board.control import (
-    is_controlled_by, refresh_all_control, calculate_control,
+    is_controlled_by, calculate_control,
 )
+from fs_bot.board.tribes import tribe_changed, tribe_index
+from fs_bot.state.caches import state_caches
 from fs_bot.map.map_data import (
     get_adjacent, get_tribes_in_region, get_tribe_data,
     get_region_data, get_region_group, is_city_tribe,
-    ALL_REGION_DATA,
+    get_playable_regions, ALL_REGION_DATA,
 )
 from fs_bot.commands.common import CommandError, _is_devastated, _is_intimidated
 
@@ -112,6 +117,7 @@ def _region_allows_supply_line(state, region, faction, agreements=None):
             If None, assumes all factions other than Germans agree
             (and Arverni in Ariovistus).
     """
+    flush_control(state)
     space = state["spaces"].get(region, {})
     control = space.get("control", NO_CONTROL)
 
@@ -524,24 +530,15 @@ def _find_subdued_tribe_for_ally(state, region, faction):
     """
     scenario = state["scenario"]
     tribes = get_tribes_in_region(region, scenario)
+    index = tribe_index(state)
     eligible = []
 
     for tribe_name in tribes:
-        tribe_info = get_tribe_data(tribe_name)
-
-        # Check tribe status — must be Subdued (no existing Ally)
-        tribe_state = state.get("tribes", {}).get(tribe_name, {})
-        status = tribe_state.get("status")
-        allied_faction = tribe_state.get("allied_faction")
-
-        # A tribe with an existing Ally is not Subdued
-        if allied_faction is not None:
+        # Must be Subdued: no existing Ally, no Dispersed marker
+        if not index.is_open(tribe_name):
             continue
 
-        # Check for Dispersed marker
-        from fs_bot.rules_consts import DISPERSED, DISPERSED_GATHERING
-        if status in (DISPERSED, DISPERSED_GATHERING):
-            continue
+        tribe_info = get_tribe_data(tribe_name)
 
         # Check faction restriction — §1.4.2
         restriction = tribe_info.faction_restriction
@@ -557,6 +554,7 @@ def _find_subdued_tribe_for_ally(state, region, faction):
     return eligible
 
 
+@batched
 def recruit_in_region(state, region, action, *, tribe=None, free=False,
                       agreements=None):
     """Execute Roman Recruit in a single region.
@@ -649,6 +647,7 @@ def recruit_in_region(state, region, action, *, tribe=None, free=False,
         # Update tribe status
         state["tribes"][tribe]["allied_faction"] = ROMANS
         state["tribes"][tribe]["status"] = None  # Allied now
+        tribe_changed(state, tribe)
 
         result["pieces_placed"][ALLY] = 1
         result["tribe_allied"] = tribe
@@ -689,9 +688,6 @@ def recruit_in_region(state, region, action, *, tribe=None, free=False,
     else:
         raise CommandError(f"Unknown Recruit action: {action}")
 
-    # Refresh control
-    refresh_all_control(state)
-
     return result
 
 
@@ -760,6 +756,7 @@ def _german_warband_cap(state, region):
     return allies
 
 
+@batched
 def rally_in_region(state, region, faction, action, *, tribe=None,
                     free=False):
     """Execute Rally in a single region.
@@ -865,6 +862,7 @@ def rally_in_region(state, region, faction, action, *, tribe=None,
         # Update tribe status
         state["tribes"][tribe]["allied_faction"] = faction
         state["tribes"][tribe]["status"] = None
+        tribe_changed(state, tribe)
 
         result["pieces_placed"][ALLY] = 1
         result["tribe_allied"] = tribe
@@ -1027,9 +1025,6 @@ def rally_in_region(state, region, faction, action, *, tribe=None,
     else:
         raise CommandError(f"Unknown Rally action: {action}")
 
-    # Refresh control
-    refresh_all_control(state)
-
     return result
 
 
@@ -1037,6 +1032,7 @@ def rally_in_region(state, region, faction, action, *, tribe=None,
 # GERMANIC RALLY — ARIOVISTUS HOME BONUS (A3.4.1)
 # ============================================================================
 
+@batched
 def german_rally_home_bonus(state, region):
     """Place the Germanic home region bonus Warband.
 
@@ -1069,7 +1065,6 @@ def german_rally_home_bonus(state, region):
         return 0
 
     place_piece(state, region, GERMANS, WARBAND)
-    refresh_all_control(state)
     return 1
 
 
@@ -1077,6 +1072,7 @@ def german_rally_home_bonus(state, region):
 # GERMANS PHASE RALLY (§6.2.1) — Base Game Only
 # ============================================================================
 
+@batched
 def germans_phase_rally(state):
     """Execute the Germans Phase Rally procedure — §6.2.1.
 
@@ -1163,8 +1159,9 @@ def germans_phase_rally(state):
             place_piece(state, chosen_region, GERMANS, ALLY)
             state["tribes"][chosen_tribe]["allied_faction"] = GERMANS
             state["tribes"][chosen_tribe]["status"] = None
+            tribe_changed(state, chosen_tribe)
             result["allies_placed"].append((chosen_region, chosen_tribe))
-            refresh_all_control(state)
+            flush_control(state)
 
     # Step 2: Place as many Warbands as possible — §6.2.1
     # Including where Allies were just placed, and in un-Devastated
@@ -1201,6 +1198,162 @@ def germans_phase_rally(state):
         if to_place > 0:
             place_piece(state, region, GERMANS, WARBAND, to_place)
             result["warbands_placed"][region] = to_place
-
-    refresh_all_control(state)
     return result
+
+
+# ============================================================================
+# RALLY OPPORTUNITIES — board-wide table for bot planning
+# ============================================================================
+#
+# Every bot's Rally estimator and prevalidate_rally_plan ask the same
+# questions of each Region (legal? cost? which tribes? what cap?). The table
+# answers them in one sweep and is cached per board: the key is the piece
+# board version plus what piece operations do not version — Tribe statuses,
+# Devastated/Intimidated markers and the active capabilities.
+
+class RallyRow(NamedTuple):
+    """What Rally by ``faction`` could do in ``region``, on the board as it
+    stands (before any placement of the Rally itself)."""
+    region: str
+    faction: str
+    legal: bool             # validate_rally_region
+    cost: int               # rally_cost
+    home: bool              # Rally symbol (Germans: also a Settlement, A3.4.1)
+    home_bonus: int         # A3.4.1 bonus Warband (Germania or Settlement)
+    controlled: bool        # is_controlled_by
+    ally_gate: bool         # place_ally gate: Control (or Vercingetorix)
+    leader: bool            # faction's Leader present
+    pieces: int             # faction's pieces
+    rival_pieces: int       # every other Faction's pieces
+    allies: int
+    citadels: int
+    settlements: int        # Germanic Settlements (Ariovistus)
+    allied_tribes: tuple    # tribes allied to faction
+    city_allied: tuple      # ... of which Cities (Citadel candidates)
+    open_tribes: tuple      # tribes with no Ally at all
+    ally_tribes: tuple      # _find_subdued_tribe_for_ally
+    base_cap: int           # _gallic_warband_cap / _german_warband_cap
+
+    def warband_cap(self, allies=0, citadels=0):
+        """Warbands rally_in_region would place here (before the Available
+        limit) once ``allies``/``citadels`` more of the faction's Allies and
+        Citadels stand here; 0 where it would refuse for want of a base."""
+        if self.faction == GERMANS:
+            cap = self.base_cap + allies
+            if not (self.allies + allies > 0 or self.settlements):
+                if self.home:
+                    return max(cap, 1)  # §3.4.1 home minimum
+                if cap <= 0:
+                    return 0
+            return cap
+        has_leader = self.faction == ARVERNI and self.leader
+        if not (self.allies + allies > 0 or self.citadels + citadels > 0
+                or has_leader):
+            # §3.3.1 Home Region: "at least one Warband"
+            return 1 if self.home else 0
+        cap = self.base_cap + allies + citadels
+        return max(cap, 1) if self.home else cap
+
+
+def _rally_row(state, region, faction):
+    scenario = state["scenario"]
+    ariovistus = scenario in ARIOVISTUS_SCENARIOS
+    tribes = state.get("tribes", {})
+    allied, city, open_ = [], [], []
+    for tribe in get_tribes_in_region(region, scenario):
+        owner = tribes.get(tribe, {}).get("allied_faction")
+        if owner is None:
+            open_.append(tribe)
+        elif owner == faction:
+            allied.append(tribe)
+            if is_city_tribe(tribe):
+                city.append(tribe)
+    controlled = is_controlled_by(state, region, faction)
+    leader = get_leader_in_region(state, region, faction)
+    ally_gate = controlled
+    if (not ally_gate and faction == ARVERNI
+            and scenario in BASE_SCENARIOS):
+        ally_gate = leader == VERCINGETORIX
+    settlements = (count_pieces(state, region, GERMANS, SETTLEMENT)
+                   if faction == GERMANS and ariovistus else 0)
+    home = (region in _get_home_regions(faction, scenario)
+            or settlements > 0)
+    if faction == GERMANS:
+        base_cap = _german_warband_cap(state, region)
+        home_bonus = int(ariovistus and (region in GERMANIA_REGIONS
+                                         or settlements > 0))
+    else:
+        base_cap = _gallic_warband_cap(state, region, faction)
+        home_bonus = 0
+    return RallyRow(
+        region=region,
+        faction=faction,
+        legal=validate_rally_region(state, region, faction)[0],
+        cost=rally_cost(state, region, faction),
+        home=home,
+        home_bonus=home_bonus,
+        controlled=controlled,
+        ally_gate=ally_gate,
+        leader=leader is not None,
+        pieces=count_pieces(state, region, faction),
+        rival_pieces=sum(count_pieces(state, region, f)
+                         for f in FACTIONS if f != faction),
+        allies=count_pieces(state, region, faction, ALLY),
+        citadels=count_pieces(state, region, faction, CITADEL),
+        settlements=settlements,
+        allied_tribes=tuple(allied),
+        city_allied=tuple(city),
+        open_tribes=tuple(open_),
+        ally_tribes=tuple(_find_subdued_tribe_for_ally(state, region,
+                                                       faction)),
+        base_cap=base_cap,
+    )
+
+
+def _unversioned(state):
+    """The inputs of a RallyRow that piece operations do not version:
+    Tribes (by the tribe index's stamp) and the Devastated and
+    Intimidated markers."""
+    spaces = state.get("spaces", {})
+    index = tribe_index(state)
+    return (
+        index, index.stamp(),
+        tuple((region, MARKER_DEVASTATED in m, MARKER_INTIMIDATED in m)
+              for region, m in state.get("markers", {}).items() if m),
+        tuple(region for region, space in spaces.items()
+              if space.get("devastated")),
+    )
+
+
+def rally_opportunities(state, faction):
+    """Rally by ``faction`` across the board: ``{region: RallyRow}`` for
+    every playable Region, in map order. Cached until the board changes;
+    treat the rows as read-only.
+    """
+    from fs_bot.cards.capabilities import capability_view
+    key = (board_version(state), capability_view(state),
+           _unversioned(state))
+    # Cached on the state as (key, {faction: table}).
+    caches = state_caches(state)
+    entry = caches.get("rally")
+    if entry is None or entry[0] != key:
+        entry = caches["rally"] = (key, {})
+    tables = entry[1]
+    table = tables.get(faction)
+    if table is None:
+        playable = get_playable_regions(state["scenario"],
+                                        state.get("capabilities"))
+        table = tables[faction] = {
+            region: _rally_row(state, region, faction)
+            for region in playable
+        }
+    return table
+
+
+def rally_row(state, region, faction):
+    """The :class:`RallyRow` for one Region — from the table when
+    ``region`` is playable, else computed on the spot."""
+    row = rally_opportunities(state, faction).get(region)
+    if row is None:
+        row = _rally_row(state, region, faction)
+    return row
@@ -41,8 +41,10 @@ from fs_bot.rules_consts import (
 )
 from fs_bot.board.pieces import (
     place_piece, remove_piece, get_available, count_pieces,
+    batched,
 )
-from fs_bot.board.control import is_controlled_by, refresh_all_control
+from fs_bot.board.control import is_controlled_by
+from fs_bot.board.tribes import tribe_changed
 from fs_bot.map.map_data import get_tribes_in_region, get_tribe_data
 from fs_bot.commands.common import CommandError, check_leader_proximity
 from fs_bot.commands.rally import has_supply_line
@@ -85,6 +87,7 @@ def validate_build_region(state, region, agreements=None):
     return (True, "")
 
 
+@batched
 def build_fort(state, region):
     """Place a Fort in a region via Build.
 
@@ -130,12 +133,10 @@ def build_fort(state, region):
     # Place Fort
     place_piece(state, region, ROMANS, FORT)
 
-    # Refresh control — Fort placement may change control
-    refresh_all_control(state)
-
     return {"placed": FORT, "cost": BUILD_COST_PER_FORT}
 
 
+@batched
 def build_subdue(state, region, tribe, target_faction):
     """Subdue (remove) one Gallic or Germanic Allied Tribe via Build.
 
@@ -198,9 +199,7 @@ def build_subdue(state, region, tribe, target_faction):
     # Mark tribe as Subdued
     state["tribes"][tribe]["status"] = None
     state["tribes"][tribe]["allied_faction"] = None
-
-    # Refresh control
-    refresh_all_control(state)
+    tribe_changed(state, tribe)
 
     return {
         "subdued": tribe,
@@ -209,6 +208,7 @@ def build_subdue(state, region, tribe, target_faction):
     }
 
 
+@batched
 def build_place_ally(state, region, tribe):
     """Place a Roman Ally at a Subdued Tribe via Build.
 
@@ -275,9 +275,7 @@ def build_place_ally(state, region, tribe):
 
     # Update tribe status
     state["tribes"][tribe]["allied_faction"] = ROMANS
-
-    # Refresh control
-    refresh_all_control(state)
+    tribe_changed(state, tribe)
 
     return {"placed_ally_at": tribe, "cost": BUILD_COST_PER_ALLY}
 
@@ -37,8 +37,9 @@ from fs_bot.rules_consts import (
 )
 from fs_bot.board.pieces import (
     count_pieces, count_pieces_by_state, remove_piece,
+    batched,
 )
-from fs_bot.board.control import is_controlled_by, refresh_all_control
+from fs_bot.board.control import is_controlled_by
 from fs_bot.commands.common import CommandError, check_leader_proximity
 
 
@@ -73,6 +74,7 @@ def validate_devastate_region(state, region):
     return (True, "")
 
 
+@batched
 def devastate_region(state, region, removals=None):
     """Execute Devastation in a region.
 
@@ -183,8 +185,6 @@ def devastate_region(state, region, removals=None):
         region_markers[MARKER_DEVASTATED] = True
         result["devastated_placed"] = True
 
-    refresh_all_control(state)
-
     return result
 
 
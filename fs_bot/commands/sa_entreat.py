@@ -40,8 +40,10 @@ from fs_bot.rules_consts import (
 from fs_bot.board.pieces import (
     count_pieces, count_pieces_by_state,
     place_piece, remove_piece, get_available,
+    batched,
 )
-from fs_bot.board.control import is_controlled_by, refresh_all_control
+from fs_bot.board.control import is_controlled_by
+from fs_bot.board.tribes import tribe_changed
 from fs_bot.map.map_data import get_tribes_in_region, get_tribe_data
 from fs_bot.commands.common import CommandError, check_leader_proximity
 
@@ -81,6 +83,7 @@ def validate_entreat_region(state, region):
     return (True, "")
 
 
+@batched
 def entreat_replace_piece(state, region, target_faction, target_piece_type,
                           target_piece_state=None):
     """Replace one enemy Warband or Auxilia with an Arverni Warband.
@@ -156,8 +159,6 @@ def entreat_replace_piece(state, region, target_faction, target_piece_type,
         place_piece(state, region, ARVERNI, WARBAND, 1, piece_state=HIDDEN)
         placed = True
 
-    refresh_all_control(state)
-
     return {
         "target_removed": (target_faction, target_piece_type),
         "arverni_placed": placed,
@@ -165,6 +166,7 @@ def entreat_replace_piece(state, region, target_faction, target_piece_type,
     }
 
 
+@batched
 def entreat_replace_ally(state, region, target_faction, tribe):
     """Replace one enemy Allied Tribe with an Arverni Allied Tribe.
 
@@ -233,6 +235,7 @@ def entreat_replace_ally(state, region, target_faction, tribe):
     # Remove enemy Ally
     remove_piece(state, region, target_faction, ALLY, 1)
     state["tribes"][tribe]["allied_faction"] = None
+    tribe_changed(state, tribe)
 
     # Try to place Arverni Ally
     placed = False
@@ -241,10 +244,9 @@ def entreat_replace_ally(state, region, target_faction, tribe):
         if arverni_avail >= 1:
             place_piece(state, region, ARVERNI, ALLY)
             state["tribes"][tribe]["allied_faction"] = ARVERNI
+            tribe_changed(state, tribe)
             placed = True
 
-    refresh_all_control(state)
-
     return {
         "target_removed": (target_faction, tribe),
         "arverni_placed": placed,
@@ -38,8 +38,9 @@ from fs_bot.rules_consts import (
 from fs_bot.board.pieces import (
     count_pieces_by_state, get_leader_in_region,
     flip_piece, remove_piece, clear_allied_tribe,
+    batched,
 )
-from fs_bot.board.control import is_controlled_by, refresh_all_control
+from fs_bot.board.control import is_controlled_by
 from fs_bot.commands.common import CommandError, check_leader_proximity
 
 
@@ -80,6 +81,7 @@ def validate_intimidate_region(state, region):
     return (True, "")
 
 
+@batched
 def intimidate(state, region, warbands_to_flip, target_faction,
                target_removals):
     """Execute Intimidate in a region.
@@ -188,8 +190,6 @@ def intimidate(state, region, warbands_to_flip, target_faction,
             remove_piece(state, region, target_faction, piece_type, 1,
                          piece_state=piece_state)
         result["target_removed"].append((piece_type, 1))
-
-    refresh_all_control(state)
     return result
 
 
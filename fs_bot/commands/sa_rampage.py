@@ -42,8 +42,8 @@ from fs_bot.rules_consts import (
 from fs_bot.board.pieces import (
     count_pieces, count_pieces_by_state, get_leader_in_region,
     flip_piece, remove_piece, move_piece,
+    batched,
 )
-from fs_bot.board.control import refresh_all_control
 from fs_bot.map.map_data import is_adjacent
 from fs_bot.commands.common import CommandError, check_leader_proximity
 
@@ -132,6 +132,7 @@ def validate_rampage_target(state, region, target_faction):
     return (True, "")
 
 
+@batched
 def rampage(state, region, target_faction, warbands_to_flip,
             target_actions):
     """Execute Rampage in a region.
@@ -246,8 +247,6 @@ def rampage(state, region, target_faction, warbands_to_flip,
 
         else:
             raise CommandError(f"Unknown Rampage action: {action}")
-
-    refresh_all_control(state)
     return result
 
 
@@ -40,8 +40,9 @@ from fs_bot.rules_consts import (
 )
 from fs_bot.board.pieces import (
     place_piece, get_available, count_pieces,
+    batched,
 )
-from fs_bot.board.control import is_controlled_by, refresh_all_control
+from fs_bot.board.control import is_controlled_by
 from fs_bot.map.map_data import is_adjacent, get_adjacent
 from fs_bot.commands.common import (
     CommandError, _is_devastated, check_leader_proximity,
@@ -107,6 +108,7 @@ def validate_settle_region(state, region, newly_placed_settlements=None):
     return (True, "")
 
 
+@batched
 def settle(state, region):
     """Place a Settlement in a region via Settle.
 
@@ -152,9 +154,6 @@ def settle(state, region):
     # Place Settlement
     place_piece(state, region, GERMANS, SETTLEMENT)
 
-    # Refresh control — Settlement counts for Germanic control
-    refresh_all_control(state)
-
     return {"placed": SETTLEMENT, "cost": cost}
 
 
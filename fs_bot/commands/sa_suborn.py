@@ -44,8 +44,9 @@ from fs_bot.rules_consts import (
 from fs_bot.board.pieces import (
     count_pieces, count_pieces_by_state, get_leader_in_region, find_leader,
     place_piece, remove_piece, get_available,
+    batched,
 )
-from fs_bot.board.control import refresh_all_control
+from fs_bot.board.tribes import tribe_changed
 from fs_bot.map.map_data import (
     is_adjacent, get_tribes_in_region, get_tribe_data,
 )
@@ -104,6 +105,7 @@ def validate_suborn_region(state, region):
     return (True, "")
 
 
+@batched
 def suborn(state, region, operations):
     """Execute Suborn — remove and/or place pieces.
 
@@ -198,6 +200,7 @@ def suborn(state, region, operations):
                     state["tribes"][tribe]["allied_faction"] = None
                     if state["tribes"][tribe].get("status") == "Allied":
                         state["tribes"][tribe]["status"] = None
+                    tribe_changed(state, tribe)
                 else:
                     from fs_bot.board.pieces import clear_allied_tribe
                     clear_allied_tribe(state, region, faction, ALLY)
@@ -207,12 +210,11 @@ def suborn(state, region, operations):
                 tribe = op["tribe"]
                 place_piece(state, region, faction, ALLY)
                 state["tribes"][tribe]["allied_faction"] = faction
+                tribe_changed(state, tribe)
             else:
                 place_piece(state, region, faction, piece_type, 1,
                             piece_state=HIDDEN)
             result["placed"].append((faction, piece_type, 1))
-
-    refresh_all_control(state)
     return result
 
 
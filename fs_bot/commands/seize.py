@@ -43,10 +43,12 @@ from fs_bot.board.pieces import (
     count_pieces, count_pieces_by_state, remove_piece,
     clear_allied_tribe,
     PieceError,
+    batched,
 )
 from fs_bot.board.control import (
-    is_controlled_by, refresh_all_control,
+    is_controlled_by,
 )
+from fs_bot.board.tribes import tribe_changed, tribe_index
 from fs_bot.map.map_data import (
     ALL_REGION_DATA, get_tribes_in_region,
 )
@@ -113,11 +115,8 @@ def count_dispersed_on_map(state):
     Returns:
         Integer count of Dispersed markers on the map.
     """
-    count = 0
-    for tribe, tribe_state in state.get("tribes", {}).items():
-        if tribe_state.get("status") in (DISPERSED, DISPERSED_GATHERING):
-            count += 1
-    return count
+    tribes = tribe_index(state)
+    return tribes.count(DISPERSED) + tribes.count(DISPERSED_GATHERING)
 
 
 def get_dispersible_tribes(state, region, as_if_control=False):
@@ -151,17 +150,14 @@ def get_dispersible_tribes(state, region, as_if_control=False):
     result = []
     tribes = get_tribes_in_region(region, scenario)
     remaining_markers = MAX_DISPERSED_MARKERS - current_dispersed
+    index = tribe_index(state)
 
     for tribe in tribes:
         if len(result) >= remaining_markers:
             break
 
-        tribe_state = state.get("tribes", {}).get(tribe, {})
-
         # Must be Subdued: no allied faction, no Dispersed status
-        if tribe_state.get("allied_faction") is not None:
-            continue
-        if tribe_state.get("status") in (DISPERSED, DISPERSED_GATHERING):
+        if not index.is_open(tribe):
             continue
 
         result.append(tribe)
@@ -433,6 +429,7 @@ def seize_rally_roll(state, faction):
 # SEIZE EXECUTION — §3.2.3
 # ============================================================================
 
+@batched
 def seize_in_region(state, region, tribes_to_disperse=None,
                     as_if_control=False):
     """Execute Seize in a single region.
@@ -518,6 +515,7 @@ def seize_in_region(state, region, tribes_to_disperse=None,
         # Place Dispersed markers — "not yet Gathering" — §3.2.3
         for tribe in tribes_to_disperse:
             state["tribes"][tribe]["status"] = DISPERSED
+            tribe_changed(state, tribe)
             result["tribes_dispersed"].append(tribe)
 
     # ----- Step 2: Rally Checks — §3.2.3 -----
@@ -544,8 +542,6 @@ def seize_in_region(state, region, tribes_to_disperse=None,
     result["harassment_opportunities"] = get_harassment_factions(
         state, region
     )
-
-    refresh_all_control(state)
     return result
 
 
@@ -25,6 +25,7 @@ from fs_bot.rules_consts import (
     MAX_RESOURCES, BASE_SCENARIOS, EVENT_SHADED,
 )
 from fs_bot.commands.common import CommandError
+from fs_bot.state import invariants
 
 
 def transfer_resources(state, giver, receiver, amount):
@@ -61,4 +62,6 @@ def transfer_resources(state, giver, receiver, amount):
     state["resources"][giver] = stock - actual
     state["resources"][receiver] = (
         state["resources"].get(receiver, 0) + actual)
+    if invariants.enabled:
+        invariants.resources(state, "transfer_resources", giver, receiver)
     return {"given": actual, "from": giver, "to": receiver}
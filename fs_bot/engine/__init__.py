@@ -6,37 +6,53 @@ Modules:
   germans_battle — Germans Phase Battle with Ambush (§6.2.4)
   arverni_phase — Arverni Phase game-run procedure (A6.2)
   game_engine — Sequence of Play orchestrator (§2.0-§2.4, A2.0-A2.3.9)
+  events — structured game event stream (sinks for analytics tools)
+  scheduler — asyncio multi-game driver for batched agent seats
 """
 
-from fs_bot.engine.victory import (
-    calculate_victory_score,
-    check_victory,
-    calculate_victory_margin,
-    check_any_victory,
-    determine_final_ranking,
-)
+import importlib
 
-from fs_bot.engine.winter import run_winter_round
+# Re-exports resolve lazily (PEP 562): importing a light submodule such as
+# ``fs_bot.engine.events`` from the board layer must not pull in the whole
+# engine, which itself imports the board layer.
+_EXPORTS = {
+    "calculate_victory_score": "victory",
+    "check_victory": "victory",
+    "calculate_victory_margin": "victory",
+    "check_any_victory": "victory",
+    "determine_final_ranking": "victory",
+    "run_winter_round": "winter",
+    "start_game": "game_engine",
+    "draw_card": "game_engine",
+    "advance_to_next_card": "game_engine",
+    "is_winter_card": "game_engine",
+    "is_frost": "game_engine",
+    "get_sop_factions": "game_engine",
+    "get_faction_order": "game_engine",
+    "get_eligible_factions": "game_engine",
+    "determine_eligible_order": "game_engine",
+    "get_first_eligible_options": "game_engine",
+    "get_second_eligible_options": "game_engine",
+    "execute_pass": "game_engine",
+    "adjust_eligibility": "game_engine",
+    "resolve_card_turn": "game_engine",
+    "card_turn_steps": "game_engine",
+    "DecisionRequest": "game_engine",
+    "resolve_winter_card": "game_engine",
+    "play_card": "game_engine",
+    "play_card_steps": "game_engine",
+    "run_game": "game_engine",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
 
-from fs_bot.engine.game_engine import (
-    start_game,
-    draw_card,
-    advance_to_next_card,
-    is_winter_card,
-    is_frost,
-    get_sop_factions,
-    get_faction_order,
-    get_eligible_factions,
-    determine_eligible_order,
-    get_first_eligible_options,
-    get_second_eligible_options,
-    execute_pass,
-    adjust_eligibility,
-    resolve_card_turn,
-    resolve_winter_card,
-    play_card,
-    run_game,
-)
 
 __all__ = [
     "calculate_victory_score",
@@ -59,7 +75,10 @@ __all__ = [
     "execute_pass",
     "adjust_eligibility",
     "resolve_card_turn",
+    "card_turn_steps",
+    "DecisionRequest",
     "resolve_winter_card",
     "play_card",
+    "play_card_steps",
     "run_game",
 ]
@@ -48,11 +48,13 @@ from fs_bot.board.pieces import (
     place_piece, remove_piece, move_piece, flip_piece,
     count_pieces, count_pieces_by_state, get_available,
     get_leader_in_region, find_leader, PieceError,
+    batched, flush_control,
 )
 from fs_bot.board.control import (
-    refresh_all_control, is_controlled_by, get_controlled_regions,
+    is_controlled_by, get_controlled_regions,
     calculate_control,
 )
+from fs_bot.board.tribes import tribe_changed
 from fs_bot.map.map_data import (
     get_adjacent, get_tribes_in_region, is_city_tribe,
     ALL_REGION_DATA, get_region_data, get_playable_regions,
@@ -290,6 +292,7 @@ def _factions_with_most_pieces(state, region):
 # A6.2.1 ARVERNI RALLY
 # ============================================================================
 
+@batched
 def _arverni_phase_rally(state, at_war_regions):
     """Execute Arverni Rally per A6.2.1.
 
@@ -359,9 +362,10 @@ def _arverni_phase_rally(state, at_war_regions):
         # Keep the authoritative tribe record allied to the Arverni so it
         # remains synchronized with the replacement Citadel piece.
         tribe_info["allied_faction"] = ARVERNI
+        tribe_changed(state, tribe)
         result["citadels_placed"].append((region, tribe))
         rallied_regions.add(region)
-        refresh_all_control(state)
+        flush_control(state)
 
     # Step 2: Place Allies — A6.2.1
     # Priority: Cities first, then Home Regions, then elsewhere
@@ -405,9 +409,10 @@ def _arverni_phase_rally(state, at_war_regions):
             # Place Ally
             place_piece(state, region, ARVERNI, ALLY)
             tribe_info["allied_faction"] = ARVERNI
+            tribe_changed(state, tribe)
             result["allies_placed"].append((region, tribe))
             rallied_regions.add(region)
-            refresh_all_control(state)
+            flush_control(state)
 
     # Step 3: Place Warbands — A6.2.1
     # Warbands = Allies + Citadels + 1 (Arverni Rally rule §3.3.1)
@@ -443,8 +448,6 @@ def _arverni_phase_rally(state, at_war_regions):
         if to_place > 0:
             place_piece(state, region, ARVERNI, WARBAND, to_place)
             result["warbands_placed"][region] = to_place
-
-    refresh_all_control(state)
     return result
 
 
@@ -452,6 +455,7 @@ def _arverni_phase_rally(state, at_war_regions):
 # A6.2.2 ARVERNI MARCH
 # ============================================================================
 
+@batched
 def _arverni_phase_march(state, target_region, is_frost=False):
     """Execute Arverni March per A6.2.2.
 
@@ -564,6 +568,7 @@ def _arverni_phase_march(state, target_region, is_frost=False):
     # Then: 1 additional region where Aedui or Roman Control can be removed
     # Aedui first — A6.2.2
     additional_dest = None
+    flush_control(state)
     for control_target in (AEDUI_CONTROL, ROMAN_CONTROL):
         for region in state["spaces"]:
             if region == target_region:
@@ -611,8 +616,6 @@ def _arverni_phase_march(state, target_region, is_frost=False):
                     "to": additional_dest,
                     "warbands": total_moved,
                 })
-
-    refresh_all_control(state)
     return result
 
 
@@ -777,6 +780,7 @@ def _get_raid_targets(state, region, target_faction):
 # A6.2.4 ARVERNI BATTLE WITH AMBUSH
 # ============================================================================
 
+@batched
 def _arverni_phase_battle(state, target_region, target_faction):
     """Execute Arverni Battle with Ambush per A6.2.4.
 
@@ -847,8 +851,6 @@ def _arverni_phase_battle(state, target_region, target_faction):
                 "defender": defending_faction,
                 "result": battle_result,
             })
-
-    refresh_all_control(state)
     return result
 
 
@@ -896,6 +898,7 @@ def _get_battle_targets(state, region, target_faction, arverni_hidden):
 # MAIN: RUN ARVERNI PHASE
 # ============================================================================
 
+@batched
 def run_arverni_phase(state, is_frost=False, force_at_war=False):
     """Execute the full Arverni Phase — A6.2.
 
@@ -957,6 +960,4 @@ def run_arverni_phase(state, is_frost=False, force_at_war=False):
     result["battle"] = _arverni_phase_battle(
         state, target_region, target_faction
     )
-
-    refresh_all_control(state)
     return result
@@ -0,0 +1,141 @@
+"""Executor error codes — stable integers for how an action fell short.
+
+``execute_decision`` reports a refusal as a human message (``reason``,
+``errors``, ``sa_skipped``). The message is for people; tools that count
+failures across thousands of games key on the code instead. The executor
+attaches one at every refusal site (``reason_code``, ``sa_skipped_code``,
+and ``code`` on each ``errors`` entry, one per Command/SA step);
+:func:`reason_code` only classifies a refusal that arrives without one,
+such as a result saved before its site had a code. Each code has a name
+and a severity:
+
+    counts = error_codes.counter()      # one slot per code
+    counts[code] += 1
+    error_codes.SEVERITY[code]          # "illegal", "legal-decline", ...
+
+Codes are stable: saved census output and results databases key on them.
+Add new codes at the end.
+"""
+from __future__ import annotations
+
+
+# Severities, most serious first.
+ILLEGAL = "illegal"                        # executor refused a proposal
+WASTEFUL_SA = "wasteful-sa"                # SA attached, accomplished nothing
+INEFFECTIVE_EVENT = "ineffective-event"    # Event played, did nothing
+LEGAL_DECLINE = "legal-decline"            # the flowchart's own IF-NONE
+OTHER_REFUSED = "other-refused"            # unexpected refusal
+
+SEVERITIES = (ILLEGAL, WASTEFUL_SA, INEFFECTIVE_EVENT, LEGAL_DECLINE,
+              OTHER_REFUSED)
+
+E_UNKNOWN = 0
+E_CRASH = 1                    # the game raised or timed out
+E_COMMAND_ENTRY = 2            # a Command plan entry refused, no site code
+E_SA_ENTRY = 3                 # an SA plan entry refused, no site code
+E_SA_NO_EFFECT = 4             # the SA ran and accomplished nothing
+E_SA_SKIPPED = 5               # SA withheld after an empty Command
+E_NO_LEGAL_EFFECT = 6          # the Command produced no legal effect
+E_MARCH_NOTHING_MARCHABLE = 7  # expand/mass March IF-NONE fall-through
+E_SA_NONE_AT_SA_TIME = 8       # SA re-derived after the Command: none
+E_IF_NONE = 9                  # another flowchart IF-NONE
+E_EVENT_NOT_APPLICABLE = 10    # the Event's effect could not apply
+E_NO_PLAN = 11                 # decision carries no executable plan
+E_NO_COMMAND = 12              # no executable Command (Pass/unknown)
+E_COMMAND_REFUSED = 13         # a Command refused for any other reason
+# Per-site codes: which executor step refused a plan entry.
+E_SEIZE_REGION = 14            # a Seize Region refused
+E_RAID_REGION = 15             # a Raid Region refused
+E_RALLY_ENTRY = 16             # a Rally placement refused
+E_BATTLE_NO_DEFENDER = 17      # Battle planned where the defender is absent
+E_BATTLE_REGION = 18           # a Battle refused
+E_RECRUIT_ENTRY = 19           # a Recruit placement refused
+E_MARCH_ORIGIN = 20            # a March from an origin refused
+E_MARCH_EXTRA_GROUP = 21       # an extra March group refused
+E_SETTLE_REGION = 22           # a Settle Region refused
+E_DEVASTATE_REGION = 23        # a Devastate Region refused
+E_INTIMIDATE_TARGET = 24       # an Intimidate refused
+E_SUBORN_LIMIT = 25            # Suborn past its Region limit
+E_SUBORN_REGION = 26           # a Suborn Region refused
+E_BUILD_FORT = 27              # a Build Fort refused
+E_BUILD_SUBDUE = 28            # a Build Subdue refused
+E_BUILD_ALLY = 29              # a Build Ally refused
+E_RAMPAGE_TARGET = 30          # a Rampage refused
+E_ENTREAT_REGION = 31          # an Entreat refused
+E_SCOUT_MOVE = 32              # the Scout move refused
+E_SCOUT_REVEAL = 33            # a Scout Reveal refused
+
+# code -> (name, severity), indexed by code.
+_TABLE = (
+    ("E_UNKNOWN", OTHER_REFUSED),
+    ("E_CRASH", OTHER_REFUSED),
+    ("E_COMMAND_ENTRY", ILLEGAL),
+    ("E_SA_ENTRY", ILLEGAL),
+    ("E_SA_NO_EFFECT", WASTEFUL_SA),
+    ("E_SA_SKIPPED", LEGAL_DECLINE),
+    ("E_NO_LEGAL_EFFECT", LEGAL_DECLINE),
+    ("E_MARCH_NOTHING_MARCHABLE", LEGAL_DECLINE),
+    ("E_SA_NONE_AT_SA_TIME", LEGAL_DECLINE),
+    ("E_IF_NONE", LEGAL_DECLINE),
+    ("E_EVENT_NOT_APPLICABLE", INEFFECTIVE_EVENT),
+    ("E_NO_PLAN", OTHER_REFUSED),
+    ("E_NO_COMMAND", OTHER_REFUSED),
+    ("E_COMMAND_REFUSED", OTHER_REFUSED),
+    ("E_SEIZE_REGION", ILLEGAL),
+    ("E_RAID_REGION", ILLEGAL),
+    ("E_RALLY_ENTRY", ILLEGAL),
+    ("E_BATTLE_NO_DEFENDER", ILLEGAL),
+    ("E_BATTLE_REGION", ILLEGAL),
+    ("E_RECRUIT_ENTRY", ILLEGAL),
+    ("E_MARCH_ORIGIN", ILLEGAL),
+    ("E_MARCH_EXTRA_GROUP", ILLEGAL),
+    ("E_SETTLE_REGION", ILLEGAL),
+    ("E_DEVASTATE_REGION", ILLEGAL),
+    ("E_INTIMIDATE_TARGET", ILLEGAL),
+    ("E_SUBORN_LIMIT", ILLEGAL),
+    ("E_SUBORN_REGION", ILLEGAL),
+    ("E_BUILD_FORT", ILLEGAL),
+    ("E_BUILD_SUBDUE", ILLEGAL),
+    ("E_BUILD_ALLY", ILLEGAL),
+    ("E_RAMPAGE_TARGET", ILLEGAL),
+    ("E_ENTREAT_REGION", ILLEGAL),
+    ("E_SCOUT_MOVE", ILLEGAL),
+    ("E_SCOUT_REVEAL", ILLEGAL),
+)
+
+N_CODES = len(_TABLE)
+NAMES = tuple(name for name, _ in _TABLE)
+SEVERITY = tuple(sev for _, sev in _TABLE)
+
+
+def counter():
+    """A zeroed count per code, indexed by code."""
+    return [0] * N_CODES
+
+
+# Refusal-message fragments (lower case) for refusals reported without a
+# code, in match order.
+_REASON_PATTERNS = (
+    ("nothing marchable", E_MARCH_NOTHING_MARCHABLE),
+    ("no legal effect", E_NO_LEGAL_EFFECT),
+    ("no trade or suborn at sa", E_SA_NONE_AT_SA_TIME),
+    ("no intimidate or settle", E_SA_NONE_AT_SA_TIME),
+    ("if none", E_IF_NONE),
+    ("event not applicable", E_EVENT_NOT_APPLICABLE),
+)
+
+_REASONS = {}       # message -> code
+_REASONS_MAX = 4096
+
+
+def reason_code(reason):
+    """The code of a Command refusal ``reason`` reported without one."""
+    code = _REASONS.get(reason)
+    if code is None:
+        low = str(reason).lower()
+        code = next((c for pattern, c in _REASON_PATTERNS if pattern in low),
+                    E_COMMAND_REFUSED)
+        if len(_REASONS) >= _REASONS_MAX:
+            _REASONS.clear()
+        _REASONS[reason] = code
+    return code
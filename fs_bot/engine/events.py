@@ -0,0 +1,293 @@
+"""Game event stream — compact, typed records of what happened.
+
+The engine's result dicts (``play_card`` / ``execute_decision``) are
+variable-shaped and meant for the caller of one action. Analytics that want
+"every Battle" or "every refused Command" across many games subscribe here
+instead of keeping and re-walking whole ``run_game`` results:
+
+    counts = events.CounterSink()
+    with events.subscribe(counts, kinds={events.ISSUE}):
+        farm.play_game(scenario, seed)
+
+Piece operations, Passes, Commands, Special Abilities, Events, Battles,
+Eligibility changes and Winter phases emit an :class:`Event` to every
+attached sink (any callable taking one Event). Emission sites are guarded by
+``if events.enabled:``, so with no sinks attached an emission costs one
+attribute test and builds nothing.
+
+Kinds and issue codes below are stable identifiers: JSONL logs and results
+databases key on them.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+from collections import Counter, deque
+from typing import Any, NamedTuple, Optional
+
+from fs_bot.engine import error_codes
+
+
+# ---------------------------------------------------------------------------
+# Kinds
+# ---------------------------------------------------------------------------
+
+CARD = "card"                    # a card begins: type ("event"/"winter")
+GAME_OVER = "game_over"          # winner
+PASS = "pass"                    # resources_gained
+COMMAND = "command"              # command, executed, sa_executed, reason
+SA = "sa"                        # sa, executed, timing
+EVENT = "event"                  # as COMMAND, for a card Event
+ISSUE = "issue"                  # code, error, source, message — see below
+BATTLE = "battle"                # region, defender, losses, retreated
+ELIGIBILITY = "eligibility"      # status (only when it changed)
+WINTER_PHASE = "winter_phase"    # phase, plus phase-specific fields
+PIECE_PLACE = "piece_place"      # region, piece_type, count
+PIECE_REMOVE = "piece_remove"    # region, piece_type, count
+PIECE_MOVE = "piece_move"        # region, to, piece_type, count
+PIECE_FLIP = "piece_flip"        # region, piece_type, count, to
+
+PIECE_KINDS = frozenset({PIECE_PLACE, PIECE_REMOVE, PIECE_MOVE, PIECE_FLIP})
+
+# ISSUE codes — how an executed action fell short.
+COMMAND_ERROR = "command-error"      # the executor refused a plan entry
+COMMAND_REFUSED = "command-refused"  # the Command as a whole did nothing
+SA_SKIPPED = "sa-skipped"            # SA withheld after an empty Command
+SA_ERROR = "sa-error"                # the executor refused an SA entry
+SA_NO_EFFECT = "sa-no-effect"        # the SA ran and accomplished nothing
+
+# Each ISSUE also carries ``error``, its integer code in
+# fs_bot.engine.error_codes (severity is a table lookup on it).
+_KIND_ERRORS = {
+    COMMAND_ERROR: error_codes.E_COMMAND_ENTRY,
+    SA_ERROR: error_codes.E_SA_ENTRY,
+    SA_SKIPPED: error_codes.E_SA_SKIPPED,
+    SA_NO_EFFECT: error_codes.E_SA_NO_EFFECT,
+}
+
+
+def error_code(code, message):
+    """The error_codes code of an ISSUE of ``code`` whose result carried
+    no explicit one."""
+    if code == COMMAND_REFUSED:
+        return error_codes.reason_code(message)
+    return _KIND_ERRORS.get(code, error_codes.E_UNKNOWN)
+
+
+class Event(NamedTuple):
+    """One record. ``card`` is the card in play when it was emitted."""
+    kind: str
+    card: Any
+    faction: Optional[str]
+    data: dict
+
+    def as_dict(self):
+        return {"kind": self.kind, "card": self.card,
+                "faction": self.faction, **self.data}
+
+
+# ---------------------------------------------------------------------------
+# The bus
+# ---------------------------------------------------------------------------
+
+#: True while at least one sink is attached. Emission sites test this
+#: before building an Event.
+enabled = False
+
+_sinks = []     # [(kinds frozenset or None, sink)]
+_muted = 0
+_held = None    # list collecting Events inside held(), else None
+
+
+def _refresh():
+    global enabled
+    enabled = bool(_sinks) and not _muted
+
+
+def attach(sink, kinds=None):
+    """Send Events to ``sink`` (only those whose kind is in ``kinds``, if
+    given). Returns ``sink``."""
+    _sinks.append((frozenset(kinds) if kinds is not None else None, sink))
+    _refresh()
+    return sink
+
+
+def detach(sink):
+    """Stop sending Events to ``sink``."""
+    _sinks[:] = [(k, s) for k, s in _sinks if s is not sink]
+    _refresh()
+
+
+@contextlib.contextmanager
+def subscribe(sink, kinds=None):
+    """``attach`` for the duration of a ``with`` block; yields ``sink``."""
+    attach(sink, kinds)
+    try:
+        yield sink
+    finally:
+        detach(sink)
+
+
+@contextlib.contextmanager
+def muted():
+    """Suppress emission inside the block (search rollouts, what-if
+    copies) without detaching anything."""
+    global _muted
+    _muted += 1
+    _refresh()
+    try:
+        yield
+    finally:
+        _muted -= 1
+        _refresh()
+
+
+@contextlib.contextmanager
+def held(buffer):
+    """Append the Events emitted inside the block to ``buffer`` instead of
+    delivering them — for work that may yet be rolled back and replayed.
+    Pass ``buffer`` to :func:`deliver` once the work stands."""
+    global _held
+    outer, _held = _held, buffer
+    try:
+        yield buffer
+    finally:
+        _held = outer
+
+
+def deliver(buffer):
+    """Send Events collected by :func:`held` to the attached sinks (or to
+    the enclosing :func:`held` buffer, if any)."""
+    for event in buffer:
+        if _held is not None:
+            _held.append(event)
+        else:
+            _deliver(event)
+
+
+def _deliver(event):
+    for kinds, sink in _sinks:
+        if kinds is None or event.kind in kinds:
+            sink(event)
+
+
+def emit(kind, state, faction=None, **data):
+    """Deliver one Event to the attached sinks. Call only under
+    ``if events.enabled:``."""
+    event = Event(kind, state.get("current_card"), faction, data)
+    if _held is not None:
+        _held.append(event)
+    else:
+        _deliver(event)
+
+
+def _entry_code(error, default):
+    """The site code the executor put on a refused plan entry."""
+    code = error.get("code") if isinstance(error, dict) else None
+    return default if code is None else code
+
+
+def emit_execution(state, faction, decision, result):
+    """Emit the COMMAND/EVENT, SA and ISSUE records for one executed
+    decision (``execute_decision``'s ``result``)."""
+    if not isinstance(result, dict):
+        return
+    plan = decision.get("bot_action") or decision.get("player_action") or {}
+    command = plan.get("command") or result.get("command")
+    sa = plan.get("sa")
+    sx = result.get("sa_execution")
+    emit(EVENT if command == "Event" else COMMAND, state, faction,
+         command=command, executed=bool(result.get("executed")),
+         sa_executed=isinstance(sx, dict) and bool(sx.get("executed")),
+         reason=result.get("reason"))
+    for error in result.get("errors") or []:
+        emit(ISSUE, state, faction, code=COMMAND_ERROR,
+             error=_entry_code(error, error_codes.E_COMMAND_ENTRY),
+             source=command, message=str(error))
+    if result.get("executed") is False and result.get("reason"):
+        err = result.get("reason_code")
+        if err is None:
+            err = error_codes.reason_code(str(result["reason"]))
+        emit(ISSUE, state, faction, code=COMMAND_REFUSED, error=err,
+             source=command, message=str(result["reason"]))
+    if result.get("sa_skipped"):
+        emit(ISSUE, state, faction, code=SA_SKIPPED,
+             error=result.get("sa_skipped_code", error_codes.E_SA_SKIPPED),
+             source=command, message=str(result["sa_skipped"]))
+    if not isinstance(sx, dict):
+        return
+    source = f"{command}+{sa}"
+    emit(SA, state, faction, sa=sa, executed=bool(sx.get("executed")),
+         timing=result.get("sa_timing"))
+    for error in sx.get("errors") or []:
+        emit(ISSUE, state, faction, code=SA_ERROR,
+             error=_entry_code(error, error_codes.E_SA_ENTRY),
+             source=source, message=str(error))
+    # The flowchart's own "If none ... no Special Ability" outcome (e.g.
+    # R_BUILD/R_SCOUT) is a legal decline, not a wasted SA.
+    if sx.get("executed") is False and not sx.get("declined_no_effect"):
+        why = sx.get("reason") or ("no effect" if not sx.get("actions")
+                                   and not sx.get("regions") else "?")
+        emit(ISSUE, state, faction, code=SA_NO_EFFECT,
+             error=error_codes.E_SA_NO_EFFECT, source=source,
+             message=str(why))
+
+
+# ---------------------------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------------------------
+
+class RingBuffer:
+    """Keep the last ``maxlen`` Events in memory."""
+
+    def __init__(self, maxlen=10000):
+        self.events = deque(maxlen=maxlen)
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+    def clear(self):
+        self.events.clear()
+
+
+class JsonlSink:
+    """Write each Event as one JSON line to ``path`` (or an open text
+    file). ``close()`` — or leaving the ``with`` block — flushes."""
+
+    def __init__(self, path_or_file):
+        if hasattr(path_or_file, "write"):
+            self._fh, self._owned = path_or_file, False
+        else:
+            self._fh, self._owned = open(path_or_file, "a"), True
+
+    def __call__(self, event):
+        self._fh.write(json.dumps(event.as_dict(), default=str) + "\n")
+
+    def close(self):
+        if self._owned:
+            self._fh.close()
+        else:
+            self._fh.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CounterSink:
+    """Count Events by ``key(event)`` — by default ``(kind, faction)``."""
+
+    def __init__(self, key=None):
+        self.key = key or (lambda ev: (ev.kind, ev.faction))
+        self.counts = Counter()
+
+    def __call__(self, event):
+        self.counts[self.key(event)] += 1
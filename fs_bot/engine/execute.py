@@ -29,6 +29,7 @@ Design notes:
 from fs_bot.rules_consts import EVENT_SHADED
 from fs_bot.commands.common import CommandError
 from fs_bot.board.pieces import PieceError
+from fs_bot.board.pieces import batched, flush_control
 from fs_bot.commands.seize import seize_in_region, get_dispersible_tribes
 from fs_bot.commands.raid import raid_in_region
 from fs_bot.commands.rally import rally_in_region
@@ -57,6 +58,9 @@ from fs_bot.bots.bot_common import np_agrees_to_retreat
 from fs_bot.commands.seize import execute_harassment_loss as _seize_harass_loss
 from fs_bot.rules_consts import HARASSMENT_WARBANDS_PER_LOSS as _HWB_PER_LOSS
 from fs_bot.cards.card_effects import execute_event
+from fs_bot.engine import error_codes as _ec
+from fs_bot.engine import events as _events
+from fs_bot.state import invariants as _invariants
 
 # Mechanic functions raise CommandError on rule violations and PieceError
 # on invalid piece operations (e.g. a plan gone stale against the board).
@@ -116,6 +120,7 @@ def _apply_end_of_action_capabilities(state):
     from fs_bot.rules_consts import (BELGAE, NERVII, TRIBE_NERVII, ALLY,
                                      EVENT_SHADED)
     from fs_bot.board.pieces import get_available, place_piece
+    from fs_bot.board.tribes import tribe_changed
     if not is_capability_active(state, "A70", EVENT_SHADED):
         return
     ti = state.get("tribes", {}).get(TRIBE_NERVII)
@@ -123,6 +128,7 @@ def _apply_end_of_action_capabilities(state):
             and get_available(state, BELGAE, ALLY) > 0):
         place_piece(state, NERVII, BELGAE, ALLY)
         ti["allied_faction"] = BELGAE
+        tribe_changed(state, TRIBE_NERVII)
 
 
 def _command_executed(result) -> bool:
@@ -174,7 +180,9 @@ def execute_decision(state, faction, decision):
     Returns:
         Result dict: always has ``executed`` (bool) and ``command`` (str);
         plus ``reason`` when not executed, or command-specific details when
-        executed.
+        executed. A refusal whose cause the executor knows carries its
+        ``error_codes`` code as ``reason_code`` (and ``sa_skipped_code``
+        beside ``sa_skipped``).
     """
     bot_action = decision.get("bot_action")
     is_human = False
@@ -187,7 +195,8 @@ def execute_decision(state, faction, decision):
         # until the plan is collected; report rather than crash.
         return {"executed": False, "command": None,
                 "reason": "decision carries no executable plan "
-                          "(no bot_action or player_action)"}
+                          "(no bot_action or player_action)",
+                "reason_code": _ec.E_NO_PLAN}
 
     command = bot_action.get("command")
 
@@ -244,15 +253,19 @@ def execute_decision(state, faction, decision):
             else:
                 result = dict(result)
                 result["sa_skipped"] = "command produced no legal effect"
+                result["sa_skipped_code"] = _ec.E_SA_SKIPPED
         if sa_result is not None:
             result = dict(result)
             result["sa_execution"] = sa_result
             result["sa_timing"] = "before" if before else "after"
         _apply_end_of_action_capabilities(state)
+        if _invariants.enabled:
+            _invariants.resources(state, f"execute {command}")
         return _attach_transfers(result)
     # Pass / None / unknown
     return {"executed": False, "command": command,
-            "reason": "no executable command"}
+            "reason": "no executable command",
+            "reason_code": _ec.E_NO_COMMAND}
 
 
 def _sa_survives_empty_command(faction, command, sa):
@@ -295,6 +308,7 @@ def _execute_bot_command(state, faction, bot_action):
         else:
             result = dict(result)
             result["sa_skipped"] = "command produced no legal effect"
+            result["sa_skipped_code"] = _ec.E_SA_SKIPPED
     if sa_result is not None:
         result = dict(result)
         result["sa_execution"] = sa_result
@@ -521,7 +535,8 @@ def _region_restricted_free_command(state, faction, allowed_regions,
             # §8.3.4 tie-breaks; isolating the copy keeps the real RNG stream
             # deterministic (only the executed Command advances it). The plan
             # is region/target strings, valid to execute on the real state.
-            action = node(copy.deepcopy(state))
+            with _events.muted():
+                action = node(copy.deepcopy(state))
         except Exception:
             continue  # a node mis-fires out of its flowchart context — skip
         if not isinstance(action, dict):
@@ -1298,6 +1313,7 @@ def _resolve_card_A45_intimidate(state):
     return [{"free_action": "intimidate", "flag": "card_A45", "result": res}]
 
 
+@batched
 def _resolve_card_A5_evict(state):
     """Card A5 Gallia Togata (unshaded): only Romans may stack in Cisalpina, so
     non-Roman pieces there move to a Home Region of their Faction (or are
@@ -1309,7 +1325,6 @@ def _resolve_card_A5_evict(state):
         GERMAN_HOME_REGIONS_BASE)
     from fs_bot.board.pieces import (count_pieces, count_pieces_by_state,
         get_leader_in_region, move_piece, remove_piece)
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_playable_regions
     scen = state["scenario"]
     ario = scen in ARIOVISTUS_SCENARIOS
@@ -1348,7 +1363,6 @@ def _resolve_card_A5_evict(state):
                     remove_piece(state, CISALPINA, fac, pt, count=n,
                                  piece_state=ps)
                     removed.append((fac, pt))
-    refresh_all_control(state)
     return [{"free_action": "evict_cisalpina", "flag": "card_A5",
              "moved": moved, "removed": removed,
              "executed": bool(moved or removed)}]
@@ -1434,7 +1448,6 @@ def _resolve_card67_arduenna(state, faction):
                                      REVEALED, HIDDEN)
     from fs_bot.board.pieces import (count_pieces, count_pieces_by_state,
                                      flip_piece)
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_adjacent, get_playable_regions
     scen = state["scenario"]
     playable = set(get_playable_regions(scen, state.get("capabilities")))
@@ -1471,7 +1484,7 @@ def _resolve_card67_arduenna(state, faction):
                            from_state=REVEALED, to_state=HIDDEN)
                 flipped += rev
     if flipped:
-        refresh_all_control(state)
+        flush_control(state)
         out.append({"free_action": "flip_hidden", "flag": "card_67",
                     "flipped": flipped})
     return out
@@ -1494,6 +1507,7 @@ def _place_uprising_allies(state, faction, regions, n):
     """Place up to ``n`` Allies for ``faction`` on Subdued tribes within the
     given Regions (Card A66). Returns the number placed."""
     from fs_bot.board.pieces import get_available, place_piece
+    from fs_bot.board.tribes import tribe_changed
     from fs_bot.map.map_data import get_tribes_in_region
     from fs_bot.rules_consts import ALLY
     placed = 0
@@ -1511,6 +1525,7 @@ def _place_uprising_allies(state, faction, regions, n):
                     and get_available(state, faction, ALLY) > 0):
                 place_piece(state, region, faction, ALLY)
                 t["allied_faction"] = faction
+                tribe_changed(state, tribe)
                 placed += 1
     return placed
 
@@ -2163,6 +2178,7 @@ def _resolve_card57_britannia_march(state, faction):
              "sa_deferred": "any free Special Ability (open-ended)"}]
 
 
+@batched
 def _resolve_card17_march_ambush(state, march_limit):
     """Card 17 Germanic Chieftains (unshaded): "Romans March up to 3 German
     groups, then Ambush with Germans in any 1 Region." Setup March of up to
@@ -2171,7 +2187,6 @@ def _resolve_card17_march_ambush(state, march_limit):
     Battle priority 8.8.1's spirit)."""
     from fs_bot.rules_consts import GERMANS
     from fs_bot.board.pieces import count_pieces
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_playable_regions
     from fs_bot.battle.resolve import resolve_battle
     marched = _german_setup_marches(state, march_limit)
@@ -2194,7 +2209,6 @@ def _resolve_card17_march_ambush(state, march_limit):
         return [{"free_action": "german_march_ambush",
                  "flag": "card_17_german_ambush", "marches": marched,
                  "region": best, "executed": False, "reason": repr(exc)}]
-    refresh_all_control(state)
     return [{"free_action": "german_march_ambush",
              "flag": "card_17_german_ambush", "marches": marched,
              "region": best, "defender": best_tgt, "result": res}]
@@ -2254,11 +2268,11 @@ def _german_ambush_target(state, region):
     return _faction_ambush_target(state, region, GERMANS)
 
 
+@batched
 def _faction_ambush_sweep(state, attacker, only_faction=None):
     """Ambush in every Region where ``attacker`` is able (Hidden-majority,
     Loss-causing). Returns the list of ambush results. ``only_faction``
     restricts the defender (e.g. card A58 shaded Ambushes Romans only)."""
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_playable_regions
     from fs_bot.battle.resolve import resolve_battle
     out = []
@@ -2271,7 +2285,6 @@ def _faction_ambush_sweep(state, attacker, only_faction=None):
             out.append({"region": region, "defender": tgt, "result": res})
         except _EXEC_ERRORS as exc:
             out.append({"region": region, "executed": False, "reason": repr(exc)})
-    refresh_all_control(state)
     return out
 
 
@@ -2310,7 +2323,6 @@ def _german_setup_marches(state, march_limit):
     Returns the list of marches performed. (Shared by cards 65 and 17.)"""
     from fs_bot.rules_consts import GERMANS, WARBAND, HIDDEN
     from fs_bot.board.pieces import count_pieces, count_pieces_by_state, move_piece
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_adjacent, get_playable_regions
     scen = state["scenario"]
     playable = list(get_playable_regions(scen, state.get("capabilities")))
@@ -2348,10 +2360,11 @@ def _german_setup_marches(state, march_limit):
         used.add(S)
         marched.append({"source": S, "dest": B, "warbands": cur})
     if marched:
-        refresh_all_control(state)
+        flush_control(state)
     return marched
 
 
+@batched
 def _resolve_card65_german_march_ambush(state, march_limit):
     """Card 65 German Allegiances (unshaded): "March Germans from up to 2
     Regions, then Ambush with all Germans able."
@@ -2364,7 +2377,6 @@ def _resolve_card65_german_march_ambush(state, march_limit):
     Loss), best target first.
     """
     from fs_bot.rules_consts import GERMANS
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_playable_regions
     from fs_bot.battle.resolve import resolve_battle
     scen = state["scenario"]
@@ -2385,13 +2397,13 @@ def _resolve_card65_german_march_ambush(state, march_limit):
                              "reason": repr(exc)})
             continue
         ambushes.append({"region": region, "defender": tgt, "result": res})
-    refresh_all_control(state)
     return [{"free_action": "german_march_ambush",
              "flag": "card_65_german_march_ambush",
              "marches": marched, "ambushes": ambushes,
              "executed": bool(ambushes)}]
 
 
+@batched
 def _resolve_card58_german_ambush(state):
     """Card 58 Aduatuca (shaded): "March Germans to 1 Region with a Fort. They
     Ambush Romans there, 1 Loss per 2 Warbands." ("Sugambri strike unprepared
@@ -2408,7 +2420,6 @@ def _resolve_card58_german_ambush(state):
                                      HIDDEN)
     from fs_bot.board.pieces import (count_pieces, count_pieces_by_state,
                                      move_piece)
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_adjacent, get_playable_regions
     from fs_bot.battle.resolve import resolve_battle
     scen = state["scenario"]
@@ -2448,7 +2459,6 @@ def _resolve_card58_german_ambush(state):
             continue
         move_piece(state, src, R, GERMANS, WARBAND, count=n, piece_state=HIDDEN)
         marched += n
-    refresh_all_control(state)
     try:
         res = resolve_battle(state, R, GERMANS, ROMANS,
                              is_ambush=True, ignore_fort=True)
@@ -2544,6 +2554,7 @@ def _resolve_card72_march_enemy_battle(state, faction):
     return out
 
 
+@batched
 def _resolve_card72_hidden_march_battle(state, faction):
     """Card 72 Impetuosity (shaded): "Free March 1 group of your Hidden
     Warbands (no Leader). That group then may free Battle (alone)."
@@ -2562,7 +2573,6 @@ def _resolve_card72_hidden_march_battle(state, faction):
     from fs_bot.rules_consts import (ARVERNI, GERMANS, BELGAE, AEDUI, ROMANS,
                                      WARBAND, HIDDEN, FACTIONS)
     from fs_bot.board.pieces import count_pieces, count_pieces_by_state, move_piece
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_adjacent, get_playable_regions
     from fs_bot.engine.victory import calculate_victory_margin
     from fs_bot.battle.resolve import resolve_battle
@@ -2627,7 +2637,6 @@ def _resolve_card72_hidden_march_battle(state, faction):
 
     _sc, S, B, tgt, hid = best
     move_piece(state, S, B, faction, WARBAND, count=hid, piece_state=HIDDEN)
-    refresh_all_control(state)
     rd, rr = _decide_defender_retreat(state, B, faction, tgt, False)
     try:
         res = resolve_battle(state, B, faction, tgt,
@@ -2650,7 +2659,6 @@ def _resolve_card70_march_battle(state, target_regions, legion_limit):
     double Auxilia)."""
     from fs_bot.rules_consts import ROMANS, LEGION, AUXILIA
     from fs_bot.board.pieces import count_pieces, move_piece
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_adjacent, get_playable_regions
     from fs_bot.bots.roman_bot import _rank_battle_targets
     from fs_bot.battle.resolve import resolve_battle
@@ -2701,7 +2709,7 @@ def _resolve_card70_march_battle(state, target_regions, legion_limit):
             moved["legions"] = move_leg
         if aux:
             moved["auxilia"] = _move_roman_aux(state, src, T, aux)
-        refresh_all_control(state)
+        flush_control(state)
     defenders = _rank_battle_targets(state, T, scen)
     if not defenders:
         return [{"free_action": "march", "flag": "card_70_roman_march_battle",
@@ -2841,6 +2849,7 @@ def _resolve_a20_free_seize(state):
              "region": VENETI, "result": res}]
 
 
+@batched
 def _resolve_a20_arverni_ambush(state):
     """A20 Morbihan (shaded): "If Veneti Arverni Ally, Arverni Warbands within
     1 Region Ambush Romans in a Region within 1 as if there."
@@ -2863,7 +2872,6 @@ def _resolve_a20_arverni_ambush(state):
                                      ALLY)
     from fs_bot.board.pieces import (count_pieces, count_pieces_by_state,
                                      move_piece, get_leader_in_region)
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_adjacent
     from fs_bot.battle.resolve import resolve_battle
 
@@ -2927,7 +2935,7 @@ def _resolve_a20_arverni_ambush(state):
             if take > 0:
                 move_piece(state, B, r, ARVERNI, WARBAND, count=take,
                            piece_state=HIDDEN)
-        refresh_all_control(state)
+        flush_control(state)
         return [{"free_action": "ambush", "flag": "card_A20_arverni_ambush",
                  "executed": False, "reason": repr(exc)}]
     # Return projected Warbands (now Revealed by Step 5) to their Regions.
@@ -2937,7 +2945,6 @@ def _resolve_a20_arverni_ambush(state):
         if take > 0:
             move_piece(state, B, r, ARVERNI, WARBAND, count=take,
                        piece_state=REVEALED)
-    refresh_all_control(state)
     return [{"free_action": "ambush", "flag": "card_A20_arverni_ambush",
              "region": B, "defender": ROMANS, "projected_warbands": projected,
              "result": res}]
@@ -2975,7 +2982,6 @@ def _resolve_a17_march_battle(state):
     from fs_bot.rules_consts import ROMANS, CAESAR, LEGION, AUXILIA
     from fs_bot.board.pieces import (count_pieces, get_leader_in_region,
                                      move_piece)
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_adjacent
     from fs_bot.bots.roman_bot import (_rank_march_destinations,
                                        _rank_battle_targets)
@@ -3006,7 +3012,7 @@ def _resolve_a17_march_battle(state):
             move_piece(state, src, T, ROMANS, LEGION, count=move_leg)
         if move_aux:
             _move_roman_aux(state, src, T, move_aux)
-        refresh_all_control(state)
+        flush_control(state)
         # Battle the top Roman-priority defender in T (double Auxilia Losses).
         targets = _rank_battle_targets(state, T, scen)
         if not targets:
@@ -3036,6 +3042,7 @@ def _resolve_a17_march_battle(state):
              "reason": "no Caesar-free destination with an adjacent Roman group"}]
 
 
+@batched
 def _resolve_a19_march_romans(state, faction):
     """A19 Gaius Valerius Procillus (shaded): "March all Romans in 1 Region to
     an adjacent one with Germans."
@@ -3054,7 +3061,6 @@ def _resolve_a19_march_romans(state, faction):
                                      SCOUTED, ARIOVISTUS_LEADER)
     from fs_bot.board.pieces import (count_pieces, count_pieces_by_state,
                                      get_leader_in_region, move_piece)
-    from fs_bot.board.control import refresh_all_control
     from fs_bot.map.map_data import get_adjacent, get_playable_regions
     if faction != GERMANS:
         return []
@@ -3112,7 +3118,6 @@ def _resolve_a19_march_romans(state, faction):
         if a:
             move_piece(state, S, D, ROMANS, AUXILIA, count=a, piece_state=ps)
             moved["auxilia"] += a
-    refresh_all_control(state)
     return [{"free_action": "march_romans", "flag": "card_A19_march_romans",
              "source": S, "dest": D, "moved": moved,
              "german_advantage": adv}]
@@ -3301,13 +3306,18 @@ def _execute_event(state, faction, bot_action, *, human=False):
     snapshot = _copy.deepcopy(state)
     if _agent is not None:
         state["decision_agent"] = _agent
+    # Piece Events of a rolled-back Event never happened either: hold them
+    # until the Event stands.
+    held = []
     try:
-        event_result = execute_event(state, card_id, shaded=shaded)
+        with _events.held(held):
+            event_result = execute_event(state, card_id, shaded=shaded)
     except _EVENT_SAFE_ERRORS as exc:
         # Ineffective/non-applicable Event in this state (missing pieces, a
         # stub, or a choice not derivable here). Report, do not crash —
         # and restore the pre-Event state (which also restores
         # event_params/executing_faction to their pre-call values).
+        held.clear()
         state.clear()
         state.update(snapshot)
         state["event_params"] = prev_params
@@ -3316,7 +3326,10 @@ def _execute_event(state, faction, bot_action, *, human=False):
             state["decision_agent"] = _agent
         return {"executed": False, "command": _CMD_EVENT,
                 "card_id": card_id, "shaded": shaded,
-                "reason": f"event not applicable: {exc!r}"}
+                "reason": f"event not applicable: {exc!r}",
+                "reason_code": _ec.E_EVENT_NOT_APPLICABLE}
+    finally:
+        _events.deliver(held)
     free_actions = _resolve_free_actions(state, faction)
     state["event_params"] = prev_params
     state["executing_faction"] = prev_faction
@@ -3362,7 +3375,8 @@ def _execute_seize(state, faction, bot_action):
             res = seize_in_region(state, region, tribes_to_disperse=tribes,
                                   as_if_control=as_if_control)
         except _EXEC_ERRORS as exc:
-            errors.append({"region": region, "error": str(exc)})
+            errors.append({"region": region, "error": str(exc),
+                           "code": _ec.E_SEIZE_REGION})
             continue
         dispersed_total += len(res.get("tribes_dispersed", []))
         forage_total += res.get("forage_resources", 0)
@@ -3426,7 +3440,8 @@ def _execute_raid(state, faction, bot_action):
         try:
             res = raid_in_region(state, region, faction, actions)
         except _EXEC_ERRORS as exc:
-            errors.append({"region": region, "error": str(exc)})
+            errors.append({"region": region, "error": str(exc),
+                           "code": _ec.E_RAID_REGION})
             continue
         gained_total += res.get("resources_gained", 0)
         per_region.append(res)
@@ -3469,7 +3484,7 @@ def _execute_rally(state, faction, bot_action):
                            "tribe": tribe})
         except _EXEC_ERRORS as exc:
             errors.append({"region": region, "action": action,
-                           "error": str(exc)})
+                           "error": str(exc), "code": _ec.E_RALLY_ENTRY})
 
     def _entry_parts(entry):
         # Tolerate a plain region string (human/CLI shorthand, same as the
@@ -3550,7 +3565,8 @@ def _execute_battle(state, faction, bot_action):
                   if isinstance(r, str)}
 
     from fs_bot.cards.capabilities import (
-        is_capability_active as _ica_b, get_capability_owner as _gco_b)
+        is_capability_active as _ica_b, get_capability_owner as _gco_b,
+        set_event_modifier as _sem_b, clear_event_modifier as _cem_b)
     from fs_bot.rules_consts import (EVENT_UNSHADED as _EU_B,
                                      EVENT_SHADED as _ES_B,
                                      ROMANS as _RO_B, AUXILIA as _AUX_B)
@@ -3576,8 +3592,7 @@ def _execute_battle(state, faction, bot_action):
                   for r in sorted(set(_plan_regions))]
         _cands = [c for c in _cands if c[0] > 0]
         if _cands:
-            state.setdefault("event_modifiers", {})[
-                "card59_unshaded_region"] = max(_cands)[1]
+            _sem_b(state, "card59_unshaded_region", max(_cands)[1])
 
     # Card 59 shaded: the owning Gallic Faction doubles the enemy's Losses
     # in 1 Region per Battle Command — when attacking AND when defending
@@ -3585,8 +3600,8 @@ def _execute_battle(state, faction, bot_action):
     if _ica_b(state, 59, _ES_B) and _plan_regions:
         _owner59 = _gco_b(state, 59)
         if _owner59 == faction:
-            state.setdefault("event_modifiers", {})[
-                "card59_shaded_region"] = sorted(set(_plan_regions))[0]
+            _sem_b(state, "card59_shaded_region",
+                   sorted(set(_plan_regions))[0])
         elif _owner59 is not None:
             # The owner is DEFENDING in this command: their counterattack
             # doubles in 1 Region (NP choice: most owner pieces).
@@ -3599,8 +3614,7 @@ def _execute_battle(state, faction, bot_action):
                 _best = max(_def_regions,
                             key=lambda r: (count_pieces(state, r, _owner59),
                                            r))
-                state.setdefault("event_modifiers", {})[
-                    "card59_shaded_region"] = _best
+                _sem_b(state, "card59_shaded_region", _best)
 
     battles = []
     errors = []
@@ -3620,7 +3634,8 @@ def _execute_battle(state, faction, bot_action):
         # (§3.x) — skip a no-target entry rather than resolving a no-op.
         if count_pieces(state, region, defender) <= 0:
             errors.append({"region": region, "defender": defender,
-                           "error": "defender not present"})
+                           "error": "defender not present",
+                           "code": _ec.E_BATTLE_NO_DEFENDER})
             continue
 
         is_ambush = (sa == _SA_AMBUSH and region in sa_regions)
@@ -3695,7 +3710,7 @@ def _execute_battle(state, faction, bot_action):
             )
         except _EXEC_ERRORS as exc:
             errors.append({"region": region, "defender": defender,
-                           "error": str(exc)})
+                           "error": str(exc), "code": _ec.E_BATTLE_REGION})
             continue
         # Card 10 shaded (Ballistae): the owning Gallic Faction "after
         # Ambush may remove defending Fort or Citadel" — NP: always,
@@ -3719,7 +3734,7 @@ def _execute_battle(state, faction, bot_action):
 
     # Clear the per-Command card 59 region flags.
     for _k59 in ("card59_unshaded_region", "card59_shaded_region"):
-        state.get("event_modifiers", {}).pop(_k59, None)
+        _cem_b(state, _k59)
 
     return {
         "executed": len(battles) > 0,
@@ -3811,7 +3826,7 @@ def _execute_recruit(state, faction, bot_action):
                            "tribe": tribe})
         except _EXEC_ERRORS as exc:
             errors.append({"region": region, "action": action,
-                           "error": str(exc)})
+                           "error": str(exc), "code": _ec.E_RECRUIT_ENTRY})
 
     result = {
         "executed": len(placed) > 0,
@@ -3924,7 +3939,8 @@ def _execute_march(state, faction, bot_action):
                     group_cap=subset_groups.get(origin))
                 marched.append({"origin": origin, "final_region": final})
             except _EXEC_ERRORS as exc:
-                errors.append({"origin": origin, "error": str(exc)})
+                errors.append({"origin": origin, "error": str(exc),
+                               "code": _ec.E_MARCH_ORIGIN})
             continue
         # Choose the nearest reachable planned destination; BFS the path.
         best = None  # (path_len, dest, path)
@@ -3949,7 +3965,8 @@ def _execute_march(state, faction, bot_action):
                 group_cap=subset_groups.get(origin))
             marched.append({"origin": origin, "final_region": final})
         except _EXEC_ERRORS as exc:
-            errors.append({"origin": origin, "error": str(exc)})
+            errors.append({"origin": origin, "error": str(exc),
+                           "code": _ec.E_MARCH_ORIGIN})
 
     # §3.3.2 "Pieces within a Region may make up multiple groups": a
     # player plan may carry extra_groups = [{origin, route, group}] for
@@ -3960,7 +3977,8 @@ def _execute_march(state, faction, bot_action):
         _o = eg.get("origin")
         _route = eg.get("route") or []
         if not _o or not _route or not all(r in playable for r in _route):
-            errors.append({"origin": _o, "error": "bad extra group"})
+            errors.append({"origin": _o, "error": "bad extra group",
+                           "code": _ec.E_MARCH_EXTRA_GROUP})
             continue
         try:
             final = _march_with_harassment(
@@ -3968,7 +3986,8 @@ def _execute_march(state, faction, bot_action):
             marched.append({"origin": _o, "final_region": final,
                             "extra_group": True})
         except _EXEC_ERRORS as exc:
-            errors.append({"origin": _o, "error": str(exc)})
+            errors.append({"origin": _o, "error": str(exc),
+                           "code": _ec.E_MARCH_EXTRA_GROUP})
 
     return {
         "executed": len(marched) > 0,
@@ -3985,25 +4004,10 @@ def _bfs_march_path(origin, dest, playable):
     Returns the list of Regions to move into (excluding origin), or None if
     unreachable. Used to route a March to a planned but non-adjacent
     destination (the destination is the bot's choice; only the path is
-    derived).
+    derived). Routes come from the shared March route table.
     """
-    from collections import deque
-    from fs_bot.map.map_data import get_adjacent
-    if origin == dest:
-        return []
-    seen = {origin}
-    q = deque([(origin, [])])
-    while q:
-        cur, path = q.popleft()
-        for nb in sorted(get_adjacent(cur)):
-            if nb in seen or nb not in playable:
-                continue
-            npath = path + [nb]
-            if nb == dest:
-                return npath
-            seen.add(nb)
-            q.append((nb, npath))
-    return None
+    from fs_bot.commands.march import march_route
+    return march_route(origin, dest, playable)
 
 
 def _march_with_harassment(state, faction, origin, path, group_cap=None):
@@ -4116,7 +4120,8 @@ def _execute_sa(state, faction, bot_action):
             return {"executed": False, "sa": sa,
                     "declined_no_effect": True,
                     "reason": "no Trade or Suborn at SA time (§8.6.3 "
-                              "'at that moment'; if none, no SA)"}
+                              "'at that moment'; if none, no SA)",
+                    "reason_code": _ec.E_SA_NONE_AT_SA_TIME}
         if new_sa == _A_TRADE:
             result = _execute_trade(state, faction)
             result.setdefault("rederived_at_sa_time", True)
@@ -4177,7 +4182,8 @@ def _execute_sa(state, faction, bot_action):
         return {"executed": False, "sa": _SA_INTIMIDATE,
                 "declined_no_effect": True, "rederived_at_sa_time": True,
                 "reason": "no Intimidate or Settle at SA time (A8.7.1 "
-                          "evaluated after the Command; if none, no SA)"}
+                          "evaluated after the Command; if none, no SA)",
+                "reason_code": _ec.E_SA_NONE_AT_SA_TIME}
     if sa == _SA_INTIMIDATE:
         return _execute_intimidate(state, faction, bot_action)
     if sa == _SA_SUBORN:
@@ -4328,7 +4334,8 @@ def _execute_settle(state, faction, bot_action):
             _sa_settle(state, region)
             placed.append(region)
         except _EXEC_ERRORS as exc:
-            errors.append({"region": region, "error": str(exc)})
+            errors.append({"region": region, "error": str(exc),
+                           "code": _ec.E_SETTLE_REGION})
     return {"executed": len(placed) > 0, "sa": _SA_SETTLE,
             "regions": placed, "errors": errors}
 
@@ -4343,7 +4350,8 @@ def _execute_devastate(state, faction, bot_action):
             _sa_devastate(state, region)
             done.append(region)
         except _EXEC_ERRORS as exc:
-            errors.append({"region": region, "error": str(exc)})
+            errors.append({"region": region, "error": str(exc),
+                           "code": _ec.E_DEVASTATE_REGION})
     return {"executed": len(done) > 0, "sa": _SA_DEVASTATE,
             "regions": done, "errors": errors}
 
@@ -4383,7 +4391,7 @@ def _execute_intimidate(state, faction, bot_action):
                          "count": len(removals)})
         except _EXEC_ERRORS as exc:
             errors.append({"region": region, "target": tgt,
-                           "error": str(exc)})
+                           "error": str(exc), "code": _ec.E_INTIMIDATE_TARGET})
     return {"executed": len(done) > 0, "sa": _SA_INTIMIDATE,
             "intimidations": done, "errors": errors}
 
@@ -4413,7 +4421,8 @@ def _execute_suborn(state, faction, bot_action):
         if len(done) >= _max_r:
             errors.append({"region": region,
                            "error": "Suborn is maximum %d Region(s) "
-                                    "(§4.4.2 / card 43)" % _max_r})
+                                    "(§4.4.2 / card 43)" % _max_r,
+                           "code": _ec.E_SUBORN_LIMIT})
             continue
         ops = []
         for a in sp.get("actions", []) or []:
@@ -4443,7 +4452,8 @@ def _execute_suborn(state, faction, bot_action):
             _sa_suborn(state, region, ops)
             done.append(region)
         except _EXEC_ERRORS as exc:
-            errors.append({"region": region, "error": str(exc)})
+            errors.append({"region": region, "error": str(exc),
+                           "code": _ec.E_SUBORN_REGION})
     return {"executed": len(done) > 0, "sa": _SA_SUBORN,
             "regions": done, "errors": errors}
 
@@ -4501,7 +4511,7 @@ def _execute_build(state, faction, bot_action):
             done.append(("fort", region))
         except _EXEC_ERRORS as exc:
             errors.append({"action": "fort", "region": region,
-                           "error": str(exc)})
+                           "error": str(exc), "code": _ec.E_BUILD_FORT})
     for entry in plan.get("subdue", []) or []:
         region, tribe = entry.get("region"), entry.get("tribe")
         target = state.get("tribes", {}).get(tribe, {}).get("allied_faction")
@@ -4512,7 +4522,8 @@ def _execute_build(state, faction, bot_action):
             done.append(("subdue", region, tribe))
         except _EXEC_ERRORS as exc:
             errors.append({"action": "subdue", "region": region,
-                           "tribe": tribe, "error": str(exc)})
+                           "tribe": tribe, "error": str(exc),
+                           "code": _ec.E_BUILD_SUBDUE})
     for entry in plan.get("allies", []) or []:
         region, tribe = entry.get("region"), entry.get("tribe")
         try:
@@ -4520,7 +4531,8 @@ def _execute_build(state, faction, bot_action):
             done.append(("ally", region, tribe))
         except _EXEC_ERRORS as exc:
             errors.append({"action": "ally", "region": region,
-                           "tribe": tribe, "error": str(exc)})
+                           "tribe": tribe, "error": str(exc),
+                           "code": _ec.E_BUILD_ALLY})
     result = {"executed": len(done) > 0, "sa": _SA_BUILD,
               "actions": done, "errors": errors}
     if not done and not errors:
@@ -4748,7 +4760,7 @@ def _execute_rampage(state, faction, bot_action):
             done.append({"region": region, "target": target, "count": n})
         except _EXEC_ERRORS as exc:
             errors.append({"region": region, "target": target,
-                           "error": str(exc)})
+                           "error": str(exc), "code": _ec.E_RAMPAGE_TARGET})
     return {"executed": len(done) > 0, "sa": _SA_RAMPAGE,
             "rampages": done, "errors": errors}
 
@@ -4866,7 +4878,8 @@ def _execute_entreat(state, faction, bot_action):
         return {"executed": False, "sa": _SA_ENTREAT,
                 "declined_no_effect": True, "rederived_at_sa_time": True,
                 "reason": "no legal Entreat at SA time (§8.7.1 'if none, "
-                          "no Special Ability')"}
+                          "no Special Ability')",
+                "reason_code": _ec.E_SA_NONE_AT_SA_TIME}
     done, errors = [], []
     for a in plan:
         act = a.get("action")
@@ -4883,7 +4896,7 @@ def _execute_entreat(state, faction, bot_action):
             done.append({"region": region, "action": act})
         except _EXEC_ERRORS as exc:
             errors.append({"region": region, "action": act,
-                           "error": str(exc)})
+                           "error": str(exc), "code": _ec.E_ENTREAT_REGION})
     return {"executed": len(done) > 0, "sa": _SA_ENTREAT,
             "actions": done, "errors": errors}
 
@@ -4916,7 +4929,8 @@ def _execute_scout(state, faction, bot_action):
             _sa_scout_move(state, moves)
             done.append({"moves": len(moves)})
         except _EXEC_ERRORS as exc:
-            errors.append({"action": "move", "error": str(exc)})
+            errors.append({"action": "move", "error": str(exc),
+                           "code": _ec.E_SCOUT_MOVE})
 
     # Card 12 shaded: "Build and Scout Reveal are maximum 1 Region" —
     # Reveal in the first target Region only (§8.3.3 for non-players).
@@ -4944,7 +4958,8 @@ def _execute_scout(state, faction, bot_action):
             _sa_scout_reveal(state, region, aux_count, targets)
             done.append({"region": region, "revealed": reveal})
         except _EXEC_ERRORS as exc:
-            errors.append({"region": region, "error": str(exc)})
+            errors.append({"region": region, "error": str(exc),
+                           "code": _ec.E_SCOUT_REVEAL})
 
     result = {"executed": len(done) > 0, "sa": _SA_SCOUT,
               "actions": done, "errors": errors}
@@ -5920,9 +5935,11 @@ def _derive_card_32(state, faction=None, shaded=False):
         from fs_bot.bots.arverni_bot import node_v_march_spread
         sim = _copy.deepcopy(state)
         sim.pop("decision_agent", None)
-        plan = (node_v_march_spread(sim).get("details") or {}).get(
-            "march_plan") or {}
-        moves = plan_expand_march_moves(_copy.deepcopy(state), _AR32, plan)
+        with _events.muted():
+            plan = (node_v_march_spread(sim).get("details") or {}).get(
+                "march_plan") or {}
+            moves = plan_expand_march_moves(_copy.deepcopy(state), _AR32,
+                                            plan)
     except Exception:
         return {}
     out = []
@@ -6137,12 +6154,14 @@ def _execute_expand_march(state, faction, plan):
                             "leader": mv["leader"],
                             "warbands": mv["warbands"]})
         except _EXEC_ERRORS as exc:
-            errors.append({"origin": mv["origin"], "error": str(exc)})
+            errors.append({"origin": mv["origin"], "error": str(exc),
+                           "code": _ec.E_MARCH_ORIGIN})
 
     if not marches:
         return {"executed": False, "command": _CMD_MARCH,
                 "reason": "expand/mass march: nothing marchable (leader/"
                           "warbands pinned by Control or no reachable dest)",
+                "reason_code": _ec.E_MARCH_NOTHING_MARCHABLE,
                 "errors": errors}
     return {"executed": True, "command": _CMD_MARCH, "marches": marches,
             "deferred_origins": [], "errors": errors}
@@ -21,6 +21,8 @@ Reference:
   A2.3.9      Arverni Activation (carnyx trigger)
 """
 
+from typing import NamedTuple
+
 from fs_bot.rules_consts import (
     # Factions
     ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS,
@@ -42,6 +44,7 @@ from fs_bot.cards.card_data import (
     get_faction_order as _card_get_faction_order,
     card_has_carnyx_trigger,
 )
+from fs_bot.engine import events
 from fs_bot.engine.winter import run_winter_round
 from fs_bot.engine.arverni_phase import (
     check_arverni_at_war,
@@ -370,6 +373,8 @@ def execute_pass(state, faction):
     new = min(old + amount, MAX_RESOURCES)
     state["resources"][faction] = new
     gained = new - old
+    if events.enabled:
+        events.emit(events.PASS, state, faction, resources_gained=gained)
 
     # Faction remains Eligible — §2.3.3
     # (We do NOT mark it INELIGIBLE; adjust_eligibility handles this.)
@@ -389,6 +394,7 @@ def adjust_eligibility(state, actions_taken):
     docked Rome 6 Resources but Rome was offered the very next card).
     state["forced_ineligible"] = {faction: remaining_cards}.
     """
+    before = dict(state["eligibility"]) if events.enabled else None
     _adjust_eligibility_base(state, actions_taken)
     forced = state.get("forced_ineligible")
     if forced:
@@ -412,6 +418,11 @@ def adjust_eligibility(state, actions_taken):
         for faction in stay:
             if faction not in still_forced:
                 state["eligibility"][faction] = ELIGIBLE
+    if before is not None:
+        for faction, status in state["eligibility"].items():
+            if before.get(faction) != status:
+                events.emit(events.ELIGIBILITY, state, faction,
+                            status=status)
 
 
 def _adjust_eligibility_base(state, actions_taken):
@@ -456,6 +467,26 @@ def _adjust_eligibility_base(state, actions_taken):
 # CARD TURN RESOLUTION — §2.3
 # ============================================================================
 
+class DecisionRequest(NamedTuple):
+    """A top-level Sequence-of-Play choice: the ``decision_func`` arguments
+    after ``state``. ``position`` is "1st_eligible" or "2nd_eligible"."""
+    faction: str
+    options: list
+    position: str
+
+
+def _drive(steps, state, decision_func):
+    """Run a ``*_steps`` generator to its end, answering each
+    DecisionRequest with ``decision_func``; returns the generator's
+    result."""
+    try:
+        request = next(steps)
+        while True:
+            request = steps.send(decision_func(state, *request))
+    except StopIteration as stop:
+        return stop.value
+
+
 def _maybe_execute(state, faction, decision, actions_taken):
     """Apply a recorded non-Pass decision to the board (opt-in).
 
@@ -471,6 +502,8 @@ def _maybe_execute(state, faction, decision, actions_taken):
     subsidy = maybe_np_aedui_subsidy(state)
     if subsidy and isinstance(exec_result, dict):
         exec_result["np_aedui_subsidy"] = subsidy
+    if events.enabled:
+        events.emit_execution(state, faction, decision, exec_result)
     rec = actions_taken.get(faction)
     if isinstance(rec, dict):
         rec["execution"] = exec_result
@@ -492,7 +525,7 @@ def _maybe_execute(state, faction, decision, actions_taken):
     return exec_result
 
 
-def resolve_card_turn(state, decision_func, *, execute=False):
+def resolve_card_turn(state, decision_func, *, execute=False, acted=None):
     """Orchestrate one full Event card turn — §2.3.
 
     Steps per §2.3:
@@ -518,11 +551,25 @@ def resolve_card_turn(state, decision_func, *, execute=False):
         state: Game state dict. Modified in place.
         decision_func: Callable(state, faction, options, position) → dict
             Must return {"action": str, ...}.
+        acted: Optional {faction: decision} of Factions that already took
+            their turn on this card (a card resumed on a copy of the
+            board, as a search agent's rollouts do). They are recorded in
+            their slot without being asked, executed or charged again.
 
     Returns:
         Dict with turn results including frost, arverni_phase,
         actions_taken, etc.
     """
+    return _drive(card_turn_steps(state, execute=execute, acted=acted),
+                  state, decision_func)
+
+
+def card_turn_steps(state, *, execute=False, acted=None):
+    """:func:`resolve_card_turn` as a generator: yields a
+    :class:`DecisionRequest` wherever a Faction must choose, is sent the
+    decision dict, and returns the turn result. Lets a driver suspend the
+    turn while a decision is pending (engine/scheduler.py).
+    """
     scenario = state["scenario"]
     result = {
         "card": state["current_card"],
@@ -544,18 +591,24 @@ def resolve_card_turn(state, decision_func, *, execute=False):
     eligible = get_eligible_factions(state)
     actions_taken = {}
     first_action = None
+    acted = acted or {}
 
     # --- 1st Eligible (with cascading passes) ---
     first_options = get_first_eligible_options()
     idx = 0
     while idx < len(eligible):
         faction = eligible[idx]
-        decision = decision_func(state, faction, first_options,
-                                 "1st_eligible")
+        replayed = acted.get(faction)
+        if replayed is not None:
+            decision = replayed
+        else:
+            decision = yield DecisionRequest(faction, first_options,
+                                             "1st_eligible")
         action = decision["action"]
 
         if action == ACTION_PASS:
-            pass_result = execute_pass(state, faction)
+            pass_result = ({} if replayed is not None
+                           else execute_pass(state, faction))
             actions_taken[faction] = {
                 "action": ACTION_PASS, **pass_result,
             }
@@ -565,7 +618,7 @@ def resolve_card_turn(state, decision_func, *, execute=False):
         else:
             # 1st Eligible chose to act
             actions_taken[faction] = decision
-            if execute:
+            if execute and replayed is None:
                 _maybe_execute(state, faction, decision, actions_taken)
             # Use the EFFECTIVE action (an empty Command+SA records as
             # Command only — see _maybe_execute) for the 2nd Eligible's
@@ -585,12 +638,17 @@ def resolve_card_turn(state, decision_func, *, execute=False):
         second_options = get_second_eligible_options(first_action)
         while idx < len(eligible):
             faction = eligible[idx]
-            decision = decision_func(state, faction, second_options,
-                                     "2nd_eligible")
+            replayed = acted.get(faction)
+            if replayed is not None:
+                decision = replayed
+            else:
+                decision = yield DecisionRequest(faction, second_options,
+                                                 "2nd_eligible")
             action = decision["action"]
 
             if action == ACTION_PASS:
-                pass_result = execute_pass(state, faction)
+                pass_result = ({} if replayed is not None
+                               else execute_pass(state, faction))
                 actions_taken[faction] = {
                     "action": ACTION_PASS, **pass_result,
                 }
@@ -599,7 +657,7 @@ def resolve_card_turn(state, decision_func, *, execute=False):
                 continue  # Next eligible becomes new 2nd — §2.3.3
             else:
                 actions_taken[faction] = decision
-                if execute:
+                if execute and replayed is None:
                     _maybe_execute(state, faction, decision, actions_taken)
                 break
 
@@ -714,10 +772,20 @@ def play_card(state, decision_func, *, execute=False):
     Returns:
         Dict with card result. Includes "game_over" if the game ended.
     """
+    return _drive(play_card_steps(state, execute=execute), state,
+                  decision_func)
+
+
+def play_card_steps(state, *, execute=False):
+    """:func:`play_card` as a generator, like :func:`card_turn_steps`."""
     card_id = state["current_card"]
     result = {"card": card_id, "game_over": False}
+    winter = is_winter_card(card_id)
+    if events.enabled:
+        events.emit(events.CARD, state,
+                    type="winter" if winter else "event")
 
-    if is_winter_card(card_id):
+    if winter:
         winter_result = resolve_winter_card(state)
         result["type"] = "winter"
         result["winter_result"] = winter_result
@@ -730,9 +798,12 @@ def play_card(state, decision_func, *, execute=False):
             result["game_over"] = True
             result["winner"] = victory.get("winner")
             result["final_ranking"] = victory.get("final_ranking")
+            if events.enabled:
+                events.emit(events.GAME_OVER, state,
+                            winner=result["winner"])
             return result
     else:
-        turn_result = resolve_card_turn(state, decision_func, execute=execute)
+        turn_result = yield from card_turn_steps(state, execute=execute)
         result["type"] = "event"
         result["turn_result"] = turn_result
 
@@ -740,6 +811,8 @@ def play_card(state, decision_func, *, execute=False):
     next_card = advance_to_next_card(state)
     if next_card is None:
         result["game_over"] = True
+        if events.enabled:
+            events.emit(events.GAME_OVER, state, winner=None)
     result["next_card"] = next_card
 
     return result
@@ -770,6 +843,11 @@ def run_game(state, decision_func, *, execute=False):
         if card_result["game_over"]:
             break
 
+    return _game_result(state, results)
+
+
+def _game_result(state, results):
+    """``run_game``'s result for the card results ``results``."""
     return {
         "card_results": results,
         "game_over": True,
@@ -26,7 +26,7 @@ from fs_bot.rules_consts import (
     BASE_SCENARIOS,
 )
 from fs_bot.board.pieces import count_pieces, count_pieces_by_state
-from fs_bot.board.control import refresh_all_control
+from fs_bot.board.pieces import batched
 from fs_bot.battle.losses import calculate_losses
 from fs_bot.battle.resolve import resolve_battle
 from fs_bot.commands.common import CommandError
@@ -102,6 +102,7 @@ def _get_battle_candidates(state, region):
     return candidates
 
 
+@batched
 def germans_phase_battle(state):
     """Execute Germans Phase Battle with Ambush — §6.2.4.
 
@@ -193,6 +194,4 @@ def germans_phase_battle(state):
                 })
                 if region not in result["regions"]:
                     result["regions"].append(region)
-
-    refresh_all_control(state)
     return result
@@ -96,9 +96,11 @@ from fs_bot.board.pieces import (
     place_piece, remove_piece, move_piece, count_pieces,
     clear_allied_tribe,
     count_pieces_by_state, get_available, get_leader_in_region,
-    find_leader, PieceError,
+    find_leader, PieceError, bump_board_version,
+    batched, flush_control,
 )
-from fs_bot.board.control import refresh_all_control
+from fs_bot.board.tribes import tribe_changed
+from fs_bot.engine import events
 from fs_bot.cards.capabilities import is_capability_active
 
 
@@ -396,6 +398,7 @@ def _step1_winter_events(state):
 # ============================================================================
 
 
+@batched
 def _adjust_german_forces(state):
     """Remove German pieces per Interlude spec.
 
@@ -433,6 +436,7 @@ def _adjust_german_forces(state):
 
     # 3. Settlements
     settlements_total = 0
+    flush_control(state)
     for region in list(state["spaces"].keys()):
         n_set = count_pieces(state, region, GERMANS, SETTLEMENT)
         if n_set <= 0:
@@ -458,6 +462,7 @@ def _adjust_german_forces(state):
                 )
                 state["tribes"][subdued_tribe]["status"] = None
                 state["tribes"][subdued_tribe]["allied_faction"] = GERMANS
+                tribe_changed(state, subdued_tribe)
                 place_piece(state, region, GERMANS, ALLY, 1)
                 result["settlements_replaced_with_ally"].append(region)
             else:
@@ -533,8 +538,6 @@ def _adjust_german_forces(state):
         to_removed=False, region_order=region_order,
     )
     result["warbands_to_available"] = wb_removed
-
-    refresh_all_control(state)
     return result
 
 
@@ -543,6 +546,7 @@ def _adjust_german_forces(state):
 # ============================================================================
 
 
+@batched
 def _adjust_belgae_forces(state):
     """Belgae: remove >= 1/2 of on-map Allies + 1/2 of on-map Warbands,
     Belgica last. Place Ambiorix in region with most other Belgic pieces.
@@ -613,8 +617,6 @@ def _adjust_belgae_forces(state):
             state, target, BELGAE, LEADER, leader_name=leader_name,
         )
         result["ambiorix_placed"] = target
-
-    refresh_all_control(state)
     return result
 
 
@@ -623,6 +625,7 @@ def _adjust_belgae_forces(state):
 # ============================================================================
 
 
+@batched
 def _adjust_aedui_forces(state):
     """Aedui adjustments.
 
@@ -769,10 +772,9 @@ def _adjust_aedui_forces(state):
                 if ti and ti.get("allied_faction") is None:
                     ti["status"] = "Allied"
                     ti["allied_faction"] = AEDUI
+                    tribe_changed(state, t)
                     break
             result["bibracte_replaced"] = True
-
-    refresh_all_control(state)
     return result
 
 
@@ -781,6 +783,7 @@ def _adjust_aedui_forces(state):
 # ============================================================================
 
 
+@batched
 def _adjust_arverni_forces(state):
     """Arverni adjustments per Interlude (German player carries these out).
 
@@ -985,6 +988,7 @@ def _adjust_arverni_forces(state):
                 TRIBE_ARVERNI, {"status": None, "allied_faction": None})
             ti["status"] = None
             ti["allied_faction"] = ARVERNI
+            tribe_changed(state, TRIBE_ARVERNI)
             result["gergovia_replaced"] = True
 
     # 5. Place Arverni Warbands in Arverni Region until >= 3.
@@ -995,8 +999,6 @@ def _adjust_arverni_forces(state):
     if place_n > 0:
         place_piece(state, ARVERNI_REGION, ARVERNI, WARBAND, place_n)
         result["warbands_placed_in_arverni"] = place_n
-
-    refresh_all_control(state)
     return result
 
 
@@ -1005,6 +1007,7 @@ def _adjust_arverni_forces(state):
 # ============================================================================
 
 
+@batched
 def _adjust_roman_forces(state):
     """Roman adjustments.
 
@@ -1102,7 +1105,7 @@ def _adjust_roman_forces(state):
     caesar_region = find_leader(state, ROMANS)
     if caesar_region is None and \
             state["available"].get(ROMANS, {}).get(LEADER, 0) > 0:
-        refresh_all_control(state)
+        flush_control(state)
         prov_control = state["spaces"].get(PROVINCIA, {}).get("control")
         if prov_control == ROMAN_CONTROL:
             place_piece(
@@ -1116,8 +1119,6 @@ def _adjust_roman_forces(state):
                     state, target, ROMANS, LEADER, leader_name=CAESAR,
                 )
                 result["caesar_placed"] = target
-
-    refresh_all_control(state)
     return result
 
 
@@ -1126,6 +1127,7 @@ def _adjust_roman_forces(state):
 # ============================================================================
 
 
+@batched
 def _cisalpina_relocation(state):
     """Unless Gallia Togata is in effect, factions relocate forces from
     Cisalpina to Home Regions (Ally to Subdued Tribe only) or remove them.
@@ -1202,8 +1204,6 @@ def _cisalpina_relocation(state):
             removed_here += 1
         if removed_here > 0:
             result["removed"][faction] = removed_here
-
-    refresh_all_control(state)
     return result
 
 
@@ -1278,6 +1278,7 @@ def _shift_senate_one_box(state, direction):
         state["senate"]["position"] = SENATE_POSITIONS[idx + 1]
 
 
+@batched
 def _step3_britannia(state, britannia_decision, roman_dispersed_keep=None):
     """Britannia Expedition step.
 
@@ -1337,6 +1338,10 @@ def _step3_britannia(state, britannia_decision, roman_dispersed_keep=None):
                 # transit, then re-shelf them as winter_track_legions.
                 space = state["spaces"][region]["pieces"][ROMANS]
                 space[LEGION] = space.get(LEGION, 0) - take
+                bump_board_version(state, region)
+                if events.enabled:
+                    events.emit(events.PIECE_REMOVE, state, ROMANS,
+                                region=region, piece_type=LEGION, count=take)
                 state["winter_track_legions"] = (
                     state.get("winter_track_legions", 0) + take
                 )
@@ -1412,6 +1417,7 @@ def _step3_britannia(state, britannia_decision, roman_dispersed_keep=None):
                 {"status": None, "allied_faction": None})
             ti["status"] = None
             ti["allied_faction"] = BELGAE
+            tribe_changed(state, TRIBE_CATUVELLAUNI)
         avail_wb = get_available(state, BELGAE, WARBAND)
         place_wb = min(2, avail_wb)
         if place_wb > 0:
@@ -1421,8 +1427,6 @@ def _step3_britannia(state, britannia_decision, roman_dispersed_keep=None):
         # Senate shift 1 box up (toward Uproar)
         _shift_senate_one_box(state, "up")
         result["senate_shift"] = "up"
-
-    refresh_all_control(state)
     return result
 
 
@@ -1523,6 +1527,7 @@ def _step5_spring(state, roman_dispersed_keep=None):
         if tinfo is not None:
             tinfo["status"] = saved["status"]
             tinfo["allied_faction"] = saved["allied_faction"]
+            tribe_changed(state, saved["tribe"])
 
     # "Put the Winter marker in the Quarters box" — flag for the next
     # Winter Round so harvest/senate phases know we're in the first
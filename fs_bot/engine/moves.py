@@ -3,8 +3,9 @@
 An external driver (e.g. an LLM) uses these to (a) see the legal top-level
 Sequence-of-Play actions for a Faction, (b) enumerate the legal building blocks
 for a Command plan (which Regions, which targets/Tribes, which Special
-Abilities), and (c) VALIDATE a candidate ``player_action`` by dry-running it on
-a throwaway copy before committing it to the live game.
+Abilities) or stream complete plans with :func:`iter_legal_plans`, and (c)
+VALIDATE a candidate ``player_action`` by dry-running it on a throwaway copy
+before committing it to the live game.
 
 A ``player_action`` is the same dict bots/humans emit and ``execute_decision``
 consumes::
@@ -17,11 +18,23 @@ See fs_bot/cli/human_plan.py for the per-command ``details`` shapes.
 """
 
 import copy
+import json
+import pickle
 
+from fs_bot.rules_consts import (
+    ROMANS, FACTIONS, AUXILIA, WARBAND, ALLY, CITADEL, HIDDEN,
+    CMD_RALLY, CMD_RECRUIT, CMD_RAID, CMD_BATTLE, CMD_MARCH, CMD_SEIZE,
+    SA_AMBUSH, SA_BESIEGE, SA_BUILD, SA_SCOUT, SA_ENTREAT, SA_TRADE,
+    SA_DEVASTATE, SA_SETTLE, SA_RAMPAGE,
+)
 from fs_bot.engine.game_engine import (
+    ACTION_COMMAND, ACTION_COMMAND_SA, ACTION_LIMITED_COMMAND,
     get_first_eligible_options, get_second_eligible_options,
 )
+from fs_bot.map.map_data import get_playable_regions, get_adjacent
+from fs_bot.board.pieces import get_available, count_pieces_by_state
 from fs_bot.engine.execute import execute_decision
+from fs_bot.engine import events
 from fs_bot.cli.human_plan import (
     _FACTION_COMMANDS as _FACTION_COMMANDS,
     _faction_special_abilities as faction_special_abilities,
@@ -29,6 +42,7 @@ from fs_bot.cli.human_plan import (
     _battle_regions as battle_regions,
     _enemies_in_region as enemies_in_region,
     _subdued_tribes as subdued_tribes,
+    _SA_NONE,
 )
 
 
@@ -48,30 +62,570 @@ def legal_commands(faction):
     return list(_FACTION_COMMANDS.get(faction, ()))
 
 
-def validate_player_action(state, faction, player_action):
-    """Dry-run a ``player_action`` on a DEEP COPY of state, without touching the
-    live game. Returns ``(ok, info)``: ``ok`` is True iff the action executed
-    (had a legal effect); ``info`` is the execution result dict, or a reason
-    string if it raised. The copy drops any live ``decision_agent`` so dry-run
-    validation never re-enters the agent.
+def snapshot(state):
+    """Freeze ``state`` (minus any live ``decision_agent``) into one
+    read-only snapshot that many dry-runs can fork from.
+
+    Forking a snapshot (an unpickle) is several times cheaper than a
+    ``copy.deepcopy`` of the live state, so a driver scoring many candidate
+    plans against the same board should take one snapshot and pass it to
+    :func:`validate_player_action` / :func:`preview_player_action`, or use
+    :func:`validate_many`. Returns ``None`` when the state holds something
+    unpicklable; forks then fall back to a deep copy.
     """
+    bare = {k: v for k, v in state.items() if k != "decision_agent"}
+    try:
+        return pickle.dumps(bare, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+
+
+def _fork(state, snap):
+    """A private, agent-free copy of ``state`` to dry-run on."""
+    if snap is not None:
+        return pickle.loads(snap)
     sim = copy.deepcopy(state)
     sim.pop("decision_agent", None)
+    return sim
+
+
+def validate_player_action(state, faction, player_action, *, snap=None):
+    """Dry-run a ``player_action`` on a private copy of state, without touching
+    the live game. Returns ``(ok, info)``: ``ok`` is True iff the action
+    executed (had a legal effect); ``info`` is the execution result dict, or a
+    reason string if it raised. The copy drops any live ``decision_agent`` so
+    dry-run validation never re-enters the agent.
+
+    Pass ``snap`` (from :func:`snapshot` of this same ``state``) to skip
+    re-copying the board when validating several candidates in a row.
+    """
+    return validate_decision(state, faction,
+                             {"player_action": player_action}, snap=snap)
+
+
+def validate_decision(state, faction, decision, *, snap=None):
+    """:func:`validate_player_action` for a whole engine decision -- one
+    carrying a ``bot_action`` (e.g. an Event with NP-derived params) or a
+    ``player_action``."""
+    sim = _fork(state, snap if snap is not None else snapshot(state))
     try:
-        res = execute_decision(sim, faction, {"player_action": player_action})
+        with events.muted():
+            res = execute_decision(sim, faction, decision)
     except Exception as exc:  # never raise out of a validation probe
         return (False, repr(exc))
     return (bool(res.get("executed")), res)
 
 
-def preview_player_action(state, faction, player_action):
+def preview_player_action(state, faction, player_action, *, snap=None):
     """Like validate_player_action, but also returns the resulting state copy so
     a driver can inspect the board the action WOULD produce. Returns
     ``(ok, info, resulting_state)``."""
-    sim = copy.deepcopy(state)
-    sim.pop("decision_agent", None)
+    sim = _fork(state, snap if snap is not None else snapshot(state))
     try:
-        res = execute_decision(sim, faction, {"player_action": player_action})
+        with events.muted():
+            res = execute_decision(sim, faction,
+                                   {"player_action": player_action})
         return (bool(res.get("executed")), res, sim)
     except Exception as exc:
         return (False, repr(exc), sim)
+
+
+# Below this many distinct candidates per worker a process pool costs more
+# (spawn + shipping the snapshot) than it saves.
+_MIN_CANDIDATES_PER_JOB = 4
+
+
+def _candidate_key(player_action):
+    """Canonical text of a candidate, so duplicates are dry-run once."""
+    try:
+        return json.dumps(player_action, sort_keys=True, default=repr)
+    except Exception:
+        return None
+
+
+def _validate_chunk(snap, faction, chunk, decisions=False):
+    """Process-pool worker: dry-run each (index, player_action) in ``chunk``
+    against its own fork of ``snap``. Result dicts that cannot travel back
+    to the parent are replaced by their repr."""
+    check = validate_decision if decisions else validate_player_action
+    out = []
+    for idx, pa in chunk:
+        ok, info = check(None, faction, pa, snap=snap)
+        try:
+            pickle.dumps(info)
+        except Exception:
+            info = repr(info)
+        out.append((idx, ok, info))
+    return out
+
+
+def validate_many(state, faction, candidates, *, jobs=1, first_ok=False,
+                  decisions=False):
+    """Dry-run many candidate ``player_action``s for ``faction`` at once.
+
+    All candidates share one :func:`snapshot` of ``state``; each is executed
+    on its own fork of it, so no candidate sees another's effects and the
+    live game is never touched. Identical candidates are dry-run once.
+
+    Args:
+        state: Live game state (not modified).
+        faction: The acting Faction.
+        candidates: Sequence of ``player_action`` dicts; with ``first_ok``
+            any iterable, drawn one candidate at a time.
+        jobs: Worker processes for large candidate sets. ``1`` (default)
+            validates in-process; the pool is only used when every worker
+            gets several distinct candidates.
+        first_ok: Stop at the first candidate (in input order) that
+            executes, without drawing the rest -- a generator that builds
+            plans as it goes builds no more than needed. Later entries of a
+            sized ``candidates`` are left ``None``; for an iterator the list
+            ends at the first success. Always in-process.
+        decisions: The candidates are whole engine decisions (see
+            :func:`validate_decision`) rather than ``player_action``s.
+
+    Returns:
+        List of ``(ok, info)`` aligned with ``candidates`` (see
+        :func:`validate_player_action`).
+    """
+    check = validate_decision if decisions else validate_player_action
+    snap = snapshot(state)
+    if first_ok:
+        return _first_ok(state, faction, candidates, check, snap)
+    candidates = list(candidates)
+    results = [None] * len(candidates)
+
+    # Collapse duplicates: key -> first index; later copies reuse its result.
+    first_of = {}
+    alias = {}
+    todo = []
+    for idx, pa in enumerate(candidates):
+        key = _candidate_key(pa)
+        if key is not None and key in first_of:
+            alias[idx] = first_of[key]
+            continue
+        if key is not None:
+            first_of[key] = idx
+        todo.append((idx, pa))
+
+    if jobs <= 1 or snap is None \
+            or len(todo) < 2 * _MIN_CANDIDATES_PER_JOB:
+        for idx, pa in todo:
+            results[idx] = check(state, faction, pa, snap=snap)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        jobs = min(jobs, len(todo) // _MIN_CANDIDATES_PER_JOB)
+        chunks = [todo[i::jobs] for i in range(jobs)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for part in pool.map(_validate_chunk, [snap] * jobs,
+                                 [faction] * jobs, chunks,
+                                 [decisions] * jobs):
+                for idx, ok, info in part:
+                    results[idx] = (ok, info)
+
+    for idx, src in alias.items():
+        results[idx] = results[src]
+    return results
+
+
+def _first_ok(state, faction, candidates, check, snap):
+    """validate_many(first_ok=True): draw candidates until one executes."""
+    results = []
+    seen = {}
+    for pa in candidates:
+        key = _candidate_key(pa)
+        res = seen.get(key) if key is not None else None
+        if res is None:
+            res = check(state, faction, pa, snap=snap)
+            if key is not None:
+                seen[key] = res
+        results.append(res)
+        if res[0]:
+            break
+    if hasattr(candidates, "__len__"):
+        results += [None] * (len(candidates) - len(results))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Legal-plan enumeration
+# ---------------------------------------------------------------------------
+
+def _playable(state):
+    return get_playable_regions(state["scenario"], state.get("capabilities"))
+
+
+def _ally_tribes(state, region, faction):
+    """Representative Subdued Tribes for an Ally in ``region``: the first
+    eligible City and the first eligible non-City Tribe. Other eligible
+    Tribes of the same kind place an identical Ally (symmetry reduction)."""
+    from fs_bot.rules_consts import TRIBE_TO_CITY
+    from fs_bot.commands.rally import _find_subdued_tribe_for_ally
+    reps = {}
+    for tribe in _find_subdued_tribe_for_ally(state, region, faction):
+        reps.setdefault(tribe in TRIBE_TO_CITY, tribe)
+    return [reps[k] for k in sorted(reps)]
+
+
+def _prober(state):
+    """A callable ``probe(mechanic, *args, **kw)`` that runs one per-Region
+    mechanic on its own fork of one snapshot of ``state`` and reports
+    whether it was legal. Every probe gets a fresh fork: a rejection that
+    wrote before raising (pieces, Resources, a Tribe) must not leak into
+    the next probe."""
+    snap = snapshot(state)
+
+    def probe(mechanic, *args, **kw):
+        try:
+            with events.muted():
+                mechanic(_fork(state, snap), *args, **kw)
+        except Exception:
+            return False
+        return True
+    return probe
+
+
+_RALLY_MECHANIC_ACTION = {"citadels": "place_citadel", "allies": "place_ally",
+                          "warbands": "place_warbands"}
+
+
+def _rally_choices(state, faction):
+    from fs_bot.commands.rally import (
+        validate_rally_region, rally_cost, rally_in_region,
+    )
+    from fs_bot.cli.human_plan import _citadel_upgrade_tribes
+    probe = _prober(state)
+    can_wb = get_available(state, faction, WARBAND) > 0
+    can_ally = get_available(state, faction, ALLY) > 0
+    can_cit = get_available(state, faction, CITADEL) > 0
+    out = []
+    for r in _playable(state):
+        if not validate_rally_region(state, r, faction)[0]:
+            continue
+        frags = []
+        if can_cit:
+            frags += [("citadels", {"region": r, "tribe": t})
+                      for t in _citadel_upgrade_tribes(state, r, faction)]
+        if can_ally:
+            frags += [("allies", {"region": r, "tribe": t})
+                      for t in _ally_tribes(state, r, faction)]
+        if can_wb:
+            frags.append(("warbands", r))
+        frags = [(kind, item) for kind, item in frags
+                 if probe(rally_in_region, r, faction,
+                          _RALLY_MECHANIC_ACTION[kind],
+                          tribe=item.get("tribe") if kind != "warbands"
+                          else None, free=True)]
+        if frags:
+            out.append((r, rally_cost(state, r, faction), frags))
+    return out
+
+
+def _recruit_choices(state, faction):
+    from fs_bot.commands.rally import (
+        validate_recruit_region, recruit_cost, recruit_in_region,
+    )
+    # Optimistic Supply-Line agreements give a lower-bound cost without
+    # consulting any agent; the executor charges the real cost.
+    agreed = {f: True for f in FACTIONS}
+    can_aux = get_available(state, ROMANS, AUXILIA) > 0
+    can_ally = get_available(state, ROMANS, ALLY) > 0
+    probe = _prober(state)
+    out = []
+    for r in _playable(state):
+        if not validate_recruit_region(state, r)[0]:
+            continue
+        frags = []
+        if can_ally:
+            frags += [{"region": r, "action": "place_ally", "tribe": t}
+                      for t in _ally_tribes(state, r, ROMANS)]
+        if can_aux:
+            frags.append({"region": r, "action": "place_auxilia"})
+        frags = [f for f in frags
+                 if probe(recruit_in_region, r, f["action"],
+                          tribe=f.get("tribe"), free=True, agreements=agreed)]
+        if frags:
+            out.append((r, recruit_cost(state, r, ROMANS, agreed), frags))
+    return out
+
+
+def _raid_choices(state, faction):
+    from itertools import combinations_with_replacement
+    from fs_bot.commands.common import _is_devastated
+    from fs_bot.commands.raid import (
+        validate_raid_region, get_valid_steal_targets,
+    )
+    out = []
+    for r in _playable(state):
+        if not validate_raid_region(state, r, faction)[0]:
+            continue
+        hidden = count_pieces_by_state(state, r, faction, WARBAND, HIDDEN)
+        targets = get_valid_steal_targets(state, r, faction)
+        # A no-target Raid gains a Resource, never in a Devastated
+        # Region (§3.3.3).
+        if not _is_devastated(state, r):
+            targets = [None] + targets
+        frags = []
+        # Flipped Warbands are interchangeable: one multiset per flip count.
+        for n in range(1, min(2, hidden) + 1):
+            for combo in combinations_with_replacement(targets, n):
+                frags.append([{"region": r, "target": t} for t in combo])
+        if frags:
+            out.append((r, 0, frags))
+    return out
+
+
+def _battle_choices(state, faction):
+    return [(r, 0, [{"region": r, "target": f}
+                    for f in enemies_in_region(state, r, faction)])
+            for r in battle_regions(state, faction)]
+
+
+def _march_choices(state, faction):
+    from fs_bot.commands.march import march_cost
+    from fs_bot.cli.human_plan import _mobile_count
+    playable = set(_playable(state))
+    out = []
+    for r in regions_with_pieces(state, faction):
+        if _mobile_count(state, r, faction) <= 0:
+            continue
+        dests = sorted(a for a in get_adjacent(r, state["scenario"])
+                       if a in playable)
+        if dests:
+            out.append((r, march_cost(state, r, faction),
+                        [(r, d) for d in dests]))
+    return out
+
+
+def _seize_choices(state, faction):
+    from fs_bot.commands.seize import (
+        validate_seize_region, get_dispersible_tribes,
+    )
+    out = []
+    for r in _playable(state):
+        if not validate_seize_region(state, r)[0]:
+            continue
+        frags = [(r, False)]
+        if get_dispersible_tribes(state, r):
+            frags.append((r, True))
+        out.append((r, 0, frags))
+    return out
+
+
+_COMMAND_CHOICES = {
+    CMD_RALLY: _rally_choices, CMD_RECRUIT: _recruit_choices,
+    CMD_RAID: _raid_choices, CMD_BATTLE: _battle_choices,
+    CMD_MARCH: _march_choices, CMD_SEIZE: _seize_choices,
+}
+
+
+def _assemble(command, picks):
+    """A ``player_action`` (without SA) from ``[(region, fragment)]``."""
+    regions = [r for r, _ in picks]
+    details = {}
+    if command == CMD_RALLY:
+        plan = {"citadels": [], "allies": [], "warbands": []}
+        for _, (kind, item) in picks:
+            plan[kind].append(item)
+        details["rally_plan"] = plan
+    elif command == CMD_RECRUIT:
+        details["recruit_plan"] = [dict(f) for _, f in picks]
+    elif command == CMD_RAID:
+        details["raid_plan"] = [dict(e) for _, f in picks for e in f]
+    elif command == CMD_BATTLE:
+        details["battle_plan"] = [dict(f) for _, f in picks]
+    elif command == CMD_MARCH:
+        dests = []
+        for _, (_, d) in picks:
+            if d not in dests:
+                dests.append(d)
+        details.update(origins=regions, destinations=dests,
+                       routes={o: [d] for _, (o, d) in picks})
+    elif command == CMD_SEIZE:
+        details["disperse_regions"] = [r for _, (r, disp) in picks if disp]
+    return {"command": command, "regions": regions, "sa": _SA_NONE,
+            "sa_regions": [], "details": details}
+
+
+def _combos(choices, budget, size=None, max_size=None):
+    """Lazily yield Region subsets of ``choices`` as ``[(region, fragment)]``
+    picks -- at most one fragment per Region, Regions in ``choices`` order,
+    total cost within ``budget``. With ``size`` only subsets of exactly that
+    many Regions are yielded; otherwise every subset (up to ``max_size``) in
+    depth-first pre-order. Subsets are unordered, so each is yielded once."""
+    n = len(choices)
+
+    def rec(start, spent, picked):
+        if picked:
+            if size is None:
+                yield list(picked)
+            elif len(picked) == size:
+                yield list(picked)
+                return
+        if size is None and max_size is not None and len(picked) >= max_size:
+            return
+        for i in range(start, n):
+            if size is not None and n - i < size - len(picked):
+                break
+            region, cost, frags = choices[i]
+            if spent + cost > budget:
+                continue
+            for frag in frags:
+                picked.append((region, frag))
+                yield from rec(i + 1, spent + cost, picked)
+                picked.pop()
+
+    return rec(0, 0, [])
+
+
+def _ordered_combos(choices, budget, order, max_size=None):
+    """:func:`_combos` in ``order``: "breadth" yields every 1-Region subset,
+    then every 2-Region subset, ...; "depth" extends each subset first."""
+    if order == "depth":
+        yield from _combos(choices, budget, max_size=max_size)
+        return
+    top = len(choices) if max_size is None else min(len(choices), max_size)
+    for k in range(1, top + 1):
+        yield from _combos(choices, budget, size=k)
+
+
+def _sa_choices(state, faction, sa):
+    """Region choices for an SA whose plan is independent of the Command,
+    or None when ``sa`` needs no Regions (the executor derives its plan)."""
+    from fs_bot.commands.sa_devastate import validate_devastate_region
+    from fs_bot.commands.sa_settle import validate_settle_region
+    from fs_bot.commands.sa_rampage import (
+        validate_rampage_region, validate_rampage_target,
+    )
+    if sa == SA_DEVASTATE:
+        return [(r, 0, [r]) for r in _playable(state)
+                if validate_devastate_region(state, r)[0]]
+    if sa == SA_SETTLE:
+        return [(r, 0, [r]) for r in _playable(state)
+                if validate_settle_region(state, r)[0]]
+    if sa == SA_RAMPAGE:
+        out = []
+        for r in _playable(state):
+            if not validate_rampage_region(state, r)[0]:
+                continue
+            frags = [{"region": r, "target": f}
+                     for f in enemies_in_region(state, r, faction)
+                     if validate_rampage_target(state, r, f)[0]]
+            if frags:
+                out.append((r, 0, frags))
+        return out
+    return None
+
+
+def _battle_sa_choices(state, faction, sa, plan):
+    """Ambush/Besiege Region choices among the plan's Battle Regions."""
+    from fs_bot.commands.sa_ambush import validate_ambush_region
+    from fs_bot.commands.sa_besiege import validate_besiege_region
+    out = []
+    for e in plan["details"]["battle_plan"]:
+        r, tgt = e["region"], e["target"]
+        ok = (validate_ambush_region(state, r, faction, tgt)[0]
+              if sa == SA_AMBUSH else validate_besiege_region(state, r, tgt)[0])
+        if ok:
+            out.append((r, 0, [r]))
+    return out
+
+
+# SAs that need no Regions: the executor derives Build, Scout and Entreat
+# from the flowchart and Trade has no targets.
+_PLANLESS_SAS = (SA_TRADE, SA_BUILD, SA_SCOUT, SA_ENTREAT)
+_BATTLE_SAS = (SA_AMBUSH, SA_BESIEGE)
+
+
+def iter_legal_plans(state, faction, position="1st_eligible", *,
+                     first_action=None, limit=None, order="breadth"):
+    """Lazily enumerate complete Command decisions for ``faction``.
+
+    Yields engine decisions ``{"action": ACTION_*, "player_action": {...}}``
+    covering Command x Region subset x per-Region plan x Special Ability x
+    SA Regions, filtered by the same Region validators the executors use
+    and pruned by Resources (``rally_cost`` / ``recruit_cost`` /
+    ``march_cost`` per Region; Battle, Raid and Seize are free). Symmetric
+    choices are collapsed: Region subsets are unordered, Raid flips are a
+    multiset of targets, and one City and one non-City Tribe stand in for
+    the rest of a Region's Subdued Tribes. Each March origin moves its whole
+    group one Region; Suborn, Intimidate and Enlist (piece-level plans) are
+    not enumerated. Event and Pass are not yielded -- see
+    :func:`legal_sop_actions`.
+
+    Every plan passes the pre-checks, but later board effects (one Region's
+    Rally changing another's caps, an SA after a no-effect Command) can
+    still make it a no-op; confirm picks with :func:`validate_many`.
+
+    Args:
+        state: Live game state (not modified).
+        faction: The acting Faction.
+        position: "1st_eligible" or "2nd_eligible" (with ``first_action``).
+            A Limited Command yields single-Region plans without an SA.
+        limit: Stop after this many plans.
+        order: "breadth" (fewest Regions first, interleaving Commands) or
+            "depth" (each Command's subsets depth-first, in turn).
+    """
+    if order not in ("breadth", "depth"):
+        raise ValueError("order must be 'breadth' or 'depth'")
+    actions = legal_sop_actions(state, position, first_action)
+    limited = ACTION_LIMITED_COMMAND in actions
+    with_cmd = ACTION_COMMAND in actions
+    with_sa = ACTION_COMMAND_SA in actions
+    if not (limited or with_cmd or with_sa):
+        return
+    budget = state.get("resources", {}).get(faction, 0)
+    max_size = 1 if limited else None
+    choices = {c: _COMMAND_CHOICES[c](state, faction)
+               for c in legal_commands(faction) if c in _COMMAND_CHOICES}
+
+    sas = []
+    if with_sa and not limited:
+        sas = list(faction_special_abilities(faction, state["scenario"]))
+    sa_choices = {sa: _sa_choices(state, faction, sa) for sa in sas
+                  if sa not in _BATTLE_SAS}
+
+    def decisions(command, picks):
+        # A fresh plan per decision: a consumer may edit what it receives.
+        plan = _assemble(command, picks)
+        if limited:
+            yield {"action": ACTION_LIMITED_COMMAND, "player_action": plan}
+            return
+        if with_cmd:
+            yield {"action": ACTION_COMMAND,
+                   "player_action": _assemble(command, picks)}
+        for sa in sas:
+            if sa in _BATTLE_SAS:
+                if command != CMD_BATTLE:
+                    continue
+                regs = _battle_sa_choices(state, faction, sa, plan)
+            elif sa in _PLANLESS_SAS:
+                yield {"action": ACTION_COMMAND_SA,
+                       "player_action": {**_assemble(command, picks),
+                                         "sa": sa}}
+                continue
+            else:
+                regs = sa_choices.get(sa)
+            if not regs:
+                continue
+            for sa_picks in _ordered_combos(regs, 0, order):
+                yield {"action": ACTION_COMMAND_SA,
+                       "player_action": {**_assemble(command, picks),
+                                         "sa": sa,
+                                         "sa_regions": [f for _, f in sa_picks]}}
+
+    if order == "depth":
+        streams = (decisions(c, p) for c, ch in choices.items()
+                   for p in _combos(ch, budget, max_size=max_size))
+    else:
+        top = 1 if limited else max((len(ch) for ch in choices.values()),
+                                    default=0)
+        streams = (decisions(c, p) for k in range(1, top + 1)
+                   for c, ch in choices.items()
+                   for p in _combos(ch, budget, size=k))
+    count = 0
+    for stream in streams:
+        for decision in stream:
+            if limit is not None and count >= limit:
+                return
+            count += 1
+            yield decision
@@ -0,0 +1,317 @@
+"""Async game scheduler — many games per process sharing one agent backend.
+
+``run_game`` asks ``decision_func`` synchronously, so a game with an LLM or
+remote-policy seat leaves the whole process idle while one answer is out.
+Here each game is an ``asyncio`` task that suspends at every decision an
+agent seat owes — its top-level Sequence-of-Play choices and its reactive
+``consult_agent`` requests — and a batcher hands the pending decisions of
+all games to the backend together:
+
+    async def backend(batch):            # [Pending] -> [response]
+        return await my_policy_server(batch)
+
+    sched = GameScheduler(backend, decision_func=farm.bot_decision)
+    for state in states:
+        sched.add(state, seats={ROMANS})
+    results = asyncio.run(sched.run())   # run_game results, in add() order
+
+Top-level choices suspend the card turn itself (``play_card_steps``).
+A reactive request arises deep inside execution, where nothing can
+suspend, so the card is unwound instead: the request goes to the backend,
+the board is restored from a snapshot taken at the card's start, and the
+card is replayed with every answer so far on a tape. Events emitted while
+a card may still be replayed are held and delivered once it stands, so
+event sinks see each card once.
+
+Seats outside ``seats`` are answered synchronously by ``decision_func``
+(and their reactive decisions defer to the NP logic); a game with no
+agent seats never suspends and plays exactly as ``run_game``.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import io
+import pickle
+from typing import Any, NamedTuple
+
+from fs_bot.board.pieces import board_version
+from fs_bot.engine import events
+from fs_bot.engine.game_engine import (
+    DecisionRequest, start_game, play_card_steps, _game_result,
+)
+from fs_bot.engine.moves import snapshot
+
+
+class Pending(NamedTuple):
+    """One decision an agent seat owes. ``request`` is a
+    ``DecisionRequest`` for a top-level choice (answer with a decision
+    dict) or a ``consult_agent`` request dict (answer per agent.py, or
+    None to defer). ``state`` is the board the decision is asked on: read
+    it while answering, never after."""
+    game: int
+    faction: str
+    request: Any
+    state: dict
+
+
+class _Unwind(BaseException):
+    """Carries a reactive request out of the engine. A BaseException so
+    the engine's defensive ``except Exception`` handlers let it pass."""
+
+    def __init__(self, state, faction, request):
+        super().__init__(faction)
+        self.state = state
+        self.faction = faction
+        self.request = request
+
+
+def _seat_agent(game):
+    """The ``decision_agent`` installed while ``game`` is scheduled. A plain
+    function, not a bound method, so the deep copies bots take for
+    look-ahead share it (and the tape) just as they share any agent."""
+    def agent(state, faction, request):
+        if faction not in game.seats:
+            return None
+        known, answer = game.next_answer(state)
+        if not known:
+            raise _Unwind(state, faction, request)
+        return answer
+    return agent
+
+
+class _Game:
+    def __init__(self, index, state, seats):
+        self.index = index
+        self.state = state
+        self.seats = frozenset(seats)
+        self.tape = []      # (answer, scratch) for the current card
+        self.cursor = 0     # next tape entry to replay
+        self.held = []      # Events of the current card
+        self.agent = _seat_agent(self)
+
+    def next_answer(self, state):
+        """Replay the next taped answer to a request made on ``state``, if
+        any: ``(known, answer)``."""
+        if self.cursor >= len(self.tape):
+            return False, None
+        answer, scratch = self.tape[self.cursor]
+        self.cursor += 1
+        # Copies: the engine may consume what it is handed, and the tape
+        # must replay unchanged.
+        state.update(copy.deepcopy(scratch))
+        return True, copy.deepcopy(answer)
+
+    def record(self, answer, scratch):
+        self.tape.append((copy.deepcopy(answer), copy.deepcopy(scratch)))
+
+    def restore(self, snap):
+        """Put the board back to the card's start, in place."""
+        live = board_version(self.state)
+        self.state.clear()
+        self.state.update(pickle.loads(snap))
+        self.state["decision_agent"] = self.agent
+        # Versions continue past every board this state has shown, so
+        # caches keyed on (state, version) never match a rolled-back one.
+        self.state["board_version"] = live + 1
+        self.cursor = 0
+        self.held = []
+
+
+def _fingerprint(state):
+    return {k: pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL)
+            for k, v in state.items() if k != "decision_agent"}
+
+
+class GameScheduler:
+    """Multiplex games over one batched agent ``backend``.
+
+    ``backend(batch)`` is a coroutine function taking a list of
+    :class:`Pending` and returning one response per entry, in order. At
+    most ``batch_size`` decisions go in one call and at most
+    ``concurrency`` calls are in flight at once. ``decision_func`` answers
+    every seat not given to the agent. Engine output is suppressed unless
+    ``quiet`` is False.
+    """
+
+    def __init__(self, backend, *, decision_func, execute=True,
+                 batch_size=64, concurrency=4, quiet=True):
+        self.backend = backend
+        self.decision_func = decision_func
+        self.execute = execute
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.quiet = quiet
+        self._games = []
+        self._queue = None
+        self._answering = set()     # backend calls in flight
+        self.batches = []   # size of each backend call, for tuning
+
+    def add(self, state, seats=()):
+        """Schedule a fresh game on ``state`` (set up, not yet started) with
+        the Factions in ``seats`` played by the backend. Returns its index
+        (``Pending.game``)."""
+        game = _Game(len(self._games), state, seats)
+        self._games.append(game)
+        return game.index
+
+    async def run(self):
+        """Play every added game to the end; returns their ``run_game``
+        results in ``add`` order."""
+        self._queue = asyncio.Queue()
+        batcher = asyncio.ensure_future(self._batcher())
+        try:
+            return await asyncio.gather(*(self._play(g)
+                                          for g in self._games))
+        finally:
+            # Stop batching, then any backend call still out (a game
+            # failed while others waited on theirs).
+            batcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await batcher
+            for task in self._answering:
+                task.cancel()
+            await asyncio.gather(*self._answering, return_exceptions=True)
+
+    # -- one game --------------------------------------------------------
+
+    async def _play(self, game):
+        state = game.state
+        if game.seats:
+            state["decision_agent"] = game.agent
+        self._sync(game, start_game, state)
+        self._flush(game)
+        results = []
+        try:
+            while state["current_card"] is not None:
+                card_result = await self._card(game)
+                results.append(card_result)
+                if card_result["game_over"]:
+                    break
+        finally:
+            if state.get("decision_agent") is game.agent:
+                del state["decision_agent"]
+        return _game_result(state, results)
+
+    async def _card(self, game):
+        snap = snapshot(game.state) if game.seats else None
+        game.tape, game.cursor = [], 0
+        while True:
+            steps = play_card_steps(game.state, execute=self.execute)
+            try:
+                result = await self._turn(game, steps)
+            except _Unwind as unwind:
+                # The board is left as the request saw it until answered.
+                game.record(*await self._ask(game, unwind.state,
+                                             unwind.faction, unwind.request))
+                game.restore(snap)
+                continue
+            self._flush(game)
+            return result
+
+    async def _turn(self, game, steps):
+        """Drive one card's steps; bot seats are answered in-line, agent
+        seats from the tape or the backend."""
+        advance, value = next, steps
+        while True:
+            try:
+                request = self._sync(game, self._bots, game, steps,
+                                     advance, value)
+            except StopIteration as stop:
+                return stop.value
+            known, decision = game.next_answer(game.state)
+            if not known:
+                decision, scratch = await self._ask(
+                    game, game.state, request.faction, request)
+                game.record(decision, scratch)
+                game.cursor += 1
+            advance, value = steps.send, decision
+
+    def _bots(self, game, steps, advance, value):
+        request = advance(value)
+        while request.faction not in game.seats:
+            request = steps.send(self.decision_func(game.state, *request))
+        return request
+
+    def _flush(self, game):
+        events.deliver(game.held)
+        game.held = []
+
+    def _sync(self, game, fn, *args):
+        """Run a synchronous stretch of ``game``: events held for the
+        current card, engine output suppressed."""
+        with contextlib.ExitStack() as stack:
+            if events.enabled:
+                stack.enter_context(events.held(game.held))
+            if self.quiet:
+                stack.enter_context(
+                    contextlib.redirect_stdout(io.StringIO()))
+            return fn(*args)
+
+    # -- batching --------------------------------------------------------
+
+    async def _ask(self, game, state, faction, request):
+        """The backend's answer, plus the top-level state entries it changed
+        while answering (the NP bot ``decision_func`` draws from
+        ``state["rng"]`` and leaves scratch flags execution reads), so a
+        replay can reproduce them. ``state`` is the board the request was
+        made on — a bot's look-ahead copy, sometimes."""
+        before = _fingerprint(state)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((Pending(game.index, faction, request, state),
+                               future))
+        answer = await future
+        after = _fingerprint(state)
+        scratch = {k: state[k] for k, v in after.items()
+                   if before.get(k) != v}
+        return answer, scratch
+
+    async def _batcher(self):
+        slots = asyncio.Semaphore(self.concurrency)
+        while True:
+            batch = [await self._queue.get()]
+            # Let every runnable game reach its next decision first.
+            await asyncio.sleep(0)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await slots.acquire()
+            self.batches.append(len(batch))
+            # The loop keeps only a weak reference to a task: hold it
+            # until it finishes.
+            task = asyncio.ensure_future(self._answer(batch, slots))
+            self._answering.add(task)
+            task.add_done_callback(self._answering.discard)
+
+    async def _answer(self, batch, slots):
+        try:
+            responses = await self.backend([p for p, _ in batch])
+            if len(responses) != len(batch):
+                raise ValueError(f"backend answered {len(responses)} of "
+                                 f"{len(batch)} decisions")
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+        finally:
+            slots.release()
+
+
+def local_backend(decision_func, agent=None):
+    """A backend answering in-process: top-level requests with
+    ``decision_func``, reactive ones with ``agent`` (or deferring). For
+    tests and as a template for a real policy server."""
+    async def backend(batch):
+        out = []
+        for p in batch:
+            if isinstance(p.request, DecisionRequest):
+                out.append(decision_func(p.state, *p.request))
+            else:
+                out.append(agent(p.state, p.faction, p.request)
+                           if agent is not None else None)
+        return out
+    return backend
@@ -45,6 +45,8 @@ from fs_bot.rules_consts import (
     CISALPINA, CISALPINA_CV_ARIOVISTUS,
     # Markers
     MARKER_DISPERSED, MARKER_DISPERSED_GATHERING, MARKER_COLONY,
+    # Tribe status
+    SUBDUED,
     # Legions
     LEGIONS_ROWS,
     # Misc
@@ -53,6 +55,7 @@ from fs_bot.rules_consts import (
 )
 from fs_bot.board.pieces import count_pieces, count_on_map
 from fs_bot.board.control import get_controlled_regions, is_controlled_by
+from fs_bot.board.tribes import tribe_index
 from fs_bot.map.map_data import (
     get_tribes_in_region, get_control_value, get_playable_regions,
     ALL_REGION_DATA,
@@ -77,11 +80,7 @@ def _count_allies_and_citadels(state, faction):
     Returns:
         Integer total.
     """
-    allies = 0
-    for tribe_info in state["tribes"].values():
-        if tribe_info.get("allied_faction") == faction:
-            allies += 1
-
+    allies = tribe_index(state).count(faction)
     citadels = count_on_map(state, faction, CITADEL)
     return allies + citadels
 
@@ -119,12 +118,7 @@ def _count_subdued_tribes(state):
     Returns:
         Integer count.
     """
-    count = 0
-    for tribe_info in state["tribes"].values():
-        if (tribe_info.get("allied_faction") is None
-                and tribe_info.get("status") is None):
-            count += 1
-    return count
+    return tribe_index(state).count(SUBDUED)
 
 
 def _count_dispersed_tribes(state):
@@ -133,12 +127,9 @@ def _count_dispersed_tribes(state):
     Returns:
         Integer count.
     """
-    count = 0
-    for tribe_info in state["tribes"].values():
-        status = tribe_info.get("status")
-        if status in (MARKER_DISPERSED, MARKER_DISPERSED_GATHERING):
-            count += 1
-    return count
+    tribes = tribe_index(state)
+    return (tribes.count(MARKER_DISPERSED)
+            + tribes.count(MARKER_DISPERSED_GATHERING))
 
 
 def _count_allied_tribes(state, faction):
@@ -147,11 +138,7 @@ def _count_allied_tribes(state, faction):
     Returns:
         Integer count.
     """
-    count = 0
-    for tribe_info in state["tribes"].values():
-        if tribe_info.get("allied_faction") == faction:
-            count += 1
-    return count
+    return tribe_index(state).count(faction)
 
 
 def _has_colony_marker(state):
@@ -244,12 +231,11 @@ def _calculate_belgic_control_value(state):
     # -1 for each non-Suebi Dispersed tribe in Belgic-Controlled regions
     # Per §7.2 and §3.2.3: Dispersed reduces a Region's CV, so only
     # tribes in regions that contribute to BCV (Belgic-Controlled) count.
-    for tribe_name, tribe_info in state["tribes"].items():
-        status = tribe_info.get("status")
-        if status in (MARKER_DISPERSED, MARKER_DISPERSED_GATHERING):
-            if tribe_name not in SUEBI_TRIBES:
-                tribe_region = TRIBE_TO_REGION.get(tribe_name)
-                if tribe_region in belgic_regions:
+    tribes = tribe_index(state)
+    for region in belgic_regions:
+        for status in (MARKER_DISPERSED, MARKER_DISPERSED_GATHERING):
+            for tribe_name in tribes.tribes(region, status):
+                if tribe_name not in SUEBI_TRIBES:
                     bcv -= 1
 
     return bcv
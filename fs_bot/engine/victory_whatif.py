@@ -0,0 +1,283 @@
+"""What-if victory — every Faction's score after hypothetical changes.
+
+The §8.4.4 checks ask "would this placement / removal / Event option
+advance a player Faction's victory?" once per candidate. Answering with
+``check_victory`` on a modified copy recounts the whole board for each
+candidate. :class:`VictoryTally` decomposes the §7.2 / A7.2 totals into
+their components once:
+
+  Tribes    Subdued, Dispersed (either side), Allied per Faction
+  pieces    Citadels per Faction, Settlements on the map, off-map Legions
+  Control   the controlling Faction per Region, Belgic Control Value and
+            the Germanic total per Region
+
+and scores a batch of candidates against them, each delta costing O(1),
+without applying or copying anything:
+
+    tally = VictoryTally(state)
+    results = tally.what_if([
+        TribeDelta(tribe, allied_faction=AEDUI),            # one change
+        (PieceDelta(region, BELGAE, WARBAND, -2),           # or several
+         ControlDelta(region, None)),
+    ])
+    results[0][AEDUI]      # Outcome(score, margin, wins)
+
+Each candidate is scored independently against the base state. A delta
+describes only its own change: allying a Tribe is a TribeDelta plus a
+PieceDelta for the Ally disc. A PieceDelta recomputes its Region's Control
+from the Forces (§1.6) unless the candidate also gives a ControlDelta for
+that Region. Legions placed come off the Legions track and Legions removed
+go to the Fallen, so a Legion PieceDelta moves the off-map count the other
+way. Outcomes match ``calculate_victory_score``, ``calculate_victory_margin``
+and ``check_victory`` on the changed state.
+
+Reference: §7.2, §7.3, §8.4.4, A7.2, A7.3
+"""
+
+from collections import Counter
+from typing import Any, NamedTuple, Optional
+
+from fs_bot.rules_consts import (
+    ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS, FACTIONS,
+    LEADER, LEGION, FORT, ALLY, CITADEL, SETTLEMENT, FLIPPABLE_PIECES,
+    ARIOVISTUS_SCENARIOS, FACTION_CONTROL, GERMANIA_REGIONS, SUEBI_TRIBES,
+    SUBDUED, DISPERSED, DISPERSED_GATHERING,
+    ROMAN_VICTORY_THRESHOLD, ARVERNI_LEGIONS_THRESHOLD,
+    ARVERNI_ALLIES_THRESHOLD, BELGAE_VICTORY_THRESHOLD,
+    GERMAN_VICTORY_THRESHOLD,
+)
+from fs_bot.board.control import _count_faction_forces
+from fs_bot.board.pieces import count_on_map, count_pieces, flush_control
+from fs_bot.board.tribes import tribe_index
+from fs_bot.engine.victory import (
+    _colony_region, _count_off_map_legions, _get_victory_factions,
+)
+from fs_bot.map.map_data import get_control_value
+
+
+class TribeDelta(NamedTuple):
+    """``tribe``'s entry afterwards: Allied to ``allied_faction`` and/or
+    carrying ``status`` (both None: Subdued)."""
+    tribe: str
+    allied_faction: Optional[str] = None
+    status: Optional[str] = None
+
+
+class PieceDelta(NamedTuple):
+    """``count`` of ``faction``'s ``piece_type`` placed in ``region``
+    (negative: removed)."""
+    region: str
+    faction: str
+    piece_type: str
+    count: int
+
+
+class ControlDelta(NamedTuple):
+    """``region`` ends up Controlled by ``faction`` (None: No Control)."""
+    region: str
+    faction: Optional[str]
+
+
+class Outcome(NamedTuple):
+    """A Faction's victory standing: ``score`` as calculate_victory_score
+    returns it, ``margin`` as calculate_victory_margin, ``wins`` as
+    check_victory."""
+    score: Any
+    margin: int
+    wins: bool
+
+
+_CONTROLLER = {ctrl: faction for faction, ctrl in FACTION_CONTROL.items()}
+_DISPERSED_LABELS = (DISPERSED, DISPERSED_GATHERING)
+
+
+def _labels(allied_faction, status):
+    if allied_faction is None:
+        return (SUBDUED if status is None else status,)
+    if status is None:
+        return (allied_faction,)
+    return (allied_faction, status)
+
+
+class VictoryTally:
+    """The victory components of one state, for what-if scoring. Build it
+    afresh after the state changes."""
+
+    def __init__(self, state):
+        flush_control(state)
+        self._state = state
+        self._scenario = state["scenario"]
+        self._ariovistus = self._scenario in ARIOVISTUS_SCENARIOS
+        self._factions = _get_victory_factions(state)
+        self._index = tribe_index(state)
+        idx = self._index
+        self._base = {
+            "subdued": idx.count(SUBDUED),
+            "dispersed": idx.count(DISPERSED) + idx.count(DISPERSED_GATHERING),
+            "off_map": _count_off_map_legions(state),
+            "settlements": count_on_map(state, GERMANS, SETTLEMENT),
+        }
+        for f in FACTIONS:
+            self._base["allies", f] = idx.count(f)
+            self._base["citadels", f] = count_on_map(state, f, CITADEL)
+        self._colony = _colony_region(state)
+        self._control = {r: _CONTROLLER.get(space.get("control"))
+                         for r, space in state["spaces"].items()}
+        self._forces = {}
+        self._base["bcv"] = sum(self._bcv(r) for r, f in self._control.items()
+                                if f == BELGAE)
+        self._base["germanic"] = sum(self._germanic(r)
+                                     for r, f in self._control.items()
+                                     if f == GERMANS)
+
+    # -- per-Region components ---------------------------------------------
+
+    def _bcv(self, region):
+        """Region's share of Belgic Control Value while Belgic (§7.2)."""
+        value = get_control_value(region, self._scenario)
+        if region == self._colony:
+            value += 1
+        for status in _DISPERSED_LABELS:
+            for tribe in self._index.tribes(region, status):
+                if tribe not in SUEBI_TRIBES:
+                    value -= 1
+        return value
+
+    def _germanic(self, region):
+        """Region's share of the Germanic total while Germanic (A7.2)."""
+        return ((region in GERMANIA_REGIONS)
+                + count_pieces(self._state, region, GERMANS, SETTLEMENT))
+
+    def _region_forces(self, region):
+        forces = self._forces.get(region)
+        if forces is None:
+            space = self._state["spaces"].get(region, {})
+            forces = self._forces[region] = {
+                f: _count_faction_forces(space, f, self._scenario)
+                for f in FACTIONS}
+        return forces
+
+    def _counts_as_force(self, faction, piece_type):
+        if piece_type == FORT:
+            return faction == ROMANS
+        if piece_type == SETTLEMENT:
+            return faction == GERMANS and self._ariovistus
+        return piece_type in (LEADER, LEGION, ALLY, CITADEL) \
+            or piece_type in FLIPPABLE_PIECES
+
+    # -- scoring -------------------------------------------------------------
+
+    def outcomes(self, candidate=()):
+        """``{faction: Outcome}`` for the victory Factions after
+        ``candidate`` (a delta or a sequence of deltas)."""
+        if isinstance(candidate, (TribeDelta, PieceDelta, ControlDelta)):
+            candidate = (candidate,)
+        c = dict(self._base)
+        tribes = {}                 # tribe -> labels so far in candidate
+        non_suebi = Counter()       # region -> Dispersed non-Suebi change
+        settled = Counter()         # region -> Settlements change
+        forces = {}                 # region -> {faction: Forces change}
+        control = {}                # region -> explicit controller
+        for delta in candidate:
+            if isinstance(delta, TribeDelta):
+                t = delta.tribe
+                region = self._index.region(t)
+                old = tribes.get(t, self._index.labels(t))
+                new = _labels(delta.allied_faction, delta.status)
+                tribes[t] = new
+                for labels, sign in ((old, -1), (new, 1)):
+                    for label in labels:
+                        if label == SUBDUED:
+                            c["subdued"] += sign
+                        elif label in _DISPERSED_LABELS:
+                            c["dispersed"] += sign
+                            if t not in SUEBI_TRIBES:
+                                non_suebi[region] += sign
+                        elif label in FACTIONS:
+                            c["allies", label] += sign
+            elif isinstance(delta, PieceDelta):
+                f, pt, n = delta.faction, delta.piece_type, delta.count
+                if pt == CITADEL:
+                    c["citadels", f] += n
+                elif pt == SETTLEMENT and f == GERMANS:
+                    c["settlements"] += n
+                    settled[delta.region] += n
+                elif pt == LEGION:
+                    c["off_map"] -= n
+                if self._counts_as_force(f, pt):
+                    adj = forces.setdefault(delta.region, Counter())
+                    adj[f] += n
+            elif isinstance(delta, ControlDelta):
+                control[delta.region] = delta.faction
+            else:
+                raise TypeError(f"Not a victory delta: {delta!r}")
+
+        for region, adj in forces.items():
+            if region in control:
+                continue
+            base = self._region_forces(region)
+            counts = {f: base[f] + adj[f] for f in FACTIONS}
+            total = sum(counts.values())
+            control[region] = next((f for f in FACTIONS
+                                    if counts[f] > total - counts[f]), None)
+        for region in set(control) | set(non_suebi):
+            before = self._control.get(region)
+            after = control.get(region, before)
+            if before == BELGAE:
+                c["bcv"] -= self._bcv(region)
+            if after == BELGAE:
+                c["bcv"] += self._bcv(region) - non_suebi[region]
+        for region in set(control) | set(settled):
+            before = self._control.get(region)
+            after = control.get(region, before)
+            if before == GERMANS:
+                c["germanic"] -= self._germanic(region)
+            if after == GERMANS:
+                c["germanic"] += self._germanic(region) + settled[region]
+        return {f: self._outcome(c, f) for f in self._factions}
+
+    def _allies_citadels(self, c, faction):
+        return c["allies", faction] + c["citadels", faction]
+
+    def _outcome(self, c, faction):
+        if faction == ROMANS:
+            score = c["subdued"] + c["dispersed"] + c["allies", ROMANS]
+            if self._ariovistus:
+                score -= c["settlements"]
+            margin = score - ROMAN_VICTORY_THRESHOLD
+            return Outcome(score, margin, margin > 0)
+        if faction == ARVERNI:
+            score = {"off_map_legions": c["off_map"],
+                     "allies_citadels": self._allies_citadels(c, ARVERNI)}
+            legions = score["off_map_legions"] - ARVERNI_LEGIONS_THRESHOLD
+            allies = score["allies_citadels"] - ARVERNI_ALLIES_THRESHOLD
+            return Outcome(score, min(legions, allies),
+                           legions > 0 and allies > 0)
+        if faction == AEDUI:
+            score = self._allies_citadels(c, AEDUI)
+            others = []
+            for other in FACTIONS:
+                if other == AEDUI:
+                    continue
+                ac = self._allies_citadels(c, other)
+                if self._ariovistus and other == GERMANS:
+                    ac += c["settlements"]
+                others.append(ac)
+            return Outcome(score, score - max([0] + others),
+                           all(score > ac for ac in others))
+        if faction == BELGAE:
+            score = c["bcv"] + self._allies_citadels(c, BELGAE)
+            margin = score - BELGAE_VICTORY_THRESHOLD
+            return Outcome(score, margin, margin > 0)
+        score = c["germanic"]
+        margin = score - GERMAN_VICTORY_THRESHOLD
+        return Outcome(score, margin, margin > 0)
+
+    def what_if(self, candidates):
+        """``outcomes`` for each candidate, in order."""
+        return [self.outcomes(candidate) for candidate in candidates]
+
+
+def what_if(state, candidates):
+    """:meth:`VictoryTally.what_if` on a fresh tally of ``state``."""
+    return VictoryTally(state).what_if(candidates)
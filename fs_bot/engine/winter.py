@@ -13,6 +13,8 @@ Reference:
   A6.0-A6.6  Ariovistus Winter Round
 """
 
+from collections import Counter
+
 from fs_bot.rules_consts import (
     # Factions
     ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS,
@@ -61,6 +63,8 @@ from fs_bot.rules_consts import (
     # Markers
     MARKER_DEVASTATED, MARKER_DISPERSED, MARKER_DISPERSED_GATHERING,
     MARKER_SCOUTED, MARKER_INTIMIDATED, MARKER_RAZED,
+    # Tribe status
+    SUBDUED,
     # Eligibility
     ELIGIBLE,
     # Die
@@ -74,15 +78,19 @@ from fs_bot.board.pieces import (
     count_pieces, count_pieces_by_state, get_available,
     get_leader_in_region, find_leader, PieceError,
     _count_on_legions_track,
+    batched,
 )
 from fs_bot.board.control import (
-    refresh_all_control, is_controlled_by, get_controlled_regions,
+    is_controlled_by, get_controlled_regions,
 )
+from fs_bot.board.tribes import tribe_changed, tribe_index
 from fs_bot.map.map_data import (
     get_adjacent, get_playable_regions, get_tribes_in_region,
     ALL_REGION_DATA, get_region_group,
 )
 from fs_bot.commands.common import _is_devastated, _is_intimidated
+from fs_bot.engine import events
+from fs_bot.state import invariants
 from fs_bot.engine.victory import (
     check_any_victory, check_victory, calculate_victory_score,
     calculate_victory_margin, determine_final_ranking,
@@ -120,6 +128,102 @@ _ROWS_AT_OR_ABOVE_SENATE = {
 }
 
 
+# ============================================================================
+# WINTER LEDGER
+# ============================================================================
+
+class WinterLedger:
+    """Board tallies for one Winter Round, taken in one sweep.
+
+    The phases used to rescan the map each on its own (Harvest once per
+    earning Faction, the Senate shift and Harvest for the Roman score,
+    Quarters once per Faction for Devastated Regions, Spring for every
+    Faction's flipped pieces in every Region). ``run_winter_round`` takes
+    one ledger at the start; Quarters and Senate report their piece
+    operations to it (:meth:`moved` / :meth:`removed` / :meth:`placed`),
+    and :meth:`refresh` re-sweeps after steps that run arbitrary Commands
+    (Germans Phase, Winter Uprising, Winter Campaign).
+
+    Each phase function also works without one (tests, the Interlude):
+    it then takes a fresh ledger itself.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.refresh()
+
+    def refresh(self):
+        state = self.state
+        tribes = tribe_index(state)
+        self.allies = Counter()     # Faction -> Allied Tribes
+        for faction in FACTIONS:
+            if tribes.count(faction):
+                self.allies[faction] = tribes.count(faction)
+        self.subdued = tribes.count(SUBDUED)
+        self.dispersed = (tribes.count(MARKER_DISPERSED)
+                          + tribes.count(MARKER_DISPERSED_GATHERING))
+        self.citadels = Counter()   # Faction -> Citadels on the map
+        self.settlements = 0        # Germanic Settlements on the map
+        self.legions = {}           # Region -> Legions
+        self.auxilia = {}           # Region -> Auxilia
+        self.devastated = []        # Devastated Regions, in map order
+        self.exposed = set()        # (Region, Faction) with Revealed/Scouted
+        for region, space in state["spaces"].items():
+            if _is_devastated(state, region):
+                self.devastated.append(region)
+            for faction, f_pieces in space.get("pieces", {}).items():
+                if f_pieces.get(CITADEL):
+                    self.citadels[faction] += f_pieces[CITADEL]
+                if faction == GERMANS and f_pieces.get(SETTLEMENT):
+                    self.settlements += f_pieces[SETTLEMENT]
+                if faction == ROMANS:
+                    if f_pieces.get(LEGION):
+                        self.legions[region] = f_pieces[LEGION]
+                    auxilia = sum(f_pieces.get(ps, {}).get(AUXILIA, 0)
+                                  for ps in (HIDDEN, REVEALED, SCOUTED))
+                    if auxilia:
+                        self.auxilia[region] = auxilia
+                if any(f_pieces.get(ps) for ps in (REVEALED, SCOUTED)):
+                    self.exposed.add((region, faction))
+
+    # -- piece operations applied during the Round ------------------------
+
+    def _add(self, region, faction, piece_type, count):
+        if faction == ROMANS and piece_type in (LEGION, AUXILIA):
+            tally = self.legions if piece_type == LEGION else self.auxilia
+            tally[region] = tally.get(region, 0) + count
+        elif piece_type == CITADEL:
+            self.citadels[faction] += count
+        elif faction == GERMANS and piece_type == SETTLEMENT:
+            self.settlements += count
+
+    def moved(self, src, dst, faction, piece_type, count=1,
+              piece_state=None):
+        self._add(src, faction, piece_type, -count)
+        self._add(dst, faction, piece_type, count)
+        if piece_state in (REVEALED, SCOUTED):
+            self.exposed.add((dst, faction))
+
+    def removed(self, region, faction, piece_type, count=1):
+        self._add(region, faction, piece_type, -count)
+
+    def placed(self, region, faction, piece_type, count=1):
+        self._add(region, faction, piece_type, count)
+
+    # -- derived tallies --------------------------------------------------
+
+    def roman_forces(self, region):
+        """Legions and Auxilia in ``region``."""
+        return self.legions.get(region, 0), self.auxilia.get(region, 0)
+
+    def roman_score(self):
+        """calculate_victory_score(state, ROMANS) — §7.2 / A7.2."""
+        score = self.subdued + self.dispersed + self.allies[ROMANS]
+        if self.state["scenario"] in ARIOVISTUS_SCENARIOS:
+            score -= self.settlements
+        return score
+
+
 # ============================================================================
 # PHASE 1: VICTORY PHASE (§6.1, A6.1)
 # ============================================================================
@@ -134,7 +238,7 @@ def _optimates_remove_all_legions(state):
                          to_available=False, to_track=True)
 
 
-def victory_phase(state, is_final=False):
+def victory_phase(state, is_final=False, ledger=None):
     """Execute the Victory Phase — §6.1 / A6.1.
 
     Check if any faction meets its victory condition. If the game ends,
@@ -144,6 +248,7 @@ def victory_phase(state, is_final=False):
     Args:
         state: Game state dict.
         is_final: True if this is the final Winter card (§2.4.1).
+        ledger: This Round's WinterLedger, if any.
 
     Returns:
         Dict with:
@@ -171,8 +276,12 @@ def victory_phase(state, is_final=False):
     # game and determine victory.
     if (state.get("event_modifiers", {}).get("optimates_active")
             and state.get("winter_count", 0) >= 2):
-        from fs_bot.engine.victory import calculate_victory_score
-        if calculate_victory_score(state, ROMANS) > 12:
+        if ledger is not None:
+            roman_score = ledger.roman_score()
+        else:
+            from fs_bot.engine.victory import calculate_victory_score
+            roman_score = calculate_victory_score(state, ROMANS)
+        if roman_score > 12:
             _optimates_remove_all_legions(state)
             result["game_over"] = True
             result["optimates_end"] = True
@@ -198,6 +307,7 @@ def victory_phase(state, is_final=False):
 # PHASE 2: GERMANS PHASE (§6.2, base game only)
 # ============================================================================
 
+@batched
 def germans_phase(state):
     """Execute the Germans Phase — §6.2.
 
@@ -232,8 +342,6 @@ def germans_phase(state):
 
     # §6.2.4 Battle with Ambush
     result["battle"] = germans_phase_battle(state)
-
-    refresh_all_control(state)
     return result
 
 
@@ -293,7 +401,8 @@ def _germans_phase_raid_all(state):
 # PHASE 3: QUARTERS PHASE (§6.3, A6.3)
 # ============================================================================
 
-def quarters_phase(state, relocations=None):
+@batched
+def quarters_phase(state, relocations=None, ledger=None):
     """Execute the Quarters Phase — §6.3 / A6.3.
 
     Each faction relocates its Forces, then forced die rolls for
@@ -310,6 +419,7 @@ def quarters_phase(state, relocations=None):
         relocations: Optional dict of pre-made relocation decisions,
             keyed by faction. Each value is a list of
             (piece_type, from_region, to_region, count) tuples.
+        ledger: This Round's WinterLedger; kept current as pieces move.
 
     Returns:
         Dict with phase results.
@@ -317,6 +427,8 @@ def quarters_phase(state, relocations=None):
     scenario = state["scenario"]
     if relocations is None:
         relocations = {}
+    if ledger is None:
+        ledger = WinterLedger(state)
 
     result = {
         "german_relocation": None,
@@ -328,40 +440,44 @@ def quarters_phase(state, relocations=None):
 
     if scenario in BASE_SCENARIOS:
         # Base game order: Germans, Belgae, Aedui, Arverni, Romans — §6.3
-        result["german_relocation"] = _quarters_german_relocation(state)
+        result["german_relocation"] = _quarters_german_relocation(
+            state, ledger)
         for faction in (BELGAE, AEDUI, ARVERNI):
-            _apply_relocations(state, faction, relocations.get(faction, []))
+            _apply_relocations(state, faction, relocations.get(faction, []),
+                               ledger)
             result["gallic_desertion"][faction] = _quarters_gallic_desertion(
-                state, faction
+                state, faction, ledger
             )
-        _apply_relocations(state, ROMANS, relocations.get(ROMANS, []))
+        _apply_relocations(state, ROMANS, relocations.get(ROMANS, []),
+                           ledger)
         result["roman_quartering"] = _quarters_roman_pay_or_roll(
-            state, relocations.get(ROMANS + "_quartering", {})
+            state, relocations.get(ROMANS + "_quartering", {}), ledger
         )
     else:
         # Ariovistus order: Belgae, Aedui, Germans, Romans — A6.3
         # A6.3.1: Arverni do not relocate
         for faction in (BELGAE, AEDUI):
-            _apply_relocations(state, faction, relocations.get(faction, []))
+            _apply_relocations(state, faction, relocations.get(faction, []),
+                               ledger)
             result["gallic_desertion"][faction] = _quarters_gallic_desertion(
-                state, faction
+                state, faction, ledger
             )
         # A6.3.2: Germans treated like Gauls in Ariovistus
-        _apply_relocations(state, GERMANS, relocations.get(GERMANS, []))
+        _apply_relocations(state, GERMANS, relocations.get(GERMANS, []),
+                           ledger)
         result["gallic_desertion"][GERMANS] = _quarters_gallic_desertion(
-            state, GERMANS
+            state, GERMANS, ledger
         )
         # Romans unchanged — A6.3.3
-        _apply_relocations(state, ROMANS, relocations.get(ROMANS, []))
+        _apply_relocations(state, ROMANS, relocations.get(ROMANS, []),
+                           ledger)
         result["roman_quartering"] = _quarters_roman_pay_or_roll(
-            state, relocations.get(ROMANS + "_quartering", {})
+            state, relocations.get(ROMANS + "_quartering", {}), ledger
         )
-
-    refresh_all_control(state)
     return result
 
 
-def _quarters_german_relocation(state):
+def _quarters_german_relocation(state, ledger=None):
     """Relocate Germanic Warbands from Devastated regions — §6.3.1.
 
     Base game only. All Germanic Warbands in Devastated regions without
@@ -377,13 +493,14 @@ def _quarters_german_relocation(state):
         "die_roll": None,
     }
 
+    if ledger is None:
+        ledger = WinterLedger(state)
+
     # Find Warbands to relocate
     warbands_to_move = {}
-    for region in state["spaces"]:
+    for region in ledger.devastated:
         if region in GERMANIA_REGIONS:
             continue
-        if not _is_devastated(state, region):
-            continue
         # Check for German Allies in region
         german_allies = count_pieces(state, region, GERMANS, ALLY)
         if german_allies > 0:
@@ -416,12 +533,13 @@ def _quarters_german_relocation(state):
                     state, region, dest, GERMANS, WARBAND,
                     count=ps_count, piece_state=ps
                 )
+                ledger.moved(region, dest, GERMANS, WARBAND, ps_count, ps)
         result["relocated"][region] = wb_count
 
     return result
 
 
-def _quarters_gallic_desertion(state, faction):
+def _quarters_gallic_desertion(state, faction, ledger=None):
     """Roll for Warbands in Devastated regions without Ally/Citadel — §6.3.2.
 
     For Gallic factions (and Germans in Ariovistus), roll a die for each
@@ -434,11 +552,10 @@ def _quarters_gallic_desertion(state, faction):
     result = {}
     scenario = state["scenario"]
     rng = state["rng"]
+    if ledger is None:
+        ledger = WinterLedger(state)
 
-    for region in list(state["spaces"].keys()):
-        if not _is_devastated(state, region):
-            continue
-
+    for region in ledger.devastated:
         # Check for Ally, Citadel (and Settlement for Germans in Ariovistus)
         has_ally = count_pieces(state, region, faction, ALLY) > 0
         has_citadel = count_pieces(state, region, faction, CITADEL) > 0
@@ -467,6 +584,7 @@ def _quarters_gallic_desertion(state, faction):
             region_result["rolls"].append(roll)
             if roll <= DESERTION_ROLL_THRESHOLD:
                 remove_piece(state, region, faction, WARBAND)
+                ledger.removed(region, faction, WARBAND)
                 region_result["removed"] += 1
 
         if region_result["rolls"]:
@@ -475,10 +593,11 @@ def _quarters_gallic_desertion(state, faction):
     return result
 
 
-def _apply_relocations(state, faction, relocation_list):
+def _apply_relocations(state, faction, relocation_list, ledger=None):
     """Apply pre-made relocation decisions for a faction.
 
     Each relocation is (piece_type, from_region, to_region, count).
+    Moves are reported to ``ledger`` when given.
     """
     for piece_type, from_region, to_region, count in relocation_list:
         if piece_type in FLIPPABLE_PIECES:
@@ -493,6 +612,9 @@ def _apply_relocations(state, faction, relocation_list):
                         state, from_region, to_region, faction, piece_type,
                         count=to_move, piece_state=ps
                     )
+                    if ledger is not None:
+                        ledger.moved(from_region, to_region, faction,
+                                     piece_type, to_move, ps)
                     count -= to_move
                 if count <= 0:
                     break
@@ -501,9 +623,13 @@ def _apply_relocations(state, faction, relocation_list):
                 state, from_region, to_region, faction, piece_type,
                 count=count
             )
+            if ledger is not None:
+                ledger.moved(from_region, to_region, faction, piece_type,
+                             count)
 
 
-def _quarters_roman_pay_or_roll(state, quartering_decisions=None):
+def _quarters_roman_pay_or_roll(state, quartering_decisions=None,
+                                ledger=None):
     """Execute Roman pay-or-roll for pieces outside Provincia — §6.3.3.
 
     For each Legion and Auxilia outside Provincia:
@@ -520,6 +646,8 @@ def _quarters_roman_pay_or_roll(state, quartering_decisions=None):
     """
     if quartering_decisions is None:
         quartering_decisions = {}
+    if ledger is None:
+        ledger = WinterLedger(state)
 
     result = {
         "payments": {},
@@ -540,8 +668,7 @@ def _quarters_roman_pay_or_roll(state, quartering_decisions=None):
             continue
 
         # Count Roman pieces that need quartering
-        legion_count = count_pieces(state, region, ROMANS, LEGION)
-        auxilia_count = count_pieces(state, region, ROMANS, AUXILIA)
+        legion_count, auxilia_count = ledger.roman_forces(region)
         total_pieces = legion_count + auxilia_count
         if total_pieces == 0:
             continue
@@ -615,6 +742,7 @@ def _quarters_roman_pay_or_roll(state, quartering_decisions=None):
                         remove_piece(
                             state, region, ROMANS, LEGION, to_fallen=True
                         )
+                        ledger.removed(region, ROMANS, LEGION)
                         region_rolls["removed_legions"] += 1
                     else:
                         current_auxilia = count_pieces(
@@ -622,6 +750,7 @@ def _quarters_roman_pay_or_roll(state, quartering_decisions=None):
                         )
                         if current_auxilia > 0:
                             remove_piece(state, region, ROMANS, AUXILIA)
+                            ledger.removed(region, ROMANS, AUXILIA)
                             region_rolls["removed_auxilia"] += 1
 
             result["rolls"][region] = region_rolls
@@ -637,7 +766,7 @@ def _quarters_roman_pay_or_roll(state, quartering_decisions=None):
 # PHASE 4: HARVEST PHASE (§6.4, A6.4)
 # ============================================================================
 
-def harvest_phase(state):
+def harvest_phase(state, ledger=None):
     """Execute the Harvest Phase — §6.4 / A6.4.
 
     A6.4.1: Ariovistus Roman earnings equal the Roman victory score,
@@ -651,9 +780,11 @@ def harvest_phase(state):
     """
     scenario = state["scenario"]
     result = {}
+    if ledger is None:
+        ledger = WinterLedger(state)
 
     # §6.4.1 Roman Earnings: Resources += victory score
-    roman_score = calculate_victory_score(state, ROMANS)
+    roman_score = ledger.roman_score()
     roman_earn = roman_score
     _add_resources(state, ROMANS, roman_earn)
     result[ROMANS] = roman_earn
@@ -664,15 +795,7 @@ def harvest_phase(state):
             # A6.4.2: Arverni do not earn Resources in Ariovistus
             result[faction] = 0
             continue
-        allies = 0
-        for tribe_info in state["tribes"].values():
-            if tribe_info.get("allied_faction") == faction:
-                allies += 1
-        citadels = 0
-        for region_data in state["spaces"].values():
-            f_pieces = region_data.get("pieces", {}).get(faction, {})
-            citadels += f_pieces.get(CITADEL, 0)
-        earn = 2 * (allies + citadels)
+        earn = 2 * (ledger.allies[faction] + ledger.citadels[faction])
         _add_resources(state, faction, earn)
         result[faction] = earn
 
@@ -682,15 +805,7 @@ def harvest_phase(state):
 
     # A6.4.4 Germanic Earnings (Ariovistus only): 2x (Allies + Settlements)
     if scenario in ARIOVISTUS_SCENARIOS:
-        german_allies = 0
-        for tribe_info in state["tribes"].values():
-            if tribe_info.get("allied_faction") == GERMANS:
-                german_allies += 1
-        german_settlements = 0
-        for region_data in state["spaces"].values():
-            f_pieces = region_data.get("pieces", {}).get(GERMANS, {})
-            german_settlements += f_pieces.get(SETTLEMENT, 0)
-        german_earn = 2 * (german_allies + german_settlements)
+        german_earn = 2 * (ledger.allies[GERMANS] + ledger.settlements)
         _add_resources(state, GERMANS, german_earn)
         result[GERMANS] = german_earn
 
@@ -701,14 +816,17 @@ def _add_resources(state, faction, amount):
     """Add Resources to a faction, capping at MAX_RESOURCES."""
     current = state["resources"].get(faction, 0)
     state["resources"][faction] = min(current + amount, MAX_RESOURCES)
+    if invariants.enabled:
+        invariants.resources(state, "_add_resources", faction)
 
 
 # ============================================================================
 # PHASE 5: SENATE PHASE (§6.5, A6.5)
 # ============================================================================
 
+@batched
 def senate_phase(state, first_senate_after_interlude=False,
-                 force_position=None):
+                 force_position=None, ledger=None):
     """Execute the Senate Phase — §6.5 / A6.5.
 
     Shift Senate marker, move Legions from Fallen to track and place
@@ -718,11 +836,14 @@ def senate_phase(state, first_senate_after_interlude=False,
         state: Game state dict. Modified in place.
         first_senate_after_interlude: True if this is the first Senate
             Phase after the Gallic War Interlude (A6.5.1).
+        ledger: This Round's WinterLedger, if any.
 
     Returns:
         Dict with phase results.
     """
     scenario = state["scenario"]
+    if ledger is None:
+        ledger = WinterLedger(state)
     result = {
         "marker_shift": None,
         "legions_from_fallen": 0,
@@ -740,21 +861,22 @@ def senate_phase(state, first_senate_after_interlude=False,
                                   "forced": force_position}
     else:
         result["marker_shift"] = _senate_marker_shift(
-            state, first_senate_after_interlude
+            state, first_senate_after_interlude, ledger
         )
 
     # §6.5.2 Legions
     legions_result = _senate_legions(state)
     result.update(legions_result)
+    ledger.placed(PROVINCIA, ROMANS, LEGION, result["legions_placed"])
 
     # §6.5.3 Auxilia
     result["auxilia_placed"] = _senate_auxilia(state)
-
-    refresh_all_control(state)
+    ledger.placed(PROVINCIA, ROMANS, AUXILIA, result["auxilia_placed"])
     return result
 
 
-def _senate_marker_shift(state, first_senate_after_interlude=False):
+def _senate_marker_shift(state, first_senate_after_interlude=False,
+                         ledger=None):
     """Shift the Senate marker per §6.5.1 / A6.5.1.
 
     Returns:
@@ -795,7 +917,8 @@ def _senate_marker_shift(state, first_senate_after_interlude=False):
         return result
 
     # Determine shift direction based on Roman victory score
-    roman_score = calculate_victory_score(state, ROMANS)
+    roman_score = (ledger.roman_score() if ledger is not None
+                   else calculate_victory_score(state, ROMANS))
     fallen = state.get("fallen_legions", 0)
 
     if roman_score < SENATE_SHIFT_LOW_THRESHOLD:
@@ -953,10 +1076,15 @@ def _senate_legions(state):
                 break
 
         # Place directly into Provincia (track already decremented)
-        from fs_bot.board.pieces import _ensure_faction_pieces_structure
+        from fs_bot.board.pieces import (_ensure_faction_pieces_structure,
+                                         bump_board_version)
         _ensure_faction_pieces_structure(state, PROVINCIA, ROMANS)
         f_pieces = state["spaces"][PROVINCIA]["pieces"][ROMANS]
         f_pieces[LEGION] = f_pieces.get(LEGION, 0) + total_to_place
+        bump_board_version(state, PROVINCIA)
+        if events.enabled:
+            events.emit(events.PIECE_PLACE, state, ROMANS, region=PROVINCIA,
+                        piece_type=LEGION, count=total_to_place)
         result["legions_placed"] = total_to_place
 
     return result
@@ -991,7 +1119,8 @@ def _senate_auxilia(state):
 # PHASE 6: SPRING PHASE (§6.6, A6.6)
 # ============================================================================
 
-def spring_phase(state):
+@batched
+def spring_phase(state, ledger=None):
     """Execute the Spring Phase — §6.6 / A6.6.
 
     Prepare for the coming year:
@@ -1007,6 +1136,8 @@ def spring_phase(state):
         Dict with phase results.
     """
     scenario = state["scenario"]
+    if ledger is None:
+        ledger = WinterLedger(state)
     result = {
         "successors_placed": [],
         "fallen_to_track": 0,
@@ -1040,6 +1171,8 @@ def spring_phase(state):
     # Remove Scouted markers, flip Revealed to Hidden — §6.6
     for region in state["spaces"]:
         for faction in FACTIONS:
+            if (region, faction) not in ledger.exposed:
+                continue
             # Scouted → Revealed (removing Scouted marker) — §4.2.2
             for pt in FLIPPABLE_PIECES:
                 scouted = count_pieces_by_state(
@@ -1083,18 +1216,22 @@ def spring_phase(state):
     # 1. Remove all Dispersed-Gathering markers (only)
     # 2. Flip all Dispersed to Dispersed-Gathering
     # (Do NOT remove or flip Razed marker from Sacking Event — §6.6)
-    for tribe_name, tribe_info in state["tribes"].items():
-        status = tribe_info.get("status")
-        if status == MARKER_DISPERSED_GATHERING:
-            # Remove Dispersed-Gathering → tribe becomes Subdued
-            tribe_info["status"] = None
-            tribe_info["allied_faction"] = None
-            result["dispersed_gathering_removed"] += 1
-        elif status == MARKER_DISPERSED:
-            # Flip Dispersed → Dispersed-Gathering
-            tribe_info["status"] = MARKER_DISPERSED_GATHERING
-            result["dispersed_flipped"] += 1
-        # Razed: do not touch — §6.6
+    index = tribe_index(state)
+    gathering = index.everywhere(MARKER_DISPERSED_GATHERING)
+    dispersed = index.everywhere(MARKER_DISPERSED)
+    for tribe_name in gathering:
+        # Remove Dispersed-Gathering → tribe becomes Subdued
+        tribe_info = state["tribes"][tribe_name]
+        tribe_info["status"] = None
+        tribe_info["allied_faction"] = None
+        tribe_changed(state, tribe_name)
+        result["dispersed_gathering_removed"] += 1
+    for tribe_name in dispersed:
+        # Flip Dispersed → Dispersed-Gathering
+        state["tribes"][tribe_name]["status"] = MARKER_DISPERSED_GATHERING
+        tribe_changed(state, tribe_name)
+        result["dispersed_flipped"] += 1
+    # Razed: do not touch — §6.6
 
     # Ariovistus: Remove Intimidated markers — A6.6
     if scenario in ARIOVISTUS_SCENARIOS:
@@ -1112,8 +1249,6 @@ def spring_phase(state):
     # Mark all factions Eligible — §6.6
     for faction in FACTIONS:
         state["eligibility"][faction] = ELIGIBLE
-
-    refresh_all_control(state)
     return result
 
 
@@ -1278,6 +1413,7 @@ def run_winter_round(state, is_final=False,
     consume_first_harvest_no_belgica = state.get(
         "first_harvest_after_interlude_pending", False,
     )
+    ledger = WinterLedger(state)
 
     # Phase 1: Victory
     if fws.get("skip_victory_phase"):
@@ -1285,8 +1421,13 @@ def run_winter_round(state, is_final=False,
                           "rankings": None,
                           "skipped": "1st Winter special rule"}
     else:
-        victory_result = victory_phase(state, is_final=is_final)
+        victory_result = victory_phase(state, is_final=is_final,
+                                       ledger=ledger)
     result["phases"]["victory"] = victory_result
+    if events.enabled:
+        events.emit(events.WINTER_PHASE, state, phase="victory",
+                    game_over=victory_result["game_over"],
+                    winner=victory_result.get("winner"))
     if victory_result["game_over"]:
         return result
 
@@ -1304,6 +1445,8 @@ def run_winter_round(state, is_final=False,
             roman_dispersed_keep=roman_dispersed_keep,
         )
         result["interlude"] = interlude_result
+        if events.enabled:
+            events.emit(events.WINTER_PHASE, state, phase="interlude")
         return result
 
     # Phase 2: Germans Phase (base game only)
@@ -1313,6 +1456,9 @@ def run_winter_round(state, is_final=False,
                                            "1st Winter special rule"}
         else:
             result["phases"]["germans"] = germans_phase(state)
+            ledger.refresh()
+        if events.enabled:
+            events.emit(events.WINTER_PHASE, state, phase="germans")
 
     # Phase 3: Quarters
     # Q12 (QUESTIONS.md): when the Romans are Non-player and no explicit
@@ -1340,14 +1486,17 @@ def run_winter_round(state, is_final=False,
             from fs_bot.bots.roman_bot import build_np_winter_relocations
             relocations = build_np_winter_relocations(state)
     result["phases"]["quarters"] = quarters_phase(
-        state, relocations=relocations
+        state, relocations=relocations, ledger=ledger
     )
+    if events.enabled:
+        events.emit(events.WINTER_PHASE, state, phase="quarters")
 
     # Card A66 Winter Uprising: after any Quarters Phase, resolve the
     # Uprising (remove marker, place pieces, free Command / Arverni Phase).
     if state.get("event_modifiers", {}).get("card_A66_winter_uprising"):
         from fs_bot.engine.execute import _resolve_winter_uprising
         result["phases"]["winter_uprising"] = _resolve_winter_uprising(state)
+        ledger.refresh()
 
     # Phase 4: Harvest — apply the 1st-Winter-after-Interlude exception
     # before normal harvest.
@@ -1373,19 +1522,28 @@ def run_winter_round(state, is_final=False,
         # Region(s)." NP default (documented): all into the Belgica
         # Region with the most Roman pieces (sorted-first on ties).
         from fs_bot.rules_consts import BELGICA_REGIONS
-        from fs_bot.board.pieces import count_pieces as _cp
+        from fs_bot.board.pieces import (count_pieces as _cp,
+                                         bump_board_version, batch_mutations)
         k = min(n_bel, state.get("winter_track_legions", 0))
         if k > 0:
             dest = max(sorted(BELGICA_REGIONS),
                        key=lambda r: _cp(state, r, ROMANS, LEGION)
                        + _cp(state, r, ROMANS, AUXILIA))
-            pieces = state["spaces"][dest]["pieces"].setdefault(ROMANS, {})
-            pieces[LEGION] = pieces.get(LEGION, 0) + k
+            with batch_mutations(state):
+                pieces = state["spaces"][dest]["pieces"].setdefault(ROMANS,
+                                                                    {})
+                pieces[LEGION] = pieces.get(LEGION, 0) + k
+                bump_board_version(state, dest)
+            if events.enabled:
+                events.emit(events.PIECE_PLACE, state, ROMANS, region=dest,
+                            piece_type=LEGION, count=k)
+            ledger.placed(dest, ROMANS, LEGION, k)
             state["winter_track_legions"] -= k
-            refresh_all_control(state)
             result["phases"]["harvest_belgica_legions"] = {
                 "region": dest, "legions": k}
-    result["phases"]["harvest"] = harvest_phase(state)
+    result["phases"]["harvest"] = harvest_phase(state, ledger)
+    if events.enabled:
+        events.emit(events.WINTER_PHASE, state, phase="harvest")
 
     # Card 63 shaded (Winter Campaign): "Place this card near a Gallic
     # Faction. After each Harvest, it may do any 2 Commands and/or Special
@@ -1417,6 +1575,7 @@ def run_winter_round(state, is_final=False,
                                         {"player_action": _plan})
             result["phases"]["winter_campaign"] = {
                 "owner": _owner, "result": _r63}
+            ledger.refresh()
     # §8.6.6 NP Aedui subsidy — Quarters/Harvest are §1.5.2 transfer
     # windows and Roman Resources drop paying Quarters costs.
     from fs_bot.engine.execute import maybe_np_aedui_subsidy
@@ -1430,12 +1589,18 @@ def run_winter_round(state, is_final=False,
         first_senate_after_interlude=consume_first_senate,
         force_position=(INTRIGUE if fws.get("senate_set_to_intrigue")
                         else None),
+        ledger=ledger,
     )
     if consume_first_senate:
         state["first_senate_after_interlude_pending"] = False
+    if events.enabled:
+        events.emit(events.WINTER_PHASE, state, phase="senate",
+                    position=state["senate"].get("position"))
 
     # Phase 6: Spring
-    result["phases"]["spring"] = spring_phase(state)
+    result["phases"]["spring"] = spring_phase(state, ledger)
+    if events.enabled:
+        events.emit(events.WINTER_PHASE, state, phase="spring")
     if fws.get("place_vercingetorix_in_spring"):
         # "Beginning that Spring Phase, the Arverni may at any time place
         # Vercingetorix from the Spring box into any Region (symbol up)."
@@ -0,0 +1,53 @@
+"""Per-state caches — derived data kept on the state it was derived from.
+
+Indexes, tables and views computed from a game state (the tribe index, the
+Rally tables, region views, map facts, change tracking) live in one private
+slot of the state, ``state[KEY]``, so they die with the state instead of
+keeping finished games alive in module-level tables:
+
+    entry = state_caches(state).get("rally")
+
+Every copy of a state — ``copy.deepcopy``, pickling, and so every snapshot,
+fork and rollback — starts with no caches, and save files leave the slot
+out. Each cache still checks its own freshness (board version, the identity
+of the dict it indexes) before use.
+"""
+from __future__ import annotations
+
+KEY = "_caches"
+
+
+class Caches(dict):
+    """The cache slot of one state. Copies come out empty, and any two
+    compare equal: caches are not part of the game state's value."""
+
+    __slots__ = ()
+
+    def __copy__(self):
+        return Caches()
+
+    def __deepcopy__(self, memo):
+        return Caches()
+
+    def __reduce__(self):
+        return (Caches, ())
+
+    def __eq__(self, other):
+        if isinstance(other, Caches):
+            return True
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Caches):
+            return False
+        return NotImplemented
+
+    __hash__ = None
+
+
+def state_caches(state):
+    """The cache slot of ``state``, created on first use."""
+    caches = state.get(KEY)
+    if caches is None:
+        caches = state[KEY] = Caches()
+    return caches
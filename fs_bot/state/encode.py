@@ -0,0 +1,437 @@
+"""Fixed-layout numeric board encoding — for batch analytics and evaluators.
+
+Packs the public board of a game state into one flat row of signed 16-bit
+integers (``array('h')``), always the same length and order, so many boards
+can sit back to back in one buffer, be sliced with ``memoryview`` and be
+handed to NumPy without copying.
+
+Row layout (ENCODING_VERSION 2), in order — see ``LAYOUT`` for offsets:
+
+  header        version, scenario index
+  pieces        region x faction x slot, slots: Leader (0 none, else
+                1 + index in LEADER_NAMES), Legion, Fort, Ally, Citadel,
+                Settlement, Auxilia/Warband x Hidden/Revealed/Scouted
+  control       per region: 0 No Control, 1 + faction index, -1 other
+  markers       region x marker: 0 absent, 1 present, 2 + faction index
+                when the marker holds a Faction (Abatis)
+  tribes        per tribe: status code, Allied faction (0 none, 1 + index),
+                Colony region (0 none, 1 + region index); the fixed Tribes,
+                then COLONY_SLOTS rows for card 71's Colony (decoded under
+                its default name, "Colony_<region>")
+  resources     per faction (-1 = not tracked)
+  available     faction x piece type
+  eligibility   per faction: 0 Eligible, 1 Ineligible, -1 other
+  capabilities  per capability card: side (0 off, 1 unshaded, 2 shaded),
+                owner (0 none, 1 + faction index)
+  scalars       senate position/firm, Legions track rows, fallen / removed /
+                Winter-track Legions, winter count, current / next card,
+                At War, second half
+
+Hidden information (deck order, rng) is not encoded. ``decode`` rebuilds the
+encoded keys in the state's own shapes, so board helpers such as
+``count_pieces`` work on a decoded row.
+
+NumPy is optional: :func:`as_numpy` views a buffer as an ``(n, WIDTH)``
+int16 array when NumPy is installed.
+"""
+
+import struct
+from array import array
+
+from fs_bot.rules_consts import (
+    FACTIONS, ALL_REGIONS, ALL_SCENARIOS,
+    LEADER, LEGION, AUXILIA, WARBAND, FORT, ALLY, CITADEL, SETTLEMENT,
+    PIECE_TYPES, HIDDEN, REVEALED, SCOUTED,
+    CAESAR, VERCINGETORIX, AMBIORIX, ARIOVISTUS_LEADER, DIVICIACUS,
+    BODUOGNATUS, SUCCESSOR,
+    NO_CONTROL, FACTION_CONTROL,
+    SUBDUED, ALLIED, DISPERSED, DISPERSED_GATHERING,
+    BASE_TRIBES, TRIBE_NORI, COLONY_EXTRA_TRIBE,
+    UPROAR, INTRIGUE, ADULATION, LEGIONS_ROWS,
+    ELIGIBLE, INELIGIBLE,
+    EVENT_UNSHADED, EVENT_SHADED,
+    CAPABILITY_CARDS, CAPABILITY_CARDS_ARIOVISTUS,
+    MARKER_DEVASTATED, MARKER_INTIMIDATED, MARKER_COLONY,
+    MARKER_GALLIA_TOGATA, MARKER_CIRCUMVALLATION, MARKER_RAZED,
+    MARKER_ABATIS, MARKER_ARVERNI_RALLY, MARKER_ARVERNI_TARGET,
+    MARKER_BRITANNIA_NOT_IN_PLAY, MARKER_WINTER_UPRISING,
+)
+from fs_bot.cards.card_data import (
+    get_base_event_card_ids, get_ariovistus_event_card_ids,
+    get_winter_card_ids,
+)
+
+ENCODING_VERSION = 2
+
+LEADER_NAMES = (CAESAR, VERCINGETORIX, AMBIORIX, ARIOVISTUS_LEADER,
+                DIVICIACUS, BODUOGNATUS, SUCCESSOR)
+COUNT_SLOTS = (LEGION, FORT, ALLY, CITADEL, SETTLEMENT)
+FLIP_SLOTS = tuple((pt, ps) for pt in (AUXILIA, WARBAND)
+                   for ps in (HIDDEN, REVEALED, SCOUTED))
+PIECE_SLOTS = 1 + len(COUNT_SLOTS) + len(FLIP_SLOTS)
+
+# "Uprising" is the region marker card A66 places (card_effects).
+REGION_MARKERS = (MARKER_DEVASTATED, MARKER_INTIMIDATED, MARKER_COLONY,
+                  MARKER_GALLIA_TOGATA, MARKER_CIRCUMVALLATION, MARKER_RAZED,
+                  MARKER_ABATIS, MARKER_ARVERNI_RALLY, MARKER_ARVERNI_TARGET,
+                  MARKER_BRITANNIA_NOT_IN_PLAY, MARKER_WINTER_UPRISING,
+                  "Uprising")
+TRIBES = BASE_TRIBES + (TRIBE_NORI,)
+COLONY_SLOTS = COLONY_EXTRA_TRIBE
+TRIBE_STATUSES = (None, SUBDUED, ALLIED, DISPERSED, DISPERSED_GATHERING)
+SENATE_POSITIONS = (None, UPROAR, INTRIGUE, ADULATION)
+CAPABILITY_IDS = (tuple(sorted(CAPABILITY_CARDS))
+                  + tuple(sorted(CAPABILITY_CARDS_ARIOVISTUS)))
+CARD_IDS = (tuple(get_base_event_card_ids())
+            + tuple(sorted(c for c in get_ariovistus_event_card_ids()
+                           if isinstance(c, str)))
+            + tuple(get_winter_card_ids()))
+SCALARS = ("senate_position", "senate_firm") + tuple(
+    "legions_" + row for row in LEGIONS_ROWS) + (
+    "fallen_legions", "removed_legions", "winter_track_legions",
+    "winter_count", "current_card", "next_card", "at_war", "second_half")
+
+_NF, _NR = len(FACTIONS), len(ALL_REGIONS)
+_BLOCKS = (
+    ("header", (2,)),
+    ("pieces", (_NR, _NF, PIECE_SLOTS)),
+    ("control", (_NR,)),
+    ("markers", (_NR, len(REGION_MARKERS))),
+    ("tribes", (len(TRIBES) + COLONY_SLOTS, 3)),
+    ("resources", (_NF,)),
+    ("available", (_NF, len(PIECE_TYPES))),
+    ("eligibility", (_NF,)),
+    ("capabilities", (len(CAPABILITY_IDS), 2)),
+    ("scalars", (len(SCALARS),)),
+)
+
+
+def _size(shape):
+    n = 1
+    for d in shape:
+        n *= d
+    return n
+
+
+LAYOUT = {}
+_off = 0
+for _name, _shape in _BLOCKS:
+    LAYOUT[_name] = (_off, _shape)
+    _off += _size(_shape)
+WIDTH = _off
+del _off, _name, _shape
+
+_FACTION_IX = {f: i for i, f in enumerate(FACTIONS)}
+_REGION_IX = {r: i for i, r in enumerate(ALL_REGIONS)}
+_TRIBE_IX = {t: i for i, t in enumerate(TRIBES)}
+_CARD_IX = {c: i for i, c in enumerate(CARD_IDS)}
+_CONTROL_CODE = {NO_CONTROL: 0}
+_CONTROL_CODE.update({c: 1 + _FACTION_IX[f]
+                      for f, c in FACTION_CONTROL.items()})
+_CONTROL_OF = {v: k for k, v in _CONTROL_CODE.items()}
+_ELIG_CODE = {ELIGIBLE: 0, INELIGIBLE: 1}
+_ELIG_OF = {0: ELIGIBLE, 1: INELIGIBLE}
+_SIDE_CODE = {EVENT_UNSHADED: 1, EVENT_SHADED: 2}
+_SIDE_OF = {1: EVENT_UNSHADED, 2: EVENT_SHADED}
+
+
+def _code(table, value):
+    """1-based index of ``value`` in ``table`` (0 = absent, -1 = unknown)."""
+    if value is None:
+        return 0
+    try:
+        return 1 + table.index(value)
+    except ValueError:
+        return -1
+
+
+def _of(table, code):
+    return table[code - 1] if 0 < code <= len(table) else None
+
+
+def _card_code(card_id):
+    ix = _CARD_IX.get(card_id)
+    return 0 if card_id is None else (-1 if ix is None else ix + 1)
+
+
+def encode(state, out=None):
+    """Append ``state``'s board row (WIDTH int16 values) to ``out`` (a new
+    ``array('h')`` by default) and return it."""
+    row = [0] * WIDTH
+    row[0] = ENCODING_VERSION
+    row[1] = _code(ALL_SCENARIOS, state.get("scenario"))
+
+    base = LAYOUT["pieces"][0]
+    spaces = state.get("spaces", {})
+    for r, region in enumerate(ALL_REGIONS):
+        space = spaces.get(region) or {}
+        pieces = space.get("pieces") or {}
+        for f, faction in enumerate(FACTIONS):
+            fp = pieces.get(faction)
+            if not fp:
+                continue
+            i = base + (r * _NF + f) * PIECE_SLOTS
+            row[i] = _code(LEADER_NAMES, fp.get(LEADER))
+            for k, pt in enumerate(COUNT_SLOTS, 1):
+                row[i + k] = fp.get(pt, 0)
+            k = 1 + len(COUNT_SLOTS)
+            for pt, ps in FLIP_SLOTS:
+                row[i + k] = (fp.get(ps) or {}).get(pt, 0)
+                k += 1
+        row[LAYOUT["control"][0] + r] = _CONTROL_CODE.get(
+            space.get("control", NO_CONTROL), -1)
+
+    base = LAYOUT["markers"][0]
+    markers = state.get("markers") or {}
+    for r, region in enumerate(ALL_REGIONS):
+        held = markers.get(region)
+        if not held:
+            continue
+        for m, marker in enumerate(REGION_MARKERS):
+            if marker not in held:
+                continue
+            value = held[marker] if isinstance(held, dict) else True
+            row[base + r * len(REGION_MARKERS) + m] = (
+                2 + _FACTION_IX[value] if value in _FACTION_IX else 1)
+
+    base = LAYOUT["tribes"][0]
+    tribes = state.get("tribes", {})
+    # Card 71's Colony is a Tribe added at play time; it carries its Region.
+    colonies = sorted(name for name, info in tribes.items()
+                      if name not in _TRIBE_IX and info.get("region"))
+    for t, tribe in enumerate(TRIBES + tuple(colonies[:COLONY_SLOTS])):
+        info = tribes.get(tribe)
+        if info is None:
+            continue
+        i = base + 3 * t
+        status = info.get("status")
+        row[i] = (TRIBE_STATUSES.index(status)
+                  if status in TRIBE_STATUSES else -1)
+        row[i + 1] = _code(FACTIONS, info.get("allied_faction"))
+        row[i + 2] = _code(ALL_REGIONS, info.get("region"))
+
+    resources = state.get("resources", {})
+    available = state.get("available", {})
+    eligibility = state.get("eligibility", {})
+    for f, faction in enumerate(FACTIONS):
+        row[LAYOUT["resources"][0] + f] = resources.get(faction, -1)
+        avail = available.get(faction, {})
+        for p, pt in enumerate(PIECE_TYPES):
+            row[LAYOUT["available"][0] + f * len(PIECE_TYPES) + p] = \
+                avail.get(pt, 0)
+        row[LAYOUT["eligibility"][0] + f] = _ELIG_CODE.get(
+            eligibility.get(faction), -1)
+
+    base = LAYOUT["capabilities"][0]
+    caps = state.get("capabilities") or {}
+    owners = state.get("capability_owners") or {}
+    for c, card_id in enumerate(CAPABILITY_IDS):
+        row[base + 2 * c] = _SIDE_CODE.get(caps.get(card_id), 0)
+        row[base + 2 * c + 1] = _code(FACTIONS, owners.get(card_id))
+
+    senate = state.get("senate") or {}
+    track = state.get("legions_track") or {}
+    values = [_code(SENATE_POSITIONS[1:], senate.get("position")),
+              int(bool(senate.get("firm")))]
+    values += [track.get(row_name, 0) for row_name in LEGIONS_ROWS]
+    values += [state.get("fallen_legions", 0), state.get("removed_legions", 0),
+               state.get("winter_track_legions", 0),
+               state.get("winter_count", 0),
+               _card_code(state.get("current_card")),
+               _card_code(state.get("next_card")),
+               int(bool(state.get("at_war"))),
+               int(state.get("scenario_phase") == "second_half")]
+    base = LAYOUT["scalars"][0]
+    row[base:base + len(values)] = values
+
+    if out is None:
+        out = array("h")
+    out.extend(row)
+    return out
+
+
+def encode_batch(states):
+    """Encode many states into one contiguous ``array('h')`` (n x WIDTH)."""
+    out = array("h")
+    for st in states:
+        encode(st, out)
+    return out
+
+
+def _rows(buf):
+    view = memoryview(buf)
+    if view.format != "h":
+        view = view.cast("B").cast("h")
+    if len(view) % WIDTH:
+        raise ValueError(f"buffer length {len(view)} is not a multiple of "
+                         f"the row width {WIDTH}")
+    return view
+
+
+def decode(buf, index=0):
+    """Rebuild the encoded parts of a state from row ``index`` of ``buf``
+    (an ``array('h')``, bytes or any buffer of int16 values)."""
+    view = _rows(buf)
+    row = view[index * WIDTH:(index + 1) * WIDTH]
+    if row[0] != ENCODING_VERSION:
+        raise ValueError(f"unsupported board encoding version {row[0]}")
+    out = {"scenario": _of(ALL_SCENARIOS, row[1])}
+
+    spaces = {}
+    base = LAYOUT["pieces"][0]
+    for r, region in enumerate(ALL_REGIONS):
+        pieces = {}
+        for f, faction in enumerate(FACTIONS):
+            i = base + (r * _NF + f) * PIECE_SLOTS
+            cells = row[i:i + PIECE_SLOTS]
+            if not any(cells):
+                continue
+            fp = {HIDDEN: {}, REVEALED: {}, SCOUTED: {}}
+            if cells[0]:
+                fp[LEADER] = _of(LEADER_NAMES, cells[0])
+            for k, pt in enumerate(COUNT_SLOTS, 1):
+                if cells[k]:
+                    fp[pt] = cells[k]
+            for k, (pt, ps) in enumerate(FLIP_SLOTS, 1 + len(COUNT_SLOTS)):
+                if cells[k]:
+                    fp[ps][pt] = cells[k]
+            pieces[faction] = fp
+        spaces[region] = {"pieces": pieces, "control": _CONTROL_OF.get(
+            row[LAYOUT["control"][0] + r])}
+    out["spaces"] = spaces
+
+    markers = {}
+    base = LAYOUT["markers"][0]
+    for r, region in enumerate(ALL_REGIONS):
+        held = {}
+        for m, marker in enumerate(REGION_MARKERS):
+            v = row[base + r * len(REGION_MARKERS) + m]
+            if v:
+                held[marker] = True if v == 1 else FACTIONS[v - 2]
+        if held:
+            markers[region] = held
+    out["markers"] = markers
+
+    tribes = {}
+    base = LAYOUT["tribes"][0]
+    scenario_tribes = _scenario_tribes(out["scenario"])
+    for t, tribe in enumerate(TRIBES):
+        if tribe not in scenario_tribes:
+            continue
+        status, allied, colony = row[base + 3 * t:base + 3 * t + 3]
+        info = {"status": TRIBE_STATUSES[status] if status >= 0 else None,
+                "allied_faction": _of(FACTIONS, allied)}
+        if colony:
+            info["region"] = _of(ALL_REGIONS, colony)
+        tribes[tribe] = info
+    for t in range(len(TRIBES), len(TRIBES) + COLONY_SLOTS):
+        status, allied, colony = row[base + 3 * t:base + 3 * t + 3]
+        if not colony:
+            continue
+        region = _of(ALL_REGIONS, colony)
+        tribes[f"Colony_{region}"] = {
+            "status": TRIBE_STATUSES[status] if status >= 0 else None,
+            "allied_faction": _of(FACTIONS, allied), "region": region}
+    out["tribes"] = tribes
+
+    resources, available, eligibility = {}, {}, {}
+    for f, faction in enumerate(FACTIONS):
+        res = row[LAYOUT["resources"][0] + f]
+        if res >= 0:
+            resources[faction] = res
+        b = LAYOUT["available"][0] + f * len(PIECE_TYPES)
+        available[faction] = {pt: row[b + p]
+                              for p, pt in enumerate(PIECE_TYPES)
+                              if row[b + p]}
+        eligibility[faction] = _ELIG_OF.get(row[LAYOUT["eligibility"][0] + f])
+    out.update(resources=resources, available=available,
+               eligibility=eligibility)
+
+    caps, owners = {}, {}
+    base = LAYOUT["capabilities"][0]
+    for c, card_id in enumerate(CAPABILITY_IDS):
+        side, owner = row[base + 2 * c], row[base + 2 * c + 1]
+        if side:
+            caps[card_id] = _SIDE_OF[side]
+        if owner:
+            owners[card_id] = _of(FACTIONS, owner)
+    out["capabilities"] = caps
+    out["capability_owners"] = owners
+
+    s = dict(zip(SCALARS, row[LAYOUT["scalars"][0]:]))
+    out["senate"] = {"position": _of(SENATE_POSITIONS[1:],
+                                     s["senate_position"]),
+                     "firm": bool(s["senate_firm"])}
+    out["legions_track"] = {name: s["legions_" + name]
+                            for name in LEGIONS_ROWS}
+    for key in ("fallen_legions", "removed_legions", "winter_track_legions",
+                "winter_count"):
+        out[key] = s[key]
+    out["current_card"] = _of(CARD_IDS, s["current_card"])
+    out["next_card"] = _of(CARD_IDS, s["next_card"])
+    out["at_war"] = bool(s["at_war"])
+    out["scenario_phase"] = ("second_half" if s["second_half"]
+                             else "first_half")
+    return out
+
+
+def _scenario_tribes(scenario):
+    from fs_bot.rules_consts import ARIOVISTUS_SCENARIOS, ARIOVISTUS_TRIBES
+    return set(ARIOVISTUS_TRIBES if scenario in ARIOVISTUS_SCENARIOS
+               else BASE_TRIBES)
+
+
+def decode_batch(buf):
+    """Decode every row of ``buf`` (see :func:`decode`)."""
+    return [decode(buf, i) for i in range(len(_rows(buf)) // WIDTH)]
+
+
+def as_numpy(buf):
+    """Zero-copy ``(n, WIDTH)`` int16 NumPy view of ``buf``. Requires NumPy."""
+    try:
+        import numpy as np
+    except ImportError as exc:  # optional dependency
+        raise ImportError("as_numpy requires NumPy "
+                          "(pip install numpy)") from exc
+    return np.frombuffer(_rows(buf), dtype=np.int16).reshape(-1, WIDTH)
+
+
+# ---------------------------------------------------------------------------
+# Trajectories: one board row per turn, stored with a small header.
+# ---------------------------------------------------------------------------
+
+_MAGIC = b"FSBT"
+_HEADER = struct.Struct("<4sHHI")   # magic, version, width, rows
+
+
+def encode_trajectory(states):
+    """Encode a game's successive states (one row each) — same as
+    :func:`encode_batch`, named for the self-play recorders."""
+    return encode_batch(states)
+
+
+def write_trajectory(path, rows):
+    """Write an ``array('h')`` of board rows to ``path`` (little-endian)."""
+    rows = array("h", rows)
+    if struct.pack("=h", 1) != struct.pack("<h", 1):
+        rows.byteswap()
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(_MAGIC, ENCODING_VERSION, WIDTH,
+                              len(rows) // WIDTH))
+        rows.tofile(fh)
+
+
+def read_trajectory(path):
+    """Read rows written by :func:`write_trajectory` into an ``array('h')``."""
+    with open(path, "rb") as fh:
+        magic, version, width, n = _HEADER.unpack(fh.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a board trajectory file")
+        if version != ENCODING_VERSION or width != WIDTH:
+            raise ValueError(f"{path}: encoding v{version} width {width}, "
+                             f"expected v{ENCODING_VERSION} width {WIDTH}")
+        rows = array("h")
+        rows.fromfile(fh, n * width)
+    if struct.pack("=h", 1) != struct.pack("<h", 1):
+        rows.byteswap()
+    return rows
@@ -0,0 +1,153 @@
+"""Checked mode — structural invariants asserted at the mutation.
+
+``check_structural_integrity`` scans the whole board and finds a corruption
+at the next point someone calls it, long after the operation that caused
+it. In checked mode the mutators check the invariants they can break, on
+the regions they touch, as they run:
+
+    with invariants.checking():                 # raise InvariantError
+        farm.play_game(scenario, seed)
+    with invariants.checking(found.append):     # or collect Violations
+        ...
+
+  piece helpers (place/remove/move_piece): the touched regions' control
+      flags were fresh before the operation (§1.6), they hold at most one
+      Citadel and one Fort after it, and the moved pieces' Available pool
+      is not negative.
+  _ally_tribe / _unally_tribe: in the tribe's region every Faction's
+      allied Tribes match its Ally + Citadel pieces (Q13).
+  Resource setters and executed decisions: no Faction's Resources are
+      negative.
+
+Check sites are guarded by ``if invariants.enabled:``, so with checked mode
+off a mutation pays one attribute test.
+"""
+from __future__ import annotations
+
+import contextlib
+from typing import Any, NamedTuple
+
+from fs_bot.rules_consts import (
+    FACTIONS, ALLY, CITADEL, FORT, TRIBE_TO_REGION,
+)
+
+
+class Violation(NamedTuple):
+    """One broken invariant: the operation that broke it, the card in
+    play, and what is wrong."""
+    op: str
+    card: Any
+    message: str
+
+
+class InvariantError(AssertionError):
+    """A mutation broke a structural invariant (checked mode)."""
+
+    def __init__(self, violation):
+        super().__init__(f"{violation.op} (card {violation.card}): "
+                         f"{violation.message}")
+        self.violation = violation
+
+
+#: True inside :func:`checking`. Check sites test this first.
+enabled = False
+
+_report = None      # callable taking a Violation, or None to raise
+
+
+@contextlib.contextmanager
+def checking(report=None):
+    """Checked mode for the block. Each Violation goes to ``report``, or
+    raises InvariantError at the mutation when ``report`` is None."""
+    global enabled, _report
+    outer = (enabled, _report)
+    enabled, _report = True, report
+    try:
+        yield
+    finally:
+        enabled, _report = outer
+
+
+def _violation(state, op, message):
+    violation = Violation(op, state.get("current_card"), message)
+    if _report is None:
+        raise InvariantError(violation)
+    _report(violation)
+
+
+def _describe(name, *args):
+    return f"{name}({', '.join(str(a) for a in args)})"
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+def before_piece_op(state, name, regions, *args):
+    """Before a piece operation: the control flags it will overwrite must
+    be fresh, or an earlier edit left them stale."""
+    from fs_bot.board.control import calculate_control
+    spaces = state.get("spaces", {})
+    for region in regions:
+        stored = spaces.get(region, {}).get("control")
+        if stored is None:
+            continue
+        fresh = calculate_control(state, region)
+        if stored != fresh:
+            _violation(state, _describe(name, *args),
+                       f"{region}: control flag '{stored}' was stale "
+                       f"(recompute '{fresh}') before the operation")
+
+
+def after_piece_op(state, name, regions, faction, piece_type, *args):
+    """After a piece operation: one Citadel / one Fort per touched region,
+    and a non-negative Available pool for the piece."""
+    spaces = state.get("spaces", {})
+    op = None
+    for region in regions:
+        pieces = spaces.get(region, {}).get("pieces", {})
+        for piece, label in ((CITADEL, "Citadels"), (FORT, "Forts")):
+            n = sum(pieces.get(f, {}).get(piece, 0) for f in FACTIONS)
+            if n > 1:
+                op = op or _describe(name, *args)
+                _violation(state, op,
+                           f"{region}: {n} {label} (max 1 per Region)")
+    pool = (state.get("available") or {}).get(faction) or {}
+    if pool.get(piece_type, 0) < 0:
+        _violation(state, op or _describe(name, *args),
+                   f"{faction} {piece_type} Available negative "
+                   f"({pool[piece_type]})")
+
+
+def tribe_backing(state, name, tribe):
+    """After a tribe allegiance change: in the tribe's region, allied
+    Tribes per Faction equal that Faction's Ally + Citadel pieces."""
+    tribes = state.get("tribes") or {}
+    info = tribes.get(tribe) or {}
+    region = info.get("region") or TRIBE_TO_REGION.get(tribe)
+    if region is None:
+        return
+    allied = {}
+    for t, ti in tribes.items():
+        fac = ti.get("allied_faction")
+        if fac is not None and (ti.get("region")
+                                or TRIBE_TO_REGION.get(t)) == region:
+            allied[fac] = allied.get(fac, 0) + 1
+    pieces = state.get("spaces", {}).get(region, {}).get("pieces", {})
+    for fac in FACTIONS:
+        fp = pieces.get(fac, {})
+        backing = fp.get(ALLY, 0) + fp.get(CITADEL, 0)
+        if allied.get(fac, 0) != backing:
+            _violation(state, _describe(name, tribe),
+                       f"{region}/{fac}: {allied.get(fac, 0)} allied "
+                       f"Tribe(s) but {backing} backing Ally/Citadel "
+                       f"piece(s)")
+
+
+def resources(state, name, *factions):
+    """Resources of ``factions`` (default: all) are not negative."""
+    stock = state.get("resources") or {}
+    for fac in factions or stock:
+        if stock.get(fac, 0) < 0:
+            _violation(state, name,
+                       f"{fac} Resources negative ({stock[fac]})")
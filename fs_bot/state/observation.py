@@ -0,0 +1,228 @@
+"""Observations — read-only views of the public board for agents and renderers.
+
+Renderers, the CLI's changes-diff and agent policies each want the same
+thing at a decision point: how many of which pieces every Faction has where,
+who leads where, who controls what, the tribes, Resources and scores. Asking
+``count_pieces`` per (region, faction, type) re-walks the nested state for
+every cell. :func:`observe` walks it once:
+
+    obs = observe(state)
+    obs.count(region, ROMANS, LEGION)
+    obs.region(region).leaders          # ((faction, name), ...)
+    format_state_delta(before, obs)     # structural diff of two observations
+
+An :class:`Observation` is immutable and hashable (equal observations show
+the same board). The per-region part is shared between observations —
+:func:`region_views` caches it on ``board_version`` and, after a change,
+rebuilds only the regions the piece operations name (``changed_regions``) —
+so a diff skips every untouched region by identity. Scores are computed on
+first use; read them while the decision point stands.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from fs_bot.rules_consts import (
+    FACTIONS, LEADER, LEGION, AUXILIA, WARBAND, FORT, ALLY, CITADEL,
+    SETTLEMENT, FLIPPABLE_PIECES, HIDDEN, REVEALED, SCOUTED,
+)
+from fs_bot.board.pieces import board_version, changed_regions, flush_control
+from fs_bot.state.caches import state_caches
+
+
+#: Piece types an observation counts, in display order. Leaders are kept
+#: apart, by name.
+OBSERVED_PIECES = (WARBAND, AUXILIA, LEGION, ALLY, CITADEL, FORT, SETTLEMENT)
+
+
+class RegionView(NamedTuple):
+    """One region: its control flag, the non-zero piece counts as
+    ``(faction, piece_type, count)`` in FACTIONS x OBSERVED_PIECES order,
+    and the leaders present as ``(faction, name)``."""
+    control: object
+    pieces: tuple
+    leaders: tuple
+
+    def count(self, faction, piece_type):
+        if piece_type == LEADER:
+            return sum(1 for f, _ in self.leaders if f == faction)
+        for f, pt, n in self.pieces:
+            if f == faction and pt == piece_type:
+                return n
+        return 0
+
+    def leader(self, faction):
+        for f, name in self.leaders:
+            if f == faction:
+                return name
+        return None
+
+
+EMPTY_REGION = RegionView(None, (), ())
+
+
+def _region_view(space):
+    pieces = space.get("pieces", {})
+    counts = []
+    leaders = []
+    for f in FACTIONS:
+        fp = pieces.get(f)
+        if not fp:
+            continue
+        for pt in OBSERVED_PIECES:
+            if pt in FLIPPABLE_PIECES:
+                n = (fp.get(HIDDEN, {}).get(pt, 0)
+                     + fp.get(REVEALED, {}).get(pt, 0)
+                     + fp.get(SCOUTED, {}).get(pt, 0))
+            else:
+                n = fp.get(pt, 0)
+            if n:
+                counts.append((f, pt, n))
+        name = fp.get(LEADER)
+        if name is not None:
+            leaders.append((f, name))
+    return RegionView(space.get("control"), tuple(counts), tuple(leaders))
+
+
+def region_views(state):
+    """``{region: RegionView}`` for every space, in state order. Cached until
+    a piece operation changes the board, then rebuilt for the changed
+    regions only (the other views are carried over); treat it as
+    read-only."""
+    flush_control(state)
+    version = board_version(state)
+    spaces = state.get("spaces", {})
+    # Cached on the state as (board_version, {region: RegionView}).
+    caches = state_caches(state)
+    hit = caches.get("region_views")
+    changed = None
+    if hit is not None:
+        if hit[0] == version:
+            return hit[1]
+        changed = changed_regions(state, hit[0])
+    else:
+        changed_regions(state, version)     # start tracking from here
+    if changed is None or hit[1].keys() != spaces.keys():
+        views = {region: _region_view(space)
+                 for region, space in spaces.items()}
+    else:
+        views = dict(hit[1])
+        for region in changed:
+            if region in spaces:
+                views[region] = _region_view(spaces[region])
+    caches["region_views"] = (version, views)
+    return views
+
+
+def region_view(state, region):
+    """The RegionView of one region (empty for a region not on the map)."""
+    return region_views(state).get(region, EMPTY_REGION)
+
+
+class Observation:
+    """The public board at one decision point. Build with :func:`observe`.
+
+    Attributes (all immutable): ``scenario``, ``version`` (the board
+    version observed), ``regions`` (``((region, RegionView), ...)``),
+    ``resources`` and ``tribes`` (``((tribe, allied_faction, status),
+    ...)``) in state order, ``senate`` and ``capabilities`` as item
+    tuples, and ``fallen`` (Fallen Legions).
+    """
+
+    __slots__ = ("scenario", "version", "regions", "resources", "tribes",
+                 "senate", "fallen", "capabilities",
+                 "_state", "_index", "_scores", "_key")
+
+    def __init__(self, state):
+        views = region_views(state)
+        put = object.__setattr__
+        put(self, "scenario", state.get("scenario"))
+        put(self, "version", board_version(state))
+        put(self, "regions", tuple(views.items()))
+        put(self, "resources", tuple(state.get("resources", {}).items()))
+        put(self, "tribes", tuple(
+            (t, ti.get("allied_faction"), ti.get("status"))
+            for t, ti in state.get("tribes", {}).items()))
+        put(self, "senate", tuple((state.get("senate") or {}).items()))
+        put(self, "fallen", state.get("fallen_legions", 0))
+        put(self, "capabilities",
+            tuple(state.get("capabilities", {}).items()))
+        put(self, "_state", state)
+        put(self, "_index", views)
+        put(self, "_scores", None)
+        put(self, "_key", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Observation is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Observation is immutable")
+
+    # -- lookups -----------------------------------------------------------
+
+    def region(self, region):
+        return self._index.get(region, EMPTY_REGION)
+
+    def count(self, region, faction, piece_type):
+        return self.region(region).count(faction, piece_type)
+
+    def leader(self, region, faction):
+        return self.region(region).leader(faction)
+
+    @property
+    def leaders(self):
+        """``((region, faction, name), ...)`` across the map."""
+        return tuple((region, f, name) for region, view in self.regions
+                     for f, name in view.leaders)
+
+    def tribe(self, tribe):
+        """``(allied_faction, status)`` of ``tribe``."""
+        for t, allied, status in self.tribes:
+            if t == tribe:
+                return allied, status
+        return None, None
+
+    @property
+    def scores(self):
+        """``((faction, victory score), ...)`` for every Faction the
+        scenario scores; computed on first use, from the live state."""
+        if self._scores is None:
+            from fs_bot.engine.victory import calculate_victory_score
+            if board_version(self._state) != self.version:
+                raise ValueError("board changed since it was observed")
+            scores = []
+            for f in FACTIONS:
+                try:
+                    scores.append((f, calculate_victory_score(self._state,
+                                                              f)))
+                except Exception:
+                    pass
+            object.__setattr__(self, "_scores", tuple(scores))
+        return self._scores
+
+    # -- identity ------------------------------------------------------------
+
+    def _content(self):
+        if self._key is None:
+            object.__setattr__(self, "_key", (
+                self.scenario, self.regions, self.resources, self.tribes,
+                frozenset(self.senate), self.fallen,
+                frozenset(self.capabilities)))
+        return self._key
+
+    def __eq__(self, other):
+        if not isinstance(other, Observation):
+            return NotImplemented
+        return self is other or self._content() == other._content()
+
+    def __hash__(self):
+        return hash(self._content())
+
+    def __repr__(self):
+        return (f"<Observation scenario={self.scenario!r} "
+                f"version={self.version}>")
+
+
+def observe(state):
+    """An :class:`Observation` of ``state`` as it stands now."""
+    return Observation(state)
@@ -0,0 +1,171 @@
+"""Game RNG backends.
+
+``state["rng"]`` is either a Mersenne Twister ``random.Random`` (the
+default, and what every existing save and baseline uses) or a
+:class:`CounterRng`: a keyed, counter-based generator whose whole state is
+a 32-byte key and a draw count.
+
+    state = setup_scenario(scenario, seed=7, rng_backend=RNG_COUNTER)
+    sub = state["rng"].fork("planner")   # independent stream, O(1)
+
+Word ``i`` of a CounterRng stream is the ``i % 4``-th 64-bit lane of
+``blake2b(key, i // 4)``, so copying one (every deepcopy of a state) costs
+a few attributes instead of MT's 2.5 KB, a save stores two values instead of
+625 integers, and a fork derives a fresh key from the parent's key, position
+and a stream id without touching the parent. It draws through the methods
+the engine uses (``random``, ``randint``, ``randrange``, ``choice``,
+``shuffle``, ``getrandbits``, ``getstate``/``setstate``); the two backends
+give different sequences for the same seed.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import struct
+
+RNG_MT = "mt"
+RNG_COUNTER = "counter"
+RNG_BACKENDS = (RNG_MT, RNG_COUNTER)
+
+_WORD = struct.Struct("<4Q")
+_INDEX = struct.Struct("<Q")
+
+
+def _key_bytes(value):
+    if value is None:
+        return os.urandom(32)
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+class CounterRng:
+    """Keyed counter-based RNG: ``CounterRng(seed, stream=0)``."""
+
+    __slots__ = ("_key", "_pos", "_block", "_lanes")
+
+    def __init__(self, seed=None, stream=0):
+        self._key = hashlib.blake2b(
+            _key_bytes(seed) + b"|" + _key_bytes(stream),
+            digest_size=32, person=b"fsbot-rng").digest()
+        self._pos = 0
+        self._block = -1
+        self._lanes = ()
+
+    # -- the stream --------------------------------------------------------
+
+    def _next64(self):
+        block, lane = divmod(self._pos, 4)
+        if block != self._block:
+            self._lanes = _WORD.unpack(hashlib.blake2b(
+                _INDEX.pack(block), key=self._key, digest_size=32).digest())
+            self._block = block
+        self._pos += 1
+        return self._lanes[lane]
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        value, have = 0, 0
+        while have < k:
+            value |= self._next64() << have
+            have += 64
+        return value & ((1 << k) - 1)
+
+    def _randbelow(self, n):
+        """A uniform int in [0, n), by rejection like ``random.Random``."""
+        k = n.bit_length()
+        r = self.getrandbits(k)
+        while r >= n:
+            r = self.getrandbits(k)
+        return r
+
+    # -- random.Random API used by the engine ------------------------------
+
+    def random(self):
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def randrange(self, start, stop=None, step=1):
+        if stop is None:
+            start, stop = 0, start
+        width = stop - start
+        if step == 1:
+            if width <= 0:
+                raise ValueError(f"empty range for randrange({start}, "
+                                 f"{stop})")
+            return start + self._randbelow(width)
+        if step > 0:
+            n = (width + step - 1) // step
+        elif step < 0:
+            n = (width + step + 1) // step
+        else:
+            raise ValueError("zero step for randrange()")
+        if n <= 0:
+            raise ValueError(f"empty range for randrange({start}, {stop}, "
+                             f"{step})")
+        return start + step * self._randbelow(n)
+
+    def randint(self, a, b):
+        return self.randrange(a, b + 1)
+
+    def choice(self, seq):
+        if not len(seq):
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self._randbelow(len(seq))]
+
+    def shuffle(self, x):
+        for i in reversed(range(1, len(x))):
+            j = self._randbelow(i + 1)
+            x[i], x[j] = x[j], x[i]
+
+    def getstate(self):
+        return (RNG_COUNTER, self._key.hex(), self._pos)
+
+    def setstate(self, state):
+        backend, key, pos = state
+        if backend != RNG_COUNTER:
+            raise ValueError(f"not a CounterRng state: {backend!r}")
+        self._key = bytes.fromhex(key)
+        self._pos = pos
+        self._block = -1
+        self._lanes = ()
+
+    # -- streams -----------------------------------------------------------
+
+    def fork(self, stream):
+        """An independent generator for ``stream``, derived from this one's
+        key and position; this one does not advance."""
+        child = CounterRng.__new__(CounterRng)
+        child._key = hashlib.blake2b(
+            _INDEX.pack(self._pos) + _key_bytes(stream), key=self._key,
+            digest_size=32, person=b"fsbot-fork").digest()
+        child._pos = 0
+        child._block = -1
+        child._lanes = ()
+        return child
+
+    def __eq__(self, other):
+        if not isinstance(other, CounterRng):
+            return NotImplemented
+        return self._key == other._key and self._pos == other._pos
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"<CounterRng {self._key.hex()[:12]}@{self._pos}>"
+
+
+def make_rng(seed=None, backend=RNG_MT):
+    """A fresh game RNG of ``backend`` seeded with ``seed``."""
+    if backend == RNG_MT:
+        return random.Random(seed)
+    if backend == RNG_COUNTER:
+        return CounterRng(seed)
+    raise ValueError(f"Unknown RNG backend: {backend!r} "
+                     f"(expected one of {RNG_BACKENDS})")
+
+
+def rng_backend(rng):
+    """The backend name of a game RNG."""
+    return RNG_COUNTER if isinstance(rng, CounterRng) else RNG_MT
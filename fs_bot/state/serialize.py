@@ -12,6 +12,11 @@ Encoding: containers needing it are tagged —
   {"__dict__": [[k, v], ...]}  dict with any non-str key or a key that
                                would collide with a tag
   {"__rng__": [...]}     random.Random (via getstate/setstate)
+  {"__crng__": [key, n]} counter-based rng (state/rng.py): key hex, draws
+
+Pieces of a compact state (board/compact.py) are saved as the nested dicts
+they stand for; ``state["piece_backend"]`` is saved with them and
+load_game packs them again.
 
 ``decision_agent`` (a live callable) is never saved; the CLI reinstalls it
 on load.
@@ -25,9 +30,13 @@ decision + reactive-response log (see cli/app.py) used by --replay.
 import json
 import random
 
+from fs_bot.state.rng import CounterRng, RNG_COUNTER
+from fs_bot.state.caches import KEY as CACHES, Caches
+from fs_bot.board.compact import RegionPieces, PIECES_COMPACT, compact_pieces
+
 SAVE_VERSION = 1
 
-_TAGS = ("__set__", "__tuple__", "__dict__", "__rng__")
+_TAGS = ("__set__", "__tuple__", "__dict__", "__rng__", "__crng__")
 
 
 def encode(obj):
@@ -36,6 +45,11 @@ def encode(obj):
         return obj
     if isinstance(obj, random.Random):
         return {"__rng__": encode(obj.getstate())}
+    if isinstance(obj, CounterRng):
+        _, key, pos = obj.getstate()
+        return {"__crng__": [key, pos]}
+    if isinstance(obj, RegionPieces):
+        return encode(obj.to_dict())
     if isinstance(obj, tuple):
         return {"__tuple__": [encode(x) for x in obj]}
     if isinstance(obj, list):
@@ -45,6 +59,9 @@ def encode(obj):
         items.sort(key=lambda e: json.dumps(e, sort_keys=True))
         return {"__set__": items}
     if isinstance(obj, dict):
+        if isinstance(obj.get(CACHES), Caches):
+            # A state's cache slot is derived data, never saved.
+            obj = {k: v for k, v in obj.items() if k != CACHES}
         plain = (all(isinstance(k, str) for k in obj)
                  and not any(k in _TAGS for k in obj))
         if plain:
@@ -63,6 +80,11 @@ def decode(obj):
             rng = random.Random()
             rng.setstate(decode(obj["__rng__"]))
             return rng
+        if "__crng__" in obj and len(obj) == 1:
+            key, pos = obj["__crng__"]
+            rng = CounterRng()
+            rng.setstate((RNG_COUNTER, key, pos))
+            return rng
         if "__tuple__" in obj and len(obj) == 1:
             return tuple(decode(x) for x in obj["__tuple__"])
         if "__set__" in obj and len(obj) == 1:
@@ -96,5 +118,8 @@ def load_game(path):
     if version != SAVE_VERSION:
         raise ValueError(f"Unsupported save version: {version!r} "
                          f"(expected {SAVE_VERSION})")
-    return (decode(payload["state"]), payload.get("meta") or {},
-            payload.get("log") or [])
+    state = decode(payload["state"])
+    if state.get("piece_backend") == PIECES_COMPACT:
+        del state["piece_backend"]
+        compact_pieces(state)
+    return state, payload.get("meta") or {}, payload.get("log") or []
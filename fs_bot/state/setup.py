@@ -71,8 +71,11 @@ from fs_bot.rules_consts import (
 )
 
 from fs_bot.state.state_schema import build_initial_state, validate_state
+from fs_bot.state.rng import RNG_MT
 from fs_bot.board.pieces import place_piece, remove_piece, PieceError
 from fs_bot.board.control import refresh_all_control
+from fs_bot.board.tribes import tribe_changed
+from fs_bot.board.compact import PIECES_DICT, set_piece_backend
 
 
 def _set_tribe_allied(state, tribe, faction):
@@ -87,18 +90,21 @@ def _set_tribe_allied(state, tribe, faction):
     """
     state["tribes"][tribe]["status"] = None
     state["tribes"][tribe]["allied_faction"] = faction
+    tribe_changed(state, tribe)
 
 
 def _set_tribe_dispersed(state, tribe):
     """Set a tribe as Dispersed."""
     state["tribes"][tribe]["status"] = DISPERSED
     state["tribes"][tribe]["allied_faction"] = None
+    tribe_changed(state, tribe)
 
 
 def _set_tribe_dispersed_gathering(state, tribe):
     """Set a tribe as Dispersed-Gathering."""
     state["tribes"][tribe]["status"] = DISPERSED_GATHERING
     state["tribes"][tribe]["allied_faction"] = None
+    tribe_changed(state, tribe)
 
 
 def _set_legions_track(state, bottom=0, middle=0, top=0):
@@ -926,12 +932,16 @@ _SETUP_FUNCTIONS = {
 }
 
 
-def setup_scenario(scenario, seed=None):
+def setup_scenario(scenario, seed=None, rng_backend=RNG_MT,
+                   piece_backend=PIECES_DICT):
     """Set up a scenario and return the initial game state.
 
     Args:
         scenario: Scenario identifier from rules_consts.
         seed: Optional RNG seed for deterministic replay.
+        rng_backend: RNG_MT (default) or RNG_COUNTER — see state/rng.py.
+        piece_backend: PIECES_DICT (default) or PIECES_COMPACT — see
+            board/compact.py.
 
     Returns:
         Complete game state dictionary, validated.
@@ -943,7 +953,7 @@ def setup_scenario(scenario, seed=None):
     if scenario not in _SETUP_FUNCTIONS:
         raise ValueError(f"Unknown scenario: {scenario}")
 
-    state = build_initial_state(scenario, seed=seed)
+    state = build_initial_state(scenario, seed=seed, rng_backend=rng_backend)
     _SETUP_FUNCTIONS[scenario](state)
 
     # Validate state integrity
@@ -954,4 +964,6 @@ def setup_scenario(scenario, seed=None):
             + "\n".join(f"  - {e}" for e in errors)
         )
 
+    if piece_backend != PIECES_DICT:
+        set_piece_backend(state, piece_backend)
     return state
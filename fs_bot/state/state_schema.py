@@ -7,8 +7,6 @@ All constants from rules_consts.py.
 Reference: §1.4.1, §1.8, §6.5, §6.6, A1.4, A1.8
 """
 
-import random
-
 from fs_bot.rules_consts import (
     # Factions
     ROMANS, ARVERNI, AEDUI, BELGAE, GERMANS,
@@ -42,6 +40,8 @@ from fs_bot.rules_consts import (
     MARKER_GALLIA_TOGATA,
 )
 
+from fs_bot.state.rng import RNG_MT, make_rng
+from fs_bot.state.caches import KEY as CACHES, Caches
 from fs_bot.map.map_data import (
     ALL_REGION_DATA,
     get_playable_regions,
@@ -49,7 +49,7 @@ from fs_bot.map.map_data import (
 )
 
 
-def build_initial_state(scenario, seed=None):
+def build_initial_state(scenario, seed=None, rng_backend=RNG_MT):
     """Create an empty game state with correct pools for the scenario.
 
     This creates a state with all pieces in Available pools (or on the
@@ -59,6 +59,7 @@ def build_initial_state(scenario, seed=None):
     Args:
         scenario: Scenario identifier from rules_consts.
         seed: Optional RNG seed for deterministic replay.
+        rng_backend: RNG_MT (default) or RNG_COUNTER — see state/rng.py.
 
     Returns:
         Game state dictionary.
@@ -150,7 +151,7 @@ def build_initial_state(scenario, seed=None):
         "capabilities": {},
         "markers": {},  # Per-region/tribe markers (Devastated, etc.)
         "tribes": tribes,
-        "rng": random.Random(seed),
+        "rng": make_rng(seed, rng_backend),
         "current_card": None,
         "next_card": None,
         "winter_count": 0,
@@ -167,6 +168,9 @@ def build_initial_state(scenario, seed=None):
         # Leaders held off-map in the Winter track Spring box (A2.1)
         # List of leader name strings (e.g. VERCINGETORIX).
         "spring_box_leaders": [],
+        # Derived indexes and tables (fs_bot.state.caches) — not game
+        # state; copies and saves leave them out.
+        CACHES: Caches(),
     }
 
     return state
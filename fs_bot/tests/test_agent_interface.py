@@ -154,6 +154,133 @@ class TestMoveAPI:
         live.pop("rng", None)
         assert live == snapshot
 
+    def test_validate_many_aligned_with_single_validation(self):
+        st = self._state()
+        st["decision_agent"] = lambda *a: None  # stripped, never entered
+        region = moves.regions_with_pieces(st, rc.AEDUI)[0]
+        good = {"command": "Rally", "regions": [], "sa": "No SA",
+                "sa_regions": [], "details": {"rally_plan": {
+                    "citadels": [], "allies": [], "warbands": [region]}}}
+        bad = {"command": "Battle", "regions": [], "sa": "No SA",
+               "sa_regions": [], "details": {"battle_plan": [
+                   {"region": "Britannia", "target": "Romans"}]}}
+        before = copy.deepcopy({k: v for k, v in st.items() if k != "rng"})
+        rng_state = st["rng"].getstate()
+        res = moves.validate_many(st, rc.AEDUI, [bad, good, bad, good])
+        assert [ok for ok, _ in res] == [False, True, False, True]
+        single = moves.validate_player_action(st, rc.AEDUI, good)
+        assert res[1][1] == single[1]
+        # Candidates never see each other's effects or the live game.
+        assert {k: v for k, v in st.items() if k != "rng"} == before
+        assert st["rng"].getstate() == rng_state
+        # first_ok stops at the first executable candidate.
+        later = {**good, "sa": "Trade"}
+        res = moves.validate_many(st, rc.AEDUI, [bad, good, later],
+                                  first_ok=True)
+        assert res[0][0] is False and res[1][0] is True and res[2] is None
+        # ... and draws no candidate past it from an iterator.
+        drawn = []
+
+        def lazy():
+            for pa in (bad, good, later):
+                drawn.append(pa)
+                yield pa
+        res = moves.validate_many(st, rc.AEDUI, lazy(), first_ok=True)
+        assert [ok for ok, _ in res] == [False, True] and drawn == [bad, good]
+
+    def test_validate_many_takes_whole_decisions(self):
+        st = self._state()
+        region = moves.regions_with_pieces(st, rc.AEDUI)[0]
+        good = {"command": "Rally", "regions": [], "sa": "No SA",
+                "sa_regions": [], "details": {"rally_plan": {
+                    "citadels": [], "allies": [], "warbands": [region]}}}
+        res = moves.validate_many(st, rc.AEDUI, [
+            {"action": "command", "player_action": good},
+            {"action": "command", "bot_action": {"command": "Battle"}},
+            {"action": "pass"}], decisions=True)
+        assert [ok for ok, _ in res] == [True, False, False]
+        assert res[0][1] == moves.validate_player_action(st, rc.AEDUI,
+                                                         good)[1]
+
+    def test_validate_many_process_pool_matches_in_process(self):
+        st = self._state()
+        plans = [{"command": "Rally", "regions": [], "sa": "No SA",
+                  "sa_regions": [], "details": {"rally_plan": {
+                      "citadels": [], "allies": [], "warbands": [r]}}}
+                 for r in moves.regions_with_pieces(st, rc.AEDUI)]
+        plans += [{"command": "Raid", "regions": [], "sa": "No SA",
+                   "sa_regions": [], "details": {"raid_plan": [
+                       {"region": r, "target": None}]}}
+                  for r in sorted(st["spaces"])]
+        serial = moves.validate_many(st, rc.AEDUI, plans)
+        pooled = moves.validate_many(st, rc.AEDUI, plans, jobs=2)
+        assert [ok for ok, _ in pooled] == [ok for ok, _ in serial]
+
+    def test_iter_legal_plans_yields_executor_valid_plans(self):
+        st = self._state()
+        before = copy.deepcopy(st)
+        before.pop("rng", None)
+        gen = moves.iter_legal_plans(st, rc.ARVERNI, limit=400)
+        assert iter(gen) is gen  # lazy: nothing materialised up front
+        plans = list(gen)
+        assert len(plans) == 400
+        assert {d["action"] for d in plans} <= {"command", "command_sa"}
+        # breadth order: Region counts never decrease
+        sizes = [len(d["player_action"]["regions"]) for d in plans]
+        assert sizes == sorted(sizes)
+        results = moves.validate_many(st, rc.ARVERNI,
+                                      [d["player_action"] for d in plans[::7]])
+        assert all(ok for ok, _ in results)
+        live = copy.deepcopy(st)
+        live.pop("rng", None)
+        assert live == before
+
+    def test_probe_rejections_do_not_leak_into_the_next_probe(self):
+        st = self._state()
+        region = moves.regions_with_pieces(st, rc.AEDUI)[0]
+        before = count_pieces(st, region, rc.AEDUI)
+
+        def writes_then_raises(sim):
+            place_piece(sim, region, rc.AEDUI, rc.WARBAND, 1)
+            raise ValueError("rejected after writing")
+
+        def sees_clean_board(sim):
+            assert count_pieces(sim, region, rc.AEDUI) == before
+
+        probe = moves._prober(st)
+        assert not probe(writes_then_raises)
+        assert probe(sees_clean_board)
+        assert count_pieces(st, region, rc.AEDUI) == before
+
+    def test_no_resource_raids_in_devastated_regions(self):
+        st = self._state()
+        for region in moves.regions_with_pieces(st, rc.ARVERNI):
+            st.setdefault("markers", {}).setdefault(
+                region, {})[rc.MARKER_DEVASTATED] = True
+        raids = [d["player_action"] for d in moves.iter_legal_plans(
+            st, rc.ARVERNI, "2nd_eligible", first_action="command")
+            if d["player_action"]["command"] == "Raid"]
+        assert raids
+        for plan in raids:
+            assert all(e["target"] is not None
+                       for e in plan["details"]["raid_plan"])
+        assert all(ok for ok, _ in moves.validate_many(st, rc.ARVERNI, raids))
+
+    def test_iter_legal_plans_limited_and_cost_pruning(self):
+        st = self._state()
+        limited = list(moves.iter_legal_plans(
+            st, rc.AEDUI, "2nd_eligible", first_action="command"))
+        assert limited
+        for d in limited:
+            assert d["action"] == "limited_command"
+            assert len(d["player_action"]["regions"]) == 1
+            assert d["player_action"]["sa"] == "No SA"
+        st["resources"][rc.AEDUI] = 0
+        cmds = {d["player_action"]["command"]
+                for d in moves.iter_legal_plans(st, rc.AEDUI, order="depth")}
+        assert "Rally" not in cmds and "March" not in cmds  # cost >= 1
+        assert "Raid" in cmds
+
 
 class TestAgentFullTurn:
     def test_agent_plays_a_turn_and_reactive_decision(self):
@@ -0,0 +1,54 @@
+"""Tests for the benchmark suite (fs_bot.bench)."""
+import fs_bot.rules_consts as rc
+from fs_bot.bench import corpus, suite
+from fs_bot.bench.run import compare
+from fs_bot.state.caches import KEY as CACHES
+from fs_bot.state.serialize import encode
+
+
+def test_corpus_holds_every_point():
+    loaded = dict(corpus.load_corpus())
+    assert sorted(loaded) == sorted(corpus.point_name(*p)
+                                    for p in corpus.POINTS)
+    for point in corpus.POINTS:
+        assert loaded[corpus.point_name(*point)]["current_card"] is not None
+    late = loaded[corpus.point_name(rc.SCENARIO_GALLIC_WAR, 1, 50)]
+    assert late["scenario_phase"] == "second_half"      # past the Interlude
+    assert corpus.point_name(rc.SCENARIO_PAX_GALLICA, 1, 12) == \
+        "pax-gallica-s1-c12"
+
+
+def test_every_benchmark_runs_once():
+    states = corpus.load_corpus()
+    before = [encode(s) for _, s in states]
+    groups = (suite.MICRO, suite.BOTS, suite.EXECUTE)
+    benches = suite.benches(states, groups)
+    assert {b.group for b in benches} == set(groups)
+    names = [b.name for b in benches]
+    assert "count_pieces" in names and "prevalidate_rally_plan" in names
+    assert f"dispatch_bot_turn[{rc.ROMANS}]" in names
+    for bench in benches:
+        assert bench.calls > 0
+        assert suite.measure(bench, repeat=1, min_time=0) > 0
+    # The copies the bots and executor ran on were fresh each sweep.
+    assert [encode(s) for _, s in states] == before
+
+
+def test_micro_sweeps_get_fresh_states():
+    states = corpus.load_corpus()
+    originals = {id(s) for _, s in states}
+    for bench in suite.micro_benches(states):
+        args = bench.setup()
+        assert len(args) == bench.calls
+        for a in args:
+            assert id(a[0]) not in originals and not a[0].get(CACHES)
+        bench.run(args)
+        # The next sweep starts cold again.
+        assert not any(a[0].get(CACHES) for a in bench.setup())
+
+
+def test_compare_flags_slowdowns_beyond_the_band():
+    rows = compare({"a": 1.0, "b": 1.0, "gone": 1.0},
+                   {"a": 1.4, "b": 1.6, "new": 2.0}, band=0.5)
+    assert [(name, regressed) for name, _, _, _, regressed in rows] == \
+        [("a", False), ("b", True)]
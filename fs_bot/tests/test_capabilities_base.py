@@ -663,3 +663,46 @@ class TestIneligibleThroughNextCard:
         # End of the NEXT card: normal rules resume.
         adjust_eligibility(st, {})
         assert st["eligibility"][ROMANS] == ELIGIBLE
+
+
+class TestCapabilityView:
+    """The compiled view read by the Battle code tracks the setters and
+    falls back to a rebuild on direct dict writes."""
+
+    def test_tracks_setters_and_direct_writes(self):
+        from fs_bot.cards.capabilities import (
+            capability_view, set_event_modifier, clear_event_modifier)
+        st = _state()
+        v = capability_view(st)
+        assert capability_view(st) is v
+        assert not (v.ballistae or v.legio_x or v.motivation)
+
+        activate_capability(st, 10, EVENT_UNSHADED)
+        assert capability_view(st).ballistae
+        activate_capability(st, "A33", EVENT_SHADED)
+        assert capability_view(st).motivation
+        set_event_modifier(st, "card_A31_cancel_german_benefits")
+        assert not capability_view(st).motivation
+        set_event_modifier(st, "card59_unshaded_region", MANDUBII)
+        set_event_modifier(st, "card59_unshaded_region", ATREBATES)
+        assert capability_view(st).germanic_horse_region == ATREBATES
+        clear_event_modifier(st, "card59_unshaded_region")
+        assert capability_view(st).germanic_horse_region is None
+        deactivate_capability(st, 10)
+        assert not capability_view(st).ballistae
+
+        st["capabilities"][15] = EVENT_SHADED       # bypasses the setters
+        assert capability_view(st).legio_x_shaded
+        st["capabilities"] = {27: EVENT_UNSHADED}   # new dict object
+        v = capability_view(st)
+        assert v.gallic_archers and not v.legio_x_shaded
+
+    def test_view_stays_off_state(self, tmp_path):
+        from fs_bot.cards.capabilities import capability_view
+        from fs_bot.state.serialize import save_game
+        st = _state()
+        activate_capability(st, 15, EVENT_UNSHADED)
+        keys = set(st)
+        assert capability_view(st).legio_x
+        assert set(st) == keys
+        save_game(st, str(tmp_path / "g.json"))
@@ -455,6 +455,36 @@ class TestFormatStateSummary:
         assert "VICTORY" in vs
 
 
+    def test_tables_redraw_only_changed_regions(self):
+        from fs_bot.board.pieces import place_piece
+        from fs_bot.board.tribes import tribe_changed
+        from fs_bot.cli import display
+        from fs_bot.rules_consts import PROVINCIA, AUXILIA, TRIBE_HELVII
+        state = setup_scenario(SCENARIO_PAX_GALLICA, seed=42)
+        table = format_region_table(state)
+        tribes = format_tribes_table(state)
+        rows = dict(display._REGION_ROWS)
+        place_piece(state, PROVINCIA, ROMANS, AUXILIA, 1)
+        state["tribes"][TRIBE_HELVII]["allied_faction"] = AEDUI
+        tribe_changed(state, TRIBE_HELVII)
+        after = format_region_table(state)
+        redrawn = {k for k, v in display._REGION_ROWS.items()
+                   if rows.get(k) is not v}
+        assert redrawn == {(PROVINCIA, SCENARIO_PAX_GALLICA)}
+        assert after != table
+        assert [ln for ln in after.splitlines()
+                if ln.startswith(PROVINCIA)] != \
+            [ln for ln in table.splitlines() if ln.startswith(PROVINCIA)]
+        new_tribes = format_tribes_table(state)
+        changed = set(new_tribes.splitlines()) - set(tribes.splitlines())
+        assert len(changed) == 1 and TRIBE_HELVII in changed.pop()
+        # Matches a from-scratch render.
+        display._REGION_ROWS.clear()
+        display._TRIBE_ROWS.clear()
+        assert format_region_table(state) == after
+        assert format_tribes_table(state) == new_tribes
+
+
 # ============================================================================
 # format_card
 # ============================================================================
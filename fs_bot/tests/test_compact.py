@@ -0,0 +1,126 @@
+"""Tests for compact piece storage (fs_bot.board.compact)."""
+import copy
+import pickle
+
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.board.compact import (
+    PIECES_COMPACT, PIECES_DICT, RegionPieces, compact_pieces, dict_pieces,
+    piece_backend, set_piece_backend,
+)
+from fs_bot.board.pieces import (
+    count_pieces, count_pieces_by_state, flip_piece, move_piece, place_piece,
+    remove_piece,
+)
+from fs_bot.state.serialize import load_game, save_game
+from fs_bot.state.setup import setup_scenario
+from fs_bot.tools import farm
+
+
+def _nonzero(pieces):
+    """The dict form of ``pieces`` with zero counts and empty buckets
+    dropped, for comparing the two backends."""
+    out = {}
+    for faction, fp in pieces.items():
+        kept = {}
+        for key, value in fp.items():
+            if key in (rc.HIDDEN, rc.REVEALED, rc.SCOUTED):
+                value = {pt: n for pt, n in value.items() if n}
+                if value:
+                    kept[key] = value
+            elif value:
+                kept[key] = value
+        if kept:
+            out[faction] = kept
+    return out
+
+
+@pytest.mark.parametrize("scenario", [rc.SCENARIO_PAX_GALLICA,
+                                      rc.SCENARIO_GREAT_REVOLT])
+def test_compact_game_matches_dict_game(scenario):
+    plain = farm.play_game(scenario, 2)
+    packed = farm.new_game(scenario, 2, piece_backend=PIECES_COMPACT)
+    assert piece_backend(packed) == PIECES_COMPACT
+    assert repr(farm.play_game(scenario, 2, state=packed)["card_results"]) \
+        == repr(plain["card_results"])
+
+
+def test_views_read_and_write_like_dicts():
+    plain = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1)
+    state = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1,
+                           piece_backend=PIECES_COMPACT)
+    for region, space in plain["spaces"].items():
+        view = state["spaces"][region]["pieces"]
+        assert isinstance(view, RegionPieces)
+        assert _nonzero(view.to_dict()) == _nonzero(space["pieces"])
+        for faction in rc.FACTIONS:
+            for pt in rc.FLIPPABLE_PIECES:
+                for ps in (rc.HIDDEN, rc.REVEALED, rc.SCOUTED):
+                    assert count_pieces_by_state(
+                        state, region, faction, pt, ps) == \
+                        count_pieces_by_state(plain, region, faction, pt, ps)
+            assert count_pieces(state, region, faction) == \
+                count_pieces(plain, region, faction)
+            assert count_pieces(state, region, faction, rc.LEADER) == \
+                count_pieces(plain, region, faction, rc.LEADER)
+
+    region = rc.PROVINCIA
+    view = state["spaces"][region]["pieces"]
+    fp = view[rc.BELGAE]                # indexable with no pieces here
+    assert fp[rc.LEADER] is None and fp[rc.ALLY] == 0
+    assert rc.LEADER not in fp and fp[rc.HIDDEN][rc.WARBAND] == 0
+    place_piece(state, region, rc.BELGAE, rc.WARBAND, 3)
+    flip_piece(state, region, rc.BELGAE, rc.WARBAND, 2,
+               from_state=rc.HIDDEN, to_state=rc.REVEALED)
+    assert dict(fp[rc.HIDDEN]) == {rc.WARBAND: 1}
+    assert dict(fp[rc.REVEALED]) == {rc.WARBAND: 2}
+    assert rc.BELGAE in view
+    dest = next(r for r in state["spaces"] if r != region)
+    move_piece(state, region, dest, rc.BELGAE, rc.WARBAND, 1,
+               piece_state=rc.HIDDEN)
+    remove_piece(state, region, rc.BELGAE, rc.WARBAND, 2,
+                 piece_state=rc.REVEALED)
+    assert rc.BELGAE not in view
+    # Assigning a live view copies its counts before clearing the slot.
+    fp[rc.HIDDEN] = fp[rc.HIDDEN]
+    view[rc.BELGAE] = view[rc.BELGAE]
+    assert count_pieces(state, dest, rc.BELGAE, rc.WARBAND) >= 1
+    with pytest.raises(ValueError):
+        fp[rc.LEADER] = "Nobody"
+    with pytest.raises(KeyError):
+        view["Nobody"]
+
+
+def test_copies_share_one_buffer_and_are_independent():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1,
+                           piece_backend=PIECES_COMPACT)
+    for clone in (copy.deepcopy(state), pickle.loads(pickle.dumps(state))):
+        bufs = {id(s["pieces"]._buf) for s in clone["spaces"].values()}
+        assert len(bufs) == 1
+        assert bufs != {id(state["spaces"][rc.PROVINCIA]["pieces"]._buf)}
+        before = count_pieces(state, rc.PROVINCIA, rc.ROMANS)
+        place_piece(clone, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+        assert count_pieces(state, rc.PROVINCIA, rc.ROMANS) == before
+        assert count_pieces(clone, rc.PROVINCIA, rc.ROMANS) == before + 1
+
+
+def test_save_load_and_unpack(tmp_path):
+    state = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=4,
+                           piece_backend=PIECES_COMPACT)
+    path = tmp_path / "g.json"
+    save_game(state, path)
+    loaded, _, _ = load_game(path)
+    assert piece_backend(loaded) == PIECES_COMPACT
+    for region, space in state["spaces"].items():
+        assert loaded["spaces"][region]["pieces"].to_dict() == \
+            space["pieces"].to_dict()
+
+    unpacked = dict_pieces(copy.deepcopy(state))
+    assert piece_backend(unpacked) == PIECES_DICT
+    assert "piece_backend" not in unpacked
+    assert all(type(s["pieces"]) is dict
+               for s in unpacked["spaces"].values())
+    assert compact_pieces(unpacked) is unpacked
+    with pytest.raises(ValueError):
+        set_piece_backend(unpacked, "sparse")
@@ -0,0 +1,107 @@
+"""Tests for the fixed-layout board encoder (fs_bot.state.encode)."""
+from array import array
+
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.state import encode as enc
+from fs_bot.state.setup import setup_scenario
+from fs_bot.board.pieces import count_pieces
+from fs_bot.tools.heuristic_selfplay import play_game
+
+
+def _assert_board_equal(state, board):
+    for region in rc.ALL_REGIONS:
+        for faction in rc.FACTIONS:
+            for pt in rc.PIECE_TYPES:
+                assert (count_pieces(board, region, faction, pt)
+                        == count_pieces(state, region, faction, pt)), \
+                    (region, faction, pt)
+        assert (board["spaces"][region]["control"]
+                == state["spaces"][region].get("control"))
+    for tribe, info in state["tribes"].items():
+        assert board["tribes"][tribe]["status"] == info["status"]
+        assert (board["tribes"][tribe]["allied_faction"]
+                == info.get("allied_faction"))
+    assert board["resources"] == state["resources"]
+    assert board["capabilities"] == state.get("capabilities", {})
+    assert board["senate"]["position"] == state["senate"]["position"]
+    assert board["legions_track"] == state["legions_track"]
+    assert board["current_card"] == state.get("current_card")
+
+
+@pytest.mark.parametrize("scenario", [rc.SCENARIO_GREAT_REVOLT,
+                                      rc.SCENARIO_ARIOVISTUS])
+def test_round_trip_setup(scenario):
+    state = setup_scenario(scenario, seed=1)
+    row = enc.encode(state)
+    assert isinstance(row, array) and len(row) == enc.WIDTH
+    _assert_board_equal(state, enc.decode(row))
+
+
+def test_round_trip_keeps_card_71_colony():
+    from fs_bot.cards.card_effects import execute_card_71
+    state = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1)
+    state["executing_faction"] = rc.ROMANS
+    state["event_params"] = {"region": rc.PROVINCIA}
+    execute_card_71(state)
+    colony = state["tribes"]["Colony_" + rc.PROVINCIA]
+    assert colony["allied_faction"] == rc.ROMANS
+
+    board = enc.decode(enc.encode(state))
+    _assert_board_equal(state, board)
+    assert board["tribes"]["Colony_" + rc.PROVINCIA] == colony
+
+
+def test_trajectory_round_trip_after_a_game(tmp_path):
+    rows = array("h")
+    r = play_game(rc.SCENARIO_PAX_GALLICA, seed=2, trajectory=rows)
+    assert r["winner"] is not None
+    n = len(rows) // enc.WIDTH
+    assert n >= r["cards"]
+
+    path = tmp_path / "game.fsbt"
+    enc.write_trajectory(path, rows)
+    back = enc.read_trajectory(path)
+    assert back == rows
+    boards = enc.decode_batch(back)
+    assert len(boards) == n
+    assert boards[-1]["winter_count"] >= boards[0]["winter_count"]
+    # Rows in the middle of the buffer decode as the same board as alone.
+    mid = n // 2
+    single = array("h", back[mid * enc.WIDTH:(mid + 1) * enc.WIDTH])
+    assert enc.decode(single) == boards[mid]
+
+
+def test_capabilities_markers_and_batch():
+    a = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1)
+    b = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1)
+    b["capabilities"] = {8: rc.EVENT_SHADED}
+    b["capability_owners"] = {8: rc.ROMANS}
+    b.setdefault("markers", {})[rc.MANDUBII] = {
+        rc.MARKER_DEVASTATED: True, rc.MARKER_ABATIS: rc.GERMANS}
+    buf = enc.encode_batch([a, b])
+    assert len(buf) == 2 * enc.WIDTH
+    first, second = enc.decode_batch(buf.tobytes())
+    assert first == enc.decode(buf, 0)
+    assert second["capabilities"] == {8: rc.EVENT_SHADED}
+    assert second["capability_owners"] == {8: rc.ROMANS}
+    assert second["markers"][rc.MANDUBII] == {
+        rc.MARKER_DEVASTATED: True, rc.MARKER_ABATIS: rc.GERMANS}
+
+
+def test_bad_buffers_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        enc.decode(array("h", [0] * (enc.WIDTH + 1)))
+    bogus = tmp_path / "x.fsbt"
+    bogus.write_bytes(b"nope" + bytes(16))
+    with pytest.raises(ValueError):
+        enc.read_trajectory(bogus)
+
+
+def test_as_numpy_view():
+    np = pytest.importorskip("numpy")
+    state = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1)
+    buf = enc.encode_batch([state, state])
+    arr = enc.as_numpy(buf)
+    assert arr.shape == (2, enc.WIDTH) and arr.dtype == np.int16
@@ -401,6 +401,25 @@ class TestIsEventEffective:
         # if Arverni have Available pieces
         assert is_event_effective(state, "A24", shaded=False) is True
 
+    def test_map_sweep_cached_per_board_version(self, monkeypatch):
+        """The map facts are swept once per board version: the other
+        Factions considering the same card reuse them, and a piece
+        operation forces a fresh sweep."""
+        import fs_bot.cards.event_eval as ev
+        sweeps = []
+        real = ev._sweep_map
+        monkeypatch.setattr(ev, "_sweep_map",
+                            lambda st: sweeps.append(1) or real(st))
+        state = _setup_base_state()
+        state["available"][ROMANS][AUXILIA] = 0
+        for _ in range(4):
+            assert is_event_effective(state, 16, shaded=True) is False
+        assert len(sweeps) == 1
+        state["available"][ROMANS][AUXILIA] = 1
+        place_piece(state, PROVINCIA, ROMANS, AUXILIA, 1)
+        assert is_event_effective(state, 16, shaded=True) is True
+        assert len(sweeps) == 2
+
 
 # ===================================================================
 # 5. is_capability_final_year() tests
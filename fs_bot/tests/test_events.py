@@ -0,0 +1,202 @@
+"""Tests for the game event stream (fs_bot.engine.events)."""
+import json
+from collections import Counter
+
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.engine import error_codes as ec
+from fs_bot.engine import events
+from fs_bot.board.pieces import place_piece, count_pieces
+from fs_bot.state.setup import setup_scenario
+from fs_bot.tools import farm
+
+
+def test_no_sinks_means_no_emission(monkeypatch):
+    assert events.enabled is False
+
+    def boom(*a, **k):
+        raise AssertionError("emitted with no sinks attached")
+    monkeypatch.setattr(events, "emit", boom)
+    monkeypatch.setattr(events, "emit_execution", boom)
+    farm.play_game(rc.SCENARIO_PAX_GALLICA, 1)
+
+
+def test_full_game_stream_and_sinks(tmp_path):
+    ring = events.RingBuffer(maxlen=None)
+    counts = events.CounterSink()
+    path = tmp_path / "events.jsonl"
+    with events.JsonlSink(path) as jsonl:
+        with events.subscribe(ring), events.subscribe(counts), \
+                events.subscribe(jsonl, kinds={events.WINTER_PHASE}):
+            assert events.enabled
+            res = farm.play_game(rc.SCENARIO_PAX_GALLICA, 1)
+    assert events.enabled is False
+
+    kinds = {ev.kind for ev in ring}
+    for kind in (events.CARD, events.COMMAND, events.PIECE_PLACE,
+                 events.PIECE_REMOVE, events.BATTLE, events.ELIGIBILITY,
+                 events.WINTER_PHASE, events.GAME_OVER):
+        assert kind in kinds, kind
+    cards = [ev for ev in ring if ev.kind == events.CARD]
+    assert len(cards) == res["total_cards_played"]
+    assert ring.events[-1].kind == events.GAME_OVER
+    assert ring.events[-1].data["winner"] == farm.winner_of(res)
+    assert sum(n for (kind, _), n in counts.counts.items()) == len(ring)
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines and {d["kind"] for d in lines} == {events.WINTER_PHASE}
+    assert lines[0]["phase"] == "victory"
+
+
+def _piece_table(state):
+    table = Counter()
+    for region in state["spaces"]:
+        for faction in rc.FACTIONS:
+            for piece_type in rc.PIECE_TYPES:
+                n = count_pieces(state, region, faction, piece_type)
+                if n:
+                    table[(region, faction, piece_type)] = n
+    return table
+
+
+@pytest.mark.parametrize("scenario", [rc.SCENARIO_PAX_GALLICA,
+                                      rc.SCENARIO_GREAT_REVOLT])
+def test_piece_events_match_live_board(scenario, monkeypatch):
+    # Bot look-ahead copies, dry-runs and rolled-back Events must not reach
+    # the sinks: every piece record is one the live board actually took.
+    state = farm.new_game(scenario, 1)
+    foreign = []
+    emit = events.emit
+
+    def checked_emit(kind, st, faction=None, **data):
+        if kind in events.PIECE_KINDS and st is not state:
+            foreign.append(kind)
+        emit(kind, st, faction, **data)
+    monkeypatch.setattr(events, "emit", checked_emit)
+
+    before = _piece_table(state)
+    ring = events.RingBuffer(maxlen=None)
+    with events.subscribe(ring, kinds=events.PIECE_KINDS):
+        farm.play_game(scenario, 1, state=state)
+    assert foreign == []
+
+    net = Counter()
+    for ev in ring:
+        key = (ev.data["region"], ev.faction, ev.data["piece_type"])
+        if ev.kind == events.PIECE_PLACE:
+            net[key] += ev.data["count"]
+        elif ev.kind == events.PIECE_REMOVE:
+            net[key] -= ev.data["count"]
+        elif ev.kind == events.PIECE_MOVE:
+            net[key] -= ev.data["count"]
+            net[(ev.data["to"],) + key[1:]] += ev.data["count"]
+    after = _piece_table(state)
+    after.subtract(before)
+    after.subtract(net)
+    assert +after == Counter() and -after == Counter()
+
+
+def test_kind_filter_and_mute():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    ring = events.RingBuffer()
+    with events.subscribe(ring, kinds=events.PIECE_KINDS):
+        place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 2)
+        with events.muted():
+            assert not events.enabled
+            place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+        assert events.enabled
+    (ev,) = list(ring)
+    assert ev == events.Event(events.PIECE_PLACE, state["current_card"],
+                              rc.ROMANS, {"region": rc.PROVINCIA,
+                                          "piece_type": rc.AUXILIA,
+                                          "count": 2})
+
+
+def test_held_events_wait_for_delivery():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    ring = events.RingBuffer()
+    buffer = []
+    with events.subscribe(ring):
+        with events.held(buffer):
+            place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+        assert len(ring) == 0 and len(buffer) == 1
+        events.deliver(buffer)
+        assert list(ring) == buffer
+        # Delivered inside an outer hold, they wait for that one instead.
+        outer, inner = [], []
+        with events.held(outer):
+            with events.held(inner):
+                place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+            events.deliver(inner)
+        assert len(ring) == 1 and outer == inner
+
+
+def test_issue_records_carry_stable_codes():
+    state = {"current_card": 7}
+    ring = events.RingBuffer()
+    decision = {"bot_action": {"command": "March", "sa": "Scout"}}
+    result = {"executed": False, "command": "March",
+              "reason": "nothing marchable",
+              "sa_execution": {"executed": False, "errors": ["bad region"]}}
+    with events.subscribe(ring, kinds={events.ISSUE}):
+        events.emit_execution(state, rc.ROMANS, decision, result)
+    assert [(ev.data["code"], ev.data["source"]) for ev in ring] == [
+        (events.COMMAND_REFUSED, "March"),
+        (events.SA_ERROR, "March+Scout"),
+        (events.SA_NO_EFFECT, "March+Scout"),
+    ]
+    assert all(ev.card == 7 for ev in ring)
+    assert [ev.data["error"] for ev in ring] == [
+        ec.E_MARCH_NOTHING_MARCHABLE, ec.E_SA_ENTRY, ec.E_SA_NO_EFFECT]
+
+
+def test_error_codes_table():
+    assert len(ec.NAMES) == len(ec.SEVERITY) == ec.N_CODES
+    for code, name in enumerate(ec.NAMES):
+        assert getattr(ec, name) == code
+    assert set(ec.SEVERITY) <= set(ec.SEVERITIES)
+    assert ec.reason_code("expand/mass march: nothing marchable") \
+        == ec.E_MARCH_NOTHING_MARCHABLE
+    assert ec.reason_code("no Rally node for Faction") == ec.E_COMMAND_REFUSED
+
+
+def test_executor_codes_override_message_matching():
+    state = {"current_card": 7}
+    ring = events.RingBuffer()
+    result = {"executed": False, "command": "Event",
+              "reason": "event not applicable: CommandError('if none')",
+              "reason_code": ec.E_EVENT_NOT_APPLICABLE,
+              "sa_skipped": "command produced no legal effect",
+              "sa_skipped_code": ec.E_SA_SKIPPED}
+    with events.subscribe(ring, kinds={events.ISSUE}):
+        events.emit_execution(state, rc.AEDUI, {"bot_action": {}}, result)
+    assert [ev.data["error"] for ev in ring] == [
+        ec.E_EVENT_NOT_APPLICABLE, ec.E_SA_SKIPPED]
+
+
+def test_refused_entries_carry_their_site_code():
+    from fs_bot.engine.execute import execute_decision
+    from fs_bot.tools.error_census import _detail
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    region = next(r for r in state["spaces"]
+                  if count_pieces(state, r, rc.ARVERNI) == 0)
+    decision = {"bot_action": {"command": "Battle", "details": {
+        "battle_plan": [{"region": region, "target": rc.ARVERNI}]}}}
+    ring = events.RingBuffer()
+    with events.subscribe(ring, kinds={events.ISSUE}):
+        result = execute_decision(state, rc.ROMANS, decision)
+        events.emit_execution(state, rc.ROMANS, decision, result)
+    issues = [ev.data for ev in ring if ev.data["code"] == events.COMMAND_ERROR]
+    assert [d["error"] for d in issues] == [ec.E_BATTLE_NO_DEFENDER]
+    # A coded incident is one defect class, whatever its message says.
+    assert _detail(ec.E_BATTLE_NO_DEFENDER, issues[0]["message"]) \
+        == "E_BATTLE_NO_DEFENDER"
+    assert _detail(ec.E_COMMAND_REFUSED, "only 2 Allies in 'Treveri'") \
+        == "only N Allies in '*'"
+
+
+@pytest.fixture(autouse=True)
+def _no_leaked_sinks():
+    yield
+    assert not events._sinks
@@ -692,6 +692,30 @@ class TestResolveCardTurn:
         for f in [ROMANS, ARVERNI, AEDUI, BELGAE]:
             assert state["eligibility"][f] == ELIGIBLE
 
+    def test_acted_factions_are_replayed_not_asked(self):
+        """A card resumed after Romans passed and Arverni acted: neither is
+        asked again nor charged, and both still count for Eligibility."""
+        state = _make_base_state()
+        state["current_card"] = 1  # Ro Ar Ae Be
+        for f in [ROMANS, ARVERNI, AEDUI, BELGAE]:
+            state["eligibility"][f] = ELIGIBLE
+        resources = dict(state["resources"])
+        calls = []
+
+        def decision(st, faction, options, position):
+            calls.append((faction, position))
+            return {"action": ACTION_LIMITED_COMMAND}
+
+        result = resolve_card_turn(state, decision, acted={
+            ROMANS: {"action": ACTION_PASS},
+            ARVERNI: {"action": ACTION_COMMAND}})
+        assert calls == [(AEDUI, "2nd_eligible")]
+        assert state["resources"] == resources
+        assert result["passes"] == [ROMANS]
+        assert state["eligibility"][ROMANS] == ELIGIBLE
+        assert state["eligibility"][ARVERNI] == INELIGIBLE
+        assert state["eligibility"][AEDUI] == INELIGIBLE
+
     def test_second_passes_cascading(self):
         """If 2nd passes, next eligible becomes new 2nd."""
         state = _make_base_state()
@@ -836,6 +836,21 @@ class TestNodeGRally:
         assert result["sa"] == SA_ACTION_SETTLE
         assert result["details"]["rally_plan"]["settlements_before"]
 
+    def test_ally_outside_germania_needs_the_planner_budget(self):
+        """The planner budgets a Rally outside Germania at 2 (A3.4.1 tiers)
+        in the base game too, where it also serves as the free-Rally node."""
+        state = _make_state(scenario=SCENARIO_GREAT_REVOLT)
+        _place_german_force(state, TREVERI, warbands=4)
+        state["tribes"][TRIBE_TREVERI]["allied_faction"] = None
+        refresh_all_control(state)
+        assert is_controlled_by(state, TREVERI, GERMANS)
+        state["resources"][GERMANS] = 1
+        allies = node_g_rally(state)["details"]["rally_plan"]["allies"]
+        assert TREVERI not in {a["region"] for a in allies}
+        state["resources"][GERMANS] = 2
+        allies = node_g_rally(state)["details"]["rally_plan"]["allies"]
+        assert {"region": TREVERI, "tribe": TRIBE_TREVERI, "cost": 2} in allies
+
     def test_no_sa_when_no_settlement_placeable(self):
         """Per A8.7.1: if cannot place Settlements, no SA."""
         state = _make_state()
@@ -1081,6 +1096,21 @@ class TestDeterminism:
         assert a1["sa_regions"] == a2["sa_regions"]
 
 
+    def test_base_game_board_is_pinned(self):
+        """A whole bot game of a base scenario ends on a known board, so a
+        planner refactor that changes decisions shows up here."""
+        import hashlib
+        import json
+        from fs_bot.state.serialize import encode
+        from fs_bot.tools import farm
+        state = farm.new_game(SCENARIO_GREAT_REVOLT, 9)
+        res = farm.play_game(SCENARIO_GREAT_REVOLT, 9, state=state)
+        board = {k: state[k] for k in ("spaces", "tribes", "resources")}
+        digest = hashlib.sha1(json.dumps(encode(board), sort_keys=True)
+                              .encode()).hexdigest()[:12]
+        assert (digest, len(res["card_results"])) == ("d57db072ed76", 46)
+
+
 # ===================================================================
 # Execute driver
 # ===================================================================
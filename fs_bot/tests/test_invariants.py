@@ -0,0 +1,66 @@
+"""Tests for checked mode (fs_bot.state.invariants)."""
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.board.pieces import place_piece
+from fs_bot.cards.card_effects import _ally_tribe
+from fs_bot.engine.winter import _add_resources
+from fs_bot.state import invariants
+from fs_bot.state.setup import setup_scenario
+from fs_bot.tools import farm
+
+
+def _subdued_tribe(state):
+    for tribe, info in state["tribes"].items():
+        if info.get("allied_faction") is None and info.get("status") is None:
+            return tribe
+    raise AssertionError("no Subdued tribe")
+
+
+def test_off_by_default_and_bot_games_are_clean():
+    assert invariants.enabled is False
+    found = []
+    with invariants.checking(found.append):
+        assert invariants.enabled
+        farm.play_game(rc.SCENARIO_GREAT_REVOLT, 1)
+    assert invariants.enabled is False
+    assert found == []
+
+
+def test_stale_control_is_reported_at_the_next_piece_op():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    space = state["spaces"][rc.PROVINCIA]
+    space["control"] = rc.ARVERNI_CONTROL       # an edit that skipped refresh
+    with invariants.checking():
+        with pytest.raises(invariants.InvariantError) as err:
+            place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+    assert "place_piece" in err.value.violation.op
+    assert "stale" in err.value.violation.message
+
+
+def test_tribe_backing_checked_by_tribe_mutators():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    tribe = _subdued_tribe(state)
+    region = rc.TRIBE_TO_REGION[tribe]
+    found = []
+    with invariants.checking(found.append):
+        assert _ally_tribe(state, tribe, rc.AEDUI)
+        assert found == []
+        # Drop the backing disc behind the mutators' back.
+        state["spaces"][region]["pieces"][rc.AEDUI][rc.ALLY] -= 1
+        other = _subdued_tribe(state)
+        state["tribes"][other]["region"] = region
+        _ally_tribe(state, other, rc.AEDUI)
+    assert [v.op for v in found] == [f"_ally_tribe({other})"]
+    assert f"{region}/{rc.AEDUI}" in found[0].message
+
+
+def test_negative_resources_reported_by_setters():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    state["resources"][rc.ROMANS] = -3
+    found = []
+    _add_resources(state, rc.ROMANS, 1)         # checked mode off
+    with invariants.checking(found.append):
+        _add_resources(state, rc.ROMANS, 1)
+    assert len(found) == 1 and "Romans Resources negative" in \
+        found[0].message
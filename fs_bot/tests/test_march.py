@@ -59,8 +59,11 @@ from fs_bot.commands.march import (
     _check_crossing_stop,
     _max_steps_for_group,
     _get_movable_piece_types,
+    march_route,
+)
+from fs_bot.map.map_data import (
+    ALL_REGION_DATA, get_adjacent, get_playable_regions,
 )
-from fs_bot.map.map_data import ALL_REGION_DATA
 
 
 # ============================================================================
@@ -1035,3 +1038,36 @@ def test_human_subset_march_splits_stack():
     assert count_pieces(st, "Carnutes", rc.AEDUI, rc.WARBAND) == 4
     assert count_pieces(st, "Mandubii", rc.AEDUI,
                         rc.WARBAND) == before - 4
+
+
+# ============================================================================
+# ROUTES
+# ============================================================================
+
+def _reference_route(origin, dest, playable):
+    from collections import deque
+    if origin == dest:
+        return []
+    seen = {origin}
+    q = deque([(origin, [])])
+    while q:
+        cur, path = q.popleft()
+        for nb in sorted(get_adjacent(cur)):
+            if nb in seen or nb not in playable:
+                continue
+            if nb == dest:
+                return path + [nb]
+            seen.add(nb)
+            q.append((nb, path + [nb]))
+    return None
+
+
+class TestMarchRoute:
+    @pytest.mark.parametrize("scenario", [SCENARIO_PAX_GALLICA,
+                                          SCENARIO_ARIOVISTUS])
+    def test_route_matches_bfs(self, scenario):
+        playable = set(get_playable_regions(scenario))
+        for origin in playable:
+            for dest in playable:
+                assert (march_route(origin, dest, playable)
+                        == _reference_route(origin, dest, playable))
@@ -0,0 +1,73 @@
+"""Tests for memory profiling (fs_bot.bench.memory)."""
+import os
+import tracemalloc
+
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.bench import memory
+from fs_bot.tools import farm
+from fs_bot.tools.balance_smoke import _bot_game
+
+
+@pytest.fixture
+def traced(monkeypatch):
+    """Profile inside the test, then stop tracing so the rest of the suite
+    runs at full speed."""
+    monkeypatch.setattr(memory, "_history", [])
+    was_tracing = tracemalloc.is_tracing()
+    yield
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def test_leak_needs_growth_across_every_recent_game():
+    k = 1024
+    assert not memory.leak([0, 100 * k, 200 * k])          # too few games
+    assert memory.leak([0, 100 * k, 200 * k, 300 * k])
+    assert not memory.leak([0, 100 * k, 90 * k, 300 * k])  # one shrank
+    assert not memory.leak([0, 1, 2, 3])                   # below threshold
+
+
+def test_subsystem_is_the_innermost_fs_bot_frame():
+    pkg = os.path.dirname(os.path.dirname(memory.__file__))
+    bots = os.path.join(pkg, "bots", "romans_bot.py")
+    battle = os.path.join(pkg, "battle", "resolve.py")
+    # Raw frames run most recent first.
+    tb = tracemalloc.Traceback(((os.__file__, 1), (battle, 2), (bots, 3)))
+    assert memory.subsystem(tb) == "battle"
+    tb = tracemalloc.Traceback(((os.path.join(pkg, "board", "x.py"), 1),))
+    assert memory.subsystem(tb) == "engine"
+    assert memory.subsystem(tracemalloc.Traceback(((os.__file__, 1),))) \
+        == "other"
+
+
+def test_game_report_has_phases_and_subsystems(traced):
+    with memory.profiling() as prof:
+        farm.play_game(rc.SCENARIO_PAX_GALLICA, 1)
+    report = prof.report()
+    assert report["peak"] > 0
+    assert report["phases"]["event card"]["spans"] > 10
+    assert report["phases"]["winter:victory"]["spans"] >= 1
+    assert set(report["subsystems"]) == set(memory.SUBSYSTEMS)
+    assert report["process"]["games"] == 1
+    assert not report["process"]["leak"]
+    assert "winter:victory" in memory.format_report(report)
+
+
+def test_farm_reports_memory_per_job(traced, capsys):
+    jobs = farm.matrix([rc.SCENARIO_PAX_GALLICA], [1, 2])
+    out = list(farm.run(jobs, _bot_game, memory=True))
+    assert [e for _, _, e in out] == [None, None]
+    assert [j["memory"]["process"]["games"] for j, _, _ in out] == [1, 2]
+    err = capsys.readouterr().err
+    assert "seed=2] peak" in err and "memory: 2 game(s)" in err
+
+
+def test_consecutive_farm_games_do_not_leak(traced, capsys):
+    # Derived caches live on the state they index, so a finished game's
+    # caches are freed with it and process memory settles.
+    jobs = farm.matrix([rc.SCENARIO_PAX_GALLICA], range(1, 7))
+    out = list(farm.run(jobs, _bot_game, memory=True))
+    assert [e for _, _, e in out] == [None] * 6
+    assert not any(j["memory"]["process"]["leak"] for j, _, _ in out)
@@ -0,0 +1,95 @@
+"""Tests for board observations (fs_bot.state.observation)."""
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.board.pieces import (
+    board_version, bump_board_version, changed_regions, count_pieces,
+    get_leader_in_region, move_piece, place_piece, remove_piece,
+)
+from fs_bot.cli.display import format_state_delta, snapshot_state
+from fs_bot.state.observation import Observation, observe, region_views
+from fs_bot.state.setup import setup_scenario
+
+
+@pytest.mark.parametrize("scenario", [rc.SCENARIO_GREAT_REVOLT,
+                                      rc.SCENARIO_ARIOVISTUS])
+def test_counts_match_board_helpers(scenario):
+    state = setup_scenario(scenario, seed=1)
+    obs = observe(state)
+    for region in state["spaces"]:
+        for faction in rc.FACTIONS:
+            for pt in rc.PIECE_TYPES:
+                assert (obs.count(region, faction, pt)
+                        == count_pieces(state, region, faction, pt)), \
+                    (region, faction, pt)
+            assert (obs.leader(region, faction)
+                    == get_leader_in_region(state, region, faction))
+        assert obs.region(region).control == state["spaces"][region].get(
+            "control")
+    assert obs.count("Nowhere", rc.ROMANS, rc.LEGION) == 0
+    assert dict(obs.scores)[rc.ROMANS] is not None
+
+
+def test_immutable_and_hashable():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    obs = observe(state)
+    with pytest.raises(AttributeError):
+        obs.fallen = 3
+    again = observe(state)
+    assert again == obs and hash(again) == hash(obs)
+    assert len({obs, again}) == 1
+    state["resources"][rc.ROMANS] += 1
+    assert observe(state) != obs
+
+
+def test_region_views_shared_until_board_changes():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    views = region_views(state)
+    assert region_views(state) is views
+    place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+    fresh = region_views(state)
+    assert fresh is not views
+    assert fresh[rc.PROVINCIA].count(rc.ROMANS, rc.AUXILIA) == \
+        views[rc.PROVINCIA].count(rc.ROMANS, rc.AUXILIA) + 1
+    obs = observe(state)
+    place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+    with pytest.raises(ValueError):
+        obs.scores
+
+
+def test_region_views_rebuild_only_changed_regions():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    views = region_views(state)
+    since = board_version(state)
+    assert changed_regions(state, since) == frozenset()
+    move_piece(state, rc.PROVINCIA, rc.SEQUANI, rc.ROMANS, rc.AUXILIA, 1)
+    assert changed_regions(state, since) == {rc.PROVINCIA, rc.SEQUANI}
+    fresh = region_views(state)
+    kept = {r for r in views if fresh[r] is views[r]}
+    assert kept == set(views) - {rc.PROVINCIA, rc.SEQUANI}
+    assert fresh == {r: v for r, v in region_views(
+        {**state, "board_version": -1}).items()}     # same as a full build
+    # A change not attributed to a region, or replaced spaces: unknown.
+    since = board_version(state)
+    bump_board_version(state)
+    assert changed_regions(state, since) is None
+    since = board_version(state)
+    place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+    assert changed_regions(state, since) == {rc.PROVINCIA}
+    state["spaces"] = dict(state["spaces"])
+    assert changed_regions(state, since) is None
+
+
+def test_state_delta_is_structural():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    before = snapshot_state(state)
+    assert isinstance(before, Observation)
+    assert format_state_delta(before, snapshot_state(state)) == []
+    place_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 2)
+    remove_piece(state, rc.PROVINCIA, rc.ROMANS, rc.AUXILIA, 1)
+    state["resources"][rc.AEDUI] += 3
+    lines = format_state_delta(before, snapshot_state(state))
+    assert f"  {rc.PROVINCIA}: {rc.ROMANS} +1 {rc.AUXILIA}" in lines
+    assert any(line.startswith(f"  {rc.AEDUI} Resources:")
+               for line in lines)
+    assert len(lines) == 2
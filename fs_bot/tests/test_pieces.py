@@ -436,3 +436,68 @@ def test_citadel_one_per_region_invariant():
     with pytest.raises(PieceError):
         place_piece(state, MANDUBII, AEDUI, CITADEL)
     assert count_pieces(state, MANDUBII, ARVERNI, CITADEL) == 1
+
+
+def test_board_version_advances_on_every_operation():
+    """Caches derived from the map key on board_version; every piece
+    operation must advance it, and a failed operation must not."""
+    from fs_bot.board.pieces import board_version
+    state = make_state()
+    seen = [board_version(state)]
+
+    def step():
+        v = board_version(state)
+        assert v > seen[-1]
+        seen.append(v)
+
+    place_piece(state, MORINI, BELGAE, WARBAND, 3)
+    step()
+    flip_piece(state, MORINI, BELGAE, WARBAND, 1,
+               from_state=HIDDEN, to_state=REVEALED)
+    step()
+    move_piece(state, MORINI, NERVII, BELGAE, WARBAND, 1,
+               piece_state=HIDDEN)
+    step()
+    remove_piece(state, NERVII, BELGAE, WARBAND, 1, piece_state=HIDDEN)
+    step()
+    with pytest.raises(PieceError):
+        remove_piece(state, NERVII, BELGAE, WARBAND, 1, piece_state=HIDDEN)
+    assert board_version(state) == seen[-1]
+
+
+def test_batch_mutations_refreshes_control_once_per_region(monkeypatch):
+    """Inside a batch, Control is recomputed at the end, once per touched
+    region; the Control readers still see it up to date."""
+    from fs_bot.board import control
+    from fs_bot.board.pieces import batch_mutations, batched
+    from fs_bot.rules_consts import BELGIC_CONTROL, NO_CONTROL
+    state = make_state()
+    calls = []
+    real = control.calculate_control
+    monkeypatch.setattr(control, "calculate_control",
+                        lambda st, r: calls.append(r) or real(st, r))
+    with batch_mutations(state):
+        with batch_mutations(state):            # nested: no early refresh
+            place_piece(state, MORINI, BELGAE, WARBAND, 3)
+        move_piece(state, MORINI, NERVII, BELGAE, WARBAND, 1,
+                   piece_state=HIDDEN)
+        place_piece(state, MORINI, BELGAE, WARBAND, 1)
+        assert calls == []
+        assert state["spaces"][MORINI]["control"] == NO_CONTROL   # pending
+        assert control.is_controlled_by(state, MORINI, BELGAE)    # flushes
+        assert sorted(calls) == [MORINI, NERVII]
+        remove_piece(state, NERVII, BELGAE, WARBAND, 1, piece_state=HIDDEN)
+    assert sorted(calls) == [MORINI, NERVII, NERVII]
+    assert state["spaces"][MORINI]["control"] == BELGIC_CONTROL
+    assert state["spaces"][NERVII]["control"] == NO_CONTROL
+
+    @batched
+    def reinforce(state, region):
+        place_piece(state, region, BELGAE, WARBAND, 2)
+        place_piece(state, region, BELGAE, ALLY)
+        return region
+
+    del calls[:]
+    assert reinforce(state, NERVII) == NERVII
+    assert calls == [NERVII]
+    assert state["spaces"][NERVII]["control"] == BELGIC_CONTROL
@@ -63,6 +63,7 @@ from fs_bot.board.pieces import (
     get_leader_in_region, PieceError,
 )
 from fs_bot.board.control import refresh_all_control, is_controlled_by
+from fs_bot.map.map_data import get_playable_regions
 from fs_bot.rules_consts import TRIBE_TO_REGION as rc_TRIBE_TO_REGION
 from fs_bot.rules_consts import SCENARIO_GREAT_REVOLT, MANDUBII, NERVII, MORINI
 from fs_bot.commands.rally import (
@@ -1471,3 +1472,70 @@ class TestRallyPlanStringEntries:
         # warbands leg succeeds; string ally/citadel legs -> captured errors
         assert res["executed"] is True
         assert all(isinstance(e, dict) for e in res.get("errors", []))
+
+
+class TestRallyOpportunities:
+    """rally_opportunities: the board-wide table agrees with the per-Region
+    rules functions and with what rally_in_region does."""
+
+    @pytest.mark.parametrize("scenario", [
+        SCENARIO_PAX_GALLICA, SCENARIO_GREAT_REVOLT, SCENARIO_ARIOVISTUS,
+    ])
+    @pytest.mark.parametrize("faction", [ARVERNI, AEDUI, BELGAE, GERMANS])
+    def test_rows_match_rules_functions(self, scenario, faction):
+        from fs_bot.commands.rally import (
+            rally_opportunities, _find_subdued_tribe_for_ally,
+        )
+        state = make_state(scenario, seed=3)
+        table = rally_opportunities(state, faction)
+        assert tuple(table) == get_playable_regions(
+            scenario, state.get("capabilities"))
+        for region, row in table.items():
+            assert row.region == region
+            assert row.legal == validate_rally_region(
+                state, region, faction)[0]
+            assert row.cost == rally_cost(state, region, faction)
+            assert row.controlled == is_controlled_by(state, region, faction)
+            assert row.pieces == count_pieces(state, region, faction)
+            assert list(row.ally_tribes) == _find_subdued_tribe_for_ally(
+                state, region, faction)
+
+    @pytest.mark.parametrize("scenario,faction", [
+        (SCENARIO_PAX_GALLICA, ARVERNI), (SCENARIO_PAX_GALLICA, BELGAE),
+        (SCENARIO_GREAT_REVOLT, AEDUI), (SCENARIO_ARIOVISTUS, GERMANS),
+    ])
+    def test_warband_cap_matches_executor(self, scenario, faction):
+        import copy
+        from fs_bot.commands.rally import rally_opportunities
+        state = make_state(scenario, seed=3)
+        give_resources(state, faction, 40)
+        avail = get_available(state, faction, WARBAND)
+        for region, row in rally_opportunities(state, faction).items():
+            if not row.legal:
+                continue
+            trial = copy.deepcopy(state)
+            try:
+                res = rally_in_region(trial, region, faction,
+                                      "place_warbands")
+            except CommandError:
+                placed = 0
+            else:
+                placed = res["pieces_placed"].get(WARBAND, 0)
+            assert placed == min(row.warband_cap(), avail), region
+
+    def test_cached_per_board(self):
+        from fs_bot.commands.rally import rally_opportunities
+        state = make_state(SCENARIO_PAX_GALLICA)
+        table = rally_opportunities(state, AEDUI)
+        assert rally_opportunities(state, AEDUI) is table
+        # A piece operation versions the board.
+        place_piece(state, CARNUTES, AEDUI, WARBAND, 3)
+        fresh = rally_opportunities(state, AEDUI)
+        assert fresh is not table
+        assert fresh[CARNUTES].pieces == table[CARNUTES].pieces + 3
+        # Tribe statuses and markers are written directly; they count too.
+        state["tribes"][TRIBE_CARNUTES]["allied_faction"] = AEDUI
+        assert (TRIBE_CARNUTES
+                in rally_opportunities(state, AEDUI)[CARNUTES].allied_tribes)
+        state["markers"].setdefault(CARNUTES, {})[MARKER_DEVASTATED] = True
+        assert not rally_opportunities(state, AEDUI)[CARNUTES].legal
@@ -0,0 +1,85 @@
+"""Tests for the game RNG backends (fs_bot.state.rng)."""
+import copy
+import random
+
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.state import serialize
+from fs_bot.state.rng import (
+    CounterRng, RNG_COUNTER, RNG_MT, make_rng, rng_backend,
+)
+from fs_bot.state.setup import setup_scenario
+from fs_bot.tools import farm
+
+
+def test_draws_stay_in_range():
+    rng = CounterRng(5)
+    for _ in range(500):
+        assert 1 <= rng.randint(1, 6) <= 6
+        assert 0.0 <= rng.random() < 1.0
+        assert rng.randrange(10) in range(10)
+        assert rng.randrange(3, 20, 4) in range(3, 20, 4)
+        assert rng.randrange(10, 0, -3) in range(10, 0, -3)
+        assert rng.getrandbits(70) < 1 << 70
+    faces = {rng.randint(1, 6) for _ in range(200)}
+    assert faces == set(range(1, 7))
+    deck = list(range(20))
+    rng.shuffle(deck)
+    assert sorted(deck) == list(range(20)) and deck != list(range(20))
+    assert rng.choice("abc") in "abc"
+    with pytest.raises(IndexError):
+        rng.choice([])
+    with pytest.raises(ValueError):
+        rng.randrange(0)
+
+
+def test_seeded_streams_and_forks():
+    a, b = CounterRng(7), CounterRng(7)
+    assert [a.random() for _ in range(9)] == [b.random() for _ in range(9)]
+    assert CounterRng(7, stream=1).random() != CounterRng(7).random()
+    state = a.getstate()
+    child = a.fork("planner")
+    assert a.getstate() == state
+    assert child.getstate() != state
+    assert child.random() != a.random()
+    b.random()
+    assert a.fork("x").random() == b.fork("x").random()
+    assert a.fork("x").random() != a.fork("y").random()
+
+
+def test_state_copy_and_serialize_round_trip():
+    rng = CounterRng(3)
+    rng.shuffle(list(range(10)))
+    clones = [copy.deepcopy(rng), serialize.decode(serialize.encode(rng))]
+    expected = [rng.randint(1, 6) for _ in range(20)]
+    for clone in clones:
+        assert [clone.randint(1, 6) for _ in range(20)] == expected
+        assert clone == rng
+    saved = rng.getstate()
+    first = [rng.random() for _ in range(5)]
+    rng.setstate(saved)
+    assert [rng.random() for _ in range(5)] == first
+    with pytest.raises(ValueError):
+        rng.setstate(("mt", "00", 0))
+
+
+def test_backend_selection():
+    assert isinstance(make_rng(1), random.Random)
+    assert rng_backend(make_rng(1, RNG_COUNTER)) == RNG_COUNTER
+    with pytest.raises(ValueError):
+        make_rng(1, "pcg")
+    legacy = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    assert rng_backend(legacy["rng"]) == RNG_MT
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1,
+                           rng_backend=RNG_COUNTER)
+    assert rng_backend(state["rng"]) == RNG_COUNTER
+    decoded = serialize.decode(serialize.encode(state))
+    assert decoded["rng"] == state["rng"] and decoded["deck"] == state["deck"]
+
+
+def test_counter_game_is_deterministic():
+    results = [farm.play_game(None, None, state=farm.new_game(
+        rc.SCENARIO_GREAT_REVOLT, 2, rng_backend=RNG_COUNTER))
+        for _ in range(2)]
+    assert results[0]["card_results"] == results[1]["card_results"]
@@ -1060,6 +1060,34 @@ class TestMarchGroup881:
             for o, g in det["groups"].items():
                 assert LEGION in g and AUXILIA in g
 
+    def test_node_r_march_frost_scores_departures(self, monkeypatch):
+        """§8.4.4: under Frost each origin's departing group is scored on
+        the decision's one victory tally; restricted origins are dropped."""
+        from fs_bot.bots import roman_bot
+        from fs_bot.engine.victory_whatif import PieceDelta
+        state = _make_state(non_players={ROMANS, AEDUI, BELGAE})
+        _clear_region(state, MANDUBII)
+        place_piece(state, MANDUBII, ROMANS, LEADER, leader_name=CAESAR)
+        place_piece(state, MANDUBII, ROMANS, LEGION, 4,
+                    from_legions_track=True)
+        place_piece(state, MANDUBII, ROMANS, AUXILIA, 4)
+        place_piece(state, MANDUBII, BELGAE, WARBAND, 1)
+        set_tribe_allied_helper(state, MANDUBII, BELGAE)
+        assert node_r_march(state)["command"] == ACTION_MARCH
+
+        state["frost"] = True
+        seen = []
+
+        def restricted(st, candidates, tally):
+            seen.append((candidates, tally))
+            return [True] * len(candidates)
+        monkeypatch.setattr(roman_bot, "frost_restricted", restricted)
+        assert node_r_march(state)["command"] != ACTION_MARCH
+        ((candidates, tally),) = seen
+        assert tally is not None
+        assert PieceDelta(MANDUBII, ROMANS, LEADER, -1) in candidates[0]
+        assert PieceDelta(MANDUBII, ROMANS, LEGION, -4) in candidates[0]
+
 
 class TestScoutAuxiliaMoves881:
     """§8.8.1 SCOUT (errata): concrete Auxilia moves — escort to 4 with
@@ -3,8 +3,10 @@ Documents is either cited somewhere in fs_bot source or allow-listed as
 not applicable (with a reason) in tools/rules_trace.py. New sections, or
 citations lost in refactors, fail here."""
 
+import json
+
 from fs_bot.tools.rules_trace import (parse_sections, citation_census,
-                                      unaccounted, NOT_APPLICABLE)
+                                      unaccounted, NOT_APPLICABLE, _cited)
 
 
 def test_reference_documents_parse():
@@ -27,3 +29,27 @@ def test_allowlist_entries_are_real_and_uncited():
     for sec in NOT_APPLICABLE:
         assert sec in sections, sec
         assert not hits[sec], f"{sec} is now cited — drop it from the list"
+
+
+def test_citation_matching():
+    sections = {"3.2", "3.2.4", "A3.2", "1.0"}
+    assert _cited(["3.2.4"], sections) == {"3.2", "3.2.4"}
+    assert _cited(["3.2.45"], sections) == {"3.2"}
+    assert _cited(["A3.2.", "11.0"], sections) == {"A3.2", "3.2", "1.0"}
+
+
+def test_index_rescans_only_changed_files(tmp_path):
+    index = str(tmp_path / "index.json")
+    sections, hits = citation_census()
+    assert citation_census(index) == (sections, hits)
+    data = json.loads(open(index).read())
+    # An unchanged file (same mtime and size) is taken from the index...
+    rel = "farm.py"
+    data["files"][rel]["numbers"] = ["A8.7.4"]
+    open(index, "w").write(json.dumps(data))
+    assert rel in citation_census(index)[1]["A8.7.4"]
+    # ...and one whose stamp moved is rescanned when its hash differs.
+    data["files"][rel]["mtime_ns"] -= 1
+    data["files"][rel]["sha1"] = "stale"
+    open(index, "w").write(json.dumps(data))
+    assert citation_census(index) == (sections, hits)
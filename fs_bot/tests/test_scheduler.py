@@ -0,0 +1,140 @@
+"""Tests for the async multi-game scheduler (fs_bot.engine.scheduler)."""
+import asyncio
+import json
+from collections import Counter
+
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.engine import events
+from fs_bot.engine.game_engine import (
+    DecisionRequest, card_turn_steps, start_game,
+)
+from fs_bot.engine.scheduler import GameScheduler, Pending, local_backend
+from fs_bot.tools import farm
+from fs_bot.tools.llm_seat import reactive_policy
+
+
+def _dump(res):
+    return json.dumps(res, default=str, sort_keys=True)
+
+
+def _sync_game(scenario, seed, seat):
+    state = farm.new_game(scenario, seed)
+    state["decision_agent"] = reactive_policy(seat)
+    ring = events.RingBuffer(maxlen=None)
+    with events.subscribe(ring):
+        res = farm.play_game(None, None, state=state)
+    return res, state, list(ring)
+
+
+def test_card_turn_steps_yields_requests():
+    state = farm.new_game(rc.SCENARIO_PAX_GALLICA, 1)
+    start_game(state)
+    steps = card_turn_steps(state)
+    request = next(steps)
+    assert isinstance(request, DecisionRequest)
+    assert request.position == "1st_eligible"
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            request = steps.send({"action": "pass"})
+    assert stop.value.value["passes"]
+
+
+def test_no_agent_seats_plays_as_run_game():
+    ref = farm.play_game(rc.SCENARIO_PAX_GALLICA, 2)
+    sched = GameScheduler(local_backend(farm.bot_decision),
+                          decision_func=farm.bot_decision)
+    sched.add(farm.new_game(rc.SCENARIO_PAX_GALLICA, 2))
+    (res,) = asyncio.run(sched.run())
+    assert _dump(res) == _dump(ref)
+    assert sched.batches == []
+
+
+@pytest.mark.parametrize("scenario,seed,seat", [
+    (rc.SCENARIO_PAX_GALLICA, 1, rc.ROMANS),
+    # Reactive Aedui decisions inside the bots' look-ahead copies.
+    (rc.SCENARIO_GREAT_REVOLT, 2, rc.AEDUI),
+])
+def test_agent_seat_matches_sync_game(scenario, seed, seat):
+    ref, ref_state, ref_events = _sync_game(scenario, seed, seat)
+    sched = GameScheduler(
+        local_backend(farm.bot_decision, reactive_policy(seat)),
+        decision_func=farm.bot_decision)
+    state = farm.new_game(scenario, seed)
+    sched.add(state, seats={seat})
+    ring = events.RingBuffer(maxlen=None)
+    with events.subscribe(ring):
+        (res,) = asyncio.run(sched.run())
+    assert _dump(res) == _dump(ref)
+    assert state["spaces"] == ref_state["spaces"]
+    assert "decision_agent" not in state
+    # Replayed cards deliver their events once. (Order can differ: what
+    # the stub backend's bots emit is delivered while the card is held.)
+    assert Counter(map(repr, ring)) == Counter(map(repr, ref_events))
+
+
+def test_pending_decisions_are_batched():
+    seen = []
+    inner = local_backend(farm.bot_decision)
+
+    async def backend(batch):
+        assert all(isinstance(p, Pending) for p in batch)
+        seen.append(sorted({p.game for p in batch}))
+        await asyncio.sleep(0)
+        return await inner(batch)
+
+    seeds = (1, 2, 3, 4)
+    sched = GameScheduler(backend, decision_func=farm.bot_decision)
+    for seed in seeds:
+        sched.add(farm.new_game(rc.SCENARIO_PAX_GALLICA, seed),
+                  seats={rc.ROMANS})
+    results = asyncio.run(sched.run())
+    assert max(sched.batches) == len(seeds)
+    assert seen[0] == [0, 1, 2, 3]
+    for seed, res in zip(seeds, results):
+        assert farm.winner_of(res) == farm.winner_of(
+            farm.play_game(rc.SCENARIO_PAX_GALLICA, seed))
+
+
+def test_backend_failure_propagates():
+    async def broken(batch):
+        return []
+
+    sched = GameScheduler(broken, decision_func=farm.bot_decision)
+    sched.add(farm.new_game(rc.SCENARIO_PAX_GALLICA, 1), seats={rc.ROMANS})
+    with pytest.raises(ValueError, match="answered 0 of"):
+        asyncio.run(sched.run())
+
+
+def test_backend_calls_in_flight_are_cancelled_on_failure():
+    cancelled = []
+
+    async def backend(batch):
+        if batch[0].game == 0:
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(batch[0].game)
+                raise
+        return []
+
+    sched = GameScheduler(backend, decision_func=farm.bot_decision,
+                          batch_size=1)
+    for seed in (1, 2):
+        sched.add(farm.new_game(rc.SCENARIO_PAX_GALLICA, seed),
+                  seats={rc.ROMANS})
+
+    async def main():
+        with pytest.raises(ValueError, match="answered 0 of"):
+            await sched.run()
+        # Settled before run() returned, not left to the loop's teardown.
+        return list(cancelled), set(sched._answering)
+
+    assert asyncio.run(main()) == ([0], set())
+
+
+@pytest.fixture(autouse=True)
+def _no_leaked_sinks():
+    yield
+    assert not events._sinks
@@ -24,6 +24,32 @@ def test_every_profile_finishes_a_game():
         assert r["cards"] >= 1
 
 
+def test_plan_turn_builds_no_plan_past_the_first_valid(monkeypatch):
+    from fs_bot.agents import heuristic
+    from fs_bot.engine.game_engine import (start_game,
+                                           get_first_eligible_options)
+    from fs_bot.state.setup import setup_scenario
+    st = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1)
+    start_game(st)
+    built = []
+
+    def counting(cmd, builder):
+        def build(*args):
+            built.append(cmd)
+            return builder(*args)
+        return build
+    monkeypatch.setattr(heuristic, "_BUILDERS", {
+        cmd: counting(cmd, b) for cmd, b in heuristic._BUILDERS.items()})
+    prof = {**next(p for p in PROFILES.values()
+                   if p["faction"] == rc.ARVERNI and "planner" not in p),
+            "commands": ["Rally", "March", "Raid", "Battle"]}
+    decision = heuristic.plan_turn(st, rc.ARVERNI, prof,
+                                   get_first_eligible_options(),
+                                   "1st_eligible")
+    assert decision["player_action"]["command"] == built[-1]
+    assert built == prof["commands"][:len(built)] and len(built) < 4
+
+
 def test_random_plan_policy_finishes():
     from fs_bot.agents.heuristic import RandomPlanPolicy
     pol = RandomPlanPolicy(rc.ROMANS, seed=3)
@@ -202,3 +228,206 @@ def test_self_play_maintains_structural_integrity():
                 except Exception:
                     pass
     assert violations == [], violations[:5]
+
+
+def test_mcts_agent_finishes_and_reports_throughput():
+    from fs_bot.agents.mcts import MCTSAgent
+    agent = MCTSAgent(rc.AEDUI, rollouts=4, depth=1, max_candidates=4, seed=2)
+    r = play_game(rc.SCENARIO_GREAT_REVOLT, seed=2, agent_faction=rc.AEDUI,
+                  planner=agent.plan_turn)
+    assert r["winner"] is not None
+    assert agent.stats["rollouts"] > 0
+    assert agent.stats["failed_rollouts"] == 0
+    assert agent.rollouts_per_sec() > 0
+
+
+def test_mcts_search_leaves_live_state_untouched():
+    import copy
+    from fs_bot.state.setup import setup_scenario
+    from fs_bot.engine.game_engine import (start_game, get_sop_factions,
+                                           get_first_eligible_options)
+    from fs_bot.agents.mcts import MCTSAgent
+    st = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=5)
+    st["non_player_factions"] = set(get_sop_factions(st))
+    start_game(st)
+    before = copy.deepcopy(st)
+    agent = MCTSAgent(rc.ROMANS, rollouts=6, depth=1, max_candidates=3)
+    decision = agent.plan_turn(st, rc.ROMANS, get_first_eligible_options(),
+                               "1st_eligible")
+    assert decision["action"] in get_first_eligible_options()
+    assert agent.last_search["rollouts"] == 6
+    assert st["rng"].getstate() == before["rng"].getstate()
+    st.pop("rng"), before.pop("rng")
+    assert st == before
+
+
+def test_mcts_search_without_a_snapshot(monkeypatch):
+    from fs_bot.state.setup import setup_scenario
+    from fs_bot.engine import moves
+    from fs_bot.engine.game_engine import (start_game, get_sop_factions,
+                                           get_first_eligible_options)
+    from fs_bot.agents.mcts import MCTSAgent
+    st = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=5)
+    st["non_player_factions"] = set(get_sop_factions(st))
+    start_game(st)
+    # An unpicklable state: rollouts fork by deep copy instead.
+    monkeypatch.setattr(moves, "snapshot", lambda state: None)
+    agent = MCTSAgent(rc.ROMANS, rollouts=4, depth=1, max_candidates=3)
+    agent.plan_turn(st, rc.ROMANS, get_first_eligible_options(),
+                    "1st_eligible")
+    assert agent.last_search["rollouts"] == 4
+    assert agent.stats["failed_rollouts"] == 0
+
+
+def test_mcts_determinize_and_first_action():
+    import random
+    from fs_bot.state.setup import setup_scenario
+    from fs_bot.engine.game_engine import (
+        is_winter_card, get_second_eligible_options, ACTION_COMMAND,
+        ACTION_COMMAND_SA, ACTION_EVENT)
+    from fs_bot.agents.mcts import determinize, first_action_from_options
+    st = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1)
+    deck = list(st["deck"])
+    determinize(st, random.Random(0))
+    assert st["deck"][0] == deck[0]
+    assert sorted(map(str, st["deck"])) == sorted(map(str, deck))
+    assert ([is_winter_card(c) for c in st["deck"]]
+            == [is_winter_card(c) for c in deck])
+    for first in (ACTION_COMMAND, ACTION_COMMAND_SA, ACTION_EVENT):
+        assert first_action_from_options(
+            get_second_eligible_options(first)) == first
+    # A counter-based game rng is forked, keeping the game's backend.
+    from fs_bot.state.rng import CounterRng
+    st["rng"] = game_rng = CounterRng(7)
+    determinize(st, random.Random(0))
+    assert isinstance(st["rng"], CounterRng) and st["rng"] != game_rng
+    assert game_rng == CounterRng(7)
+
+
+def _db_writer(path, seed):
+    from fs_bot.tools import results_db
+    conn = results_db.connect(path)
+    for label in ("A", "B", "C"):
+        results_db.record_game(conn, "t", label, "S", seed,
+                               {"winner": rc.ROMANS, "cards": seed})
+
+
+def test_results_db_records_and_aggregates(tmp_path):
+    import json
+    import multiprocessing
+    from fs_bot.tools import results_db
+    path = tmp_path / "r.db"
+    conn = results_db.connect(path)
+
+    r = play_game(rc.SCENARIO_PAX_GALLICA, seed=2)
+    outcomes = r.pop("outcomes")
+    assert outcomes and all(len(row) == 8 for row in outcomes)
+    rec = {"label": "BOTS", "scenario": rc.SCENARIO_PAX_GALLICA, "seed": 2,
+           **r}
+    gid = results_db.record_game(
+        conn, "heuristic_selfplay", "BOTS", rc.SCENARIO_PAX_GALLICA, 2, rec,
+        outcomes=outcomes,
+        scores=[(f, m, i) for i, (f, m) in enumerate(r["scores"], 1)])
+    # Re-recording the same key replaces the row instead of duplicating it.
+    gid = results_db.record_game(
+        conn, "heuristic_selfplay", "BOTS", rc.SCENARIO_PAX_GALLICA, 2, rec,
+        outcomes=outcomes)
+    assert conn.execute("SELECT COUNT(*) FROM games").fetchone()[0] == 1
+    assert conn.execute("SELECT COUNT(*) FROM card_outcomes WHERE game_id=?",
+                        (gid,)).fetchone()[0] == len(outcomes)
+    assert results_db.done_keys(conn, "heuristic_selfplay") == {
+        ("BOTS", rc.SCENARIO_PAX_GALLICA, 2)}
+    assert results_db.done_keys(conn, "heuristic_selfplay",
+                                fingerprint="other") == set()
+    (rate,) = results_db.win_rates(conn, tool="heuristic_selfplay")
+    assert rate["winner"] == r["winner"] and rate["rate"] == 1.0
+
+    jsonl = tmp_path / "old.jsonl"
+    jsonl.write_text("\n".join(json.dumps(
+        {"label": "X", "scenario": "S", "seed": s, "winner": w, "cards": c})
+        for s, w, c in [(1, rc.ROMANS, 20), (2, rc.BELGAE, 30)]) + "\nbad\n")
+    assert results_db.import_jsonl(conn, jsonl) == 2
+    (length,) = results_db.game_lengths(conn, label="X")
+    assert length["games"] == 2 and length["avg_cards"] == 25
+    rates = {w["winner"]: w["rate"]
+             for w in results_db.win_rates(conn, label="X")}
+    assert rates == {rc.ROMANS: 0.5, rc.BELGAE: 0.5}
+    assert results_db.import_baseline(conn) > 0
+
+    # Parallel writer processes share the file without losing rows.
+    procs = [multiprocessing.Process(target=_db_writer, args=(str(path), s))
+             for s in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(60)
+        assert p.exitcode == 0
+    assert len(results_db.done_keys(conn, "t")) == 12
+
+
+def _slow_game(job):
+    import time
+    time.sleep(job["seed"])
+    return job["seed"]
+
+
+def _swallowing_game(job):
+    import time
+    try:
+        time.sleep(job["seed"])
+    except Exception:
+        pass
+    return "truncated"
+
+
+def test_engine_fingerprint_ignores_non_engine_packages(tmp_path,
+                                                        monkeypatch):
+    from fs_bot.tools import results_db
+    for rel in ("engine/a.py", "bench/b.py", "tools/c.py", "tests/d.py"):
+        (tmp_path / rel).parent.mkdir(exist_ok=True)
+        (tmp_path / rel).write_text("x = 1\n")
+    monkeypatch.setattr(results_db, "_PKG", tmp_path)
+
+    def fingerprint():
+        monkeypatch.setattr(results_db, "_fingerprint", None)
+        return results_db.engine_fingerprint()
+    before = fingerprint()
+    for rel in ("bench/b.py", "tools/c.py", "tests/d.py"):
+        (tmp_path / rel).write_text("x = 2\n")
+    assert fingerprint() == before
+    (tmp_path / "engine/a.py").write_text("x = 2\n")
+    assert fingerprint() != before
+
+
+def test_farm_runs_in_order_in_parallel_with_timeouts():
+    from collections import Counter
+    from fs_bot.tools import farm
+    from fs_bot.tools.balance_smoke import _bot_game
+    jobs = farm.matrix([rc.SCENARIO_PAX_GALLICA], farm.seed_range("1-3"))
+    serial = [(j["seed"], v["winner"], v["cards"], e)
+              for j, v, e in farm.run(jobs, _bot_game)]
+    parallel = [(j["seed"], v["winner"], v["cards"], e)
+                for j, v, e in farm.run(jobs, _bot_game, workers=2)]
+    assert serial == parallel
+    assert [s for s, *_ in serial] == [1, 2, 3]
+
+    out = list(farm.run([{"seed": 0}, {"seed": 5}], _slow_game,
+                        timeout=0.3))
+    assert out[0][1:] == (0, None)
+    assert out[1][1] is None and out[1][2].startswith("GameTimeout")
+
+    # A game over budget is reported, not cut short and kept: the engine's
+    # ``except Exception`` handlers must not swallow the timeout.
+    (_, value, error), = farm.run([{"seed": 5}], _swallowing_game,
+                                  timeout=0.1)
+    assert value is None and error.startswith("GameTimeout")
+    for job, value, error in farm.run(
+            farm.matrix([rc.SCENARIO_PAX_GALLICA], farm.seed_range("1-8")),
+            _bot_game, timeout=0.03):
+        assert value is None and error.startswith("GameTimeout"), job
+
+    total = {"n": 1, "c": Counter(a=1), "l": [1], "s": {1}, "d": {"x": 1}}
+    farm.merge(total, {"n": 2, "c": Counter(a=2), "l": [2], "s": {2},
+                       "d": {"x": 1, "y": 3}, "new": "v"})
+    assert total == {"n": 3, "c": Counter(a=3), "l": [1, 2], "s": {1, 2},
+                     "d": {"x": 2, "y": 3}, "new": "v"}
@@ -0,0 +1,106 @@
+"""Tests for the tribe status index (fs_bot.board.tribes)."""
+import fs_bot.rules_consts as rc
+from fs_bot.board.pieces import count_pieces
+from fs_bot.board.tribes import TribeIndex, tribe_index
+from fs_bot.cards import card_effects as ce
+from fs_bot.commands.seize import get_dispersible_tribes, seize_in_region
+from fs_bot.engine.winter import spring_phase
+from fs_bot.state.setup import setup_scenario
+
+
+def _walk(state, label):
+    """Count ``label`` the slow way, straight from the tribes dict."""
+    n = 0
+    for info in state["tribes"].values():
+        allied, status = info.get("allied_faction"), info.get("status")
+        if label == rc.SUBDUED:
+            n += allied is None and status is None
+        else:
+            n += label in (allied, status)
+    return n
+
+
+def _assert_fresh(state):
+    index = tribe_index(state)
+    assert index.stale(state["tribes"]) == []
+    for label in rc.FACTIONS + (rc.SUBDUED, rc.DISPERSED,
+                                rc.DISPERSED_GATHERING):
+        assert index.count(label) == _walk(state, label), label
+    return index
+
+
+def test_index_matches_tribes_dict():
+    state = setup_scenario(rc.SCENARIO_GREAT_REVOLT, seed=1)
+    index = _assert_fresh(state)
+    assert tribe_index(state) is index
+    for region in state["spaces"]:
+        expected = tuple(t for t, info in state["tribes"].items()
+                         if rc.TRIBE_TO_REGION.get(t) == region
+                         and info["allied_faction"] is None
+                         and info["status"] is None)
+        assert index.tribes(region, rc.SUBDUED) == expected
+    assert index.everywhere(rc.BELGAE) == tuple(
+        t for t, info in state["tribes"].items()
+        if info["allied_faction"] == rc.BELGAE)
+    assert index.labels("no such tribe") == frozenset()
+    assert index.is_open("no such tribe")
+
+
+def test_mutators_keep_the_index_in_place():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    index = tribe_index(state)
+    tribe = index.everywhere(rc.SUBDUED)[0]
+    region = rc.TRIBE_TO_REGION[tribe]
+    stamps = index.stamp(), index.stamp(region)
+    assert ce._ally_tribe(state, tribe, rc.AEDUI)
+    assert index.labels(tribe) == {rc.AEDUI}
+    assert index.stamp() > stamps[0] and index.stamp(region) > stamps[1]
+    assert not index.is_open(tribe)
+    assert tribe in index.tribes(region, rc.AEDUI)
+    assert ce._unally_tribe(state, tribe) == rc.AEDUI
+    assert index.labels(tribe) == {rc.SUBDUED}
+
+    region = next(r for r in state["spaces"]
+                  if count_pieces(state, r, rc.ROMANS)
+                  and get_dispersible_tribes(state, r, as_if_control=True))
+    target = get_dispersible_tribes(state, region, as_if_control=True)[:1]
+    seize_in_region(state, region, target, as_if_control=True)
+    assert index.tribes(region, rc.DISPERSED) == tuple(target)
+    spring_phase(state)
+    assert index.tribes(region, rc.DISPERSED_GATHERING) == tuple(target)
+    spring_phase(state)
+    assert set(target) <= set(index.tribes(region, rc.SUBDUED))
+    assert tribe_index(state) is index
+    _assert_fresh(state)
+
+
+def test_colony_tribe_indexed_in_its_region():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=3)
+    before = tribe_index(state).count(rc.ARVERNI)
+    state["executing_faction"] = rc.ARVERNI
+    state["event_params"] = {"region": rc.ARVERNI_REGION}
+    ce.execute_event(state, 71, shaded=False)
+    colony = f"Colony_{rc.ARVERNI_REGION}"
+    index = _assert_fresh(state)
+    assert index.count(rc.ARVERNI) == before + 1
+    assert colony in index.tribes(rc.ARVERNI_REGION, rc.ARVERNI)
+
+
+def test_unannounced_writes():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    index = tribe_index(state)
+    tribe = index.everywhere(rc.SUBDUED)[0]
+    region = rc.TRIBE_TO_REGION[tribe]
+    stamp = index.stamp(region)
+    # A direct write, no tribe_changed: the next lookup re-indexes it.
+    state["tribes"][tribe]["allied_faction"] = rc.BELGAE
+    assert tribe_index(state) is index
+    assert index.labels(tribe) == {rc.BELGAE}
+    assert index.stamp(region) > stamp
+    _assert_fresh(state)
+    stamp = index.stamp()
+    assert index.sync(state["tribes"]) == [] and index.stamp() == stamp
+    # A replaced tribes dict (rollback, restore) is indexed afresh.
+    state["tribes"] = {t: dict(info) for t, info in state["tribes"].items()}
+    assert tribe_index(state) is not index
+    assert isinstance(tribe_index(state), TribeIndex)
@@ -0,0 +1,152 @@
+"""Tests for what-if victory scoring (fs_bot.engine.victory_whatif)."""
+import copy
+import random
+
+import pytest
+
+import fs_bot.rules_consts as rc
+from fs_bot.bench.corpus import load_corpus
+from fs_bot.board.control import calculate_control
+from fs_bot.board.pieces import bump_board_version, count_pieces
+from fs_bot.board.tribes import tribe_changed
+from fs_bot.engine.victory import (
+    calculate_victory_margin, calculate_victory_score, check_victory,
+    _get_victory_factions,
+)
+from fs_bot.engine.victory_whatif import (
+    ControlDelta, Outcome, PieceDelta, TribeDelta, VictoryTally, what_if,
+)
+from fs_bot.state.setup import setup_scenario
+
+_TYPES = (rc.ALLY, rc.CITADEL, rc.SETTLEMENT, rc.LEGION, rc.FORT,
+          rc.WARBAND, rc.AUXILIA)
+
+
+def _apply(state, candidate):
+    """Make ``candidate`` happen on ``state`` the slow way."""
+    touched = set()
+    for d in candidate:
+        if isinstance(d, TribeDelta):
+            info = state["tribes"][d.tribe]
+            info["allied_faction"], info["status"] = d.allied_faction, d.status
+            tribe_changed(state, d.tribe)
+        elif isinstance(d, PieceDelta):
+            fp = state["spaces"][d.region]["pieces"].setdefault(d.faction, {})
+            if d.piece_type in rc.FLIPPABLE_PIECES:
+                fp = fp.setdefault(rc.HIDDEN, {})
+            fp[d.piece_type] = fp.get(d.piece_type, 0) + d.count
+            if d.piece_type == rc.LEGION:
+                state["fallen_legions"] = state.get("fallen_legions", 0) \
+                    - d.count
+            touched.add(d.region)
+    for region in touched:
+        state["spaces"][region]["control"] = calculate_control(state, region)
+    for d in candidate:
+        if isinstance(d, ControlDelta):
+            state["spaces"][d.region]["control"] = (
+                rc.NO_CONTROL if d.faction is None
+                else rc.FACTION_CONTROL[d.faction])
+    bump_board_version(state)
+
+
+def _expected(state):
+    return {f: Outcome(calculate_victory_score(state, f),
+                       calculate_victory_margin(state, f),
+                       check_victory(state, f))
+            for f in _get_victory_factions(state)}
+
+
+def _random_delta(rng, state):
+    region = rng.choice(list(state["spaces"]))
+    kind = rng.randrange(3)
+    if kind == 0:
+        tribe = rng.choice(list(state["tribes"]))
+        allied = rng.choice((None,) + rc.FACTIONS)
+        status = rng.choice((None, None, rc.DISPERSED,
+                             rc.DISPERSED_GATHERING))
+        return TribeDelta(tribe, allied, status)
+    if kind == 1:
+        faction = rng.choice(rc.FACTIONS)
+        pt = rng.choice(_TYPES)
+        have = count_pieces(state, region, faction, pt)
+        return PieceDelta(region, faction, pt,
+                          rng.choice([n for n in (-2, -1, 1, 3)
+                                      if have + n >= 0]))
+    return ControlDelta(region, rng.choice((None,) + rc.FACTIONS))
+
+
+@pytest.mark.parametrize("name,state", load_corpus())
+def test_outcomes_match_applying_the_change(name, state):
+    rng = random.Random(name)
+    tally = VictoryTally(state)
+    assert tally.outcomes() == _expected(state)
+    candidates = []
+    for _ in range(40):
+        candidates.append(tuple(_random_delta(rng, state)
+                                for _ in range(rng.randint(1, 3))))
+    results = tally.what_if(candidates)
+    for candidate, got in zip(candidates, results):
+        sim = copy.deepcopy(state)
+        _apply(sim, candidate)
+        assert got == _expected(sim), candidate
+    assert VictoryTally(state).outcomes() == _expected(state)   # untouched
+
+
+def test_single_delta_and_helper():
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    tribe = next(t for t, info in state["tribes"].items()
+                 if info["allied_faction"] is None and info["status"] is None)
+    base, allied = what_if(state, [(), TribeDelta(tribe, rc.AEDUI)])
+    assert allied[rc.AEDUI].score == base[rc.AEDUI].score + 1
+    assert allied[rc.ROMANS].score == base[rc.ROMANS].score - 1
+    with pytest.raises(TypeError):
+        VictoryTally(state).outcomes([("ally", tribe)])
+
+
+def test_would_advance_player_victory_with_candidate():
+    from fs_bot.bots.bot_common import would_advance_player_victory
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    state["non_player_factions"] = set(rc.FACTIONS) - {rc.AEDUI}
+    tally = VictoryTally(state)
+    open_tribes = [t for t, info in state["tribes"].items()
+                   if info["allied_faction"] is None
+                   and info["status"] is None]
+    # Ally open Tribes to the Aedui until one more would win.
+    allied = []
+    while not tally.outcomes(tuple(allied))[rc.AEDUI].wins:
+        allied.append(TribeDelta(open_tribes[len(allied)], rc.AEDUI))
+    assert would_advance_player_victory(state, rc.ROMANS, rc.AEDUI,
+                                        tuple(allied))
+    assert not would_advance_player_victory(state, rc.ROMANS, rc.AEDUI,
+                                            tuple(allied[:-1]))
+    assert not would_advance_player_victory(state, rc.AEDUI, rc.ROMANS,
+                                            tuple(allied))   # NP faction
+    assert would_advance_player_victory(state, rc.ROMANS, rc.AEDUI,
+                                        tuple(allied), tally=tally)
+    # A malformed candidate is an error, not a silent "no".
+    with pytest.raises(TypeError):
+        would_advance_player_victory(state, rc.ROMANS, rc.AEDUI,
+                                     ("ally",), tally=tally)
+
+
+def test_frost_restricted_scores_a_batch_on_one_tally(monkeypatch):
+    from fs_bot.bots import bot_common
+    state = setup_scenario(rc.SCENARIO_PAX_GALLICA, seed=1)
+    state["non_player_factions"] = set(rc.FACTIONS) - {rc.AEDUI}
+    open_tribes = [t for t, info in state["tribes"].items()
+                   if info["allied_faction"] is None
+                   and info["status"] is None]
+    allied = []
+    tally = VictoryTally(state)
+    while not tally.outcomes(tuple(allied))[rc.AEDUI].wins:
+        allied.append(TribeDelta(open_tribes[len(allied)], rc.AEDUI))
+    candidates = [(), tuple(allied[:-1]), tuple(allied)]
+    assert bot_common.frost_restricted(state, candidates) == [False] * 3
+
+    state["frost"] = True
+    built = []
+    monkeypatch.setattr(bot_common, "VictoryTally",
+                        lambda st: built.append(st) or VictoryTally(st))
+    assert bot_common.frost_restricted(state, candidates) == [
+        False, False, True]
+    assert len(built) == 1
@@ -87,6 +87,7 @@ from fs_bot.engine.winter import (
     _senate_auxilia,
     _quarters_german_relocation,
     _quarters_gallic_desertion,
+    WinterLedger,
 )
 from fs_bot.engine.victory import calculate_victory_score
 
@@ -804,3 +805,71 @@ def test_player_rome_quarters_defaults_to_np_plan_not_roll_for_all():
     # the same plan applied (roll-for-all would lose more on average;
     # deterministic seed makes this exact).
     assert game(np_rome=False) == game(np_rome=True)
+
+
+# ============================================================================
+# TEST: WINTER LEDGER
+# ============================================================================
+
+def _assert_ledger_current(ledger, state):
+    fresh = WinterLedger(state)
+    for field in ("allies", "subdued", "dispersed", "citadels",
+                  "settlements", "devastated"):
+        assert getattr(ledger, field) == getattr(fresh, field), field
+    for region in state["spaces"]:
+        assert ledger.roman_forces(region) == fresh.roman_forces(region)
+    # Spring re-checks each entry, so a superset is enough.
+    assert fresh.exposed <= ledger.exposed
+
+
+class TestWinterLedger:
+    """WinterLedger tallies agree with the board they were taken from and
+    stay current through a Winter Round."""
+
+    def test_tallies_match_victory_counts(self):
+        state = make_state(SCENARIO_ARIOVISTUS)
+        set_tribe_allied(state, TRIBE_ARVERNI, ARVERNI)
+        place_piece(state, ARVERNI_REGION, ARVERNI, CITADEL)
+        ledger = WinterLedger(state)
+        assert ledger.roman_score() == calculate_victory_score(state, ROMANS)
+        assert ledger.citadels[ARVERNI] == 1
+        assert ledger.allies[ARVERNI] >= 1
+
+    def test_quarters_moves_keep_ledger_current(self):
+        state = make_state()
+        place_piece(state, MANDUBII, ROMANS, LEGION, 2,
+                    from_legions_track=True)
+        place_piece(state, MANDUBII, ROMANS, AUXILIA, 3)
+        flip_piece(state, MANDUBII, ROMANS, AUXILIA, count=1,
+                   from_state=HIDDEN, to_state=REVEALED)
+        place_piece(state, CARNUTES, BELGAE, WARBAND, 4)
+        mark_devastated(state, CARNUTES)
+        ledger = WinterLedger(state)
+        quarters_phase(state, relocations={
+            ROMANS: [(LEGION, MANDUBII, PROVINCIA, 2),
+                     (AUXILIA, MANDUBII, PROVINCIA, 3)],
+        }, ledger=ledger)
+        assert ledger.roman_forces(MANDUBII) == (0, 0)
+        assert (PROVINCIA, ROMANS) in ledger.exposed
+        _assert_ledger_current(ledger, state)
+
+    @pytest.mark.parametrize("scenario", [
+        SCENARIO_PAX_GALLICA, SCENARIO_ARIOVISTUS, SCENARIO_GALLIC_WAR,
+    ])
+    def test_ledger_current_at_spring_in_bot_games(self, scenario,
+                                                   monkeypatch):
+        import fs_bot.engine.winter as winter
+        from fs_bot.tools import farm
+        checked = []
+        real_spring = winter.spring_phase
+
+        def checking_spring(state, ledger=None):
+            if ledger is not None:  # the Interlude's Spring takes its own
+                _assert_ledger_current(ledger, state)
+                checked.append(state["winter_count"])
+            return real_spring(state, ledger)
+
+        monkeypatch.setattr(winter, "spring_phase", checking_spring)
+        for seed in (1, 2):
+            farm.play_game(scenario, seed)
+        assert checked
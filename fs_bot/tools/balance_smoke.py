@@ -9,6 +9,8 @@ After an *intended* change, refresh with ``--update``.
     python -m fs_bot.tools.balance_smoke              # check (exit 1 on drift)
     python -m fs_bot.tools.balance_smoke --update     # rebaseline
     python -m fs_bot.tools.balance_smoke --seeds 1-5  # quicker spot check
+    python -m fs_bot.tools.balance_smoke --db results.db  # also record games
+    python -m fs_bot.tools.balance_smoke --jobs 8     # parallel (fs_bot.tools.farm)
 
 Caught during bring-up: The Great Revolt is Arverni-won in every bot-only game
 (see QUESTIONS.md Q12). A guardrail makes any future shift in that pattern
@@ -17,8 +19,6 @@ visible immediately.
 from __future__ import annotations
 
 import argparse
-import contextlib
-import io
 import json
 import os
 import sys
@@ -35,10 +35,7 @@ if os.environ.get("PYTHONHASHSEED") != _HASHSEED and __name__ == "__main__":
                               "fs_bot.tools.balance_smoke"] + sys.argv[1:])
 
 import fs_bot.rules_consts as rc
-from fs_bot.state.setup import setup_scenario
-from fs_bot.engine.game_engine import run_game, ACTION_EVENT, get_sop_factions
-from fs_bot.bots.bot_dispatch import dispatch_bot_turn
-from fs_bot.cli.dispatcher import _translate_bot_action
+from fs_bot.tools import farm, results_db
 
 BASELINE_PATH = Path(__file__).resolve().parent / "balance_baseline.json"
 SCENARIOS = (rc.SCENARIO_PAX_GALLICA, rc.SCENARIO_RECONQUEST,
@@ -46,29 +43,15 @@ SCENARIOS = (rc.SCENARIO_PAX_GALLICA, rc.SCENARIO_RECONQUEST,
 FACTIONS = (rc.ROMANS, rc.ARVERNI, rc.AEDUI, rc.BELGAE)
 
 
-def play_bot_game(scenario, seed):
-    st = setup_scenario(scenario, seed=seed)
-    st["non_player_factions"] = set(get_sop_factions(st))
+def _bot_game(job):
+    return results_db.summarize(farm.play_game(job["scenario"], job["seed"]))
 
-    def decision_func(state, faction, options, position):
-        state["current_card_id"] = state.get("current_card")
-        state["is_second_eligible"] = (position == "2nd_eligible")
-        state["can_play_event"] = (ACTION_EVENT in options)
-        ba = dispatch_bot_turn(state, faction)
-        return {"action": _translate_bot_action(ba, options), "bot_action": ba}
 
-    with contextlib.redirect_stdout(io.StringIO()):
-        res = run_game(st, decision_func=decision_func, execute=True)
-    winner = None
-    for cr in res["card_results"]:
-        if cr.get("winner"):
-            winner = cr["winner"]
-    return {"winner": winner or "none", "cards": res["total_cards_played"]}
-
-
-def _seed_range(spec):
-    lo, _, hi = spec.partition("-")
-    return range(int(lo), int(hi or lo) + 1)
+def play_bot_game(scenario, seed, db=None):
+    r = _bot_game({"scenario": scenario, "seed": seed})
+    if db is not None:
+        results_db.record_game(db, "balance_smoke", "BOTS", scenario, seed, r)
+    return {"winner": r["winner"] or "none", "cards": r["cards"]}
 
 
 def _rates(games, scenario):
@@ -85,21 +68,38 @@ def main(argv=None) -> int:
     ap.add_argument("--band", type=float, default=0.15)
     ap.add_argument("--update", action="store_true")
     ap.add_argument("--baseline", default=str(BASELINE_PATH))
+    ap.add_argument("--db", default=None,
+                    help="Also record games in this results database.")
+    farm.add_arguments(ap)
     args = ap.parse_args(argv)
+    db = results_db.connect(args.db) if args.db else None
 
     scenarios = [s for s in args.scenarios.split("|") if s]
-    seeds = _seed_range(args.seeds)
+    seeds = farm.seed_range(args.seeds)
     bpath = Path(args.baseline)
     baseline = json.loads(bpath.read_text()) if bpath.exists() else {"games": {}}
 
     current = {}
-    for scen in scenarios:
-        for seed in seeds:
-            key = f"{scen}|{seed}"
-            r = play_bot_game(scen, seed)
-            current[key] = r
-            print(f"[{scen} seed={seed:2d}] winner={r['winner']} "
-                  f"({r['cards']} cards)")
+    errors = []
+    for job, r, err in farm.run(farm.matrix(scenarios, seeds), _bot_game,
+                                workers=args.jobs, timeout=args.timeout,
+                                progress=args.progress,
+                                memory=args.memory):
+        scen, seed = job["scenario"], job["seed"]
+        if err:
+            errors.append(f"{scen}|{seed}")
+            print(f"[{scen} seed={seed:2d}] ERROR {err}")
+            continue
+        if db is not None:
+            results_db.record_game(db, "balance_smoke", "BOTS", scen, seed, r)
+        current[f"{scen}|{seed}"] = {"winner": r["winner"] or "none",
+                                     "cards": r["cards"]}
+        print(f"[{scen} seed={seed:2d}] winner={r['winner'] or 'none'} "
+              f"({r['cards']} cards)")
+    if errors:
+        print(f"\nFAIL: {len(errors)} game(s) did not finish: "
+              f"{', '.join(errors)}")
+        return 1
 
     if args.update:
         baseline["games"].update(current)
@@ -14,6 +14,12 @@ flowchart legally declining:
                       IF-NONE fall-through (nothing marchable, command produced
                       no legal effect): NOT a defect.
 
+Incidents are counted by their integer error code (fs_bot.engine.error_codes)
+in a fixed-size array, and severity is the code's table entry. The executor
+codes every refusal site, so an incident's defect class is its code name;
+only incidents that arrive without a specific code (crashes, and the
+generic entry/refusal codes) are broken down by normalized message.
+
 This is the acceptance instrument for the planner-quality backlog in
 QUESTIONS.md ("OPEN — planner quality").
 
@@ -23,17 +29,14 @@ QUESTIONS.md ("OPEN — planner quality").
 from __future__ import annotations
 
 import argparse
-import contextlib
-import io
 import json
 import re
 from collections import Counter
 
 import fs_bot.rules_consts as rc
-from fs_bot.state.setup import setup_scenario
-from fs_bot.engine.game_engine import run_game, ACTION_EVENT, get_sop_factions
-from fs_bot.bots.bot_dispatch import dispatch_bot_turn
-from fs_bot.cli.dispatcher import _translate_bot_action
+from fs_bot.engine import error_codes as ec
+from fs_bot.engine import events
+from fs_bot.tools import farm, results_db
 
 ALL_SCENARIOS = (rc.SCENARIO_PAX_GALLICA, rc.SCENARIO_GREAT_REVOLT,
                  rc.SCENARIO_RECONQUEST, rc.SCENARIO_ARIOVISTUS,
@@ -49,96 +52,52 @@ def _norm(msg):
     return s
 
 
-def play_game(scenario, seed):
-    st = setup_scenario(scenario, seed=seed)
-    st["non_player_factions"] = set(get_sop_factions(st))
+def play_game(scenario, seed, db=None):
+    res = farm.play_game(scenario, seed)
+    if db is not None:
+        results_db.record_run(db, "error_census", "BOTS", scenario, seed, res)
+    return res
 
-    def decision_func(state, faction, options, position):
-        state["current_card_id"] = state.get("current_card")
-        state["is_second_eligible"] = (position == "2nd_eligible")
-        state["can_play_event"] = (ACTION_EVENT in options)
-        ba = dispatch_bot_turn(state, faction)
-        return {"action": _translate_bot_action(ba, options), "bot_action": ba}
 
-    with contextlib.redirect_stdout(io.StringIO()):
-        res = run_game(st, decision_func=decision_func, execute=True)
-    return res
+# Codes that stand in for a missing one: the message is all that tells
+# their incidents apart, so each distinct one is its own defect class.
+# Every other code is one class.
+_UNCODED = frozenset({ec.E_UNKNOWN, ec.E_CRASH, ec.E_COMMAND_ENTRY,
+                      ec.E_SA_ENTRY, ec.E_COMMAND_REFUSED})
 
 
-def census_result(res, counts, examples, scenario, seed):
-    for cr in res["card_results"]:
-        tr = cr.get("turn_result") or {}
-        for faction, rec in (tr.get("actions_taken") or {}).items():
-            ex = rec.get("execution")
-            ba = rec.get("bot_action") or {}
-            if not isinstance(ex, dict):
-                continue
-            _walk(ex, faction, ba.get("command"), ba.get("sa"),
-                  counts, examples, scenario, seed, cr.get("card"))
+def _detail(code, msg):
+    return _norm(msg) if code in _UNCODED else ec.NAMES[code]
 
 
-def _walk(ex, faction, cmd, sa, counts, examples, scenario, seed, card):
-    for e in ex.get("errors") or []:
-        key = (faction, cmd, "command-error", _norm(e))
-        counts[key] += 1
-        examples.setdefault(key, (scenario, seed, card, str(e)))
-    if ex.get("executed") is False and ex.get("reason"):
-        key = (faction, cmd, "command-refused", _norm(ex["reason"]))
-        counts[key] += 1
-        examples.setdefault(key, (scenario, seed, card, str(ex["reason"])))
-    if ex.get("sa_skipped"):
-        key = (faction, cmd, "sa-skipped", _norm(ex["sa_skipped"]))
+def _census_game(job):
+    """Farm game: one game's census, merged into the totals by the parent.
+    Incidents arrive as ISSUE records on the engine event stream."""
+    by_code, counts, examples = ec.counter(), Counter(), {}
+    scenario, seed = job["scenario"], job["seed"]
+
+    def on_issue(ev):
+        d = ev.data
+        code = d["error"]
+        by_code[code] += 1
+        key = (ev.faction, d["source"], d["code"], code,
+               _detail(code, d["message"]))
         counts[key] += 1
-        examples.setdefault(key, (scenario, seed, card, str(ex["sa_skipped"])))
-    sx = ex.get("sa_execution")
-    if isinstance(sx, dict):
-        for e in sx.get("errors") or []:
-            key = (faction, f"{cmd}+{sa}", "sa-error", _norm(e))
-            counts[key] += 1
-            examples.setdefault(key, (scenario, seed, card, str(e)))
-        if sx.get("executed") is False:
-            if sx.get("declined_no_effect"):
-                # The flowchart's own "If none ... no Special Ability"
-                # outcome (e.g. R_BUILD/R_SCOUT) — a legal decline, not a
-                # refused proposal.
-                return
-            why = sx.get("reason") or ("no effect" if not sx.get("actions")
-                                       and not sx.get("regions") else "?")
-            key = (faction, f"{cmd}+{sa}", "sa-no-effect", _norm(why))
-            counts[key] += 1
-            examples.setdefault(key, (scenario, seed, card, str(why)))
-
-
-_SEVERITY_ORDER = ("illegal", "wasteful-sa", "ineffective-event",
-                  "legal-decline", "other-refused")
-
-# Reason substrings (post-_norm) that mark a Command refusal as the published
-# flowchart legally declining rather than a defect.
-_LEGAL_DECLINE_REASONS = (
-    "nothing marchable",          # expand/mass/spread March IF-NONE fall-through
-    "no legal effect",            # "command produced no legal effect"
-    "no trade or suborn at sa",   # Aedui §8.6.3 "at that moment" decline
-    "no intimidate or settle",    # German A8.7.1 decline
-    "if none",                    # generic flowchart IF-NONE text
-)
+        examples.setdefault(key, (scenario, seed, ev.card, d["message"]))
+
+    with events.subscribe(on_issue, kinds={events.ISSUE}):
+        res = farm.play_game(scenario, seed)
+    return {"by_code": by_code, "counts": counts, "examples": examples,
+            "record": results_db.summarize(res)}
+
+
+_SEVERITY_ORDER = ec.SEVERITIES
 
 
 def _severity(kind, msg):
-    """Bucket one census incident by severity (see module docstring)."""
-    if kind in ("command-error", "sa-error"):
-        return "illegal"
-    if kind == "sa-no-effect":
-        return "wasteful-sa"
-    if kind == "sa-skipped":
-        return "legal-decline"
-    if kind == "command-refused":
-        low = str(msg).lower()
-        if any(r in low for r in _LEGAL_DECLINE_REASONS):
-            return "legal-decline"
-        if "event not applicable" in low:
-            return "ineffective-event"
-        return "other-refused"   # an unexpected refusal — surfaced, not hidden
-    return "other-refused"
+    """Bucket one ISSUE (its kind and message) by severity (see module
+    docstring)."""
+    return ec.SEVERITY[events.error_code(kind, msg)]
 
 
 def main(argv=None) -> int:
@@ -147,7 +106,10 @@ def main(argv=None) -> int:
                     help="single scenario (default: all five)")
     ap.add_argument("--seeds", default="1-10")
     ap.add_argument("--out", default=None, help="write JSON detail here")
+    ap.add_argument("--db", default=None,
+                    help="Also record games in this results database.")
     ap.add_argument("--top", type=int, default=60)
+    farm.add_arguments(ap)
     ap.add_argument("--illegal-only", action="store_true",
                     help="list only 'illegal' defects (hide wasteful/legal)")
     ap.add_argument("--strict", action="store_true",
@@ -156,25 +118,44 @@ def main(argv=None) -> int:
                          "CI soak gating; legal-decline never fails")
     args = ap.parse_args(argv)
 
-    lo, _, hi = args.seeds.partition("-")
-    seeds = range(int(lo), int(hi or lo) + 1)
+    seeds = farm.seed_range(args.seeds)
     scenarios = (args.scenario,) if args.scenario else ALL_SCENARIOS
+    db = results_db.connect(args.db) if args.db else None
 
-    counts = Counter()
-    examples = {}
+    totals = {"counts": Counter(), "examples": {}}
+    by_code = ec.counter()
     games = 0
-    for sc in scenarios:
-        for seed in seeds:
-            census_result(play_game(sc, seed), counts, examples, sc, seed)
-            games += 1
-
-    total = sum(counts.values())
+    for job, part, err in farm.run(farm.matrix(scenarios, seeds),
+                                   _census_game, workers=args.jobs,
+                                   timeout=args.timeout,
+                                   progress=args.progress,
+                                   memory=args.memory):
+        if err:
+            # A crashed or timed-out game is surfaced as an incident.
+            key = ("-", "-", "crash", ec.E_CRASH, _norm(err))
+            by_code[ec.E_CRASH] += 1
+            totals["counts"][key] += 1
+            totals["examples"].setdefault(
+                key, (job["scenario"], job["seed"], None, err))
+            continue
+        record = part.pop("record")
+        if db is not None:
+            results_db.record_game(db, "error_census", "BOTS",
+                                   job["scenario"], job["seed"], record)
+        for code, n in enumerate(part.pop("by_code")):
+            by_code[code] += n
+        farm.merge(totals, part)
+        games += 1
+    counts, examples = totals["counts"], totals["examples"]
+
+    total = sum(by_code)
 
     # Aggregate by severity tier.
     by_sev = Counter()
-    for key, n in counts.items():
-        by_sev[_severity(key[2], key[3])] += n
-    illegal = by_sev.get("illegal", 0)
+    for code, n in enumerate(by_code):
+        if n:
+            by_sev[ec.SEVERITY[code]] += n
+    illegal = by_sev.get(ec.ILLEGAL, 0)
 
     print(f"games={games}  total_incidents={total}  "
           f"illegal={illegal}  (defects to drive to zero)")
@@ -186,10 +167,10 @@ def main(argv=None) -> int:
     items = counts.most_common()
     if args.illegal_only:
         items = [(k, n) for k, n in items
-                 if _severity(k[2], k[3]) == "illegal"]
+                 if ec.SEVERITY[k[3]] == ec.ILLEGAL]
     for key, n in items[:args.top]:
-        faction, cmd, kind, msg = key
-        sev = _severity(kind, msg)
+        faction, cmd, kind, code, msg = key
+        sev = ec.SEVERITY[code]
         print(f"{n:6d}  [{sev:15s}] {faction:8s} {cmd or '-':22s} "
               f"{kind:15s} {msg}")
         sc, seed, card, raw = examples[key]
@@ -198,17 +179,17 @@ def main(argv=None) -> int:
         with open(args.out, "w") as f:
             json.dump({"games": games, "total": total,
                        "by_severity": dict(by_sev),
+                       "by_code": {ec.NAMES[c]: n
+                                   for c, n in enumerate(by_code) if n},
                        "illegal": illegal,
                        "counts": [{"faction": k[0], "command": k[1],
-                                   "kind": k[2],
-                                   "severity": _severity(k[2], k[3]),
-                                   "msg": k[3], "n": n}
+                                   "kind": k[2], "code": ec.NAMES[k[3]],
+                                   "severity": ec.SEVERITY[k[3]],
+                                   "msg": k[4], "n": n}
                                   for k, n in counts.most_common()]}, f,
                       indent=1)
     if args.strict:
-        defects = (by_sev.get("illegal", 0) + by_sev.get("wasteful-sa", 0)
-                   + by_sev.get("ineffective-event", 0)
-                   + by_sev.get("other-refused", 0))
+        defects = total - by_sev.get(ec.LEGAL_DECLINE, 0)
         return min(defects, 250)
     return 0
 
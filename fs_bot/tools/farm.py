@@ -0,0 +1,226 @@
+"""Game farm — the one bot-game loop behind every batch tool.
+
+The batch tools all play the same kind of game: set up a scenario, let the
+NP bots (``bot_dispatch.dispatch_bot_turn``) take every seat that no policy
+occupies, and ``run_game`` to the end with engine chatter suppressed. This
+module holds that loop once, plus a runner for job matrices:
+
+    jobs = farm.matrix(scenarios, seeds, labels)
+    for job, value, error in farm.run(jobs, my_game, workers=8, timeout=300):
+        ...
+
+``my_game(job)`` runs in a worker and returns a small picklable value
+(a per-game record or per-game statistics); ``run`` yields the values back
+in job order, so output is identical whatever the worker count, and
+:func:`merge` folds per-game statistics into the parent's totals. Worker
+processes are started once and import the engine up front (warm), and each
+game gets a wall-clock budget (``GameTimeout``, reported as the job's
+error). ``progress=True`` prints a done/total/ETA line to stderr.
+``memory=True`` profiles each game with fs_bot.bench.memory, stores its
+report as ``job["memory"]`` and prints per-game and batch memory lines
+to stderr.
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import multiprocessing
+import signal
+import sys
+import time
+from collections import Counter
+
+from fs_bot.state.setup import setup_scenario
+from fs_bot.state.rng import RNG_MT
+from fs_bot.board.compact import PIECES_DICT
+from fs_bot.engine.game_engine import run_game, get_sop_factions
+# bot_decision is re-exported: the drivers and tools take it from here.
+from fs_bot.bots.bot_dispatch import bot_decision
+
+
+class GameTimeout(BaseException):
+    """A farm game overran its wall-clock budget. A BaseException so the
+    engine's defensive ``except Exception`` handlers let it pass instead of
+    carrying on with a truncated game."""
+
+
+# ---------------------------------------------------------------------------
+# One game
+# ---------------------------------------------------------------------------
+
+def decision_func(seats=None, on_bot=None):
+    """A ``decision_func`` giving each Faction in ``seats`` to its planner
+    (``planner(state, faction, options, position)``) and every other seat
+    to the bots. ``on_bot(state, faction, bot_action)`` sees each bot
+    decision before it is returned."""
+    seats = seats or {}
+
+    def decide(state, faction, options, position):
+        planner = seats.get(faction)
+        if planner is not None:
+            return planner(state, faction, options, position)
+        decision = bot_decision(state, faction, options, position)
+        if on_bot is not None:
+            on_bot(state, faction, decision["bot_action"])
+        return decision
+    return decide
+
+
+def new_game(scenario, seed, players=(), rng_backend=RNG_MT,
+             piece_backend=PIECES_DICT):
+    """Set up ``scenario`` at ``seed``; Factions in ``players`` are taken
+    out of ``non_player_factions``."""
+    st = setup_scenario(scenario, seed=seed, rng_backend=rng_backend,
+                        piece_backend=piece_backend)
+    st["non_player_factions"] = set(get_sop_factions(st)) - set(players)
+    return st
+
+
+def play_game(scenario, seed, decide=None, *, state=None):
+    """Run one whole game (bots everywhere unless ``decide`` is given) with
+    engine output suppressed; returns the ``run_game`` result."""
+    st = state if state is not None else new_game(scenario, seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run_game(st, decision_func=decide or bot_decision,
+                        execute=True)
+
+
+def winner_of(res):
+    """The winning Faction recorded in a ``run_game`` result, or None."""
+    winner = None
+    for cr in res["card_results"]:
+        if cr.get("winner"):
+            winner = cr["winner"]
+    return winner
+
+
+# ---------------------------------------------------------------------------
+# Job matrices
+# ---------------------------------------------------------------------------
+
+def seed_range(spec):
+    """``"1-20"`` -> ``range(1, 21)``; ``"7"`` -> ``range(7, 8)``."""
+    lo, _, hi = spec.partition("-")
+    return range(int(lo), int(hi or lo) + 1)
+
+
+def matrix(scenarios, seeds, labels=(None,)):
+    """Jobs for every label x scenario x seed, in that nesting order. A
+    label names the seat assignment and policy; the game function decides
+    what it means."""
+    return [{"label": label, "scenario": scenario, "seed": seed}
+            for label in labels for scenario in scenarios for seed in seeds]
+
+
+def merge(total, part):
+    """Fold one game's statistics into ``total`` in place: Counters and
+    numbers add, lists extend, sets union, dicts merge recursively (a key
+    ``total`` lacks is copied over; other values keep the first seen).
+    Returns ``total``."""
+    for key, value in part.items():
+        if key not in total:
+            total[key] = value
+        elif isinstance(value, Counter):
+            total[key].update(value)
+        elif isinstance(value, dict):
+            merge(total[key], value)
+        elif isinstance(value, list):
+            total[key].extend(value)
+        elif isinstance(value, set):
+            total[key] |= value
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            total[key] += value
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+def _on_alarm(signum, frame):
+    raise GameTimeout("game exceeded its time budget")
+
+
+def _call(task):
+    """Run ``game(job)`` under an optional SIGALRM budget and memory
+    profile; never raises. Returns (value, error, memory report)."""
+    game, job, timeout, memory = task
+    timed = timeout and hasattr(signal, "setitimer")
+    if timed:
+        old = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        if not memory:
+            return game(job), None, None
+        from fs_bot.bench import memory as _memory
+        with _memory.profiling(snapshots=False) as prof:
+            value = game(job)
+        return value, None, prof.report()
+    except (Exception, GameTimeout) as exc:
+        return None, f"{type(exc).__name__}: {exc}", None
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old)
+
+
+def _warm():
+    """Worker initializer: import the engine, bots and card tables once."""
+    import fs_bot.engine.execute  # noqa: F401
+    import fs_bot.cards.card_effects  # noqa: F401
+    import fs_bot.bots.bot_dispatch  # noqa: F401
+
+
+def run(jobs, game, *, workers=1, timeout=None, progress=False,
+        memory=False):
+    """Yield ``(job, value, error)`` for each job, in job order. ``game``
+    must be picklable (a module-level function) when ``workers`` > 1;
+    ``error`` is ``"Type: message"`` when the game raised or timed out."""
+    jobs = list(jobs)
+    tasks = [(game, job, timeout, memory) for job in jobs]
+    reports = []
+    t0 = time.perf_counter()
+    if workers <= 1:
+        results = map(_call, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.get_context().Pool(
+            min(workers, len(jobs)) or 1, initializer=_warm)
+        results = pool.imap(_call, tasks)
+    try:
+        for k, (job, (value, error, mem)) in enumerate(
+                zip(jobs, results), 1):
+            if mem is not None:
+                from fs_bot.bench.memory import format_report
+                job["memory"] = mem
+                reports.append(mem)
+                print(format_report(mem, f"  [{job.get('scenario')} seed="
+                                         f"{job.get('seed')}] ")
+                      .splitlines()[0], file=sys.stderr)
+            if progress:
+                spent = time.perf_counter() - t0
+                eta = spent / k * (len(jobs) - k)
+                print(f"  [{k}/{len(jobs)}] {spent:.0f}s elapsed, "
+                      f"~{eta:.0f}s left", file=sys.stderr)
+            yield job, value, error
+        if memory:
+            from fs_bot.bench.memory import summarize
+            print(summarize(reports), file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def add_arguments(ap):
+    """The shared ``--jobs`` / ``--timeout`` / ``--progress`` /
+    ``--memory`` flags."""
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="worker processes (default 1: in-process)")
+    ap.add_argument("--timeout", type=float, default=None,
+                    help="per-game wall-clock budget in seconds")
+    ap.add_argument("--progress", action="store_true",
+                    help="print done/total/ETA to stderr")
+    ap.add_argument("--memory", action="store_true",
+                    help="profile each game's memory (tracemalloc; slow) "
+                         "and report it to stderr")
@@ -5,57 +5,64 @@ batches resume for free.
 
     python -m fs_bot.tools.heuristic_selfplay --scenario "The Great Revolt" \
         --seeds 1-20 --out results.jsonl
+
+``--db PATH`` records every game in the shared results database
+(``fs_bot.tools.results_db``) and takes the skip set from it.
+``--jobs N`` / ``--timeout S`` run the games on the shared farm
+(``fs_bot.tools.farm``); records are written in matrix order either way.
+``--tensors DIR`` also dumps each game's board before every decision as a
+fixed-layout trajectory file (``fs_bot.state.encode``), one per game.
 """
 from __future__ import annotations
 
 import argparse
-import contextlib
-import io
 import json
 import time
+from array import array
 from pathlib import Path
 
 import fs_bot.rules_consts as rc
-from fs_bot.state.setup import setup_scenario
-from fs_bot.engine.game_engine import run_game, ACTION_EVENT, get_sop_factions
-from fs_bot.bots.bot_dispatch import dispatch_bot_turn
-from fs_bot.cli.dispatcher import _translate_bot_action
+from fs_bot.state.encode import encode, write_trajectory
+from fs_bot.tools import farm, results_db
 from fs_bot.agents.heuristic import (PROFILES, plan_turn, make_reactive,
                                      RandomPlanPolicy)
 
 FACTIONS = (rc.ROMANS, rc.ARVERNI, rc.AEDUI, rc.BELGAE)
+_TOOL = "heuristic_selfplay"
 
 
-def play_game(scenario, seed, agent_faction=None, planner=None):
-    st = setup_scenario(scenario, seed=seed)
-    st["non_player_factions"] = set(get_sop_factions(st))
+def play_game(scenario, seed, agent_faction=None, planner=None,
+              trajectory=None):
+    """Play one game; when ``trajectory`` is an ``array('h')`` the board is
+    encoded onto it before every decision."""
+    st = farm.new_game(scenario, seed)
     if agent_faction:
         st["decision_agent"] = make_reactive(agent_faction)
 
     decisions = [0]
 
-    def decision_func(state, faction, options, position):
-        if agent_faction and faction == agent_faction:
-            decisions[0] += 1
-            return planner(state, faction, options, position)
-        state["current_card_id"] = state.get("current_card")
-        state["is_second_eligible"] = (position == "2nd_eligible")
-        state["can_play_event"] = (ACTION_EVENT in options)
-        ba = dispatch_bot_turn(state, faction)
-        return {"action": _translate_bot_action(ba, options), "bot_action": ba}
-
-    with contextlib.redirect_stdout(io.StringIO()):
-        res = run_game(st, decision_func=decision_func, execute=True)
-    winner = None
+    def agent(state, faction, options, position):
+        decisions[0] += 1
+        return planner(state, faction, options, position)
+
+    decide = farm.decision_func({agent_faction: agent} if agent_faction
+                                else None)
+    if trajectory is not None:
+        def decide(state, faction, options, position, _inner=decide):
+            encode(state, trajectory)
+            return _inner(state, faction, options, position)
+
+    res = farm.play_game(scenario, seed, decide, state=st)
     ranking = None
     for cr in res["card_results"]:
-        if cr.get("winner"):
-            winner = cr["winner"]
         if cr.get("final_ranking"):
             ranking = cr["final_ranking"]
-    return {"winner": winner, "cards": res["total_cards_played"],
-            "winters": res["winter_count"], "decisions": decisions[0],
-            "ranking": ranking}
+    summary = results_db.summarize(res)
+    return {"winner": summary["winner"], "cards": summary["cards"],
+            "winters": summary["winters"], "decisions": decisions[0],
+            "ranking": ranking,
+            "scores": [[f, m] for f, m, _ in summary["scores"]],
+            "outcomes": summary["outcomes"]}
 
 
 def _make(label, seed):
@@ -65,6 +72,13 @@ def _make(label, seed):
         fac = label.split(":")[1]
         pol = RandomPlanPolicy(fac, seed=seed)
         return fac, pol.plan_turn
+    if label.startswith("MCTS:"):
+        # MCTS:FACTION[:ROLLOUTS] -- search agent with a rollout budget.
+        from fs_bot.agents.mcts import MCTSAgent
+        _, fac, *budget = label.split(":")
+        agent = MCTSAgent(fac, rollouts=int(budget[0]) if budget else 32,
+                          seed=seed)
+        return fac, agent.plan_turn
     prof = PROFILES[label]
     custom = prof.get("planner")
     if custom is not None:
@@ -73,25 +87,58 @@ def _make(label, seed):
                              plan_turn(s, f, _pr, o, p))
 
 
+def _tensor_name(label, scenario, seed):
+    return (f"{label}_{scenario}_{seed}".replace(":", "-")
+            .replace(" ", "_").replace("?", "") + ".fsbt")
+
+
+def _selfplay_game(job):
+    """Farm game: one labelled game, returned as its JSONL record (plus
+    the card outcomes for the results database)."""
+    label, scenario, seed = job["label"], job["scenario"], job["seed"]
+    fac, planner = _make(label, seed)
+    rows = array("h") if job.get("tensors") else None
+    t0 = time.time()
+    r = play_game(scenario, seed, fac, planner, rows)
+    if rows is not None:
+        write_trajectory(Path(job["tensors"]) / _tensor_name(
+            label, scenario, seed), rows)
+    rec = {"label": label, "faction": fac, "scenario": scenario,
+           "seed": seed, **r, "secs": round(time.time() - t0, 2)}
+    agent = getattr(planner, "__self__", None)
+    if hasattr(agent, "rollouts_per_sec"):
+        rec["rollouts"] = agent.stats["rollouts"]
+        rec["rollouts_per_sec"] = agent.rollouts_per_sec()
+    return rec
+
+
 def main(argv=None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--scenario", default=rc.SCENARIO_GREAT_REVOLT)
     ap.add_argument("--seeds", default="1-20")
     ap.add_argument("--profiles", default=None,
-                    help="Comma list of profile names, RANDOM:FACTION, BOTS. "
+                    help="Comma list of profile names, RANDOM:FACTION, "
+                         "MCTS:FACTION[:ROLLOUTS], BOTS. "
                          "Default: all profiles + RANDOM per faction + BOTS.")
     ap.add_argument("--out", default="selfplay_results.jsonl")
+    ap.add_argument("--db", default=None,
+                    help="Also record games in this results database.")
+    ap.add_argument("--tensors", default=None, metavar="DIR",
+                    help="Write per-decision board trajectories here.")
+    farm.add_arguments(ap)
     args = ap.parse_args(argv)
 
-    lo, _, hi = args.seeds.partition("-")
-    seeds = range(int(lo), int(hi or lo) + 1)
+    seeds = farm.seed_range(args.seeds)
     labels = ([s.strip() for s in args.profiles.split(",") if s.strip()]
               if args.profiles else
               list(PROFILES) + [f"RANDOM:{f}" for f in FACTIONS] + ["BOTS"])
 
     out = Path(args.out)
+    db = results_db.connect(args.db) if args.db else None
     done = set()
-    if out.exists():
+    if db is not None:
+        done = results_db.done_keys(db, _TOOL, args.scenario)
+    elif out.exists():
         for line in out.read_text().splitlines():
             try:
                 rec = json.loads(line)
@@ -99,29 +146,34 @@ def main(argv=None) -> int:
             except Exception:
                 pass
 
+    tensors = Path(args.tensors) if args.tensors else None
+    if tensors:
+        tensors.mkdir(parents=True, exist_ok=True)
+
+    jobs = [dict(job, tensors=args.tensors) for job in
+            farm.matrix([args.scenario], seeds, labels)
+            if (job["label"], job["scenario"], job["seed"]) not in done]
     with out.open("a") as fh:
-        for label in labels:
-            for seed in seeds:
-                if (label, args.scenario, seed) in done:
-                    continue
-                fac, planner = _make(label, seed)
-                t0 = time.time()
-                try:
-                    r = play_game(args.scenario, seed, fac, planner)
-                    rec = {"label": label, "faction": fac,
-                           "scenario": args.scenario, "seed": seed, **r,
-                           "secs": round(time.time() - t0, 2)}
-                except Exception as exc:
-                    rec = {"label": label, "faction": fac,
-                           "scenario": args.scenario, "seed": seed,
-                           "winner": None,
-                           "error": f"{type(exc).__name__}: {exc}",
-                           "secs": round(time.time() - t0, 2)}
-                fh.write(json.dumps(rec) + "\n")
-                fh.flush()
-                won = rec.get("winner") == fac
-                print(f"[{label:>14s} seed={seed:2d}] winner={rec.get('winner')}"
-                      f" {'WIN' if won else ''} {rec.get('error', '')}")
+        for job, rec, err in farm.run(jobs, _selfplay_game,
+                                      workers=args.jobs,
+                                      timeout=args.timeout,
+                                      progress=args.progress,
+                                      memory=args.memory):
+            label, seed = job["label"], job["seed"]
+            fac = _make(label, seed)[0]
+            if err:
+                rec = {"label": label, "faction": fac,
+                       "scenario": args.scenario, "seed": seed,
+                       "winner": None, "error": err}
+            outcomes = rec.pop("outcomes", ())
+            if db is not None:
+                results_db.record_game(db, _TOOL, label, args.scenario,
+                                       seed, rec, outcomes=outcomes)
+            fh.write(json.dumps(rec) + "\n")
+            fh.flush()
+            won = rec.get("winner") == fac
+            print(f"[{label:>14s} seed={seed:2d}] winner={rec.get('winner')}"
+                  f" {'WIN' if won else ''} {rec.get('error', '')}")
     return 0
 
 
@@ -37,10 +37,13 @@ from fs_bot.engine.game_engine import (start_game, play_card, ACTION_EVENT,
 from fs_bot.bots.bot_dispatch import dispatch_bot_turn
 from fs_bot.cli.dispatcher import _translate_bot_action
 from fs_bot.engine.agent import RETREAT, LOSS_ORDER, AGREEMENT
-from fs_bot.engine.victory import calculate_victory_score, VictoryError
-from fs_bot.board.pieces import count_pieces, get_leader_in_region
+from fs_bot.board.tribes import tribe_index
+from fs_bot.state.observation import observe, region_view
 from fs_bot.cards.card_data import get_card
 
+_TAGS = {rc.WARBAND: "w", rc.AUXILIA: "x", rc.LEGION: "L", rc.ALLY: "A",
+         rc.CITADEL: "C", rc.FORT: "F", rc.SETTLEMENT: "S"}
+
 
 def reactive_policy(seat):
     def reactive(state, faction, request):
@@ -48,13 +51,9 @@ def reactive_policy(seat):
             return None
         kind = request.get("kind")
         if kind == RETREAT:
-            region = request.get("region")
-            anchors = 0
-            for pt in (rc.ALLY, rc.CITADEL, rc.SETTLEMENT):
-                try:
-                    anchors += count_pieces(state, region, seat, pt)
-                except Exception:
-                    pass
+            view = region_view(state, request.get("region"))
+            anchors = sum(view.count(seat, pt)
+                          for pt in (rc.ALLY, rc.CITADEL, rc.SETTLEMENT))
             if anchors > 0:
                 return {"retreat": False, "region": None}
             legal = request.get("legal_regions") or []
@@ -70,7 +69,9 @@ def reactive_policy(seat):
     return reactive
 
 
-def render_board(state, scenario, options=None, position=None):
+def render_board(state, scenario, options=None, position=None, obs=None):
+    if obs is None:
+        obs = observe(state)
     out = []
     out.append(f"card={state['current_card']} next={state['next_card']} "
                f"winters={state['winter_count']}")
@@ -84,37 +85,22 @@ def render_board(state, scenario, options=None, position=None):
     out.append("res:   " + "  ".join(
         f"{f[:2]}={res.get(f, 0)}" for f in rc.FACTIONS
         if f in res))
-    scores = []
-    for f in rc.FACTIONS:
-        try:
-            scores.append(f"{f[:2]}={calculate_victory_score(state, f)}")
-        except (VictoryError, Exception):
-            pass
-    out.append("score: " + "  ".join(scores))
+    out.append("score: " + "  ".join(f"{f[:2]}={score}"
+                                      for f, score in obs.scores))
     out.append(f"senate: {state.get('senate')}  "
                f"track={state.get('legions_track')} "
                f"fallen={state.get('fallen_legions', 0)}")
-    for r in sorted(state["spaces"]):
-        sp = state["spaces"][r]
+    tribes = tribe_index(state)
+    for r, view in sorted(obs.regions):
         bits = []
         for f in rc.FACTIONS:
-            t = []
-            for pt, tag in ((rc.WARBAND, "w"), (rc.AUXILIA, "x"),
-                            (rc.LEGION, "L"), (rc.ALLY, "A"),
-                            (rc.CITADEL, "C"), (rc.FORT, "F"),
-                            (rc.SETTLEMENT, "S")):
-                n = count_pieces(state, r, f, pt)
-                if n:
-                    t.append(f"{n}{tag}")
-            if get_leader_in_region(state, r, f):
+            t = [f"{n}{_TAGS[pt]}" for f_, pt, n in view.pieces if f_ == f]
+            if view.leader(f):
                 t.append("Ldr")
             if t:
                 bits.append(f"{f[:2]}:{'+'.join(t)}")
-        ctrl = (sp.get("control") or "")[:2]
-        subdued = [t_ for t_, ti in state["tribes"].items()
-                   if ti.get("allied_faction") is None
-                   and ti.get("status") is None
-                   and rc.TRIBE_TO_REGION.get(t_) == r]
+        ctrl = (view.control or "")[:2]
+        subdued = tribes.tribes(r, rc.SUBDUED)
         out.append(f"  {r:12s} [{ctrl:2s}] {'  '.join(bits)}"
                    + (f"  subdued:{','.join(subdued)}" if subdued else ""))
     markers = state.get("markers") or {}
@@ -18,35 +18,26 @@ flowchart text for a fidelity check.
 
     python -m fs_bot.tools.play_quality --seeds 1-20
     python -m fs_bot.tools.play_quality --seeds 1-20 --scenario "Pax Gallica?"
+    python -m fs_bot.tools.play_quality --seeds 1-20 --db results.db
 """
 from __future__ import annotations
 
 import argparse
-import contextlib
-import io
 from collections import Counter, defaultdict
 
 import fs_bot.rules_consts as rc
-from fs_bot.state.setup import setup_scenario
-from fs_bot.engine.game_engine import run_game, ACTION_EVENT, get_sop_factions
-from fs_bot.bots.bot_dispatch import dispatch_bot_turn
-from fs_bot.cli.dispatcher import _translate_bot_action
+from fs_bot.engine import events
+from fs_bot.tools import farm, results_db
 
 ALL_SCENARIOS = (rc.SCENARIO_PAX_GALLICA, rc.SCENARIO_GREAT_REVOLT,
                  rc.SCENARIO_RECONQUEST, rc.SCENARIO_ARIOVISTUS,
                  rc.SCENARIO_GALLIC_WAR)
 
 
-def play_game(scenario, seed, stats):
-    st = setup_scenario(scenario, seed=seed)
-    st["non_player_factions"] = set(get_sop_factions(st))
+def play_game(scenario, seed, stats, db=None):
     sc = stats[scenario]
 
-    def decision_func(state, faction, options, position):
-        state["current_card_id"] = state.get("current_card")
-        state["is_second_eligible"] = (position == "2nd_eligible")
-        state["can_play_event"] = (ACTION_EVENT in options)
-        ba = dispatch_bot_turn(state, faction)
+    def on_bot(state, faction, ba):
         cmd = ba.get("command") or "None"
         sa = ba.get("sa") or "No SA"
         sc["commands"][(faction, cmd)] += 1
@@ -63,38 +54,38 @@ def play_game(scenario, seed, stats):
                 sc["res_zero"][faction] += 1
             if res >= rc.MAX_RESOURCES:
                 sc["res_cap"][faction] += 1
-        return {"action": _translate_bot_action(ba, options),
-                "bot_action": ba}
-
-    with contextlib.redirect_stdout(io.StringIO()):
-        res = run_game(st, decision_func=decision_func, execute=True)
-
-    winner = None
-    for cr in res["card_results"]:
-        if cr.get("winner"):
-            winner = cr["winner"]
-        tr = cr.get("turn_result") or {}
-        for faction, rec in (tr.get("actions_taken") or {}).items():
-            ex = rec.get("execution")
-            if not isinstance(ex, dict):
-                continue
-            cmd = (rec.get("bot_action") or {}).get("command")
-            sx = ex.get("sa_execution")
-            sa_did = isinstance(sx, dict) and sx.get("executed")
-            # A no-effect TURN: the Command did nothing AND no SA salvaged
-            # it (e.g. the German A8.7.4 Settle riding an empty Rally is
-            # fine — the turn accomplished its purpose).
-            if (ex.get("executed") is False and not sa_did
-                    and cmd not in ("Event", None, "Pass")):
-                sc["no_effect"][(faction, cmd)] += 1
-        for f in (tr.get("passes") or []):
-            sc["passes"][f] += 1
+
+    def on_event(ev):
+        if ev.kind == events.PASS:
+            sc["passes"][ev.faction] += 1
+        # A no-effect TURN: the Command did nothing AND no SA salvaged it
+        # (e.g. the German A8.7.4 Settle riding an empty Rally is fine —
+        # the turn accomplished its purpose).
+        elif (ev.data["executed"] is False and not ev.data["sa_executed"]
+                and ev.data["command"] not in (None, "Pass")):
+            sc["no_effect"][(ev.faction, ev.data["command"])] += 1
+
+    with events.subscribe(on_event, kinds={events.COMMAND, events.PASS}):
+        res = farm.play_game(scenario, seed,
+                             farm.decision_func(on_bot=on_bot))
+    if db is not None:
+        results_db.record_run(db, "play_quality", "BOTS", scenario, seed, res)
+
+    winner = farm.winner_of(res)
     sc["wins"][winner or "none"] += 1
     sc["games"] += 1
     sc["cards"].append(res["total_cards_played"])
     return res
 
 
+def _quality_game(job):
+    """Farm game: one game's telemetry, merged into the totals by the
+    parent."""
+    stats = defaultdict(_new_scenario_stats)
+    res = play_game(job["scenario"], job["seed"], stats)
+    return {"stats": dict(stats), "record": results_db.summarize(res)}
+
+
 def _new_scenario_stats():
     return {"commands": Counter(), "sas": Counter(), "no_effect": Counter(),
             "passes": Counter(), "events_played": Counter(),
@@ -146,15 +137,28 @@ def main(argv=None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--scenario", default=None)
     ap.add_argument("--seeds", default="1-10")
+    ap.add_argument("--db", default=None,
+                    help="Also record games in this results database.")
+    farm.add_arguments(ap)
     args = ap.parse_args(argv)
-    lo, _, hi = args.seeds.partition("-")
-    seeds = range(int(lo), int(hi or lo) + 1)
+    db = results_db.connect(args.db) if args.db else None
+    seeds = farm.seed_range(args.seeds)
     scenarios = (args.scenario,) if args.scenario else ALL_SCENARIOS
 
     stats = defaultdict(_new_scenario_stats)
-    for sc in scenarios:
-        for seed in seeds:
-            play_game(sc, seed, stats)
+    for job, part, err in farm.run(farm.matrix(scenarios, seeds),
+                                   _quality_game, workers=args.jobs,
+                                   timeout=args.timeout,
+                                   progress=args.progress,
+                                   memory=args.memory):
+        if err:
+            print(f"[{job['scenario']} seed={job['seed']}] ERROR {err}")
+            continue
+        if db is not None:
+            results_db.record_game(db, "play_quality", "BOTS",
+                                   job["scenario"], job["seed"],
+                                   part["record"])
+        farm.merge(stats, part["stats"])
     report(stats)
     return 0
 
@@ -14,6 +14,9 @@ Oracles, per game:
   crash          — run_game raised. Hard defect.
   structural     — check_structural_integrity violation at any turn boundary
                    or at game end (silent-corruption class). Hard defect.
+                   With --checked the per-turn scan is replaced by checked
+                   mode (state/invariants.py): each mutator checks what it
+                   touched, so a violation names the operation that made it.
   divergence     — a seated player's chosen plan was dry-run at decision
                    time (moves.validate_player_action) and the LIVE execution
                    produced a different outcome signature (executed flag,
@@ -62,7 +65,6 @@ import argparse
 import contextlib
 import copy
 import hashlib
-import io
 import json
 import random
 from collections import Counter
@@ -70,13 +72,12 @@ from collections import Counter
 import re
 
 import fs_bot.rules_consts as rc
-from fs_bot.state.setup import setup_scenario
-from fs_bot.engine.game_engine import run_game, ACTION_EVENT, get_sop_factions
+from fs_bot.engine.game_engine import ACTION_EVENT
 from fs_bot.engine.agent import RETREAT, LOSS_ORDER, AGREEMENT
-from fs_bot.bots.bot_dispatch import dispatch_bot_turn
-from fs_bot.cli.dispatcher import _translate_bot_action
 from fs_bot.agents.heuristic import RandomPlanPolicy
+from fs_bot.state import invariants
 from fs_bot.state.state_schema import check_structural_integrity
+from fs_bot.tools import farm
 
 ALL_SCENARIOS = (rc.SCENARIO_PAX_GALLICA, rc.SCENARIO_GREAT_REVOLT,
                  rc.SCENARIO_RECONQUEST, rc.SCENARIO_ARIOVISTUS,
@@ -345,10 +346,12 @@ def _compare_dry_vs_live(res, seats, expected):
     return divergences, partial
 
 
-def play_game(scenario, seed, *, reactive=True, events=True):
-    """One fuzzed game. Returns a result dict incl. findings and digest."""
-    st = setup_scenario(scenario, seed=seed)
-    sop = sorted(get_sop_factions(st))
+def play_game(scenario, seed, *, reactive=True, events=True, checked=False):
+    """One fuzzed game. Returns a result dict incl. findings and digest.
+    ``checked`` runs it in checked mode instead of scanning the board at
+    every decision."""
+    st = farm.new_game(scenario, seed)
+    sop = sorted(st["non_player_factions"])
     frng = random.Random(f"player_fuzz|{scenario}|{seed}")
     seats = _pick_seats(sop, frng)
     st["non_player_factions"] = set(sop) - set(seats)
@@ -430,6 +433,7 @@ def play_game(scenario, seed, *, reactive=True, events=True):
         carrying §1.5.2 transfers skip the dirty check: a successful gift
         legitimately stands even when the action itself fizzles."""
         from fs_bot.engine.execute import execute_decision
+        from fs_bot.engine.events import muted
         sim = copy.deepcopy(state)
         sim.pop("decision_agent", None)
         if reactive:
@@ -438,7 +442,8 @@ def play_game(scenario, seed, *, reactive=True, events=True):
             sim["decision_agent"] = make_random_reactive(seats, clone_rng)
         pre = _board_digest(sim)
         try:
-            info = execute_decision(sim, faction, {"player_action": pa})
+            with muted():
+                info = execute_decision(sim, faction, {"player_action": pa})
         except Exception as exc:
             findings.append(("event-crash" if pa.get("command") == "Event"
                              else "crash",
@@ -449,9 +454,14 @@ def play_game(scenario, seed, *, reactive=True, events=True):
                  and _board_digest(sim) != pre)
         return info, dirty
 
+    def on_violation(v):
+        findings.append(("structural", v.card, f"{v.op}: {v.message}"))
+
     def decision_func(state, faction, options, position):
-        for e in check_structural_integrity(state)[:3]:
-            findings.append(("structural", state.get("current_card"), e))
+        if not checked:
+            for e in check_structural_integrity(state)[:3]:
+                findings.append(("structural", state.get("current_card"),
+                                 e))
         # Gallic War Interlude seat swap (A2.1): a seated German player
         # takes on the Arverni role for the second half.
         if (state.get("interlude_completed")
@@ -497,19 +507,15 @@ def play_game(scenario, seed, *, reactive=True, events=True):
                         expected[k + (seen_keys[k],)] = _sig(info)
                         seen_keys[k] += 1
             return dec
-        state["current_card_id"] = state.get("current_card")
-        state["is_second_eligible"] = (position == "2nd_eligible")
-        state["can_play_event"] = (ACTION_EVENT in options)
-        ba = dispatch_bot_turn(state, faction)
-        return {"action": _translate_bot_action(ba, options),
-                "bot_action": ba}
+        return farm.bot_decision(state, faction, options, position)
 
     res, crash = None, None
-    with contextlib.redirect_stdout(io.StringIO()):
-        try:
-            res = run_game(st, decision_func=decision_func, execute=True)
-        except Exception as exc:
-            crash = f"{type(exc).__name__}: {exc}"
+    try:
+        with (invariants.checking(on_violation) if checked
+              else contextlib.nullcontext()):
+            res = farm.play_game(scenario, seed, decision_func, state=st)
+    except Exception as exc:
+        crash = f"{type(exc).__name__}: {exc}"
     if crash:
         findings.append(("crash", st.get("current_card"), crash))
     for e in check_structural_integrity(st)[:3]:
@@ -525,6 +531,21 @@ def play_game(scenario, seed, *, reactive=True, events=True):
             "digest": _digest(st, res)}
 
 
+def _fuzz_game(job):
+    """Farm game: one fuzzed game, replayed for the determinism oracle
+    unless the job says otherwise."""
+    kw = {"reactive": job["reactive"], "events": job["events"],
+          "checked": job.get("checked", False)}
+    r = play_game(job["scenario"], job["seed"], **kw)
+    if job["determinism"]:
+        r2 = play_game(job["scenario"], job["seed"], **kw)
+        if r2["digest"] != r["digest"]:
+            r["findings"].append(
+                ("nondeterminism", "-",
+                 f"replay digest {r['digest']} != {r2['digest']}"))
+    return r
+
+
 def main(argv=None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--scenario", default=None,
@@ -534,39 +555,47 @@ def main(argv=None) -> int:
                     help="skip the randomized reactive decision agent")
     ap.add_argument("--no-events", action="store_true",
                     help="skip player Event fuzzing")
+    farm.add_arguments(ap)
     ap.add_argument("--no-determinism", action="store_true",
                     help="skip the replay determinism double-run")
+    ap.add_argument("--checked", action="store_true",
+                    help="check invariants at each mutation instead of "
+                         "scanning the board at each decision")
     args = ap.parse_args(argv)
 
-    lo, _, hi = args.seeds.partition("-")
-    seeds = range(int(lo), int(hi or lo) + 1)
+    seeds = farm.seed_range(args.seeds)
     scenarios = (args.scenario,) if args.scenario else ALL_SCENARIOS
 
     games, turns, ev_turns, ev_ok, partial = 0, 0, 0, 0, 0
     by_kind = Counter()
     examples = []
     batch = hashlib.sha256()
-    for sc in scenarios:
-        for seed in seeds:
-            r = play_game(sc, seed, reactive=not args.no_reactive,
-                          events=not args.no_events)
-            games += 1
-            turns += r["human_turns"]
-            ev_turns += r["event_turns"]
-            ev_ok += r["events_ok"]
-            partial += r["partial"]
-            if not args.no_determinism:
-                r2 = play_game(sc, seed, reactive=not args.no_reactive,
-                               events=not args.no_events)
-                if r2["digest"] != r["digest"]:
-                    r["findings"].append(
-                        ("nondeterminism", "-",
-                         f"replay digest {r['digest']} != {r2['digest']}"))
-            for kind, card, msg in r["findings"]:
-                by_kind[kind] += 1
-                if len(examples) < 40:
-                    examples.append((sc, seed, r["seats"], kind, card, msg))
-            batch.update(f"{sc}|{seed}|{r['digest']}".encode())
+    jobs = [dict(job, reactive=not args.no_reactive,
+                 events=not args.no_events,
+                 determinism=not args.no_determinism,
+                 checked=args.checked)
+            for job in farm.matrix(scenarios, seeds)]
+    for job, r, err in farm.run(jobs, _fuzz_game, workers=args.jobs,
+                                timeout=args.timeout,
+                                progress=args.progress,
+                                memory=args.memory):
+        sc, seed = job["scenario"], job["seed"]
+        if err:
+            # play_game records its own crashes; this is a timeout or a
+            # failure outside the game loop.
+            r = {"seats": [], "human_turns": 0, "event_turns": 0,
+                 "events_ok": 0, "partial": 0, "digest": "-",
+                 "findings": [("crash", "-", err)]}
+        games += 1
+        turns += r["human_turns"]
+        ev_turns += r["event_turns"]
+        ev_ok += r["events_ok"]
+        partial += r["partial"]
+        for kind, card, msg in r["findings"]:
+            by_kind[kind] += 1
+            if len(examples) < 40:
+                examples.append((sc, seed, r["seats"], kind, card, msg))
+        batch.update(f"{sc}|{seed}|{r['digest']}".encode())
 
     hard = sum(by_kind.values())
     print(f"games={games}  human-turns={turns}  event-turns={ev_turns}  "
@@ -0,0 +1,362 @@
+"""Shared results store for the batch tools — one SQLite file, WAL mode.
+
+Every batch tool can record its games here instead of (or as well as) its
+own JSONL / JSON output, so reruns skip finished games with one indexed
+query and analyses aggregate without re-parsing files.
+
+Tables:
+  games          one row per (tool, label, scenario, seed, fingerprint):
+                 seat faction, winner, cards, winters, decisions, secs,
+                 error and a JSON ``extra`` blob for tool-specific fields
+  card_outcomes  one row per card per acting Faction (Winter cards one row
+                 with no Faction): card id, action, command, SA, executed
+  faction_scores final victory margin and rank per Faction, when the game
+                 reached a scoring Winter
+
+``fingerprint`` is a hash of the engine sources (everything under fs_bot/
+except tools/, tests/ and bench/), so results from different engine versions
+never mix: a rerun after a rules fix records fresh rows beside the old ones.
+
+Writers open their own connection; inserts run in ``BEGIN IMMEDIATE``
+transactions with a generous busy timeout, so parallel worker processes can
+share one file.
+
+    python -m fs_bot.tools.results_db results.db import-jsonl selfplay.jsonl
+    python -m fs_bot.tools.results_db results.db import-baseline
+    python -m fs_bot.tools.results_db results.db summary --tool balance_smoke
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+_PKG = Path(__file__).resolve().parents[1]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id          INTEGER PRIMARY KEY,
+    tool        TEXT NOT NULL,
+    label       TEXT NOT NULL,
+    scenario    TEXT NOT NULL,
+    seed        INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    faction     TEXT,
+    winner      TEXT,
+    cards       INTEGER,
+    winters     INTEGER,
+    decisions   INTEGER,
+    secs        REAL,
+    error       TEXT,
+    extra       TEXT,
+    created     REAL NOT NULL,
+    UNIQUE (tool, label, scenario, seed, fingerprint)
+);
+CREATE INDEX IF NOT EXISTS games_by_scenario
+    ON games (tool, scenario, fingerprint);
+CREATE TABLE IF NOT EXISTS card_outcomes (
+    game_id     INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+    idx         INTEGER NOT NULL,
+    card        TEXT NOT NULL,
+    type        TEXT,
+    faction     TEXT,
+    action      TEXT,
+    command     TEXT,
+    sa          TEXT,
+    executed    INTEGER
+);
+CREATE INDEX IF NOT EXISTS card_outcomes_by_game ON card_outcomes (game_id);
+CREATE INDEX IF NOT EXISTS card_outcomes_by_card ON card_outcomes (card);
+CREATE TABLE IF NOT EXISTS faction_scores (
+    game_id     INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+    faction     TEXT NOT NULL,
+    margin      INTEGER,
+    rank        INTEGER,
+    PRIMARY KEY (game_id, faction)
+);
+"""
+
+_GAME_COLUMNS = ("faction", "winner", "cards", "winters", "decisions",
+                 "secs", "error")
+
+_fingerprint = None
+
+# Packages that cannot change how a game plays; editing them keeps the
+# fingerprint, so their results stay comparable.
+_NOT_ENGINE = ("tools", "tests", "bench")
+
+
+def engine_fingerprint():
+    """Short hash of the engine sources (cached per process)."""
+    global _fingerprint
+    if _fingerprint is None:
+        h = hashlib.sha1()
+        for path in sorted(_PKG.rglob("*.py")):
+            rel = path.relative_to(_PKG)
+            if rel.parts[0] in _NOT_ENGINE:
+                continue
+            h.update(str(rel).encode())
+            h.update(path.read_bytes())
+        _fingerprint = h.hexdigest()[:12]
+    return _fingerprint
+
+
+def connect(path):
+    """Open (creating if needed) the results database at ``path``."""
+    conn = sqlite3.connect(str(path), timeout=60, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class _write:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` (``ROLLBACK`` on error): takes the
+    write lock up front so concurrent writers queue on the busy timeout
+    instead of failing mid-transaction."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Extracting rows from a run_game result
+# ---------------------------------------------------------------------------
+
+def card_outcomes(res):
+    """Per-card rows from a ``run_game`` result:
+    ``(idx, card, type, faction, action, command, sa, executed)``."""
+    rows = []
+    for i, cr in enumerate(res.get("card_results", ())):
+        card, kind = str(cr.get("card")), cr.get("type")
+        taken = (cr.get("turn_result") or {}).get("actions_taken") or {}
+        if not taken:
+            rows.append((i, card, kind, None, None, None, None, None))
+        for faction, rec in taken.items():
+            ba = rec.get("bot_action") or {}
+            pa = rec.get("player_action") or {}
+            ex = rec.get("execution")
+            executed = (int(bool(ex.get("executed")))
+                        if isinstance(ex, dict) else None)
+            rows.append((i, card, kind, faction, rec.get("action"),
+                         ba.get("command") or pa.get("command"),
+                         ba.get("sa") or pa.get("sa"), executed))
+    return rows
+
+
+def final_scores(res):
+    """``[(faction, margin, rank)]`` from the scoring Winter, or ``[]``."""
+    for cr in reversed(res.get("card_results", ())):
+        phases = (((cr.get("winter_result") or {}).get("winter_result")
+                   or {}).get("phases") or {})
+        rankings = (phases.get("victory") or {}).get("rankings")
+        if rankings:
+            return [(f, m, r) for r, (f, m) in enumerate(rankings, 1)]
+    return []
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def record_game(conn, tool, label, scenario, seed, record, *,
+                outcomes=None, scores=None, fingerprint=None):
+    """Insert (or replace) one game. ``record`` is a tool's per-game dict;
+    the ``games`` columns are read from it and any other JSON-able keys go
+    to ``extra``. ``outcomes`` / ``scores`` are rows as produced by
+    :func:`card_outcomes` / :func:`final_scores` (default: the record's
+    own ``"outcomes"`` / ``"scores"``; ``(faction, margin)`` score pairs
+    are ranked in order). Returns the game id."""
+    fp = fingerprint or engine_fingerprint()
+    if outcomes is None:
+        outcomes = record.get("outcomes") or ()
+    if scores is None:
+        scores = record.get("scores") or ()
+    scores = [(row[0], row[1], row[2] if len(row) > 2 else rank)
+              for rank, row in enumerate(scores, 1)]
+    skip = set(_GAME_COLUMNS) | {"label", "scenario", "seed", "tool",
+                                 "scores", "outcomes"}
+    extra = {k: v for k, v in record.items() if k not in skip}
+    with _write(conn):
+        conn.execute("DELETE FROM games WHERE tool=? AND label=? AND "
+                     "scenario=? AND seed=? AND fingerprint=?",
+                     (tool, label, scenario, seed, fp))
+        cur = conn.execute(
+            "INSERT INTO games (tool, label, scenario, seed, fingerprint, "
+            + ", ".join(_GAME_COLUMNS) + ", extra, created) VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (tool, label, scenario, seed, fp,
+             *(record.get(c) for c in _GAME_COLUMNS),
+             json.dumps(extra, default=str) if extra else None,
+             time.time()))
+        gid = cur.lastrowid
+        conn.executemany("INSERT INTO card_outcomes VALUES "
+                         "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                         [(gid, *row) for row in outcomes])
+        conn.executemany("INSERT INTO faction_scores VALUES (?, ?, ?, ?)",
+                         [(gid, *row) for row in scores])
+    return gid
+
+
+def summarize(res):
+    """The recordable parts of a ``run_game`` result: winner, cards,
+    winters, outcomes and scores (small and picklable, for farm workers)."""
+    winner = None
+    for cr in res["card_results"]:
+        if cr.get("winner"):
+            winner = cr["winner"]
+    return {"winner": winner, "cards": res["total_cards_played"],
+            "winters": res["winter_count"], "outcomes": card_outcomes(res),
+            "scores": final_scores(res)}
+
+
+def record_run(conn, tool, label, scenario, seed, res, **record):
+    """:func:`record_game` straight from a ``run_game`` result; extra
+    keyword fields (faction, secs, decisions, ...) go into the record."""
+    return record_game(conn, tool, label, scenario, seed,
+                       {**summarize(res), **record})
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+def _where(**filters):
+    clauses, params = [], []
+    for col, val in filters.items():
+        if val is not None:
+            clauses.append(f"{col} = ?")
+            params.append(val)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def done_keys(conn, tool, scenario=None, fingerprint=None):
+    """``{(label, scenario, seed)}`` already recorded for ``tool`` at
+    ``fingerprint`` (default: the current engine)."""
+    where, params = _where(tool=tool, scenario=scenario,
+                           fingerprint=fingerprint or engine_fingerprint())
+    return set(conn.execute(
+        "SELECT label, scenario, seed FROM games" + where, params))
+
+
+def win_rates(conn, *, tool=None, scenario=None, label=None,
+              fingerprint=None):
+    """``[{label, scenario, winner, games, rate}]``: each winner's share of
+    the finished games per (label, scenario). Errored games are excluded."""
+    where, params = _where(tool=tool, scenario=scenario, label=label,
+                           fingerprint=fingerprint)
+    where += (" AND" if where else " WHERE") + " error IS NULL"
+    sql = ("SELECT label, scenario, COALESCE(winner, 'none'), COUNT(*), "
+           "COUNT(*) * 1.0 / SUM(COUNT(*)) OVER "
+           "(PARTITION BY label, scenario) FROM games" + where
+           + " GROUP BY label, scenario, winner"
+           " ORDER BY label, scenario, COUNT(*) DESC")
+    cols = ("label", "scenario", "winner", "games", "rate")
+    return [dict(zip(cols, row)) for row in conn.execute(sql, params)]
+
+
+def game_lengths(conn, *, tool=None, scenario=None, label=None,
+                 fingerprint=None):
+    """``[{label, scenario, games, avg_cards, min_cards, max_cards,
+    errors}]`` per (label, scenario)."""
+    where, params = _where(tool=tool, scenario=scenario, label=label,
+                           fingerprint=fingerprint)
+    sql = ("SELECT label, scenario, COUNT(*), AVG(cards), MIN(cards), "
+           "MAX(cards), SUM(error IS NOT NULL) FROM games" + where
+           + " GROUP BY label, scenario ORDER BY label, scenario")
+    cols = ("label", "scenario", "games", "avg_cards", "min_cards",
+            "max_cards", "errors")
+    return [dict(zip(cols, row)) for row in conn.execute(sql, params)]
+
+
+# ---------------------------------------------------------------------------
+# Importers
+# ---------------------------------------------------------------------------
+
+def import_jsonl(conn, path, tool="heuristic_selfplay", fingerprint="import"):
+    """Load a heuristic_selfplay-style JSONL file; returns rows imported.
+    Old files carry no engine version, hence the ``"import"`` fingerprint."""
+    n = 0
+    for line in Path(path).read_text().splitlines():
+        try:
+            rec = json.loads(line)
+            label, scenario, seed = rec["label"], rec["scenario"], rec["seed"]
+        except (ValueError, KeyError):
+            continue
+        record_game(conn, tool, label, scenario, seed, rec,
+                    scores=rec.get("scores") or rec.get("ranking") or (),
+                    fingerprint=fingerprint)
+        n += 1
+    return n
+
+
+def import_baseline(conn, path=None, tool="balance_smoke",
+                    fingerprint="baseline"):
+    """Load ``balance_baseline.json`` (bot-only games, label ``BOTS``)."""
+    from fs_bot.tools.balance_smoke import BASELINE_PATH
+    data = json.loads(Path(path or BASELINE_PATH).read_text())
+    n = 0
+    for key, rec in data.get("games", {}).items():
+        scenario, _, seed = key.rpartition("|")
+        record_game(conn, tool, "BOTS", scenario, int(seed), rec,
+                    fingerprint=fingerprint)
+        n += 1
+    return n
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("db")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("import-jsonl")
+    p.add_argument("files", nargs="+")
+    p.add_argument("--tool", default="heuristic_selfplay")
+    p = sub.add_parser("import-baseline")
+    p.add_argument("file", nargs="?", default=None)
+    p = sub.add_parser("summary")
+    p.add_argument("--tool", default=None)
+    p.add_argument("--scenario", default=None)
+    p.add_argument("--label", default=None)
+    p.add_argument("--fingerprint", default=None,
+                   help="'current' for this engine (default: all)")
+    args = ap.parse_args(argv)
+
+    conn = connect(args.db)
+    if args.cmd == "import-jsonl":
+        for f in args.files:
+            print(f"{f}: {import_jsonl(conn, f, args.tool)} games")
+        return 0
+    if args.cmd == "import-baseline":
+        print(f"{import_baseline(conn, args.file)} games")
+        return 0
+
+    fp = (engine_fingerprint() if args.fingerprint == "current"
+          else args.fingerprint)
+    filters = dict(tool=args.tool, scenario=args.scenario, label=args.label,
+                   fingerprint=fp)
+    for row in game_lengths(conn, **filters):
+        print(f"{row['label']:>16s} {row['scenario']:20s} "
+              f"games={row['games']:4d} cards={row['avg_cards'] or 0:5.1f} "
+              f"[{row['min_cards']}-{row['max_cards']}] "
+              f"errors={row['errors']}")
+        for w in win_rates(conn, **{**filters, "label": row["label"],
+                                    "scenario": row["scenario"]}):
+            print(f"{'':>18s}{w['winner']:<10s} {w['rate']:>5.0%} "
+                  f"({w['games']})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,10 +13,18 @@ pass" for the classification of every flagged section).
 
     python -m fs_bot.tools.rules_trace
     python -m fs_bot.tools.rules_trace --all      # show cited ones too
+    python -m fs_bot.tools.rules_trace --check    # exit 1 if any unaccounted
+
+Each source file is scanned once for section-shaped numbers, whatever the
+number of sections. The command line keeps those per-file results in an
+index (INDEX_PATH, git-ignored) keyed by each file's mtime, size and hash,
+so a rerun only rescans the files that changed.
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import re
 from collections import defaultdict
@@ -31,10 +39,15 @@ CHAPTERS = [("Chapter %d" % i, "") for i in range(1, 9)] + \
 # A section header at line start: "3.2.4 Retreat." / "A8.7.4 Rally?"
 _SECTION_RE = re.compile(r"^(A?\d\.\d(?:\.\d+)?)\s+(\S.*)")
 
-# Source citation: the bare section number, optionally §-prefixed, not
-# followed by another digit (so "3.2.4" doesn't match inside "3.2.45").
-def _cite_re(sec):
-    return re.compile(re.escape(sec) + r"(?!\d)")
+INDEX_PATH = os.path.join(os.path.dirname(__file__), "..", "..",
+                          ".rules_trace_index.json")
+
+# A run of digits and dots, with the "A" of an Ariovistus number. Every
+# citation lies inside one of these runs.
+_NUMBER_RE = re.compile(r"A?\d[\d.]*")
+
+# Bump when the scan changes, so stale indexes are rescanned.
+_INDEX_FORMAT = 1
 
 
 def parse_sections():
@@ -68,23 +81,87 @@ def _iter_source_files():
                 yield os.path.join(root, f)
 
 
-def citation_census():
-    """{section: [files citing it]} across fs_bot source."""
-    sections = parse_sections()
-    hits = defaultdict(set)
-    blobs = {}
+def _scan(blob):
+    """The distinct number runs in ``blob``, sorted."""
+    return sorted(set(_NUMBER_RE.findall(blob)))
+
+
+def _cited(numbers, sections):
+    """Sections cited by the number runs: a section is cited where it
+    appears inside a run not followed by another digit (so "3.2.4" is not
+    cited by "3.2.45", while "3.2" is cited by "3.2.4")."""
+    found = set()
+    for num in numbers:
+        n = len(num)
+        for i in range(n):
+            for j in range(i + 3, n + 1):
+                if (j == n or not num[j].isdigit()) and num[i:j] in sections:
+                    found.add(num[i:j])
+    return found
+
+
+def _load_index(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if index.get("format") != _INDEX_FORMAT:
+        return {}
+    return index.get("files", {})
+
+
+def _save_index(path, files):
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": _INDEX_FORMAT, "files": files}, f,
+                      sort_keys=True)
+        os.replace(tmp, path)
+    except OSError:
+        pass        # the index is only a cache
+
+
+def _source_numbers(index_path=None):
+    """{relative path: number runs} for every source file, rescanning
+    only files whose mtime/size and then hash changed since the index at
+    ``index_path`` (None: scan everything, keep no index)."""
+    base = os.path.dirname(__file__)
+    old = _load_index(index_path) if index_path else {}
+    files = {}
     for path in _iter_source_files():
+        rel = os.path.relpath(path, base)
         try:
-            blobs[path] = open(path, encoding="utf-8",
-                               errors="replace").read()
+            st = os.stat(path)
+            entry = old.get(rel)
+            if (entry is not None and entry["mtime_ns"] == st.st_mtime_ns
+                    and entry["size"] == st.st_size):
+                files[rel] = entry
+                continue
+            with open(path, "rb") as f:
+                raw = f.read()
         except OSError:
             continue
-    for sec in sections:
-        rx = _cite_re(sec)
-        for path, blob in blobs.items():
-            if rx.search(blob):
-                hits[sec].add(os.path.relpath(
-                    path, os.path.dirname(__file__)))
+        digest = hashlib.sha1(raw).hexdigest()
+        if entry is not None and entry["sha1"] == digest:
+            numbers = entry["numbers"]
+        else:
+            numbers = _scan(raw.decode("utf-8", errors="replace"))
+        files[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                      "sha1": digest, "numbers": numbers}
+    if index_path and files != old:
+        _save_index(index_path, files)
+    return {rel: entry["numbers"] for rel, entry in files.items()}
+
+
+def citation_census(index_path=None):
+    """{section: [files citing it]} across fs_bot source. With
+    ``index_path``, per-file scans are kept there between runs."""
+    sections = parse_sections()
+    hits = defaultdict(set)
+    for rel, numbers in _source_numbers(index_path).items():
+        for sec in _cited(numbers, sections):
+            hits[sec].add(rel)
     return sections, hits
 
 
@@ -103,9 +180,9 @@ NOT_APPLICABLE = {
 }
 
 
-def unaccounted():
+def unaccounted(index_path=None):
     """Sections neither cited in source nor allow-listed as N/A."""
-    sections, hits = citation_census()
+    sections, hits = citation_census(index_path)
     return sorted(s for s in sections
                   if not hits[s] and s not in NOT_APPLICABLE)
 
@@ -114,9 +191,15 @@ def main(argv=None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--all", action="store_true",
                     help="list cited sections too")
+    ap.add_argument("--check", action="store_true",
+                    help="exit 1 if any section is unaccounted for")
+    ap.add_argument("--index", default=INDEX_PATH,
+                    help="per-file scan index (default: %(default)s)")
+    ap.add_argument("--no-index", action="store_true",
+                    help="rescan every file and keep no index")
     args = ap.parse_args(argv)
 
-    sections, hits = citation_census()
+    sections, hits = citation_census(None if args.no_index else args.index)
     uncited = sorted((s for s in sections if not hits[s]),
                      key=lambda x: (x.startswith("A"), x))
     missing = [s for s in uncited if s not in NOT_APPLICABLE]
@@ -130,7 +213,7 @@ def main(argv=None) -> int:
             if hits[sec]:
                 print(f"  {sec:8s} [{len(hits[sec]):2d} files] "
                       f"{sections[sec]}")
-    return 0
+    return 1 if args.check and missing else 0
 
 
 if __name__ == "__main__":
@@ -16,13 +16,10 @@ import contextlib
 import io
 
 import fs_bot.rules_consts as rc
-from fs_bot.state.setup import setup_scenario
-from fs_bot.engine.game_engine import (play_card, start_game, ACTION_EVENT,
-                                       get_sop_factions, is_winter_card)
+from fs_bot.engine.game_engine import play_card, start_game, is_winter_card
 from fs_bot.engine.victory import TRIBE_TO_REGION
 from fs_bot.board.pieces import count_pieces
-from fs_bot.bots.bot_dispatch import dispatch_bot_turn
-from fs_bot.cli.dispatcher import _translate_bot_action
+from fs_bot.tools import farm
 
 
 def desyncs(state):
@@ -55,41 +52,53 @@ def desyncs(state):
     return out
 
 
-def _bot_func(state, faction, options, position):
-    state["current_card_id"] = state.get("current_card")
-    state["is_second_eligible"] = (position == "2nd_eligible")
-    state["can_play_event"] = (ACTION_EVENT in options)
-    ba = dispatch_bot_turn(state, faction)
-    return {"action": _translate_bot_action(ba, options), "bot_action": ba}
+_bot_func = farm.bot_decision
+
+
+def _sync_game(job):
+    """Farm game: ``{"setup": desyncs at setup, "by_card": {tag: set}}``
+    for one bot-only game, played card by card."""
+    seed = job["seed"]
+    st = farm.new_game(job["scenario"], seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        start_game(st)
+    prev = desyncs(st)
+    setup = set(prev)
+    by_card = collections.defaultdict(set)
+    while st["current_card"] is not None:
+        cid = st["current_card"]
+        with contextlib.redirect_stdout(io.StringIO()):
+            cr = play_card(st, _bot_func, execute=True)
+        now = desyncs(st)
+        for d in now - prev:
+            tag = "WINTER" if is_winter_card(cid) else f"card {cid}"
+            by_card[tag].add((seed,) + d)
+        prev = now
+        if cr["game_over"]:
+            break
+    return {"setup": setup, "by_card": dict(by_card)}
 
 
 def main(argv=None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--scenario", default=rc.SCENARIO_RECONQUEST)
     ap.add_argument("--seeds", default="1-5")
+    farm.add_arguments(ap)
     args = ap.parse_args(argv)
-    lo, _, hi = args.seeds.partition("-")
 
     by_card = collections.defaultdict(set)
-    for seed in range(int(lo), int(hi or lo) + 1):
-        st = setup_scenario(args.scenario, seed=seed)
-        st["non_player_factions"] = set(get_sop_factions(st))
-        with contextlib.redirect_stdout(io.StringIO()):
-            start_game(st)
-        prev = desyncs(st)
-        if prev:
-            print(f"[seed {seed}] desyncs AT SETUP: {sorted(prev)}")
-        while st["current_card"] is not None:
-            cid = st["current_card"]
-            with contextlib.redirect_stdout(io.StringIO()):
-                cr = play_card(st, _bot_func, execute=True)
-            now = desyncs(st)
-            for d in now - prev:
-                tag = "WINTER" if is_winter_card(cid) else f"card {cid}"
-                by_card[tag].add((seed,) + d)
-            prev = now
-            if cr["game_over"]:
-                break
+    for job, part, err in farm.run(
+            farm.matrix([args.scenario], farm.seed_range(args.seeds)),
+            _sync_game, workers=args.jobs, timeout=args.timeout,
+            progress=args.progress,
+            memory=args.memory):
+        if err:
+            print(f"[seed {job['seed']}] ERROR {err}")
+            continue
+        if part["setup"]:
+            print(f"[seed {job['seed']}] desyncs AT SETUP: "
+                  f"{sorted(part['setup'])}")
+        farm.merge(by_card, part["by_card"])
 
     if not by_card:
         print("No tribe/piece desyncs found.")